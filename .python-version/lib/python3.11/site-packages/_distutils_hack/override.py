@@ -0,0 +1 @@
+__import__('_distutils_hack').do_override()
@@ -0,0 +1,7 @@
+from .blurhash import blurhash_encode as encode
+from .blurhash import blurhash_decode as decode
+from .blurhash import blurhash_components as components
+from .blurhash import srgb_to_linear as srgb_to_linear
+from .blurhash import linear_to_srgb as linear_to_srgb
+
+__all__ = ['encode', 'decode', 'components', 'srgb_to_linear', 'linear_to_srgb']
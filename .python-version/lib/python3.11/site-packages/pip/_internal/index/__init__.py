@@ -0,0 +1,2 @@
+"""Index interaction code
+"""
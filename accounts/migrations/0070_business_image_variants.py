@@ -0,0 +1,18 @@
+# Generated by Django 5.1 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0069_penalty_suspension_appeal'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='business',
+            name='image_variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
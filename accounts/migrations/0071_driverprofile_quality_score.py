@@ -0,0 +1,43 @@
+# Generated by Django 5.1 on 2026-10-19 14:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0070_business_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='driverprofile',
+            name='dispatch_accepts',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='driverprofile',
+            name='dispatch_rejects',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='driverprofile',
+            name='timed_deliveries',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='driverprofile',
+            name='on_time_deliveries',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='driverprofile',
+            name='driver_cancellations',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='driverprofile',
+            name='quality_score',
+            field=models.FloatField(db_index=True, default=0.815),
+        ),
+    ]
@@ -27,6 +27,7 @@ class Business(RatingModelMixin, models.Model):
     phone_number = PhoneNumberField(blank=True)#CharField(max_length=20, blank=True, default="")
     business_image = models.ImageField(upload_to="business/images/", null=True, blank=True)
     business_logo = models.ImageField(upload_to="business/logos/", null=True, blank=True)
+    image_variants = models.JSONField(default=dict, blank=True)  # image/pipeline.py
     created_at = models.DateTimeField(auto_now_add=True)
     onboarding_complete = models.BooleanField(default=False) # if this is not true then the resturant doesn't get shown
 
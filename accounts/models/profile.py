@@ -192,6 +192,14 @@ class DriverProfile(RatingModelMixin, ProfileBase):
 
     # Stats
     total_deliveries = models.IntegerField(default=0)
+
+    # Dispatch quality (ratings/scoring.py), kept current from OrderEvent transitions
+    dispatch_accepts = models.PositiveIntegerField(default=0)
+    dispatch_rejects = models.PositiveIntegerField(default=0)
+    timed_deliveries = models.PositiveIntegerField(default=0)  # delivered with an estimate to compare against
+    on_time_deliveries = models.PositiveIntegerField(default=0)
+    driver_cancellations = models.PositiveIntegerField(default=0)
+    quality_score = models.FloatField(default=0.815, db_index=True)  # scoring.DEFAULT_SCORE
     
     
     def __str__(self):
@@ -15,6 +15,7 @@ from ..models import (
     PrimaryAgent, Branch
 )
 from referrals.services import apply_referral_code
+from addresses.tasks import name_address
 from phonenumber_field.serializerfields import PhoneNumberField  # type: ignore
 from points.tasks import award_referral_success_task
 from points import service
@@ -322,6 +323,8 @@ class UpdateCustomerSerializer(serializers.Serializer):
                 address="unknown",
                 location=Point(long, lat, srid=4326),
             )
+            # named off the request path: the geocoder may be remote and is rate limited
+            transaction.on_commit(lambda: name_address.delay(location.id))
             profile_updates["default_address"] = location
             instance.addresses.add(location)
 
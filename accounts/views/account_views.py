@@ -29,6 +29,7 @@ from drf_spectacular.utils import extend_schema, inline_serializer  # type: igno
 from rest_framework import serializers as s
 from accounts.serializers import InS, OpS
 from common.phone.utils import get_phone_number
+from common.ratelimit import LoginAccountThrottle, LoginThrottle, OTPVerifyThrottle
 from django.db.models import Exists, OuterRef
 from accounts.services.profiles import (
     PROFILE_BUSINESS_ADMIN,
@@ -160,6 +161,7 @@ class LinkRequestCreateView(GenericAPIView):
 )
 class LinkApproveView(GenericAPIView):
     serializer_class = InS.LinkApproveSerializer
+    throttle_classes = [OTPVerifyThrottle]
     permission_classes = [AllowAny]
 
     def post(self, request):
@@ -424,6 +426,7 @@ class AppAdminRequestCreateView(GenericAPIView):
 )
 class AppAdminApproveView(GenericAPIView):
     serializer_class = InS.AppAdminApproveSerializer
+    throttle_classes = [OTPVerifyThrottle]
     permission_classes = [AllowAny]
 
     def post(self, request):
@@ -482,6 +485,7 @@ class AppAdminApproveView(GenericAPIView):
 class LoginView(GenericAPIView):
     permission_classes = [AllowAny]
     serializer_class = InS.LoginSerializer
+    throttle_classes = [LoginThrottle, LoginAccountThrottle]
 
     def get_profile_type(self):
         return PROFILE_CUSTOMER
@@ -662,6 +666,7 @@ class ChangePasswordView(GenericAPIView):
 class PasswordResetView(GenericAPIView):
     permission_classes = [AllowAny]
     serializer_class = InS.PasswordResetSerializer
+    throttle_classes = [OTPVerifyThrottle]
 
     def post(self, request):
         serializer = self.get_serializer(data=request.data)
@@ -6,6 +6,7 @@ from accounts.serializers import InS
 from accounts.serializers.input_ser.input_seriz import SendType
 from rest_framework.generics import GenericAPIView
 from common.phone.utils import get_phone_number
+from common.ratelimit import OTPSendThrottle, OTPVerifyThrottle
 from django.utils import timezone
 from authflow.services.jwt import issue_jwt_for_user, issue_jwt_for_user_with_plan
 from business_api.views import BaseBuisAdminAPIView
@@ -27,7 +28,8 @@ class GetSerilizerMixin():
 
 
 class SendOptMixin(GenericAPIView, GetSerilizerMixin):
-    
+    throttle_classes = [OTPSendThrottle]
+
     def request_data(self, vd):
         return 
 
@@ -61,6 +63,7 @@ class SendEmailOTPView(SendEmailMixin):
 
 
 class VerifyOtpMixin(GenericAPIView, GetSerilizerMixin):
+    throttle_classes = [OTPVerifyThrottle]
     unidentified_id_lookup = ""
 
     def verify(self, vd):
@@ -1,3 +1,11 @@
 from django.contrib import admin
+from django.contrib.gis.admin import GISModelAdmin
 
-# Register your models here.
+from .models import ServiceZone
+
+
+@admin.register(ServiceZone)
+class ServiceZoneAdmin(GISModelAdmin):
+    list_display = ("name", "is_active", "priority", "updated_at")
+    list_filter = ("is_active",)
+    search_fields = ("name",)
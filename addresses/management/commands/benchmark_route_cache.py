@@ -0,0 +1,94 @@
+import csv
+
+from django.core.management.base import BaseCommand, CommandError
+
+from addresses.utils.route_cache import GEOHASH, GRID, LocalLRU, RouteDistanceCache, haversine_coords_km
+
+DEFAULT_GRID_PRECISIONS = [6, 4, 3, 2]
+DEFAULT_GEOHASH_PRECISIONS = [8, 7, 6]
+
+
+def load_pairs_from_file(path):
+    """CSV with columns user_lon,user_lat,branch_lon,branch_lat (header optional)."""
+    pairs = []
+    with open(path, newline="") as fh:
+        for row in csv.reader(fh):
+            try:
+                u_lon, u_lat, b_lon, b_lat = (float(v) for v in row[:4])
+            except ValueError:
+                continue  # header / bad row
+            pairs.append(((u_lon, u_lat), (b_lon, b_lat)))
+    return pairs
+
+
+def load_pairs_from_orders(limit):
+    from menu.models import Order
+
+    rows = (
+        Order.objects
+        .filter(orderer__default_address__isnull=False, branch__location__isnull=False)
+        .order_by("created_at")
+        .values_list("orderer__default_address__location", "branch__location")[:limit]
+    )
+    return [((u.x, u.y), (b.x, b.y)) for u, b in rows]
+
+
+def replay(pairs, mode, precision):
+    """Replay the recorded lookups against a cache backed by a counting fake provider."""
+    calls = {"n": 0}
+
+    def provider(start, end):
+        calls["n"] += 1
+        return haversine_coords_km(start, end)
+
+    route_cache = RouteDistanceCache(
+        mode=mode,
+        precision=precision,
+        provider=provider,
+        remote=None,
+        local=LocalLRU(maxsize=len(pairs) + 1, ttl=24 * 60 * 60),
+        schedule_refresh=False,
+    )
+    max_error = 0.0
+    for start, end in pairs:
+        km = route_cache.get_distance_km(start, end)
+        max_error = max(max_error, abs(km - haversine_coords_km(start, end)))
+
+    return {
+        "hit_rate": route_cache.hit_rate(),
+        "provider_calls": calls["n"],
+        "saved": len(pairs) - calls["n"],
+        "max_error_km": max_error,
+    }
+
+
+class Command(BaseCommand):
+    help = "Replay recorded order coordinates through the routing cache and report hit rate per precision."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--file", help="CSV of user_lon,user_lat,branch_lon,branch_lat rows.")
+        parser.add_argument("--limit", type=int, default=50000, help="Max orders to sample when no --file.")
+        parser.add_argument("--grid", type=int, nargs="*", default=DEFAULT_GRID_PRECISIONS)
+        parser.add_argument("--geohash", type=int, nargs="*", default=DEFAULT_GEOHASH_PRECISIONS)
+
+    def handle(self, *args, **options):
+        if options["file"]:
+            pairs = load_pairs_from_file(options["file"])
+        else:
+            pairs = load_pairs_from_orders(options["limit"])
+
+        if not pairs:
+            raise CommandError("No coordinate pairs to replay.")
+
+        self.stdout.write(f"Replaying {len(pairs)} lookups")
+        self.stdout.write(f"{'mode':<8}{'prec':>5}{'hit rate':>10}{'calls':>8}{'saved':>8}{'max err km':>12}")
+        for mode, precisions in ((GRID, options["grid"]), (GEOHASH, options["geohash"])):
+            for precision in precisions:
+                r = replay(pairs, mode, precision)
+                self.stdout.write(
+                    f"{mode:<8}{precision:>5}{r['hit_rate']:>10.1%}"
+                    f"{r['provider_calls']:>8}{r['saved']:>8}{r['max_error_km']:>12.3f}"
+                )
+
+
+# Run with: python manage.py benchmark_route_cache --file orders.csv
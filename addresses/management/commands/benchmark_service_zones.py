@@ -0,0 +1,97 @@
+import random
+import statistics
+import time
+
+from django.contrib.gis.geos import MultiPolygon, Point, Polygon
+from django.core.management.base import BaseCommand, CommandError
+
+from addresses.services import zones as zone_service
+from common.benchmark import percentile, rolled_back
+
+# rough Lagos bounding box
+MIN_LON, MIN_LAT, MAX_LON, MAX_LAT = 3.0, 6.3, 3.9, 6.8
+
+
+def make_grid(count):
+    """count square zones tiling the bounding box."""
+    side = int(count ** 0.5) or 1
+    rows = -(-count // side)
+    d_lon = (MAX_LON - MIN_LON) / side
+    d_lat = (MAX_LAT - MIN_LAT) / rows
+    polygons = []
+    for i in range(count):
+        x0 = MIN_LON + (i % side) * d_lon
+        y0 = MIN_LAT + (i // side) * d_lat
+        polygons.append(MultiPolygon(
+            Polygon(((x0, y0), (x0 + d_lon, y0), (x0 + d_lon, y0 + d_lat), (x0, y0 + d_lat), (x0, y0))),
+            srid=4326,
+        ))
+    return polygons
+
+
+def timed(fn, points):
+    samples = []
+    for p in points:
+        started = time.perf_counter()
+        fn(p)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    samples.sort()
+    return statistics.median(samples), percentile(samples, 99)
+
+
+class Command(BaseCommand):
+    help = "Benchmark point-in-zone lookups: python loop vs STRtree vs ST_Covers."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--zones", type=int, default=1000)
+        parser.add_argument("--points", type=int, default=5000)
+        parser.add_argument("--db", action="store_true", help="Also time ST_Covers (zones are rolled back).")
+
+    def handle(self, *args, **options):
+        if zone_service.shapely is None:
+            raise CommandError("shapely is not installed.")
+
+        polygons = make_grid(options["zones"])
+        rng = random.Random(7)
+        points = [
+            Point(rng.uniform(MIN_LON, MAX_LON), rng.uniform(MIN_LAT, MAX_LAT), srid=4326)
+            for _ in range(options["points"])
+        ]
+
+        def python_loop(point):
+            for zone_id, area in enumerate(polygons):
+                if area.covers(point):
+                    return zone_id
+            return None
+
+        index = zone_service.ZoneIndex(check_seconds=10 ** 9)
+        started = time.perf_counter()
+        index.build(
+            zones=[(i, zone_service.shapely_wkb.loads(bytes(p.wkb))) for i, p in enumerate(polygons)],
+            version="bench",
+        )
+        build_ms = (time.perf_counter() - started) * 1000
+
+        self.stdout.write(f"{options['zones']} zones, {options['points']} points (µs per lookup)")
+        self.stdout.write(f"STRtree build: {build_ms:.1f} ms")
+
+        mismatches = sum(python_loop(p) != index.find(p.x, p.y) for p in points[:500])
+        results = [
+            ("python loop", timed(python_loop, points[:500])),
+            ("strtree", timed(lambda p: index.find(p.x, p.y), points)),
+        ]
+
+        if options["db"]:
+            from addresses.models import ServiceZone
+            with rolled_back():
+                ServiceZone.objects.bulk_create(
+                    ServiceZone(name=f"bench-{i}", area=area) for i, area in enumerate(polygons)
+                )
+                results.append(("st_covers", timed(zone_service.find_zone_id_db, points[:1000])))
+
+        for name, (p50, p99) in results:
+            self.stdout.write(f"{name:<12} p50={p50:>9.1f}  p99={p99:>9.1f}")
+        self.stdout.write(f"loop/strtree mismatches: {mismatches}")
+
+
+# Run with: python manage.py benchmark_service_zones --zones 1000 --db
@@ -0,0 +1,31 @@
+# Generated by Django 5.1 on 2026-10-19 10:12
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('addresses', '0004_alter_address_label'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ServiceZone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('area', django.contrib.gis.db.models.fields.MultiPolygonField(srid=4326)),
+                ('is_active', models.BooleanField(default=True)),
+                ('priority', models.IntegerField(default=0)),
+                ('settings', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['-priority', 'id'],
+                'indexes': [models.Index(fields=['is_active', '-priority'], name='addresses_s_is_acti_ae9d8e_idx')],
+            },
+        ),
+    ]
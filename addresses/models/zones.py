@@ -0,0 +1,31 @@
+from django.contrib.gis.db import models as gis_models
+from django.db import models
+
+
+class ServiceZone(gis_models.Model):
+    """
+    Delivery/service area. Stored as planar geometry (not geography) so
+    ST_Covers can use the GiST index directly.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    area = gis_models.MultiPolygonField(srid=4326)  # spatial_index=True -> GiST
+
+    is_active = models.BooleanField(default=True)
+    # overlapping zones: highest priority wins
+    priority = models.IntegerField(default=0)
+
+    # zone-level overrides read by pricing / dispatch, e.g.
+    # {"per_km_fee": 1000, "minimum_fee": 100, "search_radius_km": [3, 6]}
+    settings = models.JSONField(default=dict, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-priority", "id"]
+        indexes = [
+            models.Index(fields=["is_active", "-priority"]),
+        ]
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,2 @@
+from .geocoding import geocode, reverse_geocode, get_geocoding_service
+from .zones import find_zone_id, get_zone_settings, invalidate_zone_index
@@ -0,0 +1,314 @@
+"""
+Geocoding service layer.
+
+    geocode("12 Admiralty Way, Lekki")  -> Point | None
+    reverse_geocode(point)              -> str | None
+
+Lookups go through a normalized-address cache (forward) or a rounded-point cache
+(reverse) before touching a backend. Backends are tried in GEOCODING_BACKENDS
+order, like routing/service.py. Remote backends share one token bucket in redis
+so every process together stays under the provider policy (Nominatim: 1 req/s);
+when the bucket is empty we fall through to the next backend instead of waiting.
+"""
+import hashlib
+import logging
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+
+import redis
+from django.conf import settings
+from django.contrib.gis.geos import Point
+from django.core.cache import cache
+from django.db.models import Q
+from django.db.models.functions import Length
+
+from payments.observability.metrics import increment, observe_ms
+
+logger = logging.getLogger(__name__)
+
+DAY = 60 * 60 * 24
+
+FORWARD_KEY = "geocode:fwd:{}"
+REVERSE_KEY = "geocode:rev:{}:{}"
+BUCKET_KEY = "geocode:bucket:{}"
+
+# cached "no result" so repeated junk input does not burn rate-limit tokens
+NOT_FOUND = "__not_found__"
+
+
+def normalize_address(address_string):
+    value = (address_string or "").lower()
+    value = re.sub(r"[^\w\s]", " ", value)
+    return re.sub(r"\s+", " ", value).strip()
+
+
+# ===== RATE LIMIT =====
+
+# KEYS[1] bucket, ARGV: capacity, refill per second, now, ttl
+_TOKEN_BUCKET_LUA = """
+local tokens = tonumber(redis.call('HGET', KEYS[1], 'tokens'))
+local ts = tonumber(redis.call('HGET', KEYS[1], 'ts'))
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+if tokens == nil then
+    tokens = capacity
+    ts = now
+end
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return allowed
+"""
+
+
+class TokenBucket:
+    """
+    Shared token bucket. Uses redis when REDIS_URL is reachable, otherwise an
+    in-process bucket (tests / local dev, or pass client=False).
+    """
+
+    def __init__(self, name, rate_per_sec, capacity=1, client=None):
+        self.key = BUCKET_KEY.format(name)
+        self.rate = float(rate_per_sec)
+        self.capacity = capacity
+        self._client = client
+        self._script = None
+        self._lock = threading.Lock()
+        self._tokens = float(capacity)
+        self._ts = time.monotonic()
+
+    def _get_client(self):
+        if self._client is None:
+            url = getattr(settings, "REDIS_URL", None)
+            if not url:
+                return None
+            self._client = redis.from_url(url)
+        return self._client
+
+    def acquire(self):
+        client = self._get_client()
+        if client:
+            try:
+                if self._script is None:
+                    self._script = client.register_script(_TOKEN_BUCKET_LUA)
+                ttl = max(int(self.capacity / self.rate) + 1, 1)
+                return bool(self._script(keys=[self.key], args=[self.capacity, self.rate, time.time(), ttl]))
+            except redis.RedisError as exc:
+                logger.warning(f"[geocoding] token bucket unavailable, using local bucket: {exc}")
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._ts) * self.rate)
+            self._ts = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+# ===== BACKENDS =====
+
+class BaseGeocodingBackend(ABC):
+    name: str = ""
+    rate_limited: bool = False
+
+    @abstractmethod
+    def geocode(self, address_string):
+        """returns: (lon, lat) or None"""
+
+    @abstractmethod
+    def reverse(self, lon, lat):
+        """returns: address string or None"""
+
+
+class NominatimBackend(BaseGeocodingBackend):
+    name = "nominatim"
+    rate_limited = True
+
+    _geolocator = None
+    _init_lock = threading.Lock()
+
+    @classmethod
+    def geolocator(cls):
+        # one client (and one HTTP adapter) per process
+        if cls._geolocator is None:
+            with cls._init_lock:
+                if cls._geolocator is None:
+                    from geopy.geocoders import Nominatim
+                    cls._geolocator = Nominatim(
+                        user_agent=getattr(settings, "GEOCODING_USER_AGENT", "ovena_delivery"),
+                        timeout=getattr(settings, "GEOCODING_TIMEOUT", 5),
+                    )
+        return cls._geolocator
+
+    def geocode(self, address_string):
+        location = self.geolocator().geocode(address_string)
+        if location:
+            return location.longitude, location.latitude
+        return None
+
+    def reverse(self, lon, lat):
+        location = self.geolocator().reverse(f"{lat}, {lon}")
+        if location:
+            return location.address
+        return None
+
+
+class AddressTableBackend(BaseGeocodingBackend):
+    """
+    Offline backend fed from our own Address rows. Good enough for tests and as
+    a last-resort fallback: exact normalized match forward, nearest saved
+    address (within GEOCODING_OFFLINE_RADIUS_M) in reverse.
+
+    Forward lookups narrow the table to rows containing every normalized token
+    (a row that normalizes to the input must contain each of them whatever its
+    case, punctuation or spacing), shortest first, then compare normalized.
+    """
+    name = "addresses"
+
+    def geocode(self, address_string):
+        from addresses.models import Address
+
+        wanted = normalize_address(address_string)
+        if not wanted:
+            return None
+        contains_every_token = Q()
+        for token in set(wanted.split()):
+            contains_every_token &= Q(address__icontains=token)
+        candidates = (
+            Address.objects
+            .filter(contains_every_token)
+            .order_by(Length("address"))
+            .values_list("address", "location")[:20]
+        )
+        for address, location in candidates:
+            if normalize_address(address) == wanted:
+                return location.x, location.y
+        return None
+
+    def reverse(self, lon, lat):
+        from django.contrib.gis.measure import D
+        from addresses.models import Address
+
+        radius_m = getattr(settings, "GEOCODING_OFFLINE_RADIUS_M", 50)
+        point = Point(lon, lat, srid=4326)
+        match = (
+            Address.within_radius(point, km=D(m=radius_m).km)
+            .exclude(address__isnull=True)
+            .exclude(address__in=["", "unknown"])
+            .values_list("address", flat=True)
+            .first()
+        )
+        return match
+
+
+REGISTRY = {
+    "nominatim": NominatimBackend,
+    "addresses": AddressTableBackend,
+}
+
+
+# ===== SERVICE =====
+
+class GeocodingService:
+    def __init__(self, backends=None, cache_backend=cache, bucket=None):
+        if backends is None:
+            backends = []
+            for name in getattr(settings, "GEOCODING_BACKENDS", ["nominatim", "addresses"]):
+                cls = REGISTRY.get(name)
+                if cls:
+                    backends.append(cls())
+                else:
+                    logger.warning(f"Unknown geocoding backend: {name}")
+        self.backends = backends
+        self.cache = cache_backend
+        self.bucket = bucket or TokenBucket(
+            "nominatim",
+            rate_per_sec=getattr(settings, "GEOCODING_RATE_PER_SEC", 1),
+            capacity=getattr(settings, "GEOCODING_BURST", 1),
+        )
+        self.ttl = getattr(settings, "GEOCODING_CACHE_TTL", 30 * DAY)
+        self.reverse_precision = getattr(settings, "GEOCODING_REVERSE_PRECISION", 4)
+
+    # --- public ---
+
+    def geocode(self, address_string):
+        normalized = normalize_address(address_string)
+        if not normalized:
+            return None
+        key = FORWARD_KEY.format(hashlib.sha1(normalized.encode()).hexdigest())
+
+        coords = self._lookup("geocode", key, lambda backend: backend.geocode(address_string))
+        if coords is None:
+            return None
+        return Point(coords[0], coords[1], srid=4326)
+
+    def reverse_geocode(self, point):
+        lon = round(point.x, self.reverse_precision)
+        lat = round(point.y, self.reverse_precision)
+        key = REVERSE_KEY.format(lon, lat)
+        return self._lookup("reverse", key, lambda backend: backend.reverse(lon, lat))
+
+    # --- internals ---
+
+    def _lookup(self, op, key, call):
+        started = time.perf_counter()
+        cached = self.cache.get(key)
+        if cached is not None:
+            increment("geocoding.lookup", tags={"op": op, "result": "hit"})
+            observe_ms("geocoding.latency_ms", (time.perf_counter() - started) * 1000, tags={"op": op, "result": "hit"})
+            return None if cached == NOT_FOUND else cached
+
+        result, complete = None, True
+        for backend in self.backends:
+            if backend.rate_limited and not self.bucket.acquire():
+                increment("geocoding.rate_limited", tags={"op": op, "backend": backend.name})
+                complete = False
+                continue
+            try:
+                result = call(backend)
+            except Exception as exc:
+                logger.warning(f"[geocoding] {backend.name} {op} failed: {exc}")
+                complete = False
+                continue
+            if result is not None:
+                break
+
+        if result is not None:
+            self.cache.set(key, result, timeout=self.ttl)
+        elif complete:
+            # every backend answered "nothing" — remember it for a while
+            self.cache.set(key, NOT_FOUND, timeout=DAY)
+
+        increment("geocoding.lookup", tags={"op": op, "result": "miss"})
+        observe_ms("geocoding.latency_ms", (time.perf_counter() - started) * 1000, tags={"op": op, "result": "miss"})
+        return result
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_geocoding_service():
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = GeocodingService()
+    return _service
+
+
+def geocode(address_string):
+    return get_geocoding_service().geocode(address_string)
+
+
+def reverse_geocode(point):
+    return get_geocoding_service().reverse_geocode(point)
@@ -0,0 +1,148 @@
+"""
+Service-zone lookups: which ServiceZone covers this point?
+
+Two paths, same answer:
+  * find_zone_id_db     one ST_Covers query against the GiST index.
+  * ZoneIndex           in-process shapely STRtree, zero DB on the hot path.
+
+find_zone_id() uses the in-process index when shapely is installed and falls
+back to the DB otherwise. Zone saves/deletes bump a version in the shared cache
+(see addresses/signals.py); each process re-checks that version at most every
+SERVICE_ZONE_INDEX_CHECK_SECONDS and rebuilds when it moved.
+"""
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+VERSION_KEY = "zones:version"
+
+try:
+    import shapely
+    from shapely import wkb as shapely_wkb
+    from shapely.strtree import STRtree
+except ImportError:  # optional, DB path still works
+    shapely = None
+
+
+def find_zone_id_db(point):
+    from addresses.models import ServiceZone
+
+    return (
+        ServiceZone.objects
+        .filter(is_active=True, area__covers=point)
+        .order_by("-priority", "id")
+        .values_list("id", flat=True)
+        .first()
+    )
+
+
+def get_zone_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        version = time.time()
+        cache.add(VERSION_KEY, version, timeout=None)
+        version = cache.get(VERSION_KEY, version)
+    return version
+
+
+def bump_zone_version():
+    cache.set(VERSION_KEY, time.time(), timeout=None)
+
+
+class ZoneIndex:
+    def __init__(self, check_seconds=None):
+        self.check_seconds = check_seconds if check_seconds is not None else getattr(
+            settings, "SERVICE_ZONE_INDEX_CHECK_SECONDS", 30
+        )
+        self._lock = threading.Lock()
+        self._tree = None
+        self._ids = []
+        self._version = None
+        self._checked_at = 0.0
+
+    @staticmethod
+    def load_zones():
+        """[(id, shapely geometry)] ordered so the winning zone has the lowest index."""
+        from addresses.models import ServiceZone
+
+        rows = (
+            ServiceZone.objects
+            .filter(is_active=True)
+            .order_by("-priority", "id")
+            .values_list("id", "area")
+        )
+        return [(zone_id, shapely_wkb.loads(bytes(area.wkb))) for zone_id, area in rows]
+
+    def build(self, zones=None, version=None):
+        zones = self.load_zones() if zones is None else zones
+        tree = STRtree([geom for _, geom in zones]) if zones else None
+        with self._lock:
+            self._tree = tree
+            self._ids = [zone_id for zone_id, _ in zones]
+            self._version = version
+            self._checked_at = time.monotonic()
+
+    def clear(self):
+        with self._lock:
+            self._tree = None
+            self._ids = []
+            self._version = None
+            self._checked_at = 0.0
+
+    def _ensure_fresh(self):
+        now = time.monotonic()
+        if self._version is not None and now - self._checked_at < self.check_seconds:
+            return
+        version = get_zone_version()
+        if version != self._version:
+            self.build(version=version)
+        else:
+            self._checked_at = now
+
+    def find(self, lon, lat):
+        self._ensure_fresh()
+        tree, ids = self._tree, self._ids
+        if tree is None:
+            return None
+        hits = tree.query(shapely.Point(lon, lat), predicate="covered_by")
+        if len(hits) == 0:
+            return None
+        return ids[int(min(hits))]
+
+
+_zone_index = ZoneIndex()
+
+
+def get_zone_index():
+    return _zone_index
+
+
+def find_zone_id(point):
+    """
+    :param point: GEOS Point (lon, lat), srid 4326
+    :return: ServiceZone id or None
+    """
+    if point is None:
+        return None
+    if shapely is None or not getattr(settings, "SERVICE_ZONE_IN_PROCESS_INDEX", True):
+        return find_zone_id_db(point)
+    return _zone_index.find(point.x, point.y)
+
+
+def invalidate_zone_index():
+    bump_zone_version()
+    _zone_index.clear()
+
+
+def get_zone_settings(zone_id):
+    """Zone-level overrides for pricing / dispatch, {} when outside every zone."""
+    if zone_id is None:
+        return {}
+    from addresses.models import ServiceZone
+
+    return ServiceZone.objects.filter(id=zone_id).values_list("settings", flat=True).first() or {}
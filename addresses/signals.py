@@ -0,0 +1,12 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from addresses.models import ServiceZone
+from addresses.services.zones import invalidate_zone_index
+
+
+@receiver(post_save, sender=ServiceZone)
+@receiver(post_delete, sender=ServiceZone)
+def _refresh_zone_index(sender, instance: ServiceZone, **kwargs):
+    transaction.on_commit(invalidate_zone_index)
@@ -0,0 +1,48 @@
+from celery import shared_task
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="addresses.refresh_route_distance")
+def refresh_route_distance(key, start, end):
+    """
+    Refresh-ahead for a popular routing cache entry.
+    start/end are the snapped cell centers stored on the entry, (lon, lat).
+    """
+    from addresses.utils.route_cache import get_route_cache
+
+    route_cache = get_route_cache()
+    try:
+        entry = route_cache.compute(key, tuple(start), tuple(end))
+    finally:
+        if route_cache.remote is not None:
+            route_cache.remote.delete(f"{key}:refreshing")
+    return entry["km"]
+
+
+@shared_task(
+    bind=True,
+    name="addresses.name_address",
+    max_retries=3,
+    default_retry_delay=60,
+)
+def name_address(self, address_id):
+    """
+    Fill in an address saved from coordinates alone ("unknown") by reverse geocoding.
+    Retried while the geocoder has no answer: remote backends may be rate limited.
+    """
+    from addresses.models import Address
+    from addresses.services.geocoding import reverse_geocode
+
+    address = Address.objects.filter(id=address_id, address__in=["", "unknown"]).first()
+    if address is None:
+        return None
+    name = reverse_geocode(address.location)
+    if name is None:
+        if self.request.retries >= self.max_retries:
+            return None
+        raise self.retry()
+    # only if still unnamed: the user may have typed one in meanwhile
+    Address.objects.filter(id=address_id, address__in=["", "unknown"]).update(address=name)
+    return name
@@ -1,3 +1,5 @@
+import time
+
 import pytest
 from .utils.gis_point import make_point
 from addresses.models import Address
@@ -63,3 +65,252 @@ class TestAddressGIS:
         assert annotated[0].label == "Home"
         assert annotated[0].distance.m > 0
         assert annotated[1].distance.m > annotated[0].distance.m
+
+
+class TestRouteCache:
+
+    @pytest.fixture
+    def provider(self):
+        calls = []
+
+        def _provider(start, end):
+            calls.append((start, end))
+            return 4.2
+
+        _provider.calls = calls
+        return _provider
+
+    def _cache(self, provider, **kwargs):
+        from django.core.cache.backends.locmem import LocMemCache
+        from .utils.route_cache import RouteDistanceCache
+
+        kwargs.setdefault("mode", "grid")
+        kwargs.setdefault("precision", 3)
+        return RouteDistanceCache(
+            provider=provider,
+            remote=LocMemCache("route-cache-tests", {}),
+            schedule_refresh=False,
+            **kwargs,
+        )
+
+    def test_grid_quantize_snaps_nearby_points(self):
+        from .utils.route_cache import quantize
+
+        a, _ = quantize(3.379205, 6.524379, "grid", 3)
+        b, _ = quantize(3.379401, 6.524102, "grid", 3)  # ~30m away
+        assert a == b
+
+    def test_geohash_roundtrip(self):
+        from .utils.route_cache import geohash_encode, geohash_center
+
+        cell = geohash_encode(51.5074, -0.1278, 7)
+        assert cell == "gcpvj0d"
+        lat, lon = geohash_center(cell)
+        assert abs(lat - 51.5074) < 0.001 and abs(lon + 0.1278) < 0.001
+
+    def test_nearby_customers_share_one_provider_call(self, provider):
+        route_cache = self._cache(provider)
+
+        route_cache.get_distance_km((3.379205, 6.524379), (3.3792, 6.4500))
+        route_cache.get_distance_km((3.379401, 6.524102), (3.3792, 6.4500))
+
+        assert len(provider.calls) == 1
+        assert route_cache.stats == {"local_hit": 1, "remote_hit": 0, "miss": 1, "refresh_scheduled": 0}
+
+    def test_remote_tier_serves_other_processes(self, provider):
+        first = self._cache(provider)
+        first.get_distance_km((3.38, 6.52), (3.37, 6.45))
+
+        # a fresh local LRU shares the remote tier, like another gunicorn worker
+        second = self._cache(provider)
+        second.remote = first.remote
+        assert second.get_distance_km((3.38, 6.52), (3.37, 6.45)) == 4.2
+
+        assert len(provider.calls) == 1
+        assert second.stats["remote_hit"] == 1
+
+    def test_popular_entry_schedules_one_refresh_from_the_local_tier(self, provider, monkeypatch):
+        from addresses.tasks import refresh_route_distance
+
+        scheduled = []
+        monkeypatch.setattr(refresh_route_distance, "delay", lambda *args: scheduled.append(args))
+        # ttl shorter than refresh_ahead: every entry is due for refresh as soon as it lands
+        route_cache = self._cache(provider, ttl=10, refresh_ahead=60, popular_hits=2)
+        route_cache.schedule_refresh = True
+        route_cache.remote.clear()
+
+        for _ in range(5):
+            route_cache.get_distance_km((3.38, 6.52), (3.37, 6.45))
+
+        key, _, _ = route_cache.cell_key((3.38, 6.52), (3.37, 6.45))
+        assert len(scheduled) == 1
+        assert route_cache.stats["refresh_scheduled"] == 1
+        assert "hits" not in route_cache.remote.get(key)
+        assert route_cache.local.get(key)["refresh_at"] > time.time()
+
+    def test_local_lru_evicts_oldest(self):
+        from .utils.route_cache import LocalLRU
+
+        lru = LocalLRU(maxsize=2)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        lru.get("a")
+        lru.set("c", 3)
+
+        assert lru.get("b") is None
+        assert lru.get("a") == 1 and lru.get("c") == 3
+
+
+@pytest.mark.django_db
+class TestGeocodingService:
+
+    @pytest.fixture
+    def service(self):
+        from django.core.cache.backends.locmem import LocMemCache
+        from .services.geocoding import AddressTableBackend, GeocodingService, TokenBucket
+
+        Address.objects.create(address="12 Admiralty Way, Lekki", location=make_point(3.4720, 6.4474))
+        return GeocodingService(
+            backends=[AddressTableBackend()],
+            cache_backend=LocMemCache("geocoding-tests", {}),
+            bucket=TokenBucket("tests", rate_per_sec=1, client=False),
+        )
+
+    def test_forward_uses_offline_backend_and_caches(self, service, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            point = service.geocode("12 admiralty way lekki")
+        assert (round(point.x, 4), round(point.y, 4)) == (3.4720, 6.4474)
+
+        # normalized variants hit the cache, no query
+        with django_assert_num_queries(0):
+            assert service.geocode("  12 Admiralty Way,  LEKKI ").equals(point)
+
+    def test_reverse_rounds_point_for_cache_key(self, service, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            assert service.reverse_geocode(make_point(3.47201, 6.44741)) == "12 Admiralty Way, Lekki"
+        with django_assert_num_queries(0):
+            assert service.reverse_geocode(make_point(3.47204, 6.44738)) == "12 Admiralty Way, Lekki"
+
+    def test_not_found_is_cached(self, service, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            assert service.geocode("nowhere street") is None
+        with django_assert_num_queries(0):
+            assert service.geocode("Nowhere Street") is None
+
+    def test_rate_limited_backend_is_skipped_when_bucket_empty(self, service):
+        from .services.geocoding import BaseGeocodingBackend
+
+        class Remote(BaseGeocodingBackend):
+            name, rate_limited, calls = "remote", True, 0
+
+            def geocode(self, address_string):
+                Remote.calls += 1
+                return (1.0, 2.0)
+
+            def reverse(self, lon, lat):
+                return None
+
+        service.backends.insert(0, Remote())
+        service.geocode("first address")
+        service.geocode("second address")  # bucket empty -> falls through to Address table
+
+        assert Remote.calls == 1
+
+    def test_forward_matches_despite_punctuation_and_spacing(self, service):
+        Address.objects.create(address="3, Bourdillon Rd. Ikoyi", location=make_point(3.4300, 6.4500))
+
+        point = service.geocode("3 bourdillon rd ikoyi")
+        assert (round(point.x, 4), round(point.y, 4)) == (3.4300, 6.4500)
+
+    def test_name_address_task_fills_in_unknown_addresses(self, service, monkeypatch):
+        from .services import geocoding
+        from .tasks import name_address
+
+        monkeypatch.setattr(geocoding, "_service", service)
+        unnamed = Address.objects.create(address="unknown", location=make_point(3.47201, 6.44741))
+        named = Address.objects.create(address="Office", location=make_point(3.9, 6.9))
+
+        assert name_address.apply(args=[unnamed.id]).get() == "12 Admiralty Way, Lekki"
+        assert name_address.apply(args=[named.id]).get() is None
+
+        unnamed.refresh_from_db()
+        named.refresh_from_db()
+        assert unnamed.address == "12 Admiralty Way, Lekki"
+        assert named.address == "Office"
+
+
+def _square(x0, y0, size):
+    from django.contrib.gis.geos import MultiPolygon, Polygon
+
+    return MultiPolygon(
+        Polygon(((x0, y0), (x0 + size, y0), (x0 + size, y0 + size), (x0, y0 + size), (x0, y0))),
+        srid=4326,
+    )
+
+
+@pytest.mark.django_db
+class TestServiceZones:
+
+    @pytest.fixture(autouse=True)
+    def zones(self, django_capture_on_commit_callbacks):
+        from .models import ServiceZone
+
+        with django_capture_on_commit_callbacks(execute=True):
+            self.lagos = ServiceZone.objects.create(name="lagos", area=_square(3.0, 6.3, 1.0))
+            self.lekki = ServiceZone.objects.create(name="lekki", area=_square(3.4, 6.4, 0.2), priority=10)
+            self.off = ServiceZone.objects.create(name="off", area=_square(5.0, 7.0, 1.0), is_active=False)
+
+    def test_db_lookup_prefers_priority(self):
+        from .services.zones import find_zone_id_db
+
+        assert find_zone_id_db(make_point(3.5, 6.5)) == self.lekki.id
+        assert find_zone_id_db(make_point(3.1, 6.4)) == self.lagos.id
+        assert find_zone_id_db(make_point(5.5, 7.5)) is None  # inactive
+        assert find_zone_id_db(make_point(3.0, 6.3)) == self.lagos.id  # boundary is covered
+
+    def test_in_process_index_matches_db(self, django_assert_num_queries):
+        pytest.importorskip("shapely")
+        from .services.zones import ZoneIndex, find_zone_id_db
+
+        index = ZoneIndex(check_seconds=60)
+        index.find(0, 0)  # build
+        probes = [(3.5, 6.5), (3.1, 6.4), (5.5, 7.5), (3.0, 6.3), (10.0, 10.0)]
+        with django_assert_num_queries(0):
+            found = [index.find(lon, lat) for lon, lat in probes]
+        assert found == [find_zone_id_db(make_point(lon, lat)) for lon, lat in probes]
+
+    def test_zone_change_rebuilds_index(self, django_capture_on_commit_callbacks):
+        pytest.importorskip("shapely")
+        from .services.zones import find_zone_id
+
+        assert find_zone_id(make_point(3.5, 6.5)) == self.lekki.id
+
+        with django_capture_on_commit_callbacks(execute=True):
+            self.lekki.delete()
+
+        assert find_zone_id(make_point(3.5, 6.5)) == self.lagos.id
+
+    def test_is_location_in_service_area_uses_zones(self):
+        from .utils.calculation_utils import is_location_in_service_area
+
+        assert is_location_in_service_area(make_point(3.5, 6.5))
+        assert not is_location_in_service_area(make_point(10.0, 10.0))
+        assert is_location_in_service_area(make_point(3.5, 6.5), [_square(3.0, 6.0, 1.0)])
+
+    def test_delivery_quote_prices_in_the_customer_zone(self, monkeypatch):
+        from accounts.models import Branch, Business
+        from menu.serializers import order as order_serializers
+
+        monkeypatch.setattr(order_serializers, "get_cached_distance_km_from_2points", lambda start, end: 3.0)
+        self.lekki.settings = {"per_km_fee": 50, "minimum_fee": 10}
+        self.lekki.save()
+        branch = Branch.objects.create(
+            business=Business.objects.create(business_name="Zone Kitchen"), name="Main", location=make_point(3.45, 6.45)
+        )
+
+        inside = order_serializers.quote_delivery(True, make_point(3.5, 6.5), branch)
+        outside = order_serializers.quote_delivery(True, make_point(10.0, 10.0), branch)
+
+        assert (inside.zone_id, inside.fee) == (self.lekki.id, 150)
+        assert (outside.zone_id, outside.fee) == (None, 3.0 * order_serializers.PRICE_PER_KM)
+        assert order_serializers.quote_delivery(False, make_point(3.5, 6.5), branch).fee == 0
@@ -0,0 +1,7 @@
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path("geocode/", views.GeocodeView.as_view(), name="address-geocode"),
+    path("reverse/", views.ReverseGeocodeView.as_view(), name="address-reverse-geocode"),
+]
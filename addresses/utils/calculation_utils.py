@@ -34,10 +34,24 @@ def calculate_eta(distance_km, avg_speed_kmh=30):
     return int(minutes)
 
 
+def rank_drivers(candidates, max_drivers):
+    """
+    Order (driver_profile, distance_km) candidates by distance plus a penalty for a
+    low precomputed quality score (ratings/scoring.py), so a much better driver a
+    little further away is offered the order first.
+    """
+    weight_km = getattr(settings, "DRIVER_SCORE_WEIGHT_KM", 2.0)
+    ranked = sorted(candidates, key=lambda c: c[1] + (1.0 - c[0].quality_score) * weight_km)
+    return ranked[:max_drivers]
+
+
 def find_nearest_available_drivers(branch_location, max_drivers=3):
     """
-    Find nearest available drivers using expanding radius search
-    
+    Find the best available drivers near a branch using expanding radius search
+
+    The nearest DRIVER_CANDIDATE_MULTIPLIER * max_drivers drivers are fetched in one
+    query and ranked by distance and quality score (rank_drivers).
+
     :param branch_location: Point object of branch location
     :param max_drivers: Maximum number of drivers to return
     :return: List of (driver_profile, distance_km) tuples
@@ -47,44 +61,27 @@ def find_nearest_available_drivers(branch_location, max_drivers=3):
     )
     
     search_radiuses = settings.DRIVER_SEARCH_RADIUS_KM  # [5, 10, 15]
+    candidates = max_drivers * getattr(settings, "DRIVER_CANDIDATE_MULTIPLIER", 3)
 
-    print("Start search")
-    
-    # Try expanding radiuses
-    for radius in search_radiuses:
-        drivers = DriverLocation.objects.filter(
-            is_online=True,
-            last_updated__gte=stale_threshold,
-            driver__is_available=True,
-            driver__current_order__isnull=True,
-            location__distance_lte=(branch_location, D(km=radius))
-        ).select_related('driver', 'driver__user').annotate(
-            distance=Distance('location', branch_location)
-        ).order_by('distance')[:max_drivers]
-        
-        if drivers.exists():
-            return [
-                (d.driver, d.distance.km) 
-                for d in drivers
-            ]
-    
-    # If no drivers found in radiuses, get nearest overall
-    drivers = DriverLocation.objects.filter(
+    available = DriverLocation.objects.filter(
         is_online=True,
         last_updated__gte=stale_threshold,
         driver__is_available=True,
         driver__current_order__isnull=True,
     ).select_related('driver', 'driver__user').annotate(
         distance=Distance('location', branch_location)
-    ).order_by('distance')[:max_drivers]
+    ).order_by('distance')
 
-    drivers = list(drivers)
+    # Try expanding radiuses
+    for radius in search_radiuses:
+        drivers = list(available.filter(location__distance_lte=(branch_location, D(km=radius)))[:candidates])
+        if drivers:
+            return rank_drivers([(d.driver, d.distance.km) for d in drivers], max_drivers)
+    
+    # If no drivers found in radiuses, get nearest overall
+    drivers = list(available[:candidates])
     if drivers:
-    # if drivers.exists():
-        return [
-            (d.driver, d.distance.km)
-            for d in drivers
-        ]
+        return rank_drivers([(d.driver, d.distance.km) for d in drivers], max_drivers)
     
     return []
 
@@ -185,61 +182,45 @@ def validate_coordinates(lat, lng):
 
 def geocode_address(address_string):
     """
-    Convert address string to coordinates (optional - requires API key)
+    Convert address string to coordinates (cached, rate limited, see addresses.services.geocoding)
     
     :param address_string: Address to geocode
     :return: Point object or None
     """
-    from geopy.geocoders import Nominatim
-    
-    try:
-        geolocator = Nominatim(user_agent="ovena_delivery")
-        location = geolocator.geocode(address_string)
-        
-        if location:
-            return Point(location.longitude, location.latitude, srid=4326)
-    except Exception as e:
-        print(f"Geocoding error: {e}")
-    
-    return None
+    from addresses.services.geocoding import geocode
+    return geocode(address_string)
 
 
 def reverse_geocode_point(point):
     """
-    Convert coordinates to address string (optional - requires API key)
+    Convert coordinates to address string (cached, rate limited, see addresses.services.geocoding)
     
     :param point: Point object
     :return: Address string or None
     """
-    from geopy.geocoders import Nominatim
-    
-    try:
-        geolocator = Nominatim(user_agent="ovena_delivery")
-        location = geolocator.reverse(f"{point.y}, {point.x}")
-        
-        if location:
-            return location.address
-    except Exception as e:
-        print(f"Reverse geocoding error: {e}")
-    
-    return None
+    from addresses.services.geocoding import reverse_geocode
+    return reverse_geocode(point)
 
 
 # ===== HELPER FOR DELIVERY RADIUS VALIDATION =====
 
-def is_location_in_service_area(location, service_areas):
+def is_location_in_service_area(location, service_areas=None):
     """
     Check if location is within any service area polygon
     Useful for limiting delivery zones
     
     :param location: Point object
-    :param service_areas: List of Polygon objects
+    :param service_areas: List of Polygon objects, None to use the ServiceZone index
     :return: Boolean
     """
-    from django.contrib.gis.geos import Polygon
+    if service_areas is None:
+        from addresses.services.zones import find_zone_id
+        return find_zone_id(location) is not None
+
+    from django.contrib.gis.geos import Polygon, MultiPolygon
     
     for area in service_areas:
-        if isinstance(area, Polygon) and area.contains(location):
+        if isinstance(area, (Polygon, MultiPolygon)) and area.covers(location):
             return True
     
-    return False
\ No newline at end of file
+    return False
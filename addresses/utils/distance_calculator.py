@@ -1,7 +1,7 @@
 from django.contrib.gis.geos import Point
 import math
 from routing.service import get_distance_km
-from django.core.cache import cache
+from .route_cache import get_route_cache
 
 HOUR = 60 * 60
 
@@ -58,32 +58,33 @@ def haversine_distance_km(point1, point2):
     earth_radius_km = 6371
     return c * earth_radius_km
 
+def distance_km_from_coords(start:tuple, end:tuple):
+    """
+        start/end: (lon, lat)\n
+        Routing provider distance, haversine if every backend fails.
+    """
+    try:
+        return get_distance_km(start, end)
+    except Exception as _:
+        return haversine_distance_km(Point(*start, srid=4326), Point(*end, srid=4326))
+
+
 def get_distance_km_from_2points(user_point:Point, branch_point:Point):
     """
         user_point = user.customer_profile.default_address.location\n
         branch_point = branch.location
     """
-    lon1, lat1 = user_point.x, user_point.y
-    lon2, lat2 = branch_point.x, branch_point.y
-    try:
-        return get_distance_km((lon1, lat1), (lon2, lat2))
-    except Exception as _:
-        return haversine_distance_km(user_point, branch_point)
+    return distance_km_from_coords(
+        (user_point.x, user_point.y), (branch_point.x, branch_point.y)
+    )
 
 
 def get_cached_distance_km_from_2points(user_point:Point, branch_point:Point):
     """
         user_point = user.customer_profile.default_address.location\n
-        branch_point = branch.location
+        branch_point = branch.location\n
+        Endpoints are snapped to ROUTE_CACHE_MODE/ROUTE_CACHE_PRECISION cells, see route_cache.
     """
-    key = (
-        f"distance:"
-        f"{round(user_point.x, 6)}:{round(user_point.y, 6)}:"
-        f"{round(branch_point.x, 6)}:{round(branch_point.y, 6)}"
+    return get_route_cache().get_distance_km(
+        (user_point.x, user_point.y), (branch_point.x, branch_point.y)
     )
-    cached_distance = cache.get(key)
-    if cached_distance is not None:
-        return cached_distance
-    distance = get_distance_km_from_2points(user_point, branch_point)
-    cache.set(key, distance, timeout= HOUR* 1)
-    return distance
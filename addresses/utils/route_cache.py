@@ -0,0 +1,310 @@
+"""
+Spatially quantized, two-tier cache for routing distances.
+
+Endpoints are snapped to a grid cell (``ROUTE_CACHE_MODE = "grid"``, precision is
+the number of decimals kept) or a geohash cell (``"geohash"``, precision is the
+hash length) before the cache key is built, so customers a few meters apart
+share one entry. Lookups go:
+
+    in-process LRU  ->  shared cache (redis)  ->  routing provider
+
+The provider is always asked for the distance between the *cell centers*, so a
+cached value only depends on its key and can be refreshed from the key alone.
+Popular pairs that are close to expiring are refreshed by a celery task
+(``addresses.refresh_route_distance``) instead of falling off the cache.
+"""
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+
+from payments.observability.metrics import increment
+
+logger = logging.getLogger(__name__)
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+
+KEY_PREFIX = "routes:v2"
+GRID = "grid"
+GEOHASH = "geohash"
+
+_GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+# ===== QUANTIZATION =====
+
+def geohash_encode(lat, lon, precision):
+    lat_lo, lat_hi = -90.0, 90.0
+    lon_lo, lon_hi = -180.0, 180.0
+    chars = []
+    bits, bit_count, even = 0, 0, True
+
+    while len(chars) < precision:
+        if even:
+            mid = (lon_lo + lon_hi) / 2
+            if lon >= mid:
+                bits = (bits << 1) | 1
+                lon_lo = mid
+            else:
+                bits <<= 1
+                lon_hi = mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if lat >= mid:
+                bits = (bits << 1) | 1
+                lat_lo = mid
+            else:
+                bits <<= 1
+                lat_hi = mid
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_GEOHASH_ALPHABET[bits])
+            bits, bit_count = 0, 0
+
+    return "".join(chars)
+
+
+def geohash_center(geohash):
+    """Return (lat, lon) of the center of a geohash cell."""
+    lat_lo, lat_hi = -90.0, 90.0
+    lon_lo, lon_hi = -180.0, 180.0
+    even = True
+
+    for char in geohash:
+        value = _GEOHASH_ALPHABET.index(char)
+        for shift in range(4, -1, -1):
+            bit = (value >> shift) & 1
+            if even:
+                mid = (lon_lo + lon_hi) / 2
+                if bit:
+                    lon_lo = mid
+                else:
+                    lon_hi = mid
+            else:
+                mid = (lat_lo + lat_hi) / 2
+                if bit:
+                    lat_lo = mid
+                else:
+                    lat_hi = mid
+            even = not even
+
+    return (lat_lo + lat_hi) / 2, (lon_lo + lon_hi) / 2
+
+
+def quantize(lon, lat, mode=GRID, precision=3):
+    """
+    Snap a coordinate to its cell.
+    :return: (cell_id, (lon, lat) of the cell center)
+    """
+    if mode == GEOHASH:
+        cell = geohash_encode(lat, lon, precision)
+        c_lat, c_lon = geohash_center(cell)
+        return cell, (c_lon, c_lat)
+
+    step = 10 ** -precision
+    c_lon = round(round(lon / step) * step, precision)
+    c_lat = round(round(lat / step) * step, precision)
+    return f"{c_lon:.{precision}f},{c_lat:.{precision}f}", (c_lon, c_lat)
+
+
+def haversine_coords_km(start, end):
+    """start/end: (lon, lat)"""
+    lon1, lat1, lon2, lat2 = map(math.radians, [start[0], start[1], end[0], end[1]])
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * math.asin(math.sqrt(a)) * 6371
+
+
+# ===== LOCAL TIER =====
+
+class LocalLRU:
+    """Small thread-safe LRU with per-entry expiry, one per process."""
+
+    def __init__(self, maxsize=2048, ttl=5 * MINUTE):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+# ===== CACHE =====
+
+def _default_provider(start, end):
+    """start/end: (lon, lat) — same order as get_distance_km_from_2points."""
+    from .distance_calculator import distance_km_from_coords
+    return distance_km_from_coords(start, end)
+
+
+class RouteDistanceCache:
+    """
+    Entries in the shared tier look like:
+        {"km": 3.2, "start": [lon, lat], "end": [lon, lat], "refresh_at": <epoch>}
+
+    The local copy also carries "hits", this process's lookups since the
+    entry came due for refresh, so the LRU bounds the counters too.
+    """
+
+    def __init__(
+        self,
+        mode=None,
+        precision=None,
+        provider=None,
+        remote=cache,
+        local=None,
+        ttl=None,
+        refresh_ahead=None,
+        popular_hits=None,
+        schedule_refresh=True,
+    ):
+        self.mode = mode or getattr(settings, "ROUTE_CACHE_MODE", GRID)
+        self.precision = precision if precision is not None else getattr(settings, "ROUTE_CACHE_PRECISION", 3)
+        self.provider = provider or _default_provider
+        self.remote = remote
+        self.local = local if local is not None else LocalLRU(
+            maxsize=getattr(settings, "ROUTE_CACHE_LOCAL_MAXSIZE", 2048),
+            ttl=getattr(settings, "ROUTE_CACHE_LOCAL_TTL", 5 * MINUTE),
+        )
+        self.ttl = ttl or getattr(settings, "ROUTE_CACHE_TTL", 6 * HOUR)
+        self.refresh_ahead = refresh_ahead if refresh_ahead is not None else getattr(
+            settings, "ROUTE_CACHE_REFRESH_AHEAD", 15 * MINUTE
+        )
+        self.popular_hits = popular_hits or getattr(settings, "ROUTE_CACHE_POPULAR_HITS", 3)
+        self.schedule_refresh = schedule_refresh
+
+        self.stats = {"local_hit": 0, "remote_hit": 0, "miss": 0, "refresh_scheduled": 0}
+        self._hits_lock = threading.Lock()
+
+    # --- keys ---
+
+    def cell_key(self, start, end):
+        start_cell, start_center = quantize(start[0], start[1], self.mode, self.precision)
+        end_cell, end_center = quantize(end[0], end[1], self.mode, self.precision)
+        key = f"{KEY_PREFIX}:{self.mode}{self.precision}:{start_cell}:{end_cell}"
+        return key, start_center, end_center
+
+    # --- lookups ---
+
+    def get_distance_km(self, start, end):
+        """start/end: (lon, lat)"""
+        key, start_center, end_center = self.cell_key(start, end)
+
+        entry = self.local.get(key)
+        if entry is not None:
+            self._record("local_hit", "local", "hit")
+            self._maybe_refresh(key, entry)
+            return entry["km"]
+
+        if self.remote is not None:
+            entry = self.remote.get(key)
+            if entry is not None:
+                self._record("remote_hit", "redis", "hit")
+                self.local.set(key, entry)
+                self._maybe_refresh(key, entry)
+                return entry["km"]
+
+        self._record("miss", "provider", "miss")
+        entry = self.compute(key, start_center, end_center)
+        return entry["km"]
+
+    def compute(self, key, start_center, end_center):
+        """Ask the provider for the cell-center distance and store it in both tiers."""
+        entry = {
+            "km": self.provider(start_center, end_center),
+            "start": list(start_center),
+            "end": list(end_center),
+            "refresh_at": time.time() + self.ttl - self.refresh_ahead,
+        }
+        if self.remote is not None:
+            self.remote.set(key, entry, timeout=self.ttl)
+        self.local.set(key, entry)
+        return entry
+
+    def invalidate(self, key):
+        self.local.delete(key)
+        if self.remote is not None:
+            self.remote.delete(key)
+
+    # --- refresh-ahead ---
+
+    def _maybe_refresh(self, key, entry):
+        now = time.time()
+        if not self.schedule_refresh or now < entry.get("refresh_at", float("inf")):
+            return
+
+        with self._hits_lock:
+            hits = entry["hits"] = entry.get("hits", 0) + 1
+        if hits < self.popular_hits:
+            return
+
+        # push the local copy's refresh_at past the refresh window, so a stale
+        # local entry stops re-triggering while the new value is being computed
+        fresh = {k: v for k, v in entry.items() if k != "hits"}
+        self.local.set(key, {**fresh, "refresh_at": now + self.refresh_ahead})
+
+        # one refresh per key across all processes
+        if self.remote is not None and not self.remote.add(f"{key}:refreshing", 1, timeout=self.refresh_ahead):
+            return
+
+        from addresses.tasks import refresh_route_distance
+        try:
+            refresh_route_distance.delay(key, entry["start"], entry["end"])
+            self._record("refresh_scheduled", "provider", "refresh")
+        except Exception as exc:
+            logger.warning(f"[routing-cache] could not schedule refresh for {key}: {exc}")
+
+    def _record(self, stat, tier, result):
+        self.stats[stat] += 1
+        increment("routing.cache.lookup", tags={"tier": tier, "result": result})
+
+    def hit_rate(self):
+        hits = self.stats["local_hit"] + self.stats["remote_hit"]
+        total = hits + self.stats["miss"]
+        return (hits / total) if total else 0.0
+
+
+_route_cache = None
+_route_cache_lock = threading.Lock()
+
+
+def get_route_cache():
+    global _route_cache
+    if _route_cache is None:
+        with _route_cache_lock:
+            if _route_cache is None:
+                _route_cache = RouteDistanceCache()
+    return _route_cache
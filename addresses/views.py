@@ -0,0 +1,46 @@
+from rest_framework import serializers, status
+from rest_framework.response import Response
+
+from common.customer.view import BaseCustomerAPIView
+from .serializers import LocationGetSerializer, LocationMixin
+from .services.geocoding import geocode, reverse_geocode
+from .utils import make_point
+
+
+class GeocodeQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=255)
+
+
+class GeocodeView(BaseCustomerAPIView, LocationMixin):
+    """
+    GET /api/customer/address/geocode/?q=...
+    Address text -> coordinates. Served from cache when possible.
+    """
+    serializer_class = GeocodeQuerySerializer
+
+    def get(self, request):
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        point = geocode(serializer.validated_data["q"])
+        if point is None:
+            return Response({"detail": "Address not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response({"location": self.parse_point(point)})
+
+
+class ReverseGeocodeView(BaseCustomerAPIView):
+    """
+    GET /api/customer/address/reverse/?lat=..&long=..
+    Coordinates -> address text. Served from cache when possible.
+    """
+    serializer_class = LocationGetSerializer
+
+    def get(self, request):
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        vd = serializer.validated_data
+
+        address = reverse_geocode(make_point(vd["long"], vd["lat"]))
+        if address is None:
+            return Response({"detail": "Address not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response({"address": address})
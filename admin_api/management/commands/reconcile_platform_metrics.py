@@ -0,0 +1,32 @@
+"""
+Dashboard counter reconciliation for cron (same approach as image/storage_gc):
+
+    30 0 * * *  python manage.py reconcile_platform_metrics --snapshot --async
+"""
+from django.core.management.base import BaseCommand
+
+from admin_api.metrics import reconcile, take_snapshot
+
+
+class Command(BaseCommand):
+    help = "Recompute the admin dashboard counters from live queries, fix drift and optionally snapshot today."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--snapshot", action="store_true", help="Also write today's PlatformMetricSnapshot.")
+        parser.add_argument("--async", dest="run_async", action="store_true", help="Queue the celery task instead.")
+
+    def handle(self, *args, **options):
+        if options["run_async"]:
+            from admin_api.tasks import reconcile_platform_metrics
+
+            reconcile_platform_metrics.delay(snapshot=options["snapshot"])
+            self.stdout.write("Queued.")
+            return
+
+        corrected = reconcile()
+        for name, (was, value) in sorted(corrected.items()):
+            self.stdout.write(f"{name}: {was} -> {value}")
+        if options["snapshot"]:
+            snapshot = take_snapshot()
+            self.stdout.write(f"Snapshot {snapshot.date} written.")
+        self.stdout.write(self.style.SUCCESS(f"corrected={len(corrected)}"))
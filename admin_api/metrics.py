@@ -0,0 +1,248 @@
+"""
+Platform counters behind the admin dashboard.
+
+    read_counters()          -> {"users.total": n, ...}   one query over a few dozen rows
+    adjust_counters(deltas)  -> apply +/- deltas (signals call this after commit)
+    reconcile()              -> recompute every counter with live_counts() and fix drift
+    take_snapshot()          -> upsert today's PlatformMetricSnapshot
+
+Counters are kept current by admin_api/signals.py: every tracked model
+reports what it contributes (TRACKED below); on save/delete the difference
+between its old and new contribution is applied after commit. Each counter
+is split over COUNTER_SHARDS rows so concurrent signups / orders update
+different rows instead of queueing on one.
+
+Increments are post-commit and can be lost (a crash between commit and
+update, a queryset.update() on a tracked field). The nightly job
+(`python manage.py reconcile_platform_metrics --snapshot --async`) rewrites
+any counter that disagrees with live_counts(), which is the dashboard's
+original set of queries.
+"""
+import logging
+import random
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.utils import timezone
+
+from admin_api.models import PlatformCounter, PlatformMetricSnapshot
+from payments.observability.metrics import increment
+
+logger = logging.getLogger(__name__)
+
+COUNTER_SHARDS = 8
+
+PENDING_WITHDRAWAL_STATUSES = ("pending_batch", "processing")
+
+COUNTERS = (
+    "users.total",
+    "users.active",
+    "employees.drivers",
+    "employees.businesses",
+    "withdrawals.pending_or_processing_count",
+    "withdrawals.pending_or_processing_amount_kobo",
+    "drivers.pending_onboarding_submissions",
+    "drivers.pending_documents",
+    "orders.total",
+    "orders.delivered",
+    # no cheap per-row contribution; only refreshed by reconcile()
+    "referrals.eligible_users_for_payout",
+)
+
+
+# ===== TRUE VALUES (reconciliation + test oracle) =====
+
+def live_counts():
+    """The dashboard's original live queries. Slow on big tables: nightly job / tests only."""
+    from accounts.models import Business, DriverProfile, User
+    from accounts.models.driver import DriverDocument, DriverOnboardingSubmission
+    from menu.models import Order, OrderStatus
+    from payments.models import Withdrawal
+    from referrals.services import REFERRALS_PER_UNIT
+
+    user_stats = User.objects.aggregate(
+        total=Count("id"),
+        active=Count("id", filter=Q(is_active=True)),
+    )
+    pending_withdrawals = Withdrawal.objects.filter(status__in=PENDING_WITHDRAWAL_STATUSES).aggregate(
+        count=Count("id"),
+        amount=Sum("amount"),
+    )
+    order_stats = Order.objects.aggregate(
+        total=Count("id"),
+        delivered=Count("id", filter=Q(status=OrderStatus.DELIVERED)),
+    )
+    referral_eligible_users = (
+        User.objects.annotate(
+            unpaid=Count(
+                "profile_referrals_made",
+                filter=Q(
+                    profile_referrals_made__converted_at__isnull=False,
+                    profile_referrals_made__is_consumed=False,
+                ),
+            )
+        )
+        .filter(unpaid__gte=REFERRALS_PER_UNIT)
+        .count()
+    )
+
+    return {
+        "users.total": user_stats["total"],
+        "users.active": user_stats["active"],
+        "employees.drivers": DriverProfile.objects.count(),
+        "employees.businesses": Business.objects.count(),
+        "withdrawals.pending_or_processing_count": pending_withdrawals["count"],
+        "withdrawals.pending_or_processing_amount_kobo": pending_withdrawals["amount"] or 0,
+        "drivers.pending_onboarding_submissions": DriverOnboardingSubmission.objects.filter(
+            status=DriverOnboardingSubmission.STATUS_SUBMITTED
+        ).count(),
+        "drivers.pending_documents": DriverDocument.objects.filter(status=DriverDocument.STATUS_PENDING).count(),
+        "orders.total": order_stats["total"],
+        "orders.delivered": order_stats["delivered"],
+        "referrals.eligible_users_for_payout": referral_eligible_users,
+    }
+
+
+# ===== PER-ROW CONTRIBUTIONS =====
+
+def _user(user):
+    return {"users.total": 1, "users.active": int(bool(user.is_active))}
+
+
+def _withdrawal(withdrawal):
+    if withdrawal.status not in PENDING_WITHDRAWAL_STATUSES:
+        return {}
+    return {
+        "withdrawals.pending_or_processing_count": 1,
+        "withdrawals.pending_or_processing_amount_kobo": withdrawal.amount or 0,
+    }
+
+
+def _submission(submission):
+    return {"drivers.pending_onboarding_submissions": int(submission.status == submission.STATUS_SUBMITTED)}
+
+
+def _document(document):
+    return {"drivers.pending_documents": int(document.status == document.STATUS_PENDING)}
+
+
+def _order(order):
+    from menu.models import OrderStatus
+
+    return {"orders.total": 1, "orders.delivered": int(order.status == OrderStatus.DELIVERED)}
+
+
+# model label -> (fields the contribution reads, contribution)
+TRACKED = {
+    "accounts.User": (("is_active",), _user),
+    "accounts.DriverProfile": ((), lambda _: {"employees.drivers": 1}),
+    "accounts.Business": ((), lambda _: {"employees.businesses": 1}),
+    "accounts.DriverOnboardingSubmission": (("status",), _submission),
+    "accounts.DriverDocument": (("status",), _document),
+    "payments.Withdrawal": (("status", "amount"), _withdrawal),
+    "menu.Order": (("status",), _order),
+}
+
+
+def diff(old, new):
+    names = set(old) | set(new)
+    deltas = {name: new.get(name, 0) - old.get(name, 0) for name in names}
+    return {name: delta for name, delta in deltas.items() if delta}
+
+
+# ===== STORE =====
+
+def adjust_counters(deltas):
+    """
+    Add deltas to counters, one random shard each. Call after commit (or use
+    adjust_counters_on_commit) from code paths that bypass model signals,
+    e.g. queryset.update() or bulk_create() on a tracked model.
+    """
+    for name, delta in deltas.items():
+        if not delta:
+            continue
+        shard = random.randrange(COUNTER_SHARDS)
+        rows = PlatformCounter.objects.filter(name=name, shard=shard)
+        if not rows.update(value=F("value") + delta):
+            PlatformCounter.objects.get_or_create(name=name, shard=shard)
+            rows.update(value=F("value") + delta)
+
+
+def adjust_counters_on_commit(deltas):
+    if deltas:
+        transaction.on_commit(lambda: adjust_counters(deltas))
+
+
+def read_counters():
+    values = dict.fromkeys(COUNTERS, 0)
+    values.update(
+        PlatformCounter.objects.values("name").annotate(total=Sum("value")).values_list("name", "total")
+    )
+    return values
+
+
+def reconcile():
+    """
+    Rewrite counters that drifted from live_counts().
+    :return: {name: (counter value, true value)} for every corrected counter
+    """
+    corrected = {}
+    with transaction.atomic():
+        # lock every shard so increments landing meanwhile wait for the rewrite; count only
+        # after the lock, or increments committed in between would be overwritten by stale truth
+        list(PlatformCounter.objects.select_for_update().order_by("id").values_list("id", flat=True))
+        truth = live_counts()
+        current = read_counters()
+        for name, value in truth.items():
+            if current.get(name, 0) == value:
+                continue
+            corrected[name] = (current.get(name, 0), value)
+            PlatformCounter.objects.filter(name=name).delete()
+            PlatformCounter.objects.create(name=name, shard=0, value=value)
+
+    for name, (was, value) in corrected.items():
+        logger.warning(f"[platform-metrics] {name} drifted: counter={was} actual={value}")
+        increment("admin.platform_metrics.drift", value=abs(value - was), tags={"counter": name})
+    return corrected
+
+
+def take_snapshot(day=None):
+    day = day or timezone.localdate()
+    values = read_counters()
+    snapshot, _ = PlatformMetricSnapshot.objects.update_or_create(date=day, defaults={"values": values})
+    return snapshot
+
+
+# ===== RESPONSE SHAPE =====
+
+def format_dashboard(values):
+    """Nested payload of AdminDashboardStatsView from flat counter values."""
+    amount_kobo = values["withdrawals.pending_or_processing_amount_kobo"]
+    return {
+        "users": {
+            "total": values["users.total"],
+            "active": values["users.active"],
+            "inactive": values["users.total"] - values["users.active"],
+        },
+        "employees": {
+            "drivers": values["employees.drivers"],
+            "businesses": values["employees.businesses"],
+        },
+        "withdrawals": {
+            "pending_or_processing_count": values["withdrawals.pending_or_processing_count"],
+            "pending_or_processing_amount_kobo": amount_kobo,
+            "pending_or_processing_amount_ngn": Decimal(amount_kobo) / Decimal("100"),
+        },
+        "drivers": {
+            "pending_onboarding_submissions": values["drivers.pending_onboarding_submissions"],
+            "pending_documents": values["drivers.pending_documents"],
+        },
+        "orders": {
+            "total": values["orders.total"],
+            "delivered": values["orders.delivered"],
+        },
+        "referrals": {
+            "eligible_users_for_payout": values["referrals.eligible_users_for_payout"],
+        },
+    }
@@ -0,0 +1,37 @@
+# Generated by Django 5.1 on 2026-10-19 16:40
+
+from django.db import migrations
+
+
+def seed_platform_counters(apps, schema_editor):
+    """
+    Start the counters from the live values instead of zero, so the dashboard
+    is right (and decrements never go negative) before the first nightly
+    reconcile. live_counts() runs the dashboard's original queries.
+    """
+    from admin_api.metrics import live_counts
+
+    PlatformCounter = apps.get_model("admin_api", "PlatformCounter")
+    PlatformCounter.objects.all().delete()
+    PlatformCounter.objects.bulk_create(
+        [PlatformCounter(name=name, shard=0, value=value) for name, value in live_counts().items()]
+    )
+
+
+def clear_platform_counters(apps, schema_editor):
+    apps.get_model("admin_api", "PlatformCounter").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('admin_api', '0002_platformcounter_platformmetricsnapshot'),
+        ('accounts', '0071_driverprofile_quality_score'),
+        ('menu', '0031_order_service_zone'),
+        ('payments', '0017_paystackwebhooklog_queue'),
+        ('referrals', '0004_referralconversion_referralstats'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_platform_counters, reverse_code=clear_platform_counters),
+    ]
@@ -29,3 +29,32 @@ class AppAdmin(models.Model):
 # class OrderPaymentSettings():
 #     delivery_fee = models.IntegerField(default=0)
 #     service_fee_percent = models.FloatField(default=4)
+
+
+class PlatformCounter(models.Model):
+    """
+    One shard of a dashboard counter (admin_api.metrics). A counter's value
+    is the sum of its shards; writers pick a random shard so they don't
+    contend on one row.
+    """
+
+    name = models.CharField(max_length=100)
+    shard = models.PositiveSmallIntegerField(default=0)
+    value = models.BigIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["name", "shard"], name="uniq_platform_counter_shard"),
+        ]
+
+
+class PlatformMetricSnapshot(models.Model):
+    """Counter values as of one day, written by the nightly reconciliation job."""
+
+    date = models.DateField(unique=True)
+    values = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-date"]
@@ -4,7 +4,7 @@ from accounts.models import User
 from admin_api.models import AppAdmin
 from django.db import transaction
 from accounts.models import DriverProfile, Business
-from payments.models import Withdrawal
+from payments.models import PaystackWebhookLog, Withdrawal
 from accounts.serializers import InS
 
 # class UserInfoSerializer(serializers.Serializer):
@@ -252,6 +252,26 @@ class AdminWithdrawalMarkFailedSerializer(serializers.Serializer):
     reason = serializers.CharField()
 
 
+class AdminWebhookEventSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = PaystackWebhookLog
+        fields = [
+            "id",
+            "event_type",
+            "event_id",
+            "paystack_reference",
+            "payload",
+            "attempts",
+            "error_reason",
+            "received_at",
+            "dead_at",
+        ]
+
+
+class AdminWebhookRequeueSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False, max_length=500)
+
+
 class AdminSendNotificationSerializer(serializers.Serializer):
     # Either supply user_id (single user), or audience (broadcast segment).
     user_id = serializers.IntegerField(required=False)
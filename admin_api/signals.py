@@ -0,0 +1,43 @@
+from django.db.models.signals import post_delete, post_init, post_save
+
+from admin_api.metrics import TRACKED, adjust_counters_on_commit, diff
+
+
+def _contribution(instance):
+    fields, contribution = TRACKED[instance._meta.label]
+    if any(field not in instance.__dict__ for field in fields):
+        return None  # deferred field: reading it would cost a query per row
+    return contribution(instance)
+
+
+def _remember(sender, instance, **kwargs):
+    instance._platform_metrics = _contribution(instance)
+
+
+def _on_save(sender, instance, created=False, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    fields, _ = TRACKED[sender._meta.label]
+    if not created and update_fields is not None and not set(fields) & set(update_fields):
+        return
+
+    new = _contribution(instance)
+    old = {} if created else getattr(instance, "_platform_metrics", None)
+    instance._platform_metrics = new
+    if old is None or new is None:
+        return  # unknown before/after: left to the nightly reconcile
+    adjust_counters_on_commit(diff(old, new))
+
+
+def _on_delete(sender, instance, **kwargs):
+    old = getattr(instance, "_platform_metrics", None)
+    if old is None:
+        old = _contribution(instance)
+    if old:
+        adjust_counters_on_commit(diff(old, {}))
+
+
+for _label in TRACKED:
+    post_init.connect(_remember, sender=_label, weak=False)
+    post_save.connect(_on_save, sender=_label, weak=False)
+    post_delete.connect(_on_delete, sender=_label, weak=False)
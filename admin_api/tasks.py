@@ -1,10 +1,25 @@
-# from celery import shared_task
-# import logging
-# logger = logging.getLogger(__name__)
+from celery import shared_task
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="admin_api.reconcile_platform_metrics")
+def reconcile_platform_metrics(snapshot=True):
+    """Nightly: correct dashboard counter drift against the live counts, then snapshot the day."""
+    from admin_api.metrics import reconcile, take_snapshot
+
+    corrected = reconcile()
+    if corrected:
+        logger.info(f"[platform-metrics] corrected {len(corrected)} counters: {sorted(corrected)}")
+    if snapshot:
+        take_snapshot()
+    return len(corrected)
+
 
 # # we need for buisnesses there admins we need for drivers
 # # @shared_task(name='orders.check_if_buissness_passed_all_checks')
 # # def check_if_buissness_passed_all_checks(order_id):
 # #     ...
 
-# at the end if all is well set is_approved to true
\ No newline at end of file
+# at the end if all is well set is_approved to true
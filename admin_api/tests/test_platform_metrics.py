@@ -0,0 +1,129 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import DriverProfile, User
+from accounts.models.driver import DriverDocument
+from admin_api import metrics
+from admin_api.models import AppAdmin, PlatformCounter, PlatformMetricSnapshot
+from payments.models import Withdrawal
+
+
+def _make_user(n, **extra):
+    return User.objects.create(email=f"metrics{n}@example.com", name=f"Metrics {n}", **extra)
+
+
+def _withdrawal(user, amount, status):
+    return Withdrawal.objects.create(
+        user=user,
+        amount=amount,
+        status=status,
+        strategy=Withdrawal.STRATEGY_BATCH,
+        paystack_recipient_code="RCP",
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_counters_follow_writes_and_match_live_counts():
+    users = [_make_user(i) for i in range(4)]
+    users[3].is_active = False
+    users[3].save()
+
+    driver = DriverProfile.objects.create(user=users[0], first_name="Driver", last_name="One")
+    document = DriverDocument.objects.create(driver=driver, doc_type=DriverDocument.DOC_SELFIE, file="drivers/docs/x.jpg")
+
+    pending = _withdrawal(users[0], 15000, "pending_batch")
+    _withdrawal(users[0], 20000, "processing")
+    _withdrawal(users[0], 99999, "complete")
+    assert metrics.read_counters() == metrics.live_counts()
+
+    pending.status = "complete"
+    pending.save(update_fields=["status"])
+    document.status = DriverDocument.STATUS_APPROVED
+    document.save()
+    users[1].name = "Renamed"
+    users[1].save(update_fields=["name"])
+    # loaded from the DB rather than the instance the signal saw being created
+    reloaded = User.objects.get(pk=users[2].pk)
+    reloaded.is_active = False
+    reloaded.save()
+    users[3].delete()
+
+    values = metrics.read_counters()
+    assert values == metrics.live_counts()
+    assert values["users.total"] == 3
+    assert values["users.active"] == 2
+    assert values["withdrawals.pending_or_processing_amount_kobo"] == 20000
+    assert values["drivers.pending_documents"] == 0
+
+
+@pytest.mark.django_db
+def test_increments_only_apply_after_commit(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        _make_user(1)
+    assert metrics.read_counters()["users.total"] == 0
+
+    for callback in callbacks:
+        callback()
+    assert metrics.read_counters()["users.total"] == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_reconcile_corrects_drift_and_snapshots():
+    user = _make_user(1)
+    _withdrawal(user, 5000, "pending_batch")
+    # bypasses signals, like a raw queryset.update()
+    Withdrawal.objects.update(amount=7000)
+    User.objects.filter(pk=user.pk).update(is_active=False)
+    metrics.adjust_counters({"users.total": 3})
+
+    corrected = metrics.reconcile()
+
+    assert set(corrected) == {"users.total", "users.active", "withdrawals.pending_or_processing_amount_kobo"}
+    assert metrics.read_counters() == metrics.live_counts()
+    assert PlatformCounter.objects.filter(name="users.total").count() == 1
+    assert metrics.reconcile() == {}
+
+    snapshot = metrics.take_snapshot()
+    assert snapshot.date == timezone.localdate()
+    assert snapshot.values["withdrawals.pending_or_processing_amount_kobo"] == 7000
+    metrics.take_snapshot()
+    assert PlatformMetricSnapshot.objects.count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_reconcile_counts_under_the_shard_lock(monkeypatch):
+    _make_user(1)
+    metrics.adjust_counters({"users.total": 1})
+    live_counts = metrics.live_counts
+    locked_before_counting = []
+
+    with CaptureQueriesContext(connection) as queries:
+        def counting():
+            locked_before_counting.append(
+                connection.in_atomic_block and any("FOR UPDATE" in q["sql"] for q in queries.captured_queries)
+            )
+            return live_counts()
+
+        monkeypatch.setattr(metrics, "live_counts", counting)
+        metrics.reconcile()
+
+    assert locked_before_counting == [True]
+
+
+@pytest.mark.django_db
+def test_migration_seeds_counters_from_live_counts():
+    import importlib
+
+    from django.apps import apps
+
+    users = [_make_user(i) for i in range(3)]
+    _withdrawal(users[0], 5000, "processing")
+    PlatformCounter.objects.all().delete()  # as right after 0002, before any reconcile
+
+    seed = importlib.import_module("admin_api.migrations.0003_seed_platform_counters")
+    seed.seed_platform_counters(apps, None)
+
+    assert metrics.read_counters() == metrics.live_counts()
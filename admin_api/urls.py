@@ -19,6 +19,7 @@ urlpatterns = [
 
     # dashboard + stats
     path("dashboard/stats/", views.AdminDashboardStatsView.as_view(), name="admin-dashboard-stats"),
+    path("dashboard/history/", views.AdminDashboardHistoryView.as_view(), name="admin-dashboard-history"),
 
     # user management
     path("users/", views.AdminUserListView.as_view(), name="admin-users"),
@@ -39,9 +40,15 @@ urlpatterns = [
     path("withdrawals/batch/execute/", views.AdminWithdrawalBatchExecuteView.as_view(), name="admin-withdrawals-batch-execute"),
     path("withdrawals/reconcile/", views.AdminWithdrawalReconcileView.as_view(), name="admin-withdrawals-reconcile"),
 
+    # paystack webhook dead letters
+    path("webhooks/dead/", views.AdminWebhookDeadLetterListView.as_view(), name="admin-webhooks-dead"),
+    path("webhooks/requeue/", views.AdminWebhookRequeueView.as_view(), name="admin-webhooks-requeue"),
+
     # notifications
     path("notifications/", views.AdminNotificationListView.as_view(), name="admin-notifications"),
     path("notifications/send/", views.AdminSendNotificationView.as_view(), name="admin-notifications-send"),
+    path("notifications/broadcasts/", views.AdminBroadcastCampaignListView.as_view(), name="admin-notifications-broadcasts"),
+    path("notifications/broadcasts/<int:campaign_id>/", views.AdminBroadcastCampaignDetailView.as_view(), name="admin-notifications-broadcast-detail"),
 
     # banks
     path("banks/sync/", pay_views.SyncBanks.as_view(), name="list-banks"),
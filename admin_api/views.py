@@ -1,4 +1,5 @@
-from admin_api.models import AppAdmin
+from admin_api.metrics import COUNTERS, format_dashboard, read_counters
+from admin_api.models import AppAdmin, PlatformMetricSnapshot
 from accounts.models import User, DriverProfile, Business
 from admin_api.serializers import (
     LoginResponseSerializer,
@@ -12,6 +13,8 @@ from admin_api.serializers import (
     AdminBusinessUpdateSerializer,
     AdminWithdrawalSerializer,
     AdminWithdrawalMarkFailedSerializer,
+    AdminWebhookEventSerializer,
+    AdminWebhookRequeueSerializer,
     AdminSendNotificationSerializer,
 )
 from rest_framework.response import Response
@@ -25,25 +28,27 @@ from rest_framework.exceptions import NotFound, PermissionDenied
 from referrals.models import ReferralPayout
 from referrals.serializers import ReferralPayoutSerializer
 from referrals.services import verify_snapshot_integrity
+from django.db import transaction
 from django.db.models import Sum, Count, Q, OuterRef, Subquery
 from django.utils import timezone
 
 from accounts.models.driver import DriverOnboardingSubmission, DriverDocument
 from accounts.views.account_views import LoginView
-from notifications.models import Notification
-from notifications.serializers import NotificationSerializer
-from notifications.services import create_notification, create_bulk_notifications
+from notifications.broadcast import start_broadcast
+from notifications.models import BroadcastCampaign, Notification
+from notifications.serializers import BroadcastCampaignSerializer, NotificationSerializer
+from notifications.services import create_notification
 
-from payments.models import Withdrawal
+from payments.models import PaystackWebhookLog, Withdrawal
 from payments.payouts.services import mark_withdrawal_paid, mark_withdrawal_failed
+from payments.webhooks.queue import requeue as requeue_webhooks
 from payments.payouts.tasks import (
     execute_batch_payouts,
     execute_realtime_withdrawal,
     retry_pending_withdrawals,
     reconcile_stale_processing_withdrawals,
 )
-from referrals.services import REFERRALS_PER_UNIT
-from decimal import Decimal
+from datetime import timedelta
 from rest_framework.pagination import LimitOffsetPagination
 from accounts.services.profiles import (
     PROFILE_APP_ADMIN,
@@ -230,76 +235,23 @@ class _AppAdminRoleGuardMixin:
 
 class AdminDashboardStatsView(BaseAppAdminAPIView):
     def get(self, request):
-        # --- USERS ---
-        user_stats = User.objects.aggregate(
-            total=Count("id"),
-            active=Count("id", filter=Q(is_active=True)),
-            inactive=Count("id", filter=Q(is_active=False)),
-        )
-
-        # --- EMPLOYEES ---
-        total_drivers = DriverProfile.objects.count()
-        total_businesses = Business.objects.count()
+        # incrementally maintained counters (admin_api.metrics): one query
+        # regardless of table sizes; metrics.live_counts() is the slow truth
+        return Response(format_dashboard(read_counters()))
 
-        # --- WITHDRAWALS ---
-        pending_withdrawals_qs = Withdrawal.objects.filter(
-            status__in=["pending_batch", "processing"]
-        )
 
-        pending_withdrawals = pending_withdrawals_qs.count()
-        pending_withdrawals_amount = pending_withdrawals_qs.aggregate(
-            total=Sum("amount")
-        )["total"] or Decimal("0")
-
-        # --- DRIVERS ---
-        pending_driver_submissions = DriverOnboardingSubmission.objects.filter(
-            status=DriverOnboardingSubmission.STATUS_SUBMITTED
-        ).count()
-
-        pending_driver_documents = DriverDocument.objects.filter(
-            status=DriverDocument.STATUS_PENDING
-        ).count()
-
-        # --- REFERRALS ---
-        referral_eligible_users = (
-            User.objects.annotate(
-                unpaid=Count(
-                    "profile_referrals_made",
-                    filter=Q(
-                        profile_referrals_made__converted_at__isnull=False,
-                        profile_referrals_made__is_consumed=False,
-                    ),
-                )
-            )
-            .filter(unpaid__gte=REFERRALS_PER_UNIT)
-            .count()
-        )
+class AdminDashboardHistoryView(BaseAppAdminAPIView):
+    """Daily counter snapshots for charts: ?days=30 (max 366), newest first."""
 
+    def get(self, request):
+        try:
+            days = min(max(int(request.query_params.get("days", 30)), 1), 366)
+        except ValueError:
+            days = 30
+        since = timezone.localdate() - timedelta(days=days - 1)
+        snapshots = PlatformMetricSnapshot.objects.filter(date__gte=since).values("date", "values")
         return Response(
-            {
-                "users": {
-                    "total": user_stats["total"],
-                    "active": user_stats["active"],
-                    "inactive": user_stats["inactive"],
-                },
-                "employees": {
-                    "drivers": total_drivers,
-                    "businesses": total_businesses,
-                },
-                "withdrawals": {
-                    "pending_or_processing_count": pending_withdrawals,
-                    "pending_or_processing_amount_kobo": pending_withdrawals_amount,
-                    "pending_or_processing_amount_ngn": pending_withdrawals_amount
-                    / Decimal("100"),
-                },
-                "drivers": {
-                    "pending_onboarding_submissions": pending_driver_submissions,
-                    "pending_documents": pending_driver_documents,
-                },
-                "referrals": {
-                    "eligible_users_for_payout": referral_eligible_users,
-                },
-            }
+            [{"date": row["date"], **format_dashboard({**dict.fromkeys(COUNTERS, 0), **row["values"]})} for row in snapshots]
         )
 
 
@@ -677,6 +629,35 @@ class AdminWithdrawalReconcileView(BaseAppAdminAPIView, _AppAdminRoleGuardMixin)
         return Response({"detail": "Reconciliation + retry queued"})
 
 
+class AdminWebhookDeadLetterListView(BaseAppAdminAPIView, ListAPIView):
+    """Paystack webhook events that exhausted their retries, newest first."""
+
+    serializer_class = AdminWebhookEventSerializer
+
+    def get_queryset(self):
+        qs = PaystackWebhookLog.objects.filter(dead_at__isnull=False, processed=False).order_by("-dead_at")
+
+        event_type = (self.request.query_params.get("event_type") or "").strip()
+        if event_type:
+            qs = qs.filter(event_type=event_type)
+
+        reference = (self.request.query_params.get("reference") or "").strip()
+        if reference:
+            qs = qs.filter(paystack_reference=reference)
+        return qs
+
+
+class AdminWebhookRequeueView(BaseAppAdminAPIView, _AppAdminRoleGuardMixin):
+    allowed_roles = {AppAdmin.Role.FINANCE, AppAdmin.Role.ADMIN}
+
+    def post(self, request):
+        self._require_app_admin_roles(request, self.allowed_roles)
+        serializer = AdminWebhookRequeueSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        count = requeue_webhooks(serializer.validated_data["ids"])
+        return Response({"detail": "Webhook events requeued", "requeued": count})
+
+
 class AdminNotificationListView(BaseAppAdminAPIView, ListAPIView):
     serializer_class = NotificationSerializer
 
@@ -736,28 +717,36 @@ class AdminSendNotificationView(BaseAppAdminAPIView, _AppAdminRoleGuardMixin):
                 }
             )
 
+        # fan-out runs in notifications.run_broadcast_campaign; poll the campaign for progress
         audience = vd.get("audience")
-        users_qs = User.objects.filter(is_active=True)
-        if audience == "customers":
-            users_qs = users_qs.filter(profile_bases__profile_type="customer")
-        elif audience == "drivers":
-            users_qs = users_qs.filter(profile_bases__profile_type="driver")
-        elif audience == "business_admins":
-            users_qs = users_qs.filter(business_admin__isnull=False)
-
-        users_qs = users_qs.distinct()
-        created = create_bulk_notifications(
-            users=list(users_qs),
-            title=title,
-            body=body,
-            notification_type=notification_type,
-            payload=payload,
-        )
+        with transaction.atomic():
+            campaign = start_broadcast(
+                audience=audience,
+                title=title,
+                body=body,
+                notification_type=notification_type,
+                payload=payload,
+                created_by=request.user,
+            )
 
         return Response(
             {
                 "detail": "Broadcast queued",
                 "audience": audience,
-                "created": len(created),
-            }
+                "campaign": BroadcastCampaignSerializer(campaign).data,
+            },
+            status=status.HTTP_202_ACCEPTED,
         )
+
+
+class AdminBroadcastCampaignListView(BaseAppAdminAPIView, ListAPIView):
+    serializer_class = BroadcastCampaignSerializer
+
+    def get_queryset(self):
+        return BroadcastCampaign.objects.order_by("-created_at")
+
+
+class AdminBroadcastCampaignDetailView(BaseAppAdminAPIView, RetrieveAPIView):
+    serializer_class = BroadcastCampaignSerializer
+    queryset = BroadcastCampaign.objects.all()
+    lookup_url_kwarg = "campaign_id"
@@ -32,4 +32,10 @@ websocket_urlpatterns = [
         r'ws/orders/(?P<order_id>\d+)/chat/$', 
         consumers.ChatConsumer.as_asgi()
     ),
+
+    # In-app notifications + unread badge (any signed-in user)
+    re_path(
+        r'ws/notifications/$', 
+        consumers.NotificationConsumer.as_asgi()
+    ),
 ]
@@ -9,6 +9,7 @@ urlpatterns = [
     path("referrals/", include("referrals.urls")),
     path("coupons/", include("coupons_discount.urls")),
     path("customer/", include("customer_api.urls")),
+    path("verify/", include("verification.urls")),
     path("", include("payments.urls")),
     # path("points/", include("points.urls")),
 ]
@@ -31,6 +31,7 @@ from authflow.features import ON_BANNER, ON_CAROUSEL
 from payments.idempotency import (
     IdempotencyConflictError,
     begin_idempotent_request,
+    release_idempotent_request,
     save_idempotent_response,
 )
 from payments.models import LedgerEntry, Withdrawal
@@ -48,6 +49,7 @@ from payments.payouts.tasks import process_withdrawal
 from menu.models import Order, OrderItem
 from ratings.models import BranchRating
 from common.phone.utils import get_phone_number
+from common.ratelimit import rate_limit
 from addresses.utils import checkset_location
 from image.views import ImageMixin
 from image.mixin import S3ImageManagedMixin, BuilkS3ImageManagedMixin
@@ -422,6 +424,7 @@ class BuisnessAdminUpdateView(SendVerifyView):
 class BuisnessAdminUpdateReceiverView(BaseBuisAdminAPIView):
     serializer_class = InS.RecieverSerializer
 
+    @rate_limit("otp_verify", key=lambda self, request, *args, **kwargs: f"user:{request.user.pk}")
     def post(self, request):
         user: User = request.user
         serializer = self.get_serializer(data=request.data)
@@ -495,8 +498,8 @@ class BuisnessUpdateView(BaseBuisAdminAPIView, ImageMixin, BuilkS3ImageManagedMi
             )
 
         try:
-            self.update_image_field(business, save_kwargs, False)
             with transaction.atomic():
+                self.update_image_field(business, save_kwargs, False)
                 serializer.save(**save_kwargs)
 
             return Response(
@@ -654,6 +657,7 @@ class RestaurantPaymentView(SendVerifyView):
 class RestaurantPaymentReceiverView(BaseBuisAdminAPIView):
     serializer_class = InS.RecieverSerializer
 
+    @rate_limit("otp_verify", key=lambda self, request, *args, **kwargs: f"user:{request.user.pk}")
     def post(self, request):
         user: User = request.user
         admin = user.business_admin
@@ -725,6 +729,7 @@ class BusinessWalletWithdrawalView(BaseBuisAdminAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        row = None
         try:
             row, has_response = begin_idempotent_request(
                 scope="business_withdrawal_request",
@@ -769,6 +774,7 @@ class BusinessWalletWithdrawalView(BaseBuisAdminAPIView):
         except IdempotencyConflictError as exc:
             return Response({"error": str(exc)}, status=status.HTTP_409_CONFLICT)
         except ValueError as exc:
+            release_idempotent_request(row)
             return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -1377,8 +1383,9 @@ class BuisnessCarouselManageView(BaseBuisAdminAPIView, ImageMixin, S3ImageManage
             sub = BusinessSubscription.objects.filter(business=business).first()
             if sub:
                 if not sub.banner_info:
-                    self.delete_image_field(sub, "carousel_image", False)
-                    sub.delete()
+                    with transaction.atomic():
+                        self.delete_image_field(sub, "carousel_image", False)
+                        sub.delete()
                 else:
                     self.delete_image_field(sub, "carousel_image")
             
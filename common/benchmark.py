@@ -0,0 +1,77 @@
+"""
+Shared scaffolding for the benchmark_* management commands.
+
+    with rolled_back():
+        ...create synthetic rows, time things...
+    self.stdout.write("Rolled back synthetic rows.")
+
+    _, timings, queries = sample(500, lambda: evaluate(user))
+    self.stdout.write(f"queries/call {queries:.1f}  {latency(timings, 95)}")
+
+Everything written inside rolled_back() is discarded on the way out, so the
+commands can be pointed at a real database. Blocks nest (savepoints), which
+lets a command time a legacy path and throw its writes away before timing
+the new one against the same rows.
+"""
+import statistics
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+
+class Rollback(Exception):
+    pass
+
+
+@contextmanager
+def rolled_back():
+    try:
+        with transaction.atomic():
+            yield
+            raise Rollback
+    except Rollback:
+        pass
+
+
+def sample(calls, fn, before=None):
+    """
+    Call fn() `calls` times, running before() ahead of each untimed.
+    Returns (last result, sorted timings in ms, mean queries per call).
+    """
+    result, timings, query_counts = None, [], []
+    for _ in range(calls):
+        if before is not None:
+            before()
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            result = fn()
+            timings.append((time.perf_counter() - started) * 1000)
+        query_counts.append(len(queries.captured_queries))
+    timings.sort()
+    return result, timings, statistics.mean(query_counts)
+
+
+def percentile(timings, pct):
+    """pct-th of sorted timings; the slowest one when there are too few samples to tell."""
+    if len(timings) < round(100 / (100 - pct)):
+        return timings[-1]
+    return timings[int(len(timings) * pct / 100) - 1]
+
+
+def latency(timings, pct):
+    return f"p50 {statistics.median(timings):.2f}ms  p{pct} {percentile(timings, pct):.2f}ms"
+
+
+def measure_memory(fn):
+    """Run fn() under tracemalloc; returns (result, seconds, peak python MiB)."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, time.perf_counter() - started, peak / 2 ** 20
@@ -1,40 +1,71 @@
 import logging
+from functools import lru_cache
+
+from common.utils.circuit import provider_guards
 from .providers import get_email_providers
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _cached_providers():
+    return get_email_providers()
+
+
 class EmailRouter:
     """
     Sends email using multiple providers with automatic failover.
+
+    Providers with an open circuit breaker or no free concurrency slot are
+    skipped. When every provider was skipped (none actually failed) the result
+    carries "deferred": True so the outbox retries later without counting an
+    attempt.
     """
 
-    def __init__(self):
-        self.backends = get_email_providers()
+    def __init__(self, backends=None):
+        self.backends = backends if backends is not None else _cached_providers()
 
     def send(self, message):
         last_exception = None
+        attempted = False
 
         for provider_name, backend in self.backends:
-            try:
-                sent_count = backend.send_messages([message])
+            breaker, slots = provider_guards(f"email:{provider_name}")
+            if not breaker.allow():
+                continue
 
-                if sent_count:
-                    logger.info(
-                        f"Email sent using {provider_name}"
+            with slots.acquire() as acquired:
+                if not acquired:
+                    continue
+                attempted = True
+                try:
+                    sent_count = backend.send_messages([message])
+                except Exception as exc:
+                    last_exception = exc
+                    breaker.record_failure()
+
+                    logger.exception(
+                        f"Email provider failed: {provider_name}"
                     )
+                    continue
 
-                    return {
-                        "success": True,
-                        "provider": provider_name,
-                    }
+            if sent_count:
+                breaker.record_success()
+                logger.info(
+                    f"Email sent using {provider_name}"
+                )
 
-            except Exception as exc:
-                last_exception = exc
+                return {
+                    "success": True,
+                    "provider": provider_name,
+                }
 
-                logger.exception(
-                    f"Email provider failed: {provider_name}"
-                )
+        if not attempted:
+            return {
+                "success": False,
+                "deferred": True,
+                "error": "All email providers are busy or circuit-open",
+            }
 
         return {
             "success": False,
@@ -42,14 +42,10 @@ def _brand_context() -> dict:
     }
 
 
-def send_templated_email(to, template_name: str, context: dict, from_email: str | None = None) -> dict:
+def build_templated_message(to, template_name: str, context: dict, from_email: str | None = None) -> EmailMessage:
     """
-    Build `template_name` with `context` (merged over brand defaults) and
-    send it through the EmailRouter (which handles multi-provider failover).
-
-    `to` can be a single address or a list of addresses.
-    Returns the dict from EmailRouter.send(): {"success": bool, ...}.
-    Raises EmailDeliveryError if all providers fail.
+    Build `template_name` with `context` (merged over brand defaults) into an
+    html EmailMessage. `to` can be a single address or a list of addresses.
     """
     full_context = {**_brand_context(), **context}
     subject, html_body = build_email(template_name, full_context)
@@ -63,6 +59,19 @@ def send_templated_email(to, template_name: str, context: dict, from_email: str
         from_email=from_email or getattr(settings, "DEFAULT_FROM_EMAIL", None),
     )
     message.content_subtype = "html"
+    return message
+
+
+def send_templated_email(to, template_name: str, context: dict, from_email: str | None = None) -> dict:
+    """
+    Build the message and send it through the EmailRouter (which handles
+    multi-provider failover) inside the calling request. Prefer
+    notifications.outbox.enqueue_email from request paths.
+
+    Returns the dict from EmailRouter.send(): {"success": bool, ...}.
+    Raises EmailDeliveryError if all providers fail.
+    """
+    message = build_templated_message(to, template_name, context, from_email)
 
     result = EmailRouter().send(message)
 
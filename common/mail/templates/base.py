@@ -5,7 +5,13 @@ Every concrete template (OTP, welcome, order thank-you, congrats, ...)
 builds a small chunk of `content_html` and passes it here. This file
 owns the layout: purple top bar, logo, white card, footer. Change the
 look once here and every email type picks it up.
+
+The shell only depends on branding, so it is rendered once per brand and
+cached as a (head, tail) pair; each email only concatenates its content.
 """
+from functools import lru_cache
+
+_CONTENT_SLOT = "\x00content\x00"
 
 
 def render_shell(
@@ -22,6 +28,25 @@ def render_shell(
     content_html: pre-built inner HTML (title, paragraphs, code block,
                   button, etc). Build it with helpers from `blocks.py`.
     """
+    head, tail = _compiled_shell(product_name, website_url, logo_url, support_email, accent_color)
+    return head + content_html + tail
+
+
+@lru_cache(maxsize=32)
+def _compiled_shell(product_name, website_url, logo_url, support_email, accent_color) -> tuple[str, str]:
+    html = _render_shell(product_name, website_url, _CONTENT_SLOT, logo_url, support_email, accent_color)
+    head, _, tail = html.partition(_CONTENT_SLOT)
+    return head, tail
+
+
+def _render_shell(
+    product_name: str,
+    website_url: str,
+    content_html: str,
+    logo_url: str = "",
+    support_email: str = "",
+    accent_color: str = "#6b4fbb",
+) -> str:
     logo_header = (
         f"<img alt='{product_name}' src='{logo_url}' width='55' height='55' "
         f"style='max-width:55px;height:auto;'>"
@@ -1,4 +1,4 @@
-import time
+import math
 import string
 import secrets
 import requests
@@ -8,9 +8,10 @@ from django.core.cache import cache
 from django.core.mail import EmailMultiAlternatives
 from django.utils import timezone
 from datetime import timedelta
-from common.mail.services import send_email, send_otp_email
+from common.mail.services import send_email
 # from common.mail.template import maling_temp
-from common.phone.services import send_regular_sms, OTP_EXPIRY_MINUTES, send_otp_sms, verify_otp
+from common.ratelimit import get_limiter
+from common.phone.services import OTP_EXPIRY_MINUTES, send_otp_sms, verify_otp
 from .exceptions import *
 
 # ─── Helpers ─────────────────────────────────────────────────────────────────
@@ -20,8 +21,8 @@ def _generate_code(length: int = 6) -> str:
 
 
 def _rate_limit_key(channel: str, identifier: str) -> str:
-    # e.g. otp_rate:email:user@example.com  |  otp_rate:phone:+2348012345678
-    return f"otp_rate:{channel}:{identifier}"
+    # e.g. email:user@example.com  |  phone:+2348012345678
+    return f"{channel}:{identifier}"
 
 
 def _lookup_key(code: str) -> str:
@@ -40,7 +41,7 @@ class OTPManager:
         otp_lookup:<code>  →  identifier (email / phone / user_id / etc.)
 
     Rate limiting is per-channel so a phone flood never affects email quota:
-        otp_rate:<channel>:<identifier>  →  [timestamp, ...]
+        ratelimit:otp_send:<channel>:<identifier>  →  ZSET of send times
 
     Usage
     -----
@@ -133,24 +134,14 @@ class OTPManager:
 
     @staticmethod
     def _enforce_rate_limit(channel: str, identifier: str) -> None:
-        now = int(time.time())
-        key = _rate_limit_key(channel, identifier)
-        window = settings.RATE_LIMIT_WINDOW
-        max_sends = settings.MAX_OTP_SENDS
-
-        attempts: list[int] = cache.get(key, [])
-        # Slide the window — drop timestamps older than the window
-        attempts = [t for t in attempts if now - t < window]
-
-        if len(attempts) >= max_sends:
+        # atomic sliding window (common/ratelimit): concurrent sends can't race past the limit
+        result = get_limiter("otp_send").hit(_rate_limit_key(channel, identifier))
+        if not result.allowed:
             raise OTPRateLimitError(
                 f"Too many OTP requests on channel '{channel}'. "
-                f"Try again in {window // 60} minutes."
+                f"Try again in {math.ceil(result.retry_after / 60)} minutes."
             )
 
-        attempts.append(now)
-        cache.set(key, attempts, timeout=window)
-
     # ── Code generation & storage ─────────────────────────────────────────────
 
     @staticmethod
@@ -185,21 +176,35 @@ class OTPManager:
 
     # ── Delivery ──────────────────────────────────────────────────────────────
 
+    # Both go through the outbox (notifications/outbox.py) on the OTP lane:
+    # the request only pays for an INSERT, provider latency and failover
+    # happen in the dispatcher.
+
     @staticmethod
     def _deliver_email(email: str, code: str) -> None:
+        from notifications.models import OutboxMessage
+        from notifications.outbox import enqueue_email
 
         try:
-            send_otp_email(email, code, round(settings.OTP_EXPIRY/60))
+            enqueue_email(
+                email,
+                "otp",
+                {"code": code, "minutes_valid": round(settings.OTP_EXPIRY/60)},
+                priority=OutboxMessage.PRIORITY_OTP,
+            )
         except Exception as exc:
-            raise OTPDeliveryError(f"Failed to send OTP email to {email}: {exc}") from exc
+            raise OTPDeliveryError(f"Failed to queue OTP email to {email}: {exc}") from exc
 
     @staticmethod
     def _deliver_sms(phone_number: str, code: str) -> None:
+        from notifications.models import OutboxMessage
+        from notifications.outbox import enqueue_sms
+
         sms = f"Your verification code is {code}. Valid for {OTP_EXPIRY_MINUTES} minutes."
         try:
-            send_regular_sms(phone_number, sms)
-        except requests.RequestException as exc:
-            raise OTPDeliveryError(f"Failed to send OTP SMS to {phone_number}: {exc}") from exc
+            enqueue_sms(phone_number, sms, priority=OutboxMessage.PRIORITY_OTP)
+        except Exception as exc:
+            raise OTPDeliveryError(f"Failed to queue OTP SMS to {phone_number}: {exc}") from exc
     
     # ── External Delivery ──────────────────────────────────────────────────────────────
     @staticmethod
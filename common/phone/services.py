@@ -30,6 +30,13 @@ def send_regular_sms(phone_number, sms):
     response.raise_for_status()
 
 
+def get_sms_providers():
+    """(name, send(phone_number, sms)) pairs, tried in order by the outbox."""
+    return [
+        ("termii", send_regular_sms),
+    ]
+
+
 def send_otp_sms(phone_number) -> str:
     url = f"{TERMII_BASE_URL}/api/sms/otp/send"
     payload = {
@@ -0,0 +1,33 @@
+from .decorators import rate_limit
+from .limiter import (
+    GCRALimiter,
+    RateLimitExceeded,
+    RateLimitResult,
+    SlidingWindowLimiter,
+    get_limiter,
+)
+from .throttles import (
+    CouponCheckThrottle,
+    LimiterThrottle,
+    LoginAccountThrottle,
+    LoginThrottle,
+    OTPSendThrottle,
+    OTPVerifyThrottle,
+    client_ip,
+)
+
+__all__ = [
+    "rate_limit",
+    "GCRALimiter",
+    "RateLimitExceeded",
+    "RateLimitResult",
+    "SlidingWindowLimiter",
+    "get_limiter",
+    "CouponCheckThrottle",
+    "LimiterThrottle",
+    "LoginAccountThrottle",
+    "LoginThrottle",
+    "OTPSendThrottle",
+    "OTPVerifyThrottle",
+    "client_ip",
+]
@@ -0,0 +1,24 @@
+import functools
+
+from .limiter import get_limiter
+
+
+def rate_limit(scope, key, message=None):
+    """
+    Limit calls of the wrapped function per `key(*args, **kwargs)`.
+
+        @rate_limit("otp_verify", key=lambda self, request, *a, **kw: client_ip(request))
+        def post(self, request): ...
+
+    Over the limit it raises RateLimitExceeded, which DRF turns into a 429
+    with Retry-After. A key of None skips limiting for that call.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            identifier = key(*args, **kwargs)
+            if identifier is not None:
+                get_limiter(scope).check(identifier, message=message)
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,217 @@
+"""
+Atomic rate limiters.
+
+    limiter = get_limiter("otp_send")           # configured in RATE_LIMITS
+    result = limiter.hit("email:ada@example.com")
+    if not result.allowed: ... result.retry_after seconds
+
+Two algorithms, each a single Lua script so check-and-record is one atomic
+step in redis (no read-modify-write race between processes). Both read the
+clock from redis TIME, so app servers with skewed clocks agree:
+
+    sliding_window  ZSET log of hit timestamps. Exactly `limit` hits in any
+                    `period`; costs one member per hit. Use for small limits
+                    where exactness matters (OTP sends).
+    gcra            Generic cell rate algorithm. One key holding the
+                    theoretical arrival time; allows a burst of `limit`, then
+                    one hit every period/limit. O(1) memory (login, coupons).
+
+Like addresses/services/geocoding.TokenBucket, without REDIS_URL (tests,
+local dev) or when redis errors, the same algorithms run in-process under a
+lock. That is exact within one process only; the in-process state keeps the
+LOCAL_MAX_KEYS most recently hit identifiers per limiter and forgets the rest.
+"""
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+
+import redis
+from django.conf import settings
+from rest_framework.exceptions import Throttled
+
+logger = logging.getLogger(__name__)
+
+KEY = "ratelimit:{}:{}"
+
+LOCAL_MAX_KEYS = 10_000  # in-process fallback: least recently hit identifiers are dropped past this
+
+# KEYS[1] log, ARGV: limit, window ms, unique suffix -> {allowed, remaining, retry ms}
+_SLIDING_WINDOW_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+local count = redis.call('ZCARD', KEYS[1])
+if count < limit then
+    redis.call('ZADD', KEYS[1], now, string.format('%d', now) .. ':' .. ARGV[3])
+    redis.call('PEXPIRE', KEYS[1], window)
+    return {1, limit - count - 1, 0}
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+return {0, 0, tonumber(oldest[2]) + window - now}
+"""
+
+# KEYS[1] theoretical arrival time, ARGV: emission interval ms, tolerance ms
+_GCRA_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local emission = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+local new_tat = tat + emission
+local allow_at = new_tat - tolerance
+if now < allow_at then
+    return {0, 0, allow_at - now}
+end
+redis.call('SET', KEYS[1], string.format('%d', new_tat), 'PX', math.max(math.ceil(new_tat - now), 1))
+return {1, math.floor((now - allow_at) / emission), 0}
+"""
+
+
+class RateLimitExceeded(Throttled):
+    """429 when raised from a DRF view; carries retry_after for other callers."""
+
+    def __init__(self, retry_after=None, detail=None):
+        self.retry_after = retry_after
+        super().__init__(wait=retry_after, detail=detail)
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    remaining: int
+    retry_after: float  # seconds; 0 when allowed
+
+
+class RateLimiter:
+    lua = None
+
+    def __init__(self, name, limit, period, client=None):
+        self.name = name
+        self.limit = int(limit)
+        self.period = float(period)
+        self._client = client
+        self._script = None
+        self._lock = threading.Lock()
+        self._local = OrderedDict()
+
+    def _get_client(self):
+        if self._client is None:
+            url = getattr(settings, "REDIS_URL", None)
+            if not url:
+                return None
+            self._client = redis.from_url(url)
+        return self._client
+
+    def key(self, identifier):
+        return KEY.format(self.name, identifier)
+
+    def hit(self, identifier):
+        """Record one hit for identifier if the limit allows it."""
+        client = self._get_client()
+        if client:
+            try:
+                if self._script is None:
+                    self._script = client.register_script(self.lua)
+                allowed, remaining, retry_ms = self._script(
+                    keys=[self.key(identifier)], args=self._script_args()
+                )
+                return RateLimitResult(bool(allowed), int(remaining), int(retry_ms) / 1000)
+            except redis.RedisError as exc:
+                logger.warning(f"[ratelimit] redis unavailable, limiting {self.name} in-process: {exc}")
+
+        key = self.key(identifier)
+        with self._lock:
+            result = self._hit_local(key, time.time() * 1000)
+            if key in self._local:
+                self._local.move_to_end(key)
+            while len(self._local) > LOCAL_MAX_KEYS:
+                self._local.popitem(last=False)
+            return result
+
+    def check(self, identifier, message=None):
+        """hit(), raising RateLimitExceeded when over the limit."""
+        result = self.hit(identifier)
+        if not result.allowed:
+            raise RateLimitExceeded(retry_after=result.retry_after, detail=message)
+        return result
+
+    def reset(self, identifier):
+        client = self._get_client()
+        if client:
+            try:
+                client.delete(self.key(identifier))
+            except redis.RedisError:
+                pass
+        with self._lock:
+            self._local.pop(self.key(identifier), None)
+
+    def _script_args(self):
+        raise NotImplementedError
+
+    def _hit_local(self, key, now):
+        raise NotImplementedError
+
+
+class SlidingWindowLimiter(RateLimiter):
+    lua = _SLIDING_WINDOW_LUA
+
+    def _script_args(self):
+        return [self.limit, int(self.period * 1000), uuid.uuid4().hex]
+
+    def _hit_local(self, key, now):
+        window = self.period * 1000
+        log = self._local.setdefault(key, deque())
+        while log and log[0] <= now - window:
+            log.popleft()
+        if len(log) < self.limit:
+            log.append(now)
+            return RateLimitResult(True, self.limit - len(log), 0)
+        return RateLimitResult(False, 0, (log[0] + window - now) / 1000)
+
+
+class GCRALimiter(RateLimiter):
+    lua = _GCRA_LUA
+
+    @property
+    def emission_ms(self):
+        return self.period * 1000 / self.limit
+
+    def _script_args(self):
+        # burst of `limit`: tolerance is one full period
+        return [self.emission_ms, self.emission_ms * self.limit]
+
+    def _hit_local(self, key, now):
+        emission = self.emission_ms
+        tat = max(self._local.get(key, now), now)
+        new_tat = tat + emission
+        allow_at = new_tat - emission * self.limit
+        if now < allow_at:
+            return RateLimitResult(False, 0, (allow_at - now) / 1000)
+        self._local[key] = new_tat
+        return RateLimitResult(True, int((now - allow_at) // emission), 0)
+
+
+ALGORITHMS = {
+    "sliding_window": SlidingWindowLimiter,
+    "gcra": GCRALimiter,
+}
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(scope):
+    """Process-wide limiter for a RATE_LIMITS scope: (algorithm, limit, period seconds)."""
+    with _limiters_lock:
+        if scope not in _limiters:
+            algorithm, limit, period = settings.RATE_LIMITS[scope]
+            _limiters[scope] = ALGORITHMS[algorithm](scope, limit, period)
+        return _limiters[scope]
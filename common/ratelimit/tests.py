@@ -0,0 +1,188 @@
+import threading
+
+import pytest
+import redis
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from common.ratelimit import (
+    CouponCheckThrottle,
+    GCRALimiter,
+    LoginAccountThrottle,
+    RateLimitExceeded,
+    SlidingWindowLimiter,
+    rate_limit,
+)
+from common.ratelimit import limiter as limiter_module
+
+
+def hammer(limiter, identifier, threads=50, hits_per_thread=4):
+    """Hit from many threads released at once; returns the number allowed."""
+    allowed = []
+    barrier = threading.Barrier(threads)
+
+    def worker():
+        barrier.wait()
+        for _ in range(hits_per_thread):
+            if limiter.hit(identifier).allowed:
+                allowed.append(1)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return len(allowed)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(limiter_module.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def scoped(monkeypatch):
+    """Register an in-process limiter under a RATE_LIMITS scope."""
+    def register(scope, limiter):
+        monkeypatch.setitem(limiter_module._limiters, scope, limiter)
+        return limiter
+    return register
+
+
+@pytest.mark.parametrize("cls", [SlidingWindowLimiter, GCRALimiter])
+def test_limits_are_exact_under_concurrency(cls):
+    limiter = cls("test", limit=25, period=60, client=False)
+
+    assert hammer(limiter, "ip:1") == 25
+    assert hammer(limiter, "ip:2", threads=10, hits_per_thread=1) == 10  # keys are independent
+
+
+@pytest.mark.parametrize("cls", [SlidingWindowLimiter, GCRALimiter])
+def test_redis_limits_are_exact_under_concurrency(cls, settings):
+    if not settings.REDIS_URL:
+        pytest.skip("REDIS_URL not configured")
+    client = redis.from_url(settings.REDIS_URL)
+    try:
+        client.ping()
+    except redis.RedisError:
+        pytest.skip("redis not reachable")
+
+    limiter = cls("test_concurrency", limit=25, period=60, client=client)
+    limiter.reset("ip:1")
+    try:
+        assert hammer(limiter, "ip:1") == 25
+    finally:
+        limiter.reset("ip:1")
+
+
+def test_sliding_window_frees_slots_as_hits_age_out(clock):
+    limiter = SlidingWindowLimiter("test", limit=2, period=60, client=False)
+
+    assert limiter.hit("k").remaining == 1
+    clock[0] += 30
+    assert limiter.hit("k").remaining == 0
+    blocked = limiter.hit("k")
+    assert not blocked.allowed and blocked.retry_after == pytest.approx(30)
+
+    clock[0] += 30  # first hit leaves the window
+    assert limiter.hit("k").allowed
+    assert not limiter.hit("k").allowed
+
+
+def test_gcra_allows_burst_then_spaces_hits(clock):
+    limiter = GCRALimiter("test", limit=3, period=30, client=False)  # one hit per 10s after a burst of 3
+
+    assert [limiter.hit("k").allowed for _ in range(4)] == [True, True, True, False]
+    assert limiter.hit("k").retry_after == pytest.approx(10)
+    clock[0] += 10
+    assert limiter.hit("k").allowed
+    assert not limiter.hit("k").allowed
+
+
+def test_decorator_raises_429_with_retry_after(scoped):
+    scoped("decorated", SlidingWindowLimiter("decorated", limit=1, period=60, client=False))
+
+    @rate_limit("decorated", key=lambda user_id: f"user:{user_id}")
+    def confirm(user_id):
+        return "ok"
+
+    assert confirm(1) == "ok"
+    with pytest.raises(RateLimitExceeded) as exc:
+        confirm(1)
+    assert exc.value.status_code == 429 and exc.value.wait == 60
+    assert confirm(2) == "ok"
+
+
+def test_coupon_throttle_only_counts_coupon_attempts(scoped):
+    scoped("coupon_check", GCRALimiter("coupon_check", limit=2, period=60, client=False))
+
+    class CouponView(APIView):
+        authentication_classes = []
+        permission_classes = []
+        throttle_classes = [CouponCheckThrottle]
+
+        def post(self, request):
+            return Response({"ok": True})
+
+    view = CouponView.as_view()
+    factory = APIRequestFactory()
+
+    statuses = [
+        view(factory.post("/", {"coupon_code": code}, format="json")).status_code
+        for code in ("A1", "B2", "C3")
+    ]
+    assert statuses == [200, 200, 429]
+    assert view(factory.post("/", {}, format="json")).status_code == 200  # no code, not limited
+
+    throttled = view(factory.post("/", {"coupon_code": "D4"}, format="json"))
+    assert int(throttled["Retry-After"]) == 30
+
+
+def test_login_account_throttle_keys_one_number_however_it_is_typed(scoped):
+    scoped("login_account", GCRALimiter("login_account", limit=2, period=60, client=False))
+
+    class LoginView(APIView):
+        authentication_classes = []
+        permission_classes = []
+        throttle_classes = [LoginAccountThrottle]
+
+        def post(self, request):
+            return Response({"ok": True})
+
+    view = LoginView.as_view()
+    factory = APIRequestFactory()
+
+    statuses = [
+        view(factory.post("/", {"phone_number": number}, format="json")).status_code
+        for number in ("+2348012345678", "08012345678", "234 801 234 5678")
+    ]
+    assert statuses == [200, 200, 429]
+    assert LoginAccountThrottle().normalize(" Not-A-Number ") == "not-a-number"
+
+
+def test_in_process_state_is_bounded(monkeypatch, clock):
+    monkeypatch.setattr(limiter_module, "LOCAL_MAX_KEYS", 3)
+    limiter = GCRALimiter("bounded", limit=1, period=60, client=False)
+
+    for n in range(5):
+        limiter.hit(f"ip:{n}")
+    limiter.hit("ip:2")  # most recently used survives the next eviction
+    limiter.hit("ip:5")
+
+    assert list(limiter._local) == [limiter.key(f"ip:{n}") for n in (4, 2, 5)]
+
+
+def test_otp_sends_share_the_limiter(scoped):
+    from common.otp.base import OTPManager
+    from common.otp.exceptions import OTPRateLimitError
+
+    scoped("otp_send", SlidingWindowLimiter("otp_send", limit=3, period=600, client=False))
+
+    for _ in range(3):
+        OTPManager._enforce_rate_limit("email", "ada@example.com")
+    with pytest.raises(OTPRateLimitError, match="Try again in 10 minutes"):
+        OTPManager._enforce_rate_limit("email", "ada@example.com")
+    OTPManager._enforce_rate_limit("phone", "+2348000000000")  # separate channel quota
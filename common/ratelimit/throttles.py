@@ -0,0 +1,98 @@
+"""
+DRF throttles backed by common.ratelimit limiters.
+
+    class LoginView(GenericAPIView):
+        throttle_classes = [LoginThrottle, LoginAccountThrottle]
+
+Unlike DRF's SimpleRateThrottle (cache read-modify-write of a timestamp
+list) the check and the record are one atomic redis call.
+"""
+from phonenumber_field.phonenumber import to_python
+from rest_framework.throttling import BaseThrottle
+
+from .limiter import get_limiter
+
+
+def client_ip(request):
+    """Same address DRF throttles key on (honours NUM_PROXIES)."""
+    return BaseThrottle().get_ident(request)
+
+
+class LimiterThrottle(BaseThrottle):
+    scope = None
+
+    def get_key(self, request, view):
+        """Identifier to limit on; None means this request is not limited."""
+        if request.user and request.user.is_authenticated:
+            return f"user:{request.user.pk}"
+        return f"ip:{self.get_ident(request)}"
+
+    def allow_request(self, request, view):
+        self._wait = None
+        key = self.get_key(request, view)
+        if key is None:
+            return True
+        result = get_limiter(self.scope).hit(key)
+        self._wait = result.retry_after
+        return result.allowed
+
+    def wait(self):
+        return self._wait
+
+
+class _BodyFieldThrottle(LimiterThrottle):
+    field = None
+
+    def normalize(self, value):
+        return value.strip().lower()
+
+    def get_key(self, request, view):
+        value = request.data.get(self.field) if hasattr(request.data, "get") else None
+        value = self.normalize(str(value or ""))
+        return f"{self.field}:{value}" if value else None
+
+
+class OTPSendThrottle(LimiterThrottle):
+    scope = "otp_send_ip"
+
+    def get_key(self, request, view):
+        return f"ip:{self.get_ident(request)}"
+
+
+class OTPVerifyThrottle(LimiterThrottle):
+    scope = "otp_verify"
+
+    def get_key(self, request, view):
+        # codes are guessed, not users: always per address
+        return f"ip:{self.get_ident(request)}"
+
+
+class LoginThrottle(LimiterThrottle):
+    scope = "login"
+
+    def get_key(self, request, view):
+        return f"ip:{self.get_ident(request)}"
+
+
+class LoginAccountThrottle(_BodyFieldThrottle):
+    """Per phone number, so a distributed guesser is still capped per account."""
+    scope = "login_account"
+    field = "phone_number"
+
+    def normalize(self, value):
+        # parsed like the login serializer's PhoneNumberField (PHONENUMBER_DEFAULT_REGION), so
+        # "08012345678" and "+234 801 234 5678" share one bucket; unparseable input keys as typed
+        number = to_python(value.strip())
+        if number is not None and number.is_valid():
+            return number.as_e164
+        return super().normalize(value)
+
+
+class CouponCheckThrottle(LimiterThrottle):
+    """Only requests that actually try a coupon code count."""
+    scope = "coupon_check"
+
+    def get_key(self, request, view):
+        if not (hasattr(request.data, "get") and request.data.get("coupon_code")):
+            return None
+        return super().get_key(request, view)
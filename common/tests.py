@@ -0,0 +1,45 @@
+import pytest
+from django.contrib.auth import get_user_model
+
+from common.benchmark import percentile, rolled_back, sample
+
+
+@pytest.mark.django_db
+def test_rolled_back_discards_writes_including_nested_blocks():
+    User = get_user_model()
+
+    with rolled_back():
+        User.objects.create_user(email="bench-outer@bench.invalid", password=None)
+        with rolled_back():
+            User.objects.create_user(email="bench-inner@bench.invalid", password=None)
+        assert list(User.objects.values_list("email", flat=True)) == ["bench-outer@bench.invalid"]
+
+    assert not User.objects.exists()
+
+
+@pytest.mark.django_db
+def test_rolled_back_lets_real_errors_through():
+    with pytest.raises(ZeroDivisionError):
+        with rolled_back():
+            1 / 0
+
+
+def test_percentile_falls_back_to_the_slowest_sample_when_too_few():
+    timings = [float(i) for i in range(1, 101)]
+
+    assert percentile(timings, 99) == 99.0
+    assert percentile(timings, 95) == 95.0
+    assert percentile(timings[:19], 95) == 19.0
+
+
+@pytest.mark.django_db
+def test_sample_counts_queries_per_call_and_runs_before_untimed():
+    User = get_user_model()
+    seen = []
+
+    result, timings, queries = sample(5, lambda: User.objects.count(), before=lambda: seen.append(1))
+
+    assert result == 0
+    assert len(timings) == 5 and timings == sorted(timings)
+    assert queries == 1
+    assert len(seen) == 5
@@ -0,0 +1,113 @@
+"""
+Cross-worker circuit breaker and concurrency limit for outbound providers.
+
+State lives in the Django cache (redis in production) so every web and celery
+process sees the same breaker:
+
+    breaker:<name>:failures   consecutive-ish failures, expires after `window`
+    breaker:<name>:open       present while open (expires after `reset_timeout`)
+    breaker:<name>:tripped    set while open or half-open, cleared on success
+    breaker:<name>:probe      the single caller allowed through while half-open
+
+    slots:<name>              calls in flight (expires so a crashed worker's
+                              slot is not leaked forever)
+"""
+import logging
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    def __init__(self, name, failure_threshold=None, reset_timeout=None, window=None):
+        self.name = name
+        self.failure_threshold = failure_threshold or getattr(settings, "PROVIDER_BREAKER_THRESHOLD", 5)
+        self.reset_timeout = reset_timeout or getattr(settings, "PROVIDER_BREAKER_RESET_SECONDS", 60)
+        self.window = window or self.reset_timeout
+
+    def _key(self, part):
+        return f"breaker:{self.name}:{part}"
+
+    def allow(self):
+        """False while open; once open expires, lets exactly one probe through."""
+        if cache.get(self._key("open")):
+            return False
+        if not cache.get(self._key("tripped")):
+            return True
+        return cache.add(self._key("probe"), 1, timeout=self.reset_timeout)
+
+    def record_success(self):
+        if cache.get(self._key("tripped")):
+            logger.info(f"[breaker] {self.name} closed")
+        cache.delete_many([self._key("failures"), self._key("tripped"), self._key("probe")])
+
+    def record_failure(self):
+        if cache.get(self._key("tripped")):
+            self._open()  # failed probe
+            return
+        cache.add(self._key("failures"), 0, timeout=self.window)
+        try:
+            failures = cache.incr(self._key("failures"))
+        except ValueError:
+            failures = 1
+        if failures >= self.failure_threshold:
+            self._open()
+
+    def _open(self):
+        logger.warning(f"[breaker] {self.name} open for {self.reset_timeout}s")
+        cache.set(self._key("open"), 1, timeout=self.reset_timeout)
+        cache.set(self._key("tripped"), 1, timeout=None)
+        cache.delete_many([self._key("failures"), self._key("probe")])
+
+    @property
+    def is_open(self):
+        return bool(cache.get(self._key("open")))
+
+
+def provider_guards(name):
+    """
+    (breaker, concurrency limit) for one outbound provider, e.g. "email:resend"
+    or "sms:termii". Limits come from PROVIDER_CONCURRENCY, falling back to
+    its "default" entry.
+    """
+    limits = getattr(settings, "PROVIDER_CONCURRENCY", {})
+    return CircuitBreaker(name), ConcurrencyLimit(name, limits.get(name, limits.get("default", 10)))
+
+
+class ConcurrencyLimit:
+    def __init__(self, name, limit, ttl=300):
+        self.name = name
+        self.limit = limit
+        self.ttl = ttl
+
+    @property
+    def key(self):
+        return f"slots:{self.name}"
+
+    @contextmanager
+    def acquire(self):
+        """Yields True with a slot held, or False when `limit` calls are already in flight."""
+        cache.add(self.key, 0, timeout=self.ttl)
+        try:
+            in_flight = cache.incr(self.key)
+        except ValueError:  # expired between add and incr
+            cache.add(self.key, 1, timeout=self.ttl)
+            in_flight = 1
+
+        if in_flight > self.limit:
+            self._release()
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            self._release()
+
+    def _release(self):
+        try:
+            cache.decr(self.key)
+        except ValueError:
+            pass
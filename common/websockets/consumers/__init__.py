@@ -1,4 +1,5 @@
 from .branch import BranchConsumer
 from .chat import ChatConsumer
 from .customer import OrderConsumer
-from .driver import DriverLocationConsumer, DriverOrdersConsumer
\ No newline at end of file
+from .driver import DriverLocationConsumer, DriverOrdersConsumer
+from .notifications import NotificationConsumer
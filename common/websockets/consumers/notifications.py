@@ -0,0 +1,106 @@
+import json
+import logging
+
+from channels.db import database_sync_to_async
+from notifications.models import BroadcastCampaign
+from notifications.realtime import (
+    get_audience_notifications_group_name,
+    get_user_notifications_group_name,
+)
+from notifications.unread import get_unread_counter
+from .base import BaseConsumer, CLOSE_UNAUTHENTICATED
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationConsumer(BaseConsumer):
+    """
+    WebSocket consumer for the in-app notification inbox
+    Pushes new notifications and badge counts to every signed-in user
+    """
+
+    async def connect_func(self):
+        self.user = self.scope["user"]
+        if not self.user or self.user.is_anonymous:
+            await self.close(code=CLOSE_UNAUTHENTICATED)
+            return
+
+        self.notification_groups = [get_user_notifications_group_name(self.user.id)]
+        self.notification_groups += [
+            get_audience_notifications_group_name(audience)
+            for audience in await self.get_audiences()
+        ]
+        for group_name in self.notification_groups:
+            await self.channel_layer.group_add(group_name, self.channel_name)
+
+        await self.accept()
+
+        # Badge count on connect, so reconnecting clients catch up on missed pushes
+        await self.send(text_data=json.dumps({
+            'type': 'notification.unread',
+            'unread_count': await self.get_unread_count(),
+        }))
+        return True
+
+    async def disconnect_func(self, close_code):
+        for group_name in getattr(self, "notification_groups", []):
+            await self.channel_layer.group_discard(group_name, self.channel_name)
+
+    async def receive_func(self, message_type, data):
+        if message_type == 'request_unread_count':
+            await self.send(text_data=json.dumps({
+                'type': 'notification.unread',
+                'unread_count': await self.get_unread_count(),
+            }))
+
+    # Handler for a notification created for this user
+    async def notification_new(self, event):
+        await self._send_json({
+            'type': 'notification.new',
+            'data': event['data'],
+            'unread_count': event.get('unread_count'),
+        })
+
+    # Handler for badge changes (mark read / mark all read)
+    async def notification_unread(self, event):
+        await self._send_json({
+            'type': 'notification.unread',
+            'unread_count': event['unread_count'],
+        })
+
+    # Handler for admin broadcast campaigns
+    async def notification_broadcast(self, event):
+        await self._send_json({
+            'type': 'notification.broadcast',
+            'data': event['data'],
+        })
+
+    # Handler for a finished async verification check
+    async def verification_status(self, event):
+        await self._send_json({
+            'type': 'verification.status',
+            'job_id': event['job_id'],
+            'check': event['check'],
+            'status': event['status'],
+        })
+
+    @database_sync_to_async
+    def get_unread_count(self):
+        return get_unread_counter().get(self.user.id)
+
+    @database_sync_to_async
+    def get_audiences(self):
+        """Mirror of notifications.broadcast.audience_queryset, per user."""
+        from accounts.models import BusinessAdmin, ProfileBase
+
+        audiences = [BroadcastCampaign.AUDIENCE_ALL]
+        profile_types = set(
+            ProfileBase.objects.filter(user=self.user).values_list("profile_type", flat=True)
+        )
+        if ProfileBase.PROFILE_CUSTOMER in profile_types:
+            audiences.append(BroadcastCampaign.AUDIENCE_CUSTOMERS)
+        if ProfileBase.PROFILE_DRIVER in profile_types:
+            audiences.append(BroadcastCampaign.AUDIENCE_DRIVERS)
+        if BusinessAdmin.objects.filter(user=self.user).exists():
+            audiences.append(BroadcastCampaign.AUDIENCE_BUSINESS_ADMINS)
+        return audiences
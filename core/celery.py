@@ -1,8 +1,28 @@
 import os
 from celery import Celery
+from celery.signals import worker_init, worker_process_shutdown
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
 
 app = Celery("core")
 app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
+
+
+@worker_init.connect
+def start_metrics_exporter(**kwargs):
+    """Serve the pool's merged payments metrics from the worker's main process."""
+    from django.conf import settings
+
+    from payments.observability.exporter import clear_multiprocess_dir, start_worker_exporter
+
+    clear_multiprocess_dir()
+    if settings.ENABLE_METRICS and settings.WORKER_METRICS_PORT:
+        start_worker_exporter(settings.WORKER_METRICS_PORT)
+
+
+@worker_process_shutdown.connect
+def mark_metrics_process_dead(pid=None, **kwargs):
+    from payments.observability.exporter import mark_process_dead
+
+    mark_process_dead(pid or os.getpid())
@@ -79,6 +79,8 @@ LOCAL_APPS = [
     'admin_api',
     'customer_api',
     'points',
+    'image',
+    'verification',
 ]
 
 INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
@@ -223,10 +225,126 @@ ORS_API_KEY = env("ORS_API_KEY", default="")
 MAPBOX_ACCESS_TOKEN = env("MAPBOX_ACCESS_TOKEN", default="")
 GOOGLE_MAPS_API_KEY = env("GOOGLE_MAPS_API_KEY", default="")
 
+# Routing distance cache (addresses/utils/route_cache.py)
+# grid: precision = decimals kept (3 ~ 110m); geohash: precision = hash length (7 ~ 150m)
+ROUTE_CACHE_MODE = env("ROUTE_CACHE_MODE", default="grid")
+ROUTE_CACHE_PRECISION = env.int("ROUTE_CACHE_PRECISION", default=3)
+ROUTE_CACHE_TTL = 6 * HOUR
+ROUTE_CACHE_REFRESH_AHEAD = 15 * MINUTE
+ROUTE_CACHE_POPULAR_HITS = 3
+ROUTE_CACHE_LOCAL_MAXSIZE = 2048
+ROUTE_CACHE_LOCAL_TTL = 5 * MINUTE
+
+# Geocoding (addresses/services/geocoding.py)
+GEOCODING_BACKENDS = env.list("GEOCODING_BACKENDS", default=["nominatim", "addresses"])
+GEOCODING_RATE_PER_SEC = 1  # Nominatim usage policy, shared across all processes
+GEOCODING_BURST = 1
+GEOCODING_TIMEOUT = 5  # seconds
+GEOCODING_CACHE_TTL = 30 * DAY
+GEOCODING_REVERSE_PRECISION = 4  # ~11m
+GEOCODING_OFFLINE_RADIUS_M = 50
+
+# Service zones (addresses/services/zones.py)
+SERVICE_ZONES_ENFORCED = env.bool("SERVICE_ZONES_ENFORCED", default=False)  # reject orders outside every zone
+SERVICE_ZONE_IN_PROCESS_INDEX = True  # shapely STRtree, falls back to ST_Covers
+SERVICE_ZONE_INDEX_CHECK_SECONDS = 30
+
+# Image variants (image/pipeline.py)
+IMAGE_VARIANT_WIDTHS = (160, 320, 640, 1080)
+IMAGE_VARIANT_FORMAT = env("IMAGE_VARIANT_FORMAT", default="webp")  # or "avif" when Pillow supports it
+IMAGE_VARIANT_QUALITY = 80
+
+# Storage GC (image/gc.py)
+STORAGE_GC_MAX_ATTEMPTS = 5  # then the tombstone is dead-lettered
+STORAGE_GC_RETRY_BASE_SECONDS = MINUTE  # doubles per attempt
+STORAGE_GC_CLAIM_TIMEOUT = 15 * MINUTE  # lease on a claimed batch; expired leases come due again
+STORAGE_GC_SCAN_GRACE = DAY  # unattached presigned uploads younger than this are kept
+
+# Broadcast notifications (notifications/broadcast.py)
+BROADCAST_CHUNK_SIZE = 2000  # users per checkpointed insert
+BROADCAST_TASK_TIME_BUDGET = MINUTE  # then the task re-enqueues itself
+
+# Unread notification counters (notifications/unread.py)
+UNREAD_COUNTER_TTL = 7 * DAY  # idle users' counters expire and refill from the DB
+
+# Email / SMS outbox (notifications/outbox.py)
+OUTBOX_MAX_ATTEMPTS = 6  # then the message is dead-lettered
+OUTBOX_RETRY_BASE_SECONDS = 30  # doubles per attempt, capped at an hour
+OUTBOX_DEFER_SECONDS = 15  # every provider circuit-open or at its concurrency limit
+OUTBOX_CLAIM_TIMEOUT = 5 * MINUTE  # `sending` rows older than this are released
+OUTBOX_TASK_TIME_BUDGET = MINUTE
+OUTBOX_RETENTION = 7 * DAY
+OUTBOX_LANE_QUEUES = {}  # e.g. {0: "otp"} to give OTPs a dedicated celery queue/worker
+PROVIDER_CONCURRENCY = {"default": 10, "sms:termii": 5}  # in-flight calls per provider, all workers
+PROVIDER_BREAKER_THRESHOLD = 5  # failures within the window that open the breaker
+PROVIDER_BREAKER_RESET_SECONDS = MINUTE
+
+# Rate limits (common/ratelimit): scope -> (algorithm, limit, period seconds)
+RATE_LIMITS = {
+    "otp_send": ("sliding_window", MAX_OTP_SENDS, RATE_LIMIT_WINDOW),  # per channel + identifier
+    "otp_send_ip": ("gcra", 20, HOUR),
+    "otp_verify": ("gcra", 10, 10 * MINUTE),  # per ip, or per user when signed in
+    "login": ("gcra", 30, 10 * MINUTE),  # per ip
+    "login_account": ("sliding_window", 10, 15 * MINUTE),  # per phone number
+    "coupon_check": ("gcra", 30, 10 * MINUTE),
+    "paystack_api": ("gcra", 20, 1),  # outbound reconciliation and payout calls, shared by all workers
+}
+
+# Payout reconciliation (payments/reconciliation/engine.py)
+PAYSTACK_RECONCILE_CONCURRENCY = 8  # threads per reconciliation run
+PAYSTACK_RECONCILE_LIST_THRESHOLD = 50  # page through list-transfers from this many lookups up
+
+# Paystack webhook queue (payments/webhooks/queue.py)
+WEBHOOK_MAX_ATTEMPTS = 8  # then dead-lettered (admin_api webhooks/dead/)
+WEBHOOK_RETRY_BASE_SECONDS = 30  # doubles per attempt, capped at 6h
+WEBHOOK_CLAIM_TIMEOUT = 5 * MINUTE  # a claimed event is released after this
+WEBHOOK_TASK_TIME_BUDGET = MINUTE
+
+# Payout scheduler (payments/payouts/scheduler.py): pending batch withdrawals are
+# dispatched once the window reaches any of these
+PAYOUT_WINDOW_MAX_COUNT = 200
+PAYOUT_WINDOW_MAX_AMOUNT_KOBO = 1_000_000_000  # NGN 10m
+PAYOUT_WINDOW_MAX_AGE = 30 * MINUTE
+PAYSTACK_BULK_TRANSFER_LIMIT = 100  # transfers per bulk request
+PAYOUT_BATCH_MAX_AMOUNT_KOBO = 500_000_000  # per bulk request
+PAYOUT_LARGE_TRANSFER_KOBO = 50_000_000  # batched apart from smaller payouts
+PAYOUT_SUBMIT_CONCURRENCY = 4
+PAYOUT_NOT_FOUND_GRACE = HOUR  # a transfer Paystack still cannot find this long after submission never happened
+
+# Idempotency keys (payments/idempotency.py)
+IDEMPOTENCY_CLAIM_TTL = MINUTE  # an unfinished request's claim lapses after this
+IDEMPOTENCY_RESPONSE_TTL = 24 * HOUR  # replays served from redis; the DB row answers after
+
+# Rating aggregates (ratings/aggregates.py): deltas folded per transaction
+RATING_FOLD_BATCH_SIZE = 5000
+
+# Dispatch ranking (addresses/utils/calculation_utils.py): distance_km + (1 - quality_score) * weight
+DRIVER_SCORE_WEIGHT_KM = 2.0
+DRIVER_CANDIDATE_MULTIPLIER = 3  # nearest candidates fetched per driver offered
+
+# Referral conversions (referrals/conversions.py): candidates applied per transaction
+REFERRAL_CONVERSION_BATCH_SIZE = 1000
+
+# Coupon rule sets (coupons_discount/services/engine.py), cached per coupon version
+COUPON_RULES_TTL = 10 * MINUTE  # bounds staleness after edits that skip the save signal
+
+# Business detail menu payload (menu/services/menu_cache.py), cached per business / branch version
+MENU_PAYLOAD_TTL = HOUR  # bounds staleness for writes that skip the explicit invalidation (thumbnails, admin)
+
 # Verification
 DOJAH_APP_ID     = env("DOJAH_APP_ID", default="")
 DOJAH_SECRET_KEY = env("DOJAH_SECRET_KEY", default="")
 
+# KYC gateway (verification/gateway.py)
+DOJAH_CONNECT_TIMEOUT = 3   # seconds
+DOJAH_READ_TIMEOUT = 15     # seconds; the longest a provider call can hold a worker, per attempt
+DOJAH_MAX_RETRIES = 2       # timeouts, 429 and 5xx, with jittered backoff
+DOJAH_RETRY_BACKOFF = 0.25  # seconds, doubled per attempt
+DOJAH_POOL_SIZE = 10        # pooled connections per process
+VERIFICATION_CACHE_TTL = 7 * DAY  # encrypted lookup results, keyed by HMAC of the identifier
+VERIFICATION_CACHE_SECRET = env("VERIFICATION_CACHE_SECRET", default="")  # falls back to SECRET_KEY
+VERIFICATION_JOB_TTL = DAY  # async check status/results
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -261,6 +379,9 @@ WEBSOCKET_URL = env("WEBSOCKET_URL", default="ws://localhost:8000")
 
 # monitoring
 ENABLE_METRICS = env("ENABLE_METRICS", cast=bool, default=False)
+# Celery workers serve their metrics here (payments/observability/exporter.py);
+# set PROMETHEUS_MULTIPROC_DIR for gunicorn and the prefork pool.
+WORKER_METRICS_PORT = env("WORKER_METRICS_PORT", cast=int, default=9808)
 
 if ENABLE_METRICS:
     INSTALLED_APPS += ["django_prometheus"]
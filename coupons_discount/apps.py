@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class CouponsDiscountConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'coupons_discount'
+
+    def ready(self):
+        import coupons_discount.signals  # noqa
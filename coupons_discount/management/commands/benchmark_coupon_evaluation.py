@@ -0,0 +1,84 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from accounts.models import Branch, Business, CustomerProfile, User
+from common.benchmark import latency, rolled_back, sample
+from coupons_discount.models import Coupons, UserCouponWallet
+from coupons_discount.services import CouponService, engine
+from menu.models import BaseItem, Menu, MenuCategory, MenuItem, Order, OrderItem
+
+
+class Command(BaseCommand):
+    help = (
+        "Coupon validation against one order and best-coupon search over a full wallet: queries and "
+        "latency per evaluation, cold and warm rule cache. Everything is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--evaluations", type=int, default=500)
+        parser.add_argument("--wallet", type=int, default=50, help="reward coupons in the user's wallet")
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            self.run(options)
+        self.stdout.write("Rolled back synthetic coupons and order.")
+
+    def run(self, options):
+        now = timezone.now()
+        business = Business.objects.create(business_name="Bench coupons")
+        branch = Branch.objects.create(business=business, name="Bench branch")
+        category = MenuCategory.objects.create(menu=Menu.objects.create(business=business, name="Main"), name="Bench")
+        items = [
+            MenuItem.objects.create(
+                category=category,
+                base_item=BaseItem.objects.create(business=business, name=f"Bench {i}", default_price=10),
+                custom_name=f"Bench {i}",
+                price=10 + i,
+            )
+            for i in range(3)
+        ]
+        user = User.objects.create_user(email="bench-coupons@bench.invalid", password=None)
+        order = Order.objects.create(
+            orderer=CustomerProfile.objects.create(user=user), branch=branch, delivery_secret_hash="bench", status="pending"
+        )
+        OrderItem.objects.bulk_create(
+            [OrderItem(order=order, menu_item=item, price=item.price, quantity=2, line_total=item.price * 2) for item in items]
+        )
+
+        window = {"valid_from": now - timedelta(days=1), "valid_until": now + timedelta(days=1)}
+        coupon = Coupons.objects.create(
+            code="BENCH-BXGY", coupon_type="BxGy", scope="business", business=business,
+            buy_item=items[0], get_item=items[1], buy_amount=2, get_amount=1, max_uses=1000, max_uses_per_user=3, **window,
+        )
+        wallet = Coupons.objects.bulk_create(
+            [
+                Coupons(
+                    code=f"BENCH-W{i}", coupon_type="itemdiscount", item=items[i % 3], scope="global",
+                    discount_type="amount", discount_value=i % 7, is_reward=True, max_uses=10, **window,
+                )
+                for i in range(options["wallet"])
+            ]
+        )
+        UserCouponWallet.objects.bulk_create([UserCouponWallet(user=user, coupon=c) for c in wallet])
+
+        def validate():
+            return CouponService.is_valid_for(coupon, order)
+
+        self.measure("is_valid_for, cold cache", options["evaluations"], validate, cold=coupon)
+        self.measure("is_valid_for, warm cache", options["evaluations"], validate)
+        basket = engine.Basket.from_order(order)
+        self.measure(
+            f"best of {len(wallet)} wallet coupons, warm cache",
+            options["evaluations"],
+            lambda: engine.best_wallet_coupon(user.id, basket),
+        )
+
+    def measure(self, label, evaluations, evaluate, cold=None):
+        # as if the coupon had just been edited
+        before = (lambda: engine.bump_version(cold.pk)) if cold is not None else None
+        _, timings, queries = sample(evaluations, evaluate, before=before)
+        self.stdout.write(f"{label:<40} queries/eval {queries:.1f}  {latency(timings, 95)}")
+
+# Run with: python manage.py benchmark_coupon_evaluation --evaluations 500 --wallet 50
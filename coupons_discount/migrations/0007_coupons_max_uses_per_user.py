@@ -0,0 +1,18 @@
+# Generated by Django 5.1 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('coupons_discount', '0006_coupons_created_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='coupons',
+            name='max_uses_per_user',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -69,6 +69,8 @@ class Coupons(models.Model):
 
     max_uses = models.PositiveIntegerField(null=True, blank=True)
     uses_count = models.PositiveIntegerField(default=0)
+    # redemptions allowed per user (orders carrying this coupon); null = no limit
+    max_uses_per_user = models.PositiveIntegerField(null=True, blank=True)
 
     # False → marketing coupon (code-based, uses_count tracks redemptions)
     # True  → reward coupon  (wallet-based, uses_count tracks awards)
@@ -19,7 +19,7 @@ class CouponSerializer(serializers.ModelSerializer):
             "id", "code", "description",
             "coupon_type", "scope",
             "discount_type", "discount_value",
-            "max_uses", "uses_count",
+            "max_uses", "max_uses_per_user", "uses_count",
             "valid_from", "valid_until",
             "buy_amount", "get_amount",
             "buy_item", "get_item",
@@ -145,7 +145,7 @@ class CouponCreateUpdateSerializer(serializers.ModelSerializer):
         model = Coupons
         fields = [
             "id", "code", 
-            "description", "max_uses",
+            "description", "max_uses", "max_uses_per_user",
             "coupon_type", "category", "item",
             "buy_amount", "get_amount",
             "buy_item", "get_item",
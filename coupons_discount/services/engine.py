@@ -0,0 +1,324 @@
+"""
+Coupon evaluation as a rule table over cached rule sets.
+
+    rules  = rules_for_code("WELCOME")            # or load_rules([ids]); served from cache
+    facts  = load_facts(user_id, [rules.id])      # one query: live uses, the user's uses, wallet entry
+    basket = Basket.from_order(order)             # one query for the order's lines
+    evaluate(rules, facts[rules.id], basket)      -> Evaluation(ok, checks)
+    best_wallet_coupon(user_id, basket)           -> (rules, wallet_entry_id, discount) or None
+
+A coupon's rule set (type, scope, targets, window, limits, discount) only
+changes when someone edits the coupon, so it is cached as a frozen CouponRules
+under `coupon:rules:<id>:v<version>`. Saving or deleting a coupon bumps
+`coupon:version:<id>` (signals.py); COUPON_RULES_TTL bounds how long a
+queryset.update() that skips the signal can go unnoticed. uses_count is not
+part of the rule set: it moves with every redemption and is read live with
+the user's facts.
+
+A rule takes (rules, facts, basket, now) and returns whether that check
+passes, as in payments/eligibility/rules.py. The atomic claim in
+CouponService.apply_coupon_to_order stays the authority at redemption.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from coupons_discount.models import Coupons, UserCouponWallet
+from menu.models import Order, OrderStatus
+
+# orders that have used their coupon: paid for, in progress or completed. Unpaid,
+# cancelled and failed orders do not, so a failed payment never costs the user a use.
+REDEEMED_STATUSES = (
+    OrderStatus.PENDING, OrderStatus.CONFIRMED, OrderStatus.PREPARING, OrderStatus.READY,
+    OrderStatus.DRIVER_ASSIGNED, OrderStatus.PICKED_UP, OrderStatus.ON_THE_WAY, OrderStatus.DELIVERED,
+)
+# unpaid orders that still hold their coupon at the claim while their payment window is open
+AWAITING_PAYMENT_STATUSES = (OrderStatus.AWAITING_PAYMENT_METHOD, OrderStatus.PAYMENT_PENDING)
+
+RULES_KEY = "coupon:rules:{}:v{}"
+VERSION_KEY = "coupon:version:{}"
+CODE_KEY = "coupon:code:{}"
+
+RULE_FIELDS = (
+    "id", "code", "is_reward", "is_active", "valid_from", "valid_until", "max_uses", "max_uses_per_user",
+    "coupon_type", "scope", "business_id", "item_id", "category_id", "buy_item_id", "get_item_id",
+    "buy_amount", "get_amount", "discount_type", "discount_value",
+)
+
+
+@dataclass(frozen=True)
+class CouponRules:
+    id: int
+    code: str
+    is_reward: bool
+    is_active: bool
+    valid_from: datetime
+    valid_until: datetime | None
+    max_uses: int | None
+    max_uses_per_user: int | None
+    coupon_type: str
+    scope: str
+    business_id: int | None
+    item_id: int | None
+    category_id: int | None
+    buy_item_id: int | None
+    get_item_id: int | None
+    buy_amount: int
+    get_amount: int
+    discount_type: str
+    discount_value: Decimal
+
+
+@dataclass(frozen=True)
+class CouponFacts:
+    uses_count: int = 0
+    user_uses: int = 0
+    wallet_entry_id: int | None = None  # the user's oldest unused wallet entry for this coupon
+
+
+@dataclass(frozen=True)
+class BasketLine:
+    menu_item_id: int
+    category_id: int | None
+    quantity: int
+    price: Decimal
+
+
+@dataclass(frozen=True)
+class Basket:
+    business_id: int | None
+    lines: tuple[BasketLine, ...] = ()
+    delivery_fee: Decimal = Decimal("0")
+
+    @classmethod
+    def from_order(cls, order) -> "Basket":
+        rows = order.items.values_list("menu_item_id", "menu_item__category_id", "quantity", "price")
+        return cls(
+            business_id=order.branch.business_id,
+            lines=tuple(BasketLine(item, category, quantity, Decimal(price)) for item, category, quantity, price in rows),
+            delivery_fee=Decimal(order.delivery_price or 0),
+        )
+
+    def quantity_of(self, menu_item_id) -> int:
+        return sum(line.quantity for line in self.lines if line.menu_item_id == menu_item_id)
+
+
+@dataclass
+class Evaluation:
+    ok: bool
+    checks: dict
+
+
+# ===== RULE SETS =====
+
+def bump_version(coupon_id):
+    """Retire a coupon's cached rule set; the next read caches the new one."""
+    key = VERSION_KEY.format(coupon_id)
+    if cache.add(key, 2, timeout=None):
+        return
+    try:
+        cache.incr(key)
+    except ValueError:  # evicted between add() and incr()
+        cache.set(key, 2, timeout=None)
+
+
+def _cache_rows(rows, versions) -> dict[int, CouponRules]:
+    found, fresh = {}, {}
+    for row in rows:
+        rules = CouponRules(**{name: row[name] for name in RULE_FIELDS})
+        found[rules.id] = rules
+        fresh[RULES_KEY.format(rules.id, versions.get(VERSION_KEY.format(rules.id), 1))] = rules
+        fresh[CODE_KEY.format(rules.code)] = rules.id
+    if fresh:
+        cache.set_many(fresh, timeout=getattr(settings, "COUPON_RULES_TTL", 600))
+    return found
+
+
+def load_rules(coupon_ids) -> dict[int, CouponRules]:
+    """Rule sets by coupon id: two cache round trips, one query for whatever missed."""
+    coupon_ids = list(coupon_ids)
+    versions = cache.get_many([VERSION_KEY.format(pk) for pk in coupon_ids])
+    keys = {pk: RULES_KEY.format(pk, versions.get(VERSION_KEY.format(pk), 1)) for pk in coupon_ids}
+    cached = cache.get_many(list(keys.values()))
+    found = {pk: cached[key] for pk, key in keys.items() if key in cached}
+
+    missing = [pk for pk in coupon_ids if pk not in found]
+    if missing:
+        found.update(_cache_rows(Coupons.objects.filter(pk__in=missing).values(*RULE_FIELDS), versions))
+    return found
+
+
+def rules_for_code(code: str) -> CouponRules | None:
+    coupon_id = cache.get(CODE_KEY.format(code))
+    if coupon_id is not None:
+        rules = load_rules([coupon_id]).get(coupon_id)
+        if rules is not None and rules.code == code:
+            return rules
+    # unknown code, or the cached id has since been deleted or renamed
+    rows = list(Coupons.objects.filter(code=code).values(*RULE_FIELDS))
+    if not rows:
+        return None
+    versions = cache.get_many([VERSION_KEY.format(rows[0]["id"])])
+    return _cache_rows(rows, versions)[rows[0]["id"]]
+
+
+# ===== FACTS =====
+
+def _facts_queryset(user_id):
+    user_uses = (
+        Order.objects.filter(coupons=OuterRef("pk"), orderer__user_id=user_id, status__in=REDEEMED_STATUSES)
+        .order_by()
+        .values("coupons")
+        .annotate(n=Count("id"))
+        .values("n")
+    )
+    wallet_entry = (
+        UserCouponWallet.objects.filter(coupon=OuterRef("pk"), user_id=user_id, is_used=False)
+        .order_by("awarded_at", "id")
+        .values("id")[:1]
+    )
+    return Coupons.objects.annotate(
+        user_uses=Coalesce(Subquery(user_uses, output_field=IntegerField()), 0),
+        wallet_entry_id=Subquery(wallet_entry),
+    )
+
+
+def _facts(queryset) -> dict[int, CouponFacts]:
+    return {
+        pk: CouponFacts(uses_count=uses_count, user_uses=user_uses, wallet_entry_id=wallet_entry_id)
+        for pk, uses_count, user_uses, wallet_entry_id in queryset.values_list(
+            "pk", "uses_count", "user_uses", "wallet_entry_id"
+        )
+    }
+
+
+def load_facts(user_id, coupon_ids) -> dict[int, CouponFacts]:
+    """Live usage plus everything about this user, for any number of coupons, in one query."""
+    return _facts(_facts_queryset(user_id).filter(pk__in=list(coupon_ids)))
+
+
+# ===== RULES =====
+
+def active(rules, facts, basket, now):
+    return rules.is_active
+
+
+def in_window(rules, facts, basket, now):
+    return rules.valid_from <= now and (rules.valid_until is None or rules.valid_until >= now)
+
+
+def usage_limit(rules, facts, basket, now):
+    # reward coupons count awards, not redemptions: the wallet entry is the proof of award
+    return rules.is_reward or rules.max_uses is None or facts.uses_count < rules.max_uses
+
+
+def per_user_limit(rules, facts, basket, now):
+    return rules.max_uses_per_user is None or facts.user_uses < rules.max_uses_per_user
+
+
+def in_wallet(rules, facts, basket, now):
+    return not rules.is_reward or facts.wallet_entry_id is not None
+
+
+def business_scope(rules, facts, basket, now):
+    return rules.scope != "business" or basket.business_id == rules.business_id
+
+
+def target_in_basket(rules, facts, basket, now):
+    if rules.coupon_type == "itemdiscount":
+        return any(line.menu_item_id == rules.item_id for line in basket.lines)
+    if rules.coupon_type == "categorydiscount":
+        return any(line.category_id == rules.category_id for line in basket.lines)
+    if rules.coupon_type == "BxGy":
+        menu_items = {line.menu_item_id for line in basket.lines}
+        return bool(rules.buy_item_id and rules.get_item_id) and {rules.buy_item_id, rules.get_item_id} <= menu_items
+    return True
+
+
+RULES = {
+    "active": active,
+    "in_window": in_window,
+    "usage_limit": usage_limit,
+    "per_user_limit": per_user_limit,
+    "in_wallet": in_wallet,
+    "business_scope": business_scope,
+    "target_in_basket": target_in_basket,
+}
+
+
+def evaluate(rules: CouponRules, facts: CouponFacts, basket: Basket, now=None) -> Evaluation:
+    now = now or timezone.now()
+    checks = {name: rule(rules, facts, basket, now) for name, rule in RULES.items()}
+    return Evaluation(ok=all(checks.values()), checks=checks)
+
+
+# ===== DISCOUNT =====
+
+def _discount(rules, amount) -> Decimal:
+    # same arithmetic as CouponService.apply_discount
+    if rules.discount_type == "percent":
+        return Decimal(amount) * Decimal(rules.discount_value) / Decimal("100")
+    return min(Decimal(amount), Decimal(rules.discount_value))
+
+
+def estimate_discount(rules: CouponRules, basket: Basket) -> Decimal:
+    """What CouponService would take off this basket if the coupon were applied."""
+    if rules.coupon_type == "delivery":
+        return basket.delivery_fee
+    if rules.coupon_type in ("itemdiscount", "categorydiscount"):
+        matches = (
+            (lambda line: line.menu_item_id == rules.item_id)
+            if rules.coupon_type == "itemdiscount"
+            else (lambda line: line.category_id == rules.category_id)
+        )
+        return sum((_discount(rules, line.price) * line.quantity for line in basket.lines if matches(line)), Decimal("0"))
+    if rules.coupon_type == "BxGy" and rules.buy_amount:
+        bought = basket.quantity_of(rules.buy_item_id)
+        remaining = (bought // rules.buy_amount) * rules.get_amount
+        total = Decimal("0")
+        for line in basket.lines:
+            if line.menu_item_id == rules.get_item_id and remaining > 0:
+                free_here = min(line.quantity, remaining)
+                total += line.price * free_here
+                remaining -= free_here
+        return total
+    return Decimal("0")
+
+
+# ===== ENTRY POINTS =====
+
+def check(coupon_id, user_id, basket: Basket, now=None) -> Evaluation:
+    """One coupon against one basket: cached rules plus one facts query."""
+    rules = load_rules([coupon_id]).get(coupon_id)
+    facts = load_facts(user_id, [coupon_id]).get(coupon_id)
+    if rules is None or facts is None:
+        return Evaluation(ok=False, checks={"exists": False})
+    return evaluate(rules, facts, basket, now)
+
+
+def best_wallet_coupon(user_id, basket: Basket, now=None):
+    """
+    Evaluate every coupon in the user's wallet against the basket in one pass
+    (one query for the facts, rule sets from cache).
+    :return: (CouponRules, wallet_entry_id, discount) for the most valuable applicable coupon, or None
+    """
+    now = now or timezone.now()
+    # narrowed to the wallet first, so the per-coupon subqueries only run for the user's own coupons
+    in_wallet_ids = UserCouponWallet.objects.filter(user_id=user_id, is_used=False).values("coupon_id")
+    facts = _facts(_facts_queryset(user_id).filter(pk__in=in_wallet_ids))
+    best = None
+    for coupon_id, rules in load_rules(facts).items():
+        if not evaluate(rules, facts[coupon_id], basket, now).ok:
+            continue
+        discount = estimate_discount(rules, basket)
+        if best is None or discount > best[2]:
+            best = (rules, facts[coupon_id].wallet_entry_id, discount)
+    return best
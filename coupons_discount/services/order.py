@@ -1,10 +1,14 @@
+from datetime import timedelta
 from decimal import Decimal
+from django.conf import settings
 from django.db import transaction
 from django.db.models import F, Q, Sum
 from django.utils import timezone
 
+from accounts.models import User
 from coupons_discount.models import Coupons, UserCouponWallet
 from menu.models import Order, OrderItem
+from . import engine
 from .helper import eligible_coupon_q
 
 
@@ -34,47 +38,15 @@ class CouponService:
 
     @staticmethod
     def is_valid_for(coupon: Coupons, order: Order) -> bool:
-        """Check that the coupon can be applied to this specific order."""
-
-        # Confirm coupon is still eligible (time window + active).
-        # For reward coupons uses_count is not checked here — the wallet
-        # entry is the proof of award; the coupon just needs to still be valid.
-        qs = Coupons.objects.filter(pk=coupon.pk)
-        if coupon.is_reward:
-            # Only check time window + is_active, not uses_count cap.
-            now = timezone.now()
-            qs = qs.filter(
-                is_active=True,
-                valid_from__lte=now,
-            ).filter(
-                Q(valid_until__isnull=True) | Q(valid_until__gte=now)
-            )
-        else:
-            qs = qs.filter(eligible_coupon_q())
-
-        if not qs.exists():
-            return False
-
-        # Scope check.
-        if coupon.scope == "business" and order.branch.business_id != coupon.business_id:
-            return False
-
-        # Type-specific checks.
-        if coupon.coupon_type == "itemdiscount":
-            return order.items.filter(menu_item_id=coupon.item_id).exists()
-
-        if coupon.coupon_type == "categorydiscount":
-            return order.items.filter(menu_item__category_id=coupon.category_id).exists()
-
-        if coupon.coupon_type == "BxGy":
-            if not coupon.buy_item_id or not coupon.get_item_id:
-                return False
-            return (
-                order.items.filter(menu_item_id=coupon.buy_item_id).exists()
-                and order.items.filter(menu_item_id=coupon.get_item_id).exists()
-            )
+        """
+        Check that the coupon can be applied to this specific order.
 
-        return True
+        Runs the rule table in engine.py: the coupon's cached rule set, one
+        query for the order's lines and one for live usage and the orderer's
+        own facts (per-user uses, unused wallet entry). For reward coupons
+        uses_count is not checked — the wallet entry is the proof of award.
+        """
+        return engine.check(coupon.pk, order.orderer.user_id, engine.Basket.from_order(order)).ok
 
     # ------------------------------------------------------------------
     # Top-level entry points
@@ -104,6 +76,9 @@ class CouponService:
             return False
 
         with transaction.atomic():
+            if not CouponService._within_user_limit(coupon, order):
+                return False  # another order of this user took the last use meanwhile
+
             if coupon.is_reward:
                 # Mark the wallet entry as used (atomically, ensure not double-spent).
                 now = timezone.now()
@@ -127,11 +102,37 @@ class CouponService:
                     return False  # coupon exhausted between validation and now
 
             CouponService()._apply_order_level_discount(coupon, order)
-            order.coupon = coupon
-            order.save(update_fields=["coupon"])
+            order.coupons = coupon
+            order.save(update_fields=["coupons"])
 
         return True
 
+    @staticmethod
+    def _within_user_limit(coupon: Coupons, order: Order) -> bool:
+        """
+        max_uses_per_user at redemption; call inside the claim's transaction.
+        The orderer's user row is locked so two orders from one user serialise
+        here. Besides redeemed orders, the user's unpaid orders on this coupon
+        still inside PAYMENT_TIMEOUT count too: they may yet be paid.
+        """
+        if coupon.max_uses_per_user is None:
+            return True
+        user_id = order.orderer.user_id
+        list(User.objects.select_for_update().filter(pk=user_id).values_list("pk", flat=True))
+
+        payment_window = timezone.now() - timedelta(seconds=settings.PAYMENT_TIMEOUT)
+        used = (
+            Order.objects
+            .filter(coupons=coupon, orderer__user_id=user_id)
+            .filter(
+                Q(status__in=engine.REDEEMED_STATUSES)
+                | Q(status__in=engine.AWAITING_PAYMENT_STATUSES, created_at__gte=payment_window)
+            )
+            .exclude(pk=order.pk)
+            .count()
+        )
+        return used < coupon.max_uses_per_user
+
     # ------------------------------------------------------------------
     # Discount application
     # ------------------------------------------------------------------
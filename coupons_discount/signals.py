@@ -0,0 +1,17 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Coupons
+from .services.engine import bump_version
+
+# Edits retire the coupon's cached rule set (services/engine.py). The second bump
+# after commit stops a read racing the edit from re-caching the old row under
+# the new version.
+
+
+@receiver(post_save, sender=Coupons)
+@receiver(post_delete, sender=Coupons)
+def coupon_changed(sender, instance: Coupons, **kwargs):
+    bump_version(instance.pk)
+    transaction.on_commit(lambda: bump_version(instance.pk))
@@ -1,6 +1,8 @@
 from datetime import timedelta
+from decimal import Decimal
 
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
 from rest_framework.test import APIClient
 from django.urls import reverse
@@ -10,7 +12,9 @@ from accounts.models import CustomerProfile
 from menu.models import Menu, MenuCategory, MenuItem, BaseItem, Order, OrderItem
 from menu.services import CouponService
 
-from .models import Coupons, CouponWheel
+from .models import Coupons, CouponWheel, UserCouponWallet
+from .services import engine
+from .services.engine import Basket, BasketLine, CouponFacts, CouponRules
 from .serializers import CouponCreateUpdateSerializer, CouponSerializer, CouponWheelSetSerializer
 
 
@@ -236,3 +240,212 @@ def test_apply_bxgy_coupon_to_order(menu_items, Business_object):
     coupon.refresh_from_db()
     assert coupon.uses_count == 1
 
+
+
+# ---------------------------------------------------------------------------
+# Rule-table evaluation (services/engine.py)
+# ---------------------------------------------------------------------------
+
+
+def rules(**kwargs):
+    now = timezone.now()
+    defaults = {
+        "id": 1, "code": "RULES-001", "is_reward": False, "is_active": True,
+        "valid_from": now - timedelta(days=1), "valid_until": now + timedelta(days=1),
+        "max_uses": None, "max_uses_per_user": None,
+        "coupon_type": "delivery", "scope": "global", "business_id": None,
+        "item_id": None, "category_id": None, "buy_item_id": None, "get_item_id": None,
+        "buy_amount": 0, "get_amount": 0, "discount_type": "percent", "discount_value": Decimal("10"),
+    }
+    defaults.update(kwargs)
+    return CouponRules(**defaults)
+
+
+BASKET = Basket(
+    business_id=7,
+    lines=(BasketLine(menu_item_id=1, category_id=10, quantity=4, price=Decimal("10")),
+           BasketLine(menu_item_id=2, category_id=20, quantity=1, price=Decimal("6"))),
+    delivery_fee=Decimal("500"),
+)
+
+
+def failed(coupon_rules, facts=CouponFacts(), basket=BASKET):
+    return [name for name, ok in engine.evaluate(coupon_rules, facts, basket).checks.items() if not ok]
+
+
+@pytest.mark.parametrize(
+    "coupon_rules, facts, expected",
+    [
+        (rules(), CouponFacts(), []),
+        (rules(is_active=False), CouponFacts(), ["active"]),
+        (rules(valid_from=timezone.now() + timedelta(hours=1)), CouponFacts(), ["in_window"]),
+        (rules(valid_until=timezone.now() - timedelta(hours=1)), CouponFacts(), ["in_window"]),
+        (rules(valid_until=None), CouponFacts(), []),
+        (rules(max_uses=5), CouponFacts(uses_count=5), ["usage_limit"]),
+        (rules(max_uses=5, is_reward=True), CouponFacts(uses_count=5, wallet_entry_id=3), []),  # cap counts awards
+        (rules(max_uses_per_user=2), CouponFacts(user_uses=2), ["per_user_limit"]),
+        (rules(max_uses_per_user=2), CouponFacts(user_uses=1), []),
+        (rules(is_reward=True), CouponFacts(), ["in_wallet"]),
+        (rules(scope="business", business_id=8), CouponFacts(), ["business_scope"]),
+        (rules(scope="business", business_id=7), CouponFacts(), []),
+        (rules(coupon_type="itemdiscount", item_id=3), CouponFacts(), ["target_in_basket"]),
+        (rules(coupon_type="itemdiscount", item_id=2), CouponFacts(), []),
+        (rules(coupon_type="categorydiscount", category_id=30), CouponFacts(), ["target_in_basket"]),
+        (rules(coupon_type="categorydiscount", category_id=20), CouponFacts(), []),
+        (rules(coupon_type="BxGy", buy_item_id=1, get_item_id=3), CouponFacts(), ["target_in_basket"]),
+        (rules(coupon_type="BxGy", buy_item_id=1, get_item_id=None), CouponFacts(), ["target_in_basket"]),
+        (rules(coupon_type="BxGy", buy_item_id=1, get_item_id=2), CouponFacts(), []),
+    ],
+)
+def test_each_rule(coupon_rules, facts, expected):
+    assert failed(coupon_rules, facts) == expected
+
+
+def test_estimated_discount_matches_coupon_service_arithmetic():
+    assert engine.estimate_discount(rules(), BASKET) == Decimal("500")
+    assert engine.estimate_discount(rules(coupon_type="itemdiscount", item_id=1), BASKET) == Decimal("4")
+    assert engine.estimate_discount(
+        rules(coupon_type="categorydiscount", category_id=20, discount_type="amount", discount_value=Decimal("9")), BASKET
+    ) == Decimal("6")
+    # 4 bought in groups of 2 -> 2 free, but only 1 in the basket
+    assert engine.estimate_discount(
+        rules(coupon_type="BxGy", buy_item_id=1, get_item_id=2, buy_amount=2, get_amount=1), BASKET
+    ) == Decimal("6")
+
+
+@pytest.fixture
+def coupon_order(menu_items, Business_object):
+    cache.clear()
+    buy_item, get_item = menu_items
+    user = User.objects.create(email="engine@example.com", name="Engine")
+    order = Order.objects.create(
+        orderer=CustomerProfile.objects.create(user=user),
+        branch=Branch.objects.create(business=Business_object, name="Engine Branch"),
+        delivery_secret_hash="secret",
+        status="pending",
+        delivery_price=500,
+    )
+    OrderItem.objects.create(order=order, menu_item=buy_item, price=buy_item.price, quantity=2, line_total=buy_item.price * 2)
+    OrderItem.objects.create(order=order, menu_item=get_item, price=get_item.price, quantity=1, line_total=get_item.price)
+    yield order
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_validation_reads_rules_from_cache_and_facts_in_one_query(coupon_order, django_assert_num_queries):
+    coupon = create_coupon(code="ENGINE-001", coupon_type="itemdiscount", item=coupon_order.items.first().menu_item)
+    order = Order.objects.select_related("orderer", "branch").get(pk=coupon_order.pk)
+
+    assert CouponService.is_valid_for(coupon, order) is True  # warms the rule cache
+    with django_assert_num_queries(2):  # the order's lines, then usage and the user's facts
+        assert CouponService.is_valid_for(coupon, order) is True
+
+
+@pytest.mark.django_db
+def test_editing_a_coupon_retires_its_cached_rules(coupon_order):
+    coupon = create_coupon(code="ENGINE-002")
+    assert engine.rules_for_code("ENGINE-002").is_active is True
+
+    coupon.is_active = False
+    coupon.save()
+
+    assert engine.rules_for_code("ENGINE-002").is_active is False
+    assert CouponService.is_valid_for(coupon, coupon_order) is False
+
+
+@pytest.mark.django_db
+def test_per_user_limit_counts_the_users_own_orders(coupon_order):
+    coupon = create_coupon(code="ENGINE-003", max_uses_per_user=1)
+    assert CouponService.apply_coupon_to_order(coupon, coupon_order) is True
+
+    facts = engine.load_facts(coupon_order.orderer.user_id, [coupon.pk])[coupon.pk]
+    assert (facts.uses_count, facts.user_uses) == (1, 1)
+    assert CouponService.is_valid_for(coupon, coupon_order) is False
+
+
+@pytest.mark.django_db
+def test_best_wallet_coupon_picks_the_largest_applicable_discount(coupon_order, menu_items, django_assert_num_queries):
+    buy_item, get_item = menu_items
+    user = coupon_order.orderer.user
+    reward = {"is_reward": True, "max_uses": 10}
+    small = create_coupon(code="W-SMALL", coupon_type="itemdiscount", item=buy_item, discount_type="amount", discount_value=1, **reward)
+    large = create_coupon(code="W-LARGE", coupon_type="delivery", **reward)
+    expired = create_coupon(code="W-EXPIRED", valid_until=timezone.now() - timedelta(hours=1), **reward)
+    used = create_coupon(code="W-USED", coupon_type="delivery", discount_value=100, **reward)
+    create_coupon(code="W-NOT-MINE", coupon_type="delivery", **reward)
+    entries = {c.code: UserCouponWallet.objects.create(user=user, coupon=c) for c in (small, large, expired, used)}
+    UserCouponWallet.objects.filter(pk=entries["W-USED"].pk).update(is_used=True)
+
+    basket = Basket.from_order(coupon_order)
+    engine.best_wallet_coupon(user.id, basket)  # warms the rule cache
+    with django_assert_num_queries(1):
+        best_rules, wallet_entry_id, discount = engine.best_wallet_coupon(user.id, basket)
+
+    assert (best_rules.code, wallet_entry_id, discount) == ("W-LARGE", entries["W-LARGE"].pk, Decimal("500"))
+
+
+@pytest.mark.django_db
+def test_a_failed_payment_does_not_use_up_the_per_user_limit(coupon_order):
+    coupon = create_coupon(code="ENGINE-004", max_uses_per_user=1)
+    assert CouponService.apply_coupon_to_order(coupon, coupon_order) is True
+    Order.objects.filter(pk=coupon_order.pk).update(status="cancelled")
+
+    facts = engine.load_facts(coupon_order.orderer.user_id, [coupon.pk])[coupon.pk]
+    assert facts.user_uses == 0
+    retry = Order.objects.create(
+        orderer=coupon_order.orderer, branch=coupon_order.branch, delivery_secret_hash="retry",
+        status="payment_pending", delivery_price=500,
+    )
+    assert CouponService.apply_coupon_to_order(coupon, retry) is True
+
+
+@pytest.mark.django_db
+def test_an_unpaid_order_holds_its_use_at_the_claim(coupon_order):
+    coupon = create_coupon(code="ENGINE-005", max_uses_per_user=1)
+    Order.objects.filter(pk=coupon_order.pk).update(status="payment_pending")
+    coupon_order.refresh_from_db()
+    assert CouponService.apply_coupon_to_order(coupon, coupon_order) is True
+
+    second = Order.objects.create(
+        orderer=coupon_order.orderer, branch=coupon_order.branch, delivery_secret_hash="second",
+        status="payment_pending", delivery_price=500,
+    )
+    assert CouponService.is_valid_for(coupon, second) is True  # not redeemed yet
+    assert CouponService.apply_coupon_to_order(coupon, second) is False  # but it may still be paid
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_orders_from_one_user_respect_the_per_user_limit(Business_object):
+    import threading
+    from django.db import connection
+
+    coupon = create_coupon(code="ENGINE-006", max_uses_per_user=1, max_uses=100)
+    orderer = CustomerProfile.objects.create(user=User.objects.create(email="racer@example.com", name="Racer"))
+    branch = Branch.objects.create(business=Business_object, name="Race Branch")
+    orders = [
+        Order.objects.create(
+            orderer=orderer, branch=branch, delivery_secret_hash=f"race-{n}", status="payment_pending", delivery_price=500,
+        )
+        for n in range(4)
+    ]
+    results, errors, start = [], [], threading.Barrier(len(orders))
+
+    def redeem(order):
+        try:
+            order = Order.objects.select_related("orderer", "branch").get(pk=order.pk)
+            start.wait()
+            results.append(CouponService.apply_coupon_to_order(coupon, order))
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=redeem, args=(order,)) for order in orders]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert sorted(results) == [False, False, False, True]
+    assert Order.objects.filter(coupons=coupon).count() == 1
@@ -29,4 +29,5 @@ urlpatterns = [
     path("account/change/request/", views.UserAccountChangeRequestView.as_view(), name="account-request"),
     path("account/change/confirm/", views.UserAccountChangeConfirmView.as_view(), name="account-confirm"),
     path("points/", include("points.external_urls.customer")),
+    path("address/", include("addresses.urls")),
 ]
@@ -18,16 +18,17 @@ from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from menu.serializers import OrderCreateSerializer
 from menu.views import notify_order_created
-from addresses.utils import make_point, get_cached_distance_km_from_2points
+from addresses.utils import make_point
 from addresses.serializers import LocationGetSerializer
 from accounts.models import Branch
 from coupons_discount.models import Coupons
 from django.db.models import Q
-from menu.serializers.order import calculate_delivery_fee, PLATFORM_FEES_PERCENT
+from menu.serializers.order import quote_delivery, PLATFORM_FEES_PERCENT
 from payments.models import UserAccount
 from rest_framework import status
 from authflow.services import OTPManager, OTPInvalidError
 from common.utils.compression import decode_dict, encode_dict
+from common.ratelimit import CouponCheckThrottle, rate_limit
 from accounts.models import User
 from payments.payouts.tasks import ensure_paystack_recipient_for_user_accounts
 
@@ -193,6 +194,7 @@ class StoreDetailsView(BaseCustomerAPIView, RetrieveAPIView):
 
 class OrderCalculationsView(BaseCustomerAPIView):
     serializer_class = OrderCalculationGetSerializer
+    throttle_classes = [CouponCheckThrottle]
     @transaction.atomic
     def post(self, request):
         # customer = self.get_customer_profile(request)
@@ -208,9 +210,10 @@ class OrderCalculationsView(BaseCustomerAPIView):
         if not branch:
             return Response({"details": "branch id invalid or not active"}, status=401)
         
-        delivery_fee = calculate_delivery_fee(
-            vd["is_delivery"], get_cached_distance_km_from_2points(user_location, branch.location)
-        )
+        quote = quote_delivery(vd["is_delivery"], user_location, branch)
+        if quote.zone_id is None and settings.SERVICE_ZONES_ENFORCED:
+            return Response({"details": "We don't deliver to this location yet."}, status=400)
+        delivery_fee = quote.fee
         coupon_code = vd.get("coupon_code", None)
         if coupon_code:
             coupon = Coupons.objects.filter(
@@ -354,6 +357,8 @@ class UserAccountChangeConfirmView(BaseCustomerAPIView, SendVerifyMixin):
     """
     """
     serializer_class = AccountChangeConfirmSerializer
+
+    @rate_limit("otp_verify", key=lambda self, request, *args, **kwargs: f"user:{request.user.pk}")
     def post(self, request):
         user:User = request.user
 
@@ -0,0 +1,19 @@
+"""
+gunicorn settings, picked up from the working directory:
+
+    PROMETHEUS_MULTIPROC_DIR=/tmp/prometheus/web gunicorn core.wsgi:application
+"""
+from payments.observability.exporter import clear_multiprocess_dir, mark_process_dead
+
+bind = "0.0.0.0:8000"
+workers = 4
+threads = 2
+timeout = 120
+
+
+def on_starting(server):
+    clear_multiprocess_dir()
+
+
+def child_exit(server, worker):
+    mark_process_dead(worker.pid)
@@ -0,0 +1,16 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from .models import StorageTombstone
+
+
+@admin.register(StorageTombstone)
+class StorageTombstoneAdmin(admin.ModelAdmin):
+    list_display = ("url", "status", "reason", "attempts", "not_before", "created_at")
+    list_filter = ("status", "reason")
+    search_fields = ("url",)
+    actions = ["requeue"]
+
+    @admin.action(description="Requeue for deletion")
+    def requeue(self, request, queryset):
+        queryset.update(status=StorageTombstone.STATUS_PENDING, attempts=0, not_before=timezone.now())
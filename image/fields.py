@@ -0,0 +1,48 @@
+from rest_framework import serializers
+
+from image.pipeline import pick_variant_url
+from image.utils import get_image
+
+
+class _VariantFieldMixin:
+    """
+    Reads the image URL from `source` and its image_variants entry from
+    `variants` (an attribute returning the entry), defaulting to
+    instance.image_variants[<source>].
+    """
+
+    def __init__(self, variants=None, **kwargs):
+        self.variants = variants
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def get_entry(self, instance):
+        if self.variants:
+            return getattr(instance, self.variants, None)
+        return (getattr(instance, "image_variants", None) or {}).get(self.source)
+
+    def get_attribute(self, instance):
+        return get_image(super().get_attribute(instance)), self.get_entry(instance)
+
+
+class VariantImageField(_VariantFieldMixin, serializers.Field):
+    """
+    Size-appropriate image URL: the smallest stored variant at least `width` px
+    wide, else the original URL.
+    """
+
+    def __init__(self, width=640, **kwargs):
+        self.width = width
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        url, entry = value
+        return pick_variant_url(url, entry, self.width)
+
+
+class BlurhashField(_VariantFieldMixin, serializers.Field):
+    def to_representation(self, value):
+        url, entry = value
+        if not url or not entry or entry.get("source") != url:
+            return None
+        return entry.get("blurhash")
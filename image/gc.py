@@ -0,0 +1,248 @@
+"""
+Storage garbage collection.
+
+Request paths never delete bucket objects themselves. They call
+tombstone_urls() inside their transaction; the rows only exist if the
+transaction commits. collect_garbage() (celery task image.collect_storage_garbage,
+run from cron via `python manage.py storage_gc --async`) then deletes them in
+1,000-key batches:
+
+    pending --claimed--> not_before = now + STORAGE_GC_CLAIM_TIMEOUT (lease, committed)
+            --key deleted--> row removed
+            --key failed--> attempts += 1, not_before = now + backoff
+            --attempts >= STORAGE_GC_MAX_ATTEMPTS--> dead (left for a human)
+
+The bucket call runs after the claim commits, so no row locks are held across
+the network, and results are applied per key from the delete_objects Errors
+list: one bad key does not cost the rest of the batch an attempt.
+
+scan_orphans() is the safety net for anything that never got a tombstone:
+it lists the bucket, subtracts every key a model still references and
+tombstones what is left (older than STORAGE_GC_SCAN_GRACE, so presigned
+uploads that are not attached yet survive).
+"""
+import logging
+import os
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+
+from image.models import StorageTombstone
+from image.pipeline import VARIANT_FIELDS
+from image.services import BulkS3StorageService, S3StorageService
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000  # S3 delete_objects limit
+
+# model label -> fields holding bucket objects (URLField URLs or FileField names)
+REFERENCE_FIELDS = {
+    "menu.BaseItem": ("image",),
+    "menu.MenuItem": ("image",),
+    "menu.GlobalTag": ("images",),
+    "accounts.Business": ("business_image", "business_logo"),
+    "accounts.BusinessSubscription": ("carousel_image",),
+}
+
+SCAN_PREFIXES = ("upload/", "businesses/", "media/business/")
+
+
+def tombstone_urls(urls, reason=""):
+    """
+    Queue objects for deletion. Call inside the transaction that drops the
+    reference; nothing is deleted if it rolls back.
+    """
+    urls = sorted({url for url in urls if url})
+    if not urls:
+        return 0
+    StorageTombstone.objects.bulk_create(
+        [StorageTombstone(url=url, reason=reason[:64]) for url in urls],
+        batch_size=BATCH_SIZE,
+    )
+    return len(urls)
+
+
+def tombstone_image_fields(instance, field_names, reason=""):
+    """Tombstone the current files of an instance's image fields (and their variants)."""
+    from image.utils import get_image
+
+    urls = []
+    variants = getattr(instance, "image_variants", None) or {}
+    for field_name in field_names:
+        url = get_image(getattr(instance, field_name, None))
+        if url:
+            urls.append(url)
+            urls.extend(variant_urls(variants.get(field_name)))
+    return tombstone_urls(urls, reason)
+
+
+def tombstone_queryset(qs, field_name="image", reason=""):
+    """Tombstone a URL image column (and its variants) for every row in qs, one query."""
+    urls = []
+    for url, variants in qs.values_list(field_name, "image_variants"):
+        if url:
+            urls.append(url)
+            urls.extend(variant_urls((variants or {}).get(field_name)))
+    return tombstone_urls(urls, reason)
+
+
+def variant_urls(entry):
+    return list(((entry or {}).get("widths") or {}).values())
+
+
+def backoff(attempts):
+    base = getattr(settings, "STORAGE_GC_RETRY_BASE_SECONDS", 60)
+    return timedelta(seconds=min(base * 2 ** (attempts - 1), 24 * 60 * 60))
+
+
+def claim(batch_size=BATCH_SIZE):
+    """
+    Lease up to batch_size due tombstones and commit, so the bucket call runs
+    without row locks held. The lease is not_before pushed STORAGE_GC_CLAIM_TIMEOUT
+    ahead: other workers skip the rows until then, and a worker that dies
+    mid-batch simply lets them come due again. The lease timestamp doubles as
+    the claim token when results are applied.
+    :return: (lease_until, [(id, url, attempts), ...])
+    """
+    lease_until = timezone.now() + timedelta(
+        seconds=getattr(settings, "STORAGE_GC_CLAIM_TIMEOUT", 15 * 60)
+    )
+    with transaction.atomic():
+        rows = list(
+            StorageTombstone.objects
+            .select_for_update(skip_locked=True)
+            .filter(status=StorageTombstone.STATUS_PENDING, not_before__lte=timezone.now())
+            .order_by("not_before", "id")
+            .values_list("id", "url", "attempts")[:batch_size]
+        )
+        if rows:
+            StorageTombstone.objects.filter(id__in=[row[0] for row in rows]).update(
+                not_before=lease_until,
+            )
+    return lease_until, rows
+
+
+def collect_garbage(batch_size=BATCH_SIZE, max_batches=None, storage=BulkS3StorageService):
+    """
+    Delete due tombstones batch by batch. Each batch is leased with claim(),
+    deleted from the bucket outside any transaction, and then settled per URL:
+    only the keys delete_objects reported as failed are retried or dead-lettered.
+    :return: {"deleted": n, "retried": n, "dead": n}
+    """
+    max_attempts = getattr(settings, "STORAGE_GC_MAX_ATTEMPTS", 5)
+    stats = {"deleted": 0, "retried": 0, "dead": 0}
+    batches = 0
+
+    while max_batches is None or batches < max_batches:
+        lease_until, rows = claim(batch_size)
+        if not rows:
+            break
+        batches += 1
+
+        try:
+            failed = storage.delete_urls([url for _, url, _ in rows])
+        except Exception as exc:
+            failed = {url: str(exc) for _, url, _ in rows}
+
+        # rows whose lease ran out were re-claimed by someone else; leave them be
+        leased = StorageTombstone.objects.filter(not_before=lease_until)
+        deleted, _ = leased.filter(
+            id__in=[row_id for row_id, url, _ in rows if url not in failed]
+        ).delete()
+        stats["deleted"] += deleted
+
+        groups = {}  # (attempts, error) -> ids, so a failed batch is a few UPDATEs
+        for row_id, url, attempts in rows:
+            if url in failed:
+                groups.setdefault((attempts + 1, failed[url]), []).append(row_id)
+        now = timezone.now()
+        for (attempts, error), ids in groups.items():
+            if attempts >= max_attempts:
+                changes, key = {"status": StorageTombstone.STATUS_DEAD}, "dead"
+            else:
+                changes, key = {"not_before": now + backoff(attempts)}, "retried"
+            stats[key] += leased.filter(id__in=ids).update(
+                attempts=attempts, last_error=error, **changes,
+            )
+        if failed:
+            logger.warning(
+                f"[storage-gc] {len(failed)} of {len(rows)} URLs failed; "
+                f"retried={stats['retried']} dead={stats['dead']}"
+            )
+
+    return stats
+
+
+# ===== SCAN =====
+
+def referenced_keys():
+    """Every bucket key some row still points at, including image variants."""
+    keys = set()
+    extract = S3StorageService.extract_key_from_url
+    storage = S3StorageService.get_storage()
+
+    for label, fields in REFERENCE_FIELDS.items():
+        model = apps.get_model(label)
+        has_variants = label in VARIANT_FIELDS
+        columns = list(fields) + (["image_variants"] if has_variants else [])
+
+        for row in model.objects.values_list(*columns).iterator(chunk_size=2000):
+            for field, value in zip(fields, row):
+                if not value:
+                    continue
+                if isinstance(model._meta.get_field(field), models.FileField):
+                    value = storage.url(value)
+                keys.add(extract(value))
+            if has_variants:
+                for entry in (row[-1] or {}).values():
+                    keys.update(extract(url) for url in variant_urls(entry))
+    keys.discard("")
+    return keys
+
+
+def list_bucket(prefixes=SCAN_PREFIXES):
+    """Yields (key, last_modified) for objects under the given prefixes."""
+    storage = S3StorageService.get_storage()
+    if not S3StorageService.is_s3(storage):
+        root = storage.path("")
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                key = os.path.relpath(os.path.join(dirpath, filename), root).replace(os.sep, "/")
+                if key.startswith(tuple(prefixes)):
+                    yield key, storage.get_modified_time(key)
+        return
+
+    paginator = storage.connection.meta.client.get_paginator("list_objects_v2")
+    for prefix in dict.fromkeys(prefixes):
+        for page in paginator.paginate(Bucket=storage.bucket_name, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                yield obj["Key"], obj["LastModified"]
+
+
+def scan_orphans(prefixes=SCAN_PREFIXES, grace=None, dry_run=False):
+    """
+    Find bucket objects no model references and tombstone them.
+    :return: list of orphaned keys
+    """
+    grace = grace if grace is not None else timedelta(
+        seconds=getattr(settings, "STORAGE_GC_SCAN_GRACE", 24 * 60 * 60)
+    )
+    cutoff = timezone.now() - grace
+    referenced = referenced_keys()
+    already = set(
+        StorageTombstone.objects.values_list("url", flat=True)
+    )
+
+    orphans = []
+    for key, modified in list_bucket(prefixes):
+        if key in referenced or modified > cutoff:
+            continue
+        orphans.append(key)
+
+    if not dry_run:
+        urls = [S3StorageService.public_url(key) for key in orphans]
+        tombstone_urls([url for url in urls if url not in already], reason="scan")
+    return orphans
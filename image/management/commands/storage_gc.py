@@ -0,0 +1,45 @@
+"""
+Storage GC entry point for cron (same approach as points/finalize_leaderboard):
+
+    */10 * * * *  python manage.py storage_gc --async
+    30 3 * * 0    python manage.py storage_gc --scan --async
+"""
+from django.core.management.base import BaseCommand
+
+from image.gc import collect_garbage, scan_orphans
+from image.models import StorageTombstone
+
+
+class Command(BaseCommand):
+    help = "Delete tombstoned bucket objects in 1,000-key batches, or scan the bucket for unreferenced objects."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scan", action="store_true", help="Tombstone bucket objects no model references.")
+        parser.add_argument("--dry-run", action="store_true", help="With --scan: only report orphans.")
+        parser.add_argument("--max-batches", type=int, default=None)
+        parser.add_argument("--async", dest="run_async", action="store_true", help="Queue the celery task instead.")
+
+    def handle(self, *args, **options):
+        if options["run_async"]:
+            from image.tasks import collect_storage_garbage, scan_storage_orphans
+
+            if options["scan"]:
+                scan_storage_orphans.delay(dry_run=options["dry_run"])
+            else:
+                collect_storage_garbage.delay(max_batches=options["max_batches"])
+            self.stdout.write("Queued.")
+            return
+
+        if options["scan"]:
+            orphans = scan_orphans(dry_run=options["dry_run"])
+            for key in orphans[:50]:
+                self.stdout.write(f"  {key}")
+            verb = "Found" if options["dry_run"] else "Tombstoned"
+            self.stdout.write(self.style.SUCCESS(f"{verb} {len(orphans)} unreferenced objects."))
+            return
+
+        stats = collect_garbage(max_batches=options["max_batches"])
+        dead = StorageTombstone.objects.filter(status=StorageTombstone.STATUS_DEAD).count()
+        self.stdout.write(self.style.SUCCESS(
+            f"deleted={stats['deleted']} retried={stats['retried']} dead={stats['dead']} (dead total: {dead})"
+        ))
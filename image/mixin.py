@@ -1,81 +1,69 @@
-from .services import S3StorageService, BulkS3StorageService
+from django.db import transaction
+
+from .gc import tombstone_image_fields
+
+# Old files are never deleted inside the request: they are tombstoned in the
+# same transaction as the field change and removed by the storage GC (image/gc.py).
 
 class S3ImageManagedMixin:
     """
-    Mixin containing helper utilities to modify or clear field-backed 
+    Mixin containing helper utilities to modify or clear field-backed
     S3 assets on an object instance.
     """
-    
+
     def update_image_field(self, instance, field_name: str, new_image: str, save= True):
         """
         Safely replaces an existing image URL with a new path, cleaning up S3.
+        With save=False, call it inside the transaction that saves the instance.
         """
-        old_image = getattr(instance, field_name, None)
-        
-        # If the URL is changing, purge the legacy media from S3
-        if old_image.url:# and old_image.url != new_image:
-            S3StorageService.delete_file_by_url(old_image.url)
-            
-        setattr(instance, field_name, new_image)
-        if save:
-            instance.save(update_fields=[field_name])
+        with transaction.atomic():
+            # If the URL is changing, queue the legacy media for deletion
+            tombstone_image_fields(instance, [field_name], reason="replaced")
+
+            setattr(instance, field_name, new_image)
+            if save:
+                instance.save(update_fields=[field_name])
 
     def delete_image_field(self, instance, field_name: str, save= True):
         """
         Removes an image string pointer from a model field and purges it from S3.
         """
-        old_image = getattr(instance, field_name, None)
-        if old_image.url:
-            S3StorageService.delete_file_by_url(old_image.url)
-            
-        setattr(instance, field_name, None)
-        if hasattr(instance, "save") and save:
-            instance.save(update_fields=[field_name])
+        with transaction.atomic():
+            tombstone_image_fields(instance, [field_name], reason="deleted")
+
+            setattr(instance, field_name, None)
+            if hasattr(instance, "save") and save:
+                instance.save(update_fields=[field_name])
 
 
 class BuilkS3ImageManagedMixin:
     """
-    Mixin containing helper utilities to modify or clear field-backed 
+    Mixin containing helper utilities to modify or clear field-backed
     S3 assets on an object instance.
     """
-    
+
     def update_image_field(self, instance, image_dict: dict[str, str], save= True):
         """
         Safely replaces an existing image URL with a new path, cleaning up S3.
+        With save=False, call it inside the transaction that saves the instance.
         """
+        with transaction.atomic():
+            # If the URL is changing, queue the legacy media for deletion
+            tombstone_image_fields(instance, list(image_dict.keys()), reason="replaced")
 
-        print(image_dict)
-         
-        old_urls = []
-        for field_name in image_dict.keys():
-            old_image = getattr(instance, field_name, None)
-            if old_image is None: continue
-            if old_image.url:
-                old_urls.append(old_image.url)
-        
-        # If the URL is changing, purge the legacy media from S3
-        if old_urls:# and old_image.url != new_image:
-            BulkS3StorageService.batch_delete_urls(old_urls)
-        
-        for field_name, new_image in image_dict.items():
-            setattr(instance, field_name, new_image)
-        if save:
-            instance.save(update_fields=list(image_dict.keys()))
+            for field_name, new_image in image_dict.items():
+                setattr(instance, field_name, new_image)
+            if save:
+                instance.save(update_fields=list(image_dict.keys()))
 
     def delete_image_field(self, instance, field_names: list[str], save= True):
         """
         Removes an image string pointer from a model field and purges it from S3.
         """
-        old_urls = []
-        for field_name in field_names:
-            old_image = getattr(instance, field_name, None)
-            if old_image.url:
-                old_urls.append(old_image.url)
-        
-        if old_urls:
-            BulkS3StorageService.batch_delete_urls(old_urls)
-        
-        for field_name in field_names:
-            setattr(instance, field_name, None)
-        if hasattr(instance, "save") and save:
-            instance.save(update_fields=field_names)
+        with transaction.atomic():
+            tombstone_image_fields(instance, field_names, reason="deleted")
+
+            for field_name in field_names:
+                setattr(instance, field_name, None)
+            if hasattr(instance, "save") and save:
+                instance.save(update_fields=field_names)
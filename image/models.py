@@ -0,0 +1,33 @@
+from django.db import models
+from django.utils import timezone
+
+
+class StorageTombstone(models.Model):
+    """
+    A bucket object nothing should reference any more. Written in the same
+    transaction that drops the reference (see image/gc.py), deleted from the
+    bucket later by the storage GC, so a rolled-back request never loses a file
+    and a committed one never leaks it.
+    """
+    STATUS_PENDING = "pending"
+    STATUS_DEAD = "dead"  # gave up after STORAGE_GC_MAX_ATTEMPTS, needs a look
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_DEAD, "Dead"),
+    ]
+
+    url = models.CharField(max_length=1024)
+    reason = models.CharField(max_length=64, blank=True, default="")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+    not_before = models.DateTimeField(default=timezone.now)  # retry backoff
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "not_before"]),
+        ]
+
+    def __str__(self):
+        return f"{self.status}: {self.url}"
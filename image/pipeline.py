@@ -0,0 +1,212 @@
+"""
+Image variants: fixed-width thumbnails + a blurhash placeholder.
+
+Uploads land in the bucket untouched (presigned PUT, see image/views.py). Once a
+model points at one, image/signals.py (or the bulk menu flows) enqueue
+image.generate_image_variants, which:
+
+    reads the original  ->  resizes to IMAGE_VARIANT_WIDTHS (never upscales)
+                        ->  writes {stem}_w{width}.{format} next to the original
+                        ->  records them on the owning row's image_variants
+
+image_variants is keyed by field name:
+
+    {"image": {"source": <url>, "width": 1600, "height": 1200, "format": "webp",
+               "widths": {"160": <url>, "320": <url>, ...}, "blurhash": "LEHV6n..."}}
+
+"source" is the URL the variants were built from, so a replaced image is
+detected by comparing it with the current field value.
+"""
+import io
+import logging
+import math
+import posixpath
+
+from django.conf import settings
+
+from image.services import S3StorageService
+from image.utils import get_image
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WIDTHS = (160, 320, 640, 1080)
+
+# model label -> image fields that get variants
+VARIANT_FIELDS = {
+    "menu.BaseItem": ("image",),
+    "menu.MenuItem": ("image",),
+    "accounts.Business": ("business_image", "business_logo"),
+}
+
+CONTENT_TYPES = {"webp": "image/webp", "avif": "image/avif"}
+
+
+def get_widths():
+    return tuple(sorted(getattr(settings, "IMAGE_VARIANT_WIDTHS", DEFAULT_WIDTHS)))
+
+
+def get_format():
+    from PIL import features
+
+    fmt = getattr(settings, "IMAGE_VARIANT_FORMAT", "webp").lower()
+    if fmt == "avif" and not features.check("avif"):
+        logger.warning("[images] AVIF not supported by this Pillow build, using webp")
+        fmt = "webp"
+    return fmt
+
+
+def variant_key(source_key, width, fmt):
+    stem, _ = posixpath.splitext(source_key)
+    return f"{stem}_w{width}.{fmt}"
+
+
+# ===== BLURHASH =====
+
+_BASE83 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+
+
+def _encode83(value, length):
+    return "".join(_BASE83[(value // 83 ** (length - i)) % 83] for i in range(1, length + 1))
+
+
+def _srgb_to_linear(value):
+    v = value / 255
+    return v / 12.92 if v <= 0.04045 else ((v + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb(value):
+    v = max(0.0, min(1.0, value))
+    if v <= 0.0031308:
+        return int(v * 12.92 * 255 + 0.5)
+    return int((1.055 * v ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def _sign_pow(value, exp):
+    return math.copysign(abs(value) ** exp, value)
+
+
+def blurhash_encode(image, x_components=4, y_components=3, size=32):
+    """Blurhash (https://blurha.sh) of a PIL image, computed on a size x size thumbnail."""
+    small = image.convert("RGB").resize((size, size))
+    width, height = small.size
+    lut = [_srgb_to_linear(v) for v in range(256)]
+    raw = small.tobytes()
+    pixels = [(lut[r], lut[g], lut[b]) for r, g, b in zip(raw[0::3], raw[1::3], raw[2::3])]
+
+    cos_x = [[math.cos(math.pi * i * x / width) for x in range(width)] for i in range(x_components)]
+    cos_y = [[math.cos(math.pi * j * y / height) for y in range(height)] for j in range(y_components)]
+
+    factors = []
+    for j in range(y_components):
+        for i in range(x_components):
+            norm = (1 if i == 0 and j == 0 else 2) / (width * height)
+            r = g = b = 0.0
+            for y in range(height):
+                cy = cos_y[j][y]
+                row = y * width
+                for x in range(width):
+                    basis = cos_x[i][x] * cy
+                    pr, pg, pb = pixels[row + x]
+                    r += basis * pr
+                    g += basis * pg
+                    b += basis * pb
+            factors.append((r * norm, g * norm, b * norm))
+
+    dc, ac = factors[0], factors[1:]
+    result = _encode83((x_components - 1) + (y_components - 1) * 9, 1)
+
+    if ac:
+        actual_max = max(abs(c) for factor in ac for c in factor)
+        quantised_max = int(max(0, min(82, math.floor(actual_max * 166 - 0.5))))
+        max_value = (quantised_max + 1) / 166
+        result += _encode83(quantised_max, 1)
+    else:
+        max_value = 1
+        result += _encode83(0, 1)
+
+    result += _encode83((_linear_to_srgb(dc[0]) << 16) + (_linear_to_srgb(dc[1]) << 8) + _linear_to_srgb(dc[2]), 4)
+
+    for factor in ac:
+        r, g, b = (
+            int(max(0, min(18, math.floor(_sign_pow(c / max_value, 0.5) * 9 + 9.5))))
+            for c in factor
+        )
+        result += _encode83(r * 19 * 19 + g * 19 + b, 2)
+
+    return result
+
+
+# ===== VARIANTS =====
+
+def render_variants(data, widths=None, fmt=None, quality=None):
+    """
+    Pure part of the pipeline: original bytes in, encoded variants out.
+    :return: (meta dict, {width: bytes})
+    """
+    from PIL import Image, ImageOps
+
+    widths = widths or get_widths()
+    fmt = fmt or get_format()
+    quality = quality or getattr(settings, "IMAGE_VARIANT_QUALITY", 80)
+
+    with Image.open(io.BytesIO(data)) as opened:
+        image = ImageOps.exif_transpose(opened)
+        image.load()
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+    rendered = {}
+    for width in widths:
+        if width > image.width:
+            continue  # never upscale; the original is the best we have above this
+        height = max(1, round(image.height * width / image.width))
+        resized = image.resize((width, height), Image.Resampling.LANCZOS)
+        buf = io.BytesIO()
+        resized.save(buf, fmt.upper(), quality=quality)
+        rendered[width] = buf.getvalue()
+
+    meta = {
+        "width": image.width,
+        "height": image.height,
+        "format": fmt,
+        "blurhash": blurhash_encode(image),
+    }
+    return meta, rendered
+
+
+def build_variants(source_url, storage=S3StorageService):
+    """Read the original, write its variants next to it and return the image_variants entry."""
+    source_key = storage.extract_key_from_url(source_url)
+    meta, rendered = render_variants(storage.read_bytes(source_key))
+    fmt = meta["format"]
+
+    widths = {}
+    for width, payload in rendered.items():
+        widths[str(width)] = storage.save_bytes(variant_key(source_key, width, fmt), payload, CONTENT_TYPES[fmt])
+
+    return {"source": source_url, **meta, "widths": widths}
+
+
+def needs_variants(instance, field_name):
+    source = get_image(getattr(instance, field_name, None))
+    if not source:
+        return False
+    entry = (getattr(instance, "image_variants", None) or {}).get(field_name) or {}
+    return entry.get("source") != source
+
+
+# ===== READ SIDE =====
+
+def pick_variant_url(source_url, entry, width):
+    """
+    Smallest variant at least `width` px wide. Falls back to the original when
+    no variants exist yet, they are stale, or the original is narrower than
+    `width`.
+    """
+    if not source_url or not entry or entry.get("source") != source_url:
+        return source_url
+    widths = sorted((int(w), url) for w, url in (entry.get("widths") or {}).items())
+    for w, url in widths:
+        if w >= width:
+            return url
+    return source_url
@@ -39,12 +39,22 @@ class S3StorageService:
             
     #     return False
     
+    @staticmethod
+    def is_s3(storage) -> bool:
+        return hasattr(storage, "bucket_name")
+
     @classmethod
     def extract_key_from_url(cls, public_url: str) -> str:
         """Helper to safely parse out the S3 object key from a full URL string."""
         if not public_url or not isinstance(public_url, str):
             return ""
         storage = cls.get_storage()
+        if not cls.is_s3(storage):
+            # local storages (tests / dev): key is the path under base_url
+            base_url = getattr(storage, "base_url", None) or ""
+            if base_url and public_url.startswith(base_url):
+                return public_url[len(base_url):]
+            return public_url
         custom_domain = getattr(storage, "custom_domain", None) or settings.AWS_S3_CUSTOM_DOMAIN
         prefix = f"https://{custom_domain}/"
         
@@ -54,6 +64,42 @@ class S3StorageService:
             return public_url.split(f"{storage.bucket_name}/")[-1]
         return public_url
 
+    @classmethod
+    def public_url(cls, key: str) -> str:
+        storage = cls.get_storage()
+        if not cls.is_s3(storage):
+            return storage.url(key)
+        return f"https://{storage.custom_domain}/{key}"
+
+    @classmethod
+    def read_bytes(cls, key: str) -> bytes:
+        """Read an object by bucket key (same key space as the presigned uploads)."""
+        storage = cls.get_storage()
+        if not cls.is_s3(storage):
+            with storage.open(key, "rb") as fh:
+                return fh.read()
+        s3_client = storage.connection.meta.client
+        return s3_client.get_object(Bucket=storage.bucket_name, Key=key)["Body"].read()
+
+    @classmethod
+    def save_bytes(cls, key: str, data: bytes, content_type: str) -> str:
+        """Write (overwrite) an object by bucket key; returns its public URL."""
+        storage = cls.get_storage()
+        if not cls.is_s3(storage):
+            from django.core.files.base import ContentFile
+            if storage.exists(key):
+                storage.delete(key)
+            return storage.url(storage.save(key, ContentFile(data)))
+        s3_client = storage.connection.meta.client
+        s3_client.put_object(
+            Bucket=storage.bucket_name,
+            Key=key,
+            Body=data,
+            ContentType=content_type,
+            **getattr(settings, "AWS_S3_OBJECT_PARAMETERS", {}),
+        )
+        return cls.public_url(key)
+
     @classmethod
     def delete_file_by_url(cls, public_url: str) -> bool:
         if not public_url:
@@ -134,40 +180,62 @@ class BulkS3StorageService:
     @classmethod
     def extract_key_from_url(cls, public_url: str) -> str:
         """Safely parse the S3 object key out of a full URL string."""
-        if not public_url or not isinstance(public_url, str):
-            return ""
-        storage = cls.get_storage()
-        custom_domain = getattr(storage, "custom_domain", None) or settings.AWS_S3_CUSTOM_DOMAIN
-        prefix = f"https://{custom_domain}/"
-        if public_url.startswith(prefix):
-            return public_url.replace(prefix, "")
-        elif f"{storage.bucket_name}/" in public_url:
-            return public_url.split(f"{storage.bucket_name}/")[-1]
-        return public_url
+        return S3StorageService.extract_key_from_url(public_url)
 
     @classmethod
     def batch_delete_urls(cls, url_list: list[str]) -> bool:
         """
         Deletes S3 assets in chunks of 1,000 (AWS hard limit per call).
-        Returns False if there is nothing to delete or the call fails.
+        Returns False if there is nothing to delete or any URL was not deleted.
         """
-        keys_to_delete = [
-            {"Key": cls.extract_key_from_url(url)}
-            for url in url_list if url
-        ]
-        if not keys_to_delete:
+        if not any(url_list):
             return False
+        return not cls.delete_urls(url_list)
+
+    @classmethod
+    def delete_urls(cls, url_list: list[str]) -> dict[str, str]:
+        """
+        Deletes S3 assets in chunks of 1,000 and reports failures per URL,
+        from the delete_objects `Errors` list (or the whole chunk if the call
+        itself fails).
+        :return: {url: error} for every URL that was not deleted
+        """
+        urls_by_key = {}
+        for url in url_list:
+            if url:
+                urls_by_key.setdefault(cls.extract_key_from_url(url), []).append(url)
+        failed = {}
+        if not urls_by_key:
+            return failed
 
         storage = cls.get_storage()
+        if not S3StorageService.is_s3(storage):
+            # local storages (tests / dev)
+            for key, urls in urls_by_key.items():
+                try:
+                    storage.delete(key)
+                except Exception as e:
+                    failed.update(dict.fromkeys(urls, str(e)))
+            return failed
+
         s3_client = storage.connection.meta.client
-        try:
-            for i in range(0, len(keys_to_delete), 1000):
-                chunk = keys_to_delete[i:i + 1000]
-                s3_client.delete_objects(
+        keys = list(urls_by_key)
+        for i in range(0, len(keys), 1000):
+            chunk = keys[i:i + 1000]
+            try:
+                response = s3_client.delete_objects(
                     Bucket=storage.bucket_name,
-                    Delete={"Objects": chunk, "Quiet": True},
+                    Delete={"Objects": [{"Key": key} for key in chunk], "Quiet": True},
                 )
-            return True
-        except Exception as e:
-            logger.error(f"Failed to execute batch S3 deletion: {str(e)}")
-            return False
+            except Exception as e:
+                logger.error(f"Failed to execute batch S3 deletion: {str(e)}")
+                for key in chunk:
+                    failed.update(dict.fromkeys(urls_by_key[key], str(e)))
+                continue
+            for error in response.get("Errors") or []:
+                message = f"{error.get('Code')}: {error.get('Message')}"
+                failed.update(dict.fromkeys(urls_by_key.get(error.get("Key"), []), message))
+
+        if failed:
+            logger.error(f"Batch S3 deletion: {len(failed)} of {len(url_list)} URLs failed")
+        return failed
@@ -0,0 +1,20 @@
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from image.pipeline import VARIANT_FIELDS, needs_variants
+from image.tasks import generate_image_variants
+
+
+@receiver(post_save, sender="menu.BaseItem")
+@receiver(post_save, sender="menu.MenuItem")
+@receiver(post_save, sender="accounts.Business")
+def _enqueue_image_variants(sender, instance, update_fields=None, **kwargs):
+    label = sender._meta.label
+    for field_name in VARIANT_FIELDS[label]:
+        if update_fields is not None and field_name not in update_fields:
+            continue
+        if needs_variants(instance, field_name):
+            transaction.on_commit(
+                lambda pk=instance.pk, field_name=field_name: generate_image_variants.delay(label, pk, field_name)
+            )
@@ -0,0 +1,96 @@
+from celery import shared_task
+import logging
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.fields.json import KT
+
+from image.gc import collect_garbage, scan_orphans, tombstone_urls, variant_urls
+from image.pipeline import build_variants, needs_variants
+from image.utils import get_image
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    name="image.generate_image_variants",
+    autoretry_for=(OSError,),
+    retry_backoff=True,
+    max_retries=3,
+)
+def generate_image_variants(model_label, pk, field_name):
+    """
+    Build thumbnails + blurhash for one image field and record them on the row.
+    Network / storage errors retry; undecodable uploads are logged and dropped.
+    """
+    from PIL import UnidentifiedImageError
+
+    model = apps.get_model(model_label)
+    instance = model.objects.filter(pk=pk).first()
+    if instance is None or not needs_variants(instance, field_name):
+        return None
+
+    source = get_image(getattr(instance, field_name))
+    try:
+        entry = build_variants(source)
+    except UnidentifiedImageError:
+        logger.warning(f"[images] {model_label}#{pk}.{field_name}: not an image ({source})")
+        return None
+
+    with transaction.atomic():
+        row = model.objects.select_for_update().filter(pk=pk).first()
+        # the image may have been replaced while we were resizing
+        if row is None or get_image(getattr(row, field_name)) != source:
+            return None
+        variants = dict(row.image_variants or {})
+        # thumbnails of a replaced image are garbage now
+        tombstone_urls(variant_urls(variants.get(field_name)), reason="variants_replaced")
+        variants[field_name] = entry
+        model.objects.filter(pk=pk).update(image_variants=variants)
+    return entry["widths"]
+
+
+def stale_image_rows(model, field_name="image"):
+    """Rows whose URL image has no variants, or variants built from an older URL."""
+    source = KT(f"image_variants__{field_name}__source")
+    return (
+        model.objects
+        .exclude(**{f"{field_name}__isnull": True})
+        .exclude(**{field_name: ""})
+        .filter(Q(**{f"image_variants__{field_name}__source__isnull": True}) | ~Q(**{field_name: source}))
+    )
+
+
+@shared_task(name="image.generate_business_menu_variants")
+def generate_business_menu_variants(business_id):
+    """
+    Sweep after bulk menu writes (registration / upsert use bulk_create and
+    bulk_update, which send no post_save).
+    """
+    from menu.models import BaseItem, MenuItem
+
+    queued = 0
+    for model, lookup in ((BaseItem, "business_id"), (MenuItem, "category__menu__business_id")):
+        label = model._meta.label
+        for pk in stale_image_rows(model).filter(**{lookup: business_id}).values_list("pk", flat=True):
+            generate_image_variants.delay(label, pk, "image")
+            queued += 1
+    return queued
+
+
+def enqueue_business_menu_variants(business_id):
+    """Call inside the writing transaction; runs once it commits."""
+    transaction.on_commit(lambda: generate_business_menu_variants.delay(business_id))
+
+
+@shared_task(name="image.collect_storage_garbage")
+def collect_storage_garbage(max_batches=None):
+    """Periodic: delete tombstoned bucket objects. Safe to run concurrently."""
+    return collect_garbage(max_batches=max_batches)
+
+
+@shared_task(name="image.scan_storage_orphans")
+def scan_storage_orphans(dry_run=False):
+    """Occasional: tombstone bucket objects no row references."""
+    return len(scan_orphans(dry_run=dry_run))
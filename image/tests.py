@@ -0,0 +1,296 @@
+import io
+
+import pytest
+from PIL import Image
+
+from image.pipeline import blurhash_encode, build_variants, pick_variant_url, render_variants, variant_key
+from image.services import S3StorageService
+
+
+def make_png(width=800, height=600, color=(200, 80, 40)):
+    image = Image.new("RGB", (width, height), color)
+    for x in range(0, width, 40):
+        for y in range(height):
+            image.putpixel((x, y), (20, 20, 220))
+    buf = io.BytesIO()
+    image.save(buf, "PNG")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def local_storage(settings, tmp_path):
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "default": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": str(tmp_path), "base_url": "/media/"},
+        },
+    }
+    settings.IMAGE_VARIANT_WIDTHS = (160, 320, 640, 1080)
+    settings.IMAGE_VARIANT_FORMAT = "webp"
+    return tmp_path
+
+
+def upload(key, data):
+    """What the client does with the presigned URL."""
+    return S3StorageService.save_bytes(key, data, "image/png")
+
+
+def test_render_variants_never_upscales():
+    meta, rendered = render_variants(make_png(800, 600), widths=(160, 320, 640, 1080), fmt="webp")
+
+    assert sorted(rendered) == [160, 320, 640]
+    assert (meta["width"], meta["height"], meta["format"]) == (800, 600, "webp")
+    with Image.open(io.BytesIO(rendered[320])) as thumb:
+        assert thumb.format == "WEBP"
+        assert thumb.size == (320, 240)
+
+
+def test_blurhash_shape():
+    image = Image.open(io.BytesIO(make_png(64, 48)))
+    value = blurhash_encode(image)
+
+    # 1 size flag + 1 max AC + 4 DC + 2 per AC component (4x3 - 1)
+    assert len(value) == 6 + 2 * 11
+    assert value[0] == "L"  # (4 - 1) + (3 - 1) * 9 = 21
+    assert value == blurhash_encode(image)
+
+
+def test_pick_variant_url():
+    entry = {"source": "https://cdn/a.jpg", "widths": {"160": "s", "320": "m", "640": "l"}}
+
+    assert pick_variant_url("https://cdn/a.jpg", entry, 300) == "m"
+    assert pick_variant_url("https://cdn/a.jpg", entry, 640) == "l"
+    assert pick_variant_url("https://cdn/a.jpg", entry, 1080) == "https://cdn/a.jpg"
+    # stale variants (image replaced) and missing variants fall back to the original
+    assert pick_variant_url("https://cdn/b.jpg", entry, 300) == "https://cdn/b.jpg"
+    assert pick_variant_url("https://cdn/a.jpg", None, 300) == "https://cdn/a.jpg"
+
+
+def test_build_variants_writes_next_to_original(local_storage):
+    source = upload("upload/01ABC.png", make_png(800, 600))
+
+    entry = build_variants(source)
+
+    assert entry["source"] == source
+    assert entry["widths"] == {
+        "160": "/media/upload/01ABC_w160.webp",
+        "320": "/media/upload/01ABC_w320.webp",
+        "640": "/media/upload/01ABC_w640.webp",
+    }
+    assert (local_storage / variant_key("upload/01ABC.png", 320, "webp")).exists()
+    assert len(entry["blurhash"]) == 28
+
+
+@pytest.mark.django_db
+def test_menu_image_variants_recorded_on_row(local_storage, django_capture_on_commit_callbacks, monkeypatch):
+    from accounts.models import Business
+    from menu.models import BaseItem
+    from image import tasks
+
+    monkeypatch.setattr(tasks.generate_image_variants, "delay", tasks.generate_image_variants)
+    business = Business.objects.create(business_name="Image Test")
+    source = upload(f"businesses/{business.id}/menu/01XYZ.png", make_png(700, 700))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        item = BaseItem.objects.create(business=business, name="Burger", default_price=1000, image=source)
+
+    item.refresh_from_db()
+    entry = item.image_variants["image"]
+    assert entry["source"] == source
+    assert sorted(entry["widths"], key=int) == ["160", "320", "640"]
+    assert tasks.stale_image_rows(BaseItem).count() == 0
+
+    # replacing the image makes the row stale again until the sweep runs
+    replacement = upload(f"businesses/{business.id}/menu/01NEW.png", make_png(400, 300))
+    BaseItem.objects.filter(pk=item.pk).update(image=replacement)
+    assert list(tasks.stale_image_rows(BaseItem).values_list("pk", flat=True)) == [item.pk]
+
+    assert tasks.generate_business_menu_variants(business.id) == 1
+    item.refresh_from_db()
+    assert item.image_variants["image"]["source"] == replacement
+    assert sorted(item.image_variants["image"]["widths"], key=int) == ["160", "320"]
+
+
+@pytest.mark.django_db
+def test_serializer_emits_size_appropriate_url(local_storage):
+    from accounts.models import Business
+    from menu.models import BaseItem, Menu, MenuCategory, MenuItem
+    from menu.serializers.menu import MenuItemDetailSerializer, MenuItemFeaturedSerializer
+
+    business = Business.objects.create(business_name="Image Test")
+    source = upload("upload/01SER.png", make_png(800, 600))
+    base = BaseItem.objects.create(business=business, name="Rice", default_price=500, image=source)
+    category = MenuCategory.objects.create(menu=Menu.objects.create(business=business, name="Main"), name="Rice")
+    item = MenuItem.objects.create(category=category, base_item=base, custom_name="Rice", price=500)
+
+    assert MenuItemDetailSerializer(item).data["image"] == source  # variants not built yet
+
+    BaseItem.objects.filter(pk=base.pk).update(image_variants={"image": build_variants(source)})
+    item = MenuItem.objects.select_related("base_item").get(pk=item.pk)
+
+    assert MenuItemDetailSerializer(item).data["image"] == "/media/upload/01SER_w640.webp"
+    featured = MenuItemFeaturedSerializer(item).data
+    assert featured["image"] == "/media/upload/01SER_w320.webp"
+    assert featured["image_blurhash"] == base.__class__.objects.get(pk=base.pk).image_variants["image"]["blurhash"]
+
+
+# ===== STORAGE GC =====
+
+@pytest.mark.django_db(transaction=True)
+def test_tombstones_roll_back_with_the_request(local_storage):
+    from django.db import transaction
+    from image.gc import tombstone_urls
+    from image.models import StorageTombstone
+
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            tombstone_urls(["/media/upload/a.png"])
+            raise RuntimeError("request failed")
+
+    assert not StorageTombstone.objects.exists()
+
+
+@pytest.mark.django_db
+def test_collect_garbage_deletes_in_batches(local_storage):
+    from image.gc import collect_garbage, tombstone_urls
+    from image.models import StorageTombstone
+
+    urls = [upload(f"upload/{n}.png", b"x") for n in range(5)]
+    tombstone_urls(urls, reason="test")
+
+    stats = collect_garbage(batch_size=2)
+
+    assert stats == {"deleted": 5, "retried": 0, "dead": 0}
+    assert not StorageTombstone.objects.exists()
+    assert not any((local_storage / f"upload/{n}.png").exists() for n in range(5))
+
+
+@pytest.mark.django_db
+def test_collect_garbage_retries_then_dead_letters(local_storage, settings):
+    from django.utils import timezone
+    from image.gc import collect_garbage, tombstone_urls
+    from image.models import StorageTombstone
+
+    class FailingStorage:
+        @staticmethod
+        def delete_urls(urls):
+            raise ConnectionError("bucket unavailable")
+
+    settings.STORAGE_GC_MAX_ATTEMPTS = 2
+    tombstone_urls(["/media/upload/a.png"])
+
+    assert collect_garbage(storage=FailingStorage) == {"deleted": 0, "retried": 1, "dead": 0}
+    row = StorageTombstone.objects.get()
+    assert row.attempts == 1 and row.not_before > timezone.now()
+    assert "bucket unavailable" in row.last_error
+    assert collect_garbage(storage=FailingStorage)["retried"] == 0  # backing off
+
+    StorageTombstone.objects.update(not_before=timezone.now())
+    assert collect_garbage(storage=FailingStorage) == {"deleted": 0, "retried": 0, "dead": 1}
+    assert StorageTombstone.objects.get().status == StorageTombstone.STATUS_DEAD
+
+
+@pytest.mark.django_db
+def test_collect_garbage_only_retries_the_keys_that_failed(local_storage):
+    from image.gc import collect_garbage, tombstone_urls
+    from image.models import StorageTombstone
+
+    class PartlyFailingStorage:
+        @staticmethod
+        def delete_urls(urls):
+            return {url: "AccessDenied: Access Denied" for url in urls if url.endswith("b.png")}
+
+    tombstone_urls(["/media/upload/a.png", "/media/upload/b.png", "/media/upload/c.png"])
+
+    assert collect_garbage(storage=PartlyFailingStorage) == {"deleted": 2, "retried": 1, "dead": 0}
+    row = StorageTombstone.objects.get()
+    assert row.url == "/media/upload/b.png"
+    assert row.attempts == 1 and row.last_error == "AccessDenied: Access Denied"
+
+
+@pytest.mark.django_db
+def test_collect_garbage_leases_the_batch_before_calling_the_bucket(local_storage):
+    from django.utils import timezone
+    from image.gc import claim, collect_garbage, tombstone_urls
+    from image.models import StorageTombstone
+
+    seen = []
+
+    class InspectingStorage:
+        @staticmethod
+        def delete_urls(urls):
+            # the claim is committed: rows are leased and no other worker can take them
+            seen.append(StorageTombstone.objects.get().not_before > timezone.now())
+            seen.append(claim()[1])
+            return {}
+
+    tombstone_urls(["/media/upload/a.png"])
+
+    assert collect_garbage(storage=InspectingStorage)["deleted"] == 1
+    assert seen == [True, []]
+
+
+@pytest.mark.django_db
+def test_expired_lease_comes_due_again(local_storage):
+    from django.utils import timezone
+    from image.gc import claim, collect_garbage, tombstone_urls
+    from image.models import StorageTombstone
+
+    tombstone_urls(["/media/upload/a.png"])
+    _, rows = claim()  # the worker holding this lease dies
+    assert len(rows) == 1
+    assert collect_garbage()["deleted"] == 0
+
+    StorageTombstone.objects.update(not_before=timezone.now())
+    assert collect_garbage()["deleted"] == 1
+    assert not StorageTombstone.objects.exists()
+
+
+@pytest.mark.django_db
+def test_replacing_business_image_tombstones_instead_of_deleting(local_storage, monkeypatch):
+    from django.core.files.base import ContentFile
+    from accounts.models import Business
+    from image.gc import collect_garbage
+    from image.mixin import BuilkS3ImageManagedMixin
+    from image.models import StorageTombstone
+    from image import tasks
+
+    monkeypatch.setattr(tasks.generate_image_variants, "delay", lambda *args: None)
+    business = Business.objects.create(business_name="GC Test")
+    business.business_logo.save("old.png", ContentFile(make_png(50, 50)))
+    old_path = local_storage / business.business_logo.name
+
+    BuilkS3ImageManagedMixin().update_image_field(
+        business, {"business_logo": ContentFile(make_png(50, 50), name="new.png")}
+    )
+
+    assert old_path.exists()  # nothing deleted inside the request
+    assert StorageTombstone.objects.get().url == f"/media/{old_path.relative_to(local_storage).as_posix()}"
+    collect_garbage()
+    assert not old_path.exists()
+    assert (local_storage / business.business_logo.name).exists()
+
+
+@pytest.mark.django_db
+def test_scan_finds_unreferenced_objects(local_storage):
+    from datetime import timedelta
+    from accounts.models import Business
+    from menu.models import BaseItem
+    from image.gc import scan_orphans
+    from image.models import StorageTombstone
+
+    business = Business.objects.create(business_name="Scan Test")
+    kept = upload("upload/kept.png", b"x")
+    variant = upload("upload/kept_w160.webp", b"x")
+    upload("upload/orphan.png", b"x")
+    BaseItem.objects.filter(pk=BaseItem.objects.create(
+        business=business, name="Kept", default_price=1, image=kept,
+    ).pk).update(image_variants={"image": {"source": kept, "widths": {"160": variant}}})
+
+    assert scan_orphans(prefixes=("upload/",), grace=timedelta(hours=1)) == []  # too young
+    assert scan_orphans(prefixes=("upload/",), grace=timedelta(0), dry_run=True) == ["upload/orphan.png"]
+    assert not StorageTombstone.objects.exists()
+
+    scan_orphans(prefixes=("upload/",), grace=timedelta(0))
+    assert list(StorageTombstone.objects.values_list("url", "reason")) == [("/media/upload/orphan.png", "scan")]
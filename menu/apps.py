@@ -3,4 +3,7 @@ from django.apps import AppConfig
 
 class MenuConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'menu'
\ No newline at end of file
+    name = 'menu'
+
+    def ready(self):
+        from . import signals  # noqa: F401
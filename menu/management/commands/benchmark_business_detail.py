@@ -0,0 +1,82 @@
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.models import Branch, Business
+from addresses.utils.gis_point import make_point
+from common.benchmark import latency, rolled_back, sample
+from menu.models import (
+    BaseItem, BaseItemAvailability, Menu, MenuCategory, MenuItem,
+    MenuItemAddon, MenuItemAddonGroup, VariantGroup, VariantOption,
+)
+from menu.services import menu_cache
+
+
+class Command(BaseCommand):
+    help = (
+        "Business detail page for a large menu: p50/p99 and queries per request with the menu payload "
+        "rebuilt every time, served from cache, and revalidated with If-None-Match. Everything is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--items", type=int, default=500)
+        parser.add_argument("--categories", type=int, default=20)
+        parser.add_argument("--requests", type=int, default=200)
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            self.run(options)
+        self.stdout.write("Rolled back synthetic business.")
+
+    def run(self, options):
+        business = Business.objects.create(business_name="Bench menu", onboarding_complete=True)
+        branch = Branch.objects.create(business=business, name="Bench branch", location=make_point(3.35, 6.6))
+        menu = Menu.objects.create(business=business, name="Bench")
+        categories = MenuCategory.objects.bulk_create(
+            [MenuCategory(menu=menu, name=f"Category {c}", sort_order=c) for c in range(options["categories"])]
+        )
+        bases = BaseItem.objects.bulk_create(
+            [BaseItem(business=business, name=f"Bench item {i}", default_price=Decimal("1500")) for i in range(options["items"])]
+        )
+        items = MenuItem.objects.bulk_create(
+            [
+                MenuItem(category=categories[i % len(categories)], base_item=base, custom_name=base.name, price=Decimal("1500"))
+                for i, base in enumerate(bases)
+            ]
+        )
+        groups = VariantGroup.objects.bulk_create([VariantGroup(item=item, name="Size") for item in items])
+        VariantOption.objects.bulk_create(
+            [VariantOption(group=group, name=size, price_diff=diff) for group in groups for size, diff in (("Regular", 0), ("Large", 500))]
+        )
+        addon_base = BaseItem.objects.create(business=business, name="Bench extra", default_price=Decimal("200"))
+        addon = MenuItemAddon.objects.create(base_item=addon_base, price=Decimal("200"))
+        addon_groups = MenuItemAddonGroup.objects.bulk_create([MenuItemAddonGroup(item=item, name="Extras") for item in items])
+        MenuItemAddon.groups.through.objects.bulk_create(
+            [MenuItemAddon.groups.through(menuitemaddon_id=addon.id, menuitemaddongroup_id=group.id) for group in addon_groups]
+        )
+        BaseItemAvailability.objects.bulk_create(
+            [BaseItemAvailability(branch=branch, base_item=base, is_available=i % 10 != 0) for i, base in enumerate(bases)]
+        )
+        self.stdout.write(f"{len(items)} items in {len(categories)} categories, 2 variants and 1 addon each")
+
+        client = APIClient()
+        url = reverse("business-detail", args=[business.id])
+
+        def get(**headers):
+            return client.get(url, {"lat": 6.6, "lng": 3.35}, **headers)
+
+        etag = get()["ETag"]
+        self.measure("uncached (payload rebuilt)", options["requests"], get, before=lambda: menu_cache.invalidate_menu(business.id))
+        self.measure("cached payload + overlay", options["requests"], get)
+        self.measure("If-None-Match (304)", options["requests"], lambda: get(HTTP_IF_NONE_MATCH=etag))
+
+    def measure(self, label, requests, get, before=None):
+        response, timings, queries = sample(requests, get, before=before)
+        self.stdout.write(
+            f"{label:<28} status {response.status_code}  queries/req {queries:.1f}  "
+            f"{latency(timings, 99)}  {len(response.content) // 1024}KB"
+        )
+
+# Run with: python manage.py benchmark_business_detail --items 500 --requests 200
@@ -0,0 +1,94 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from menu.services.tagging import (
+    MinHashLSH, TagIndex, _similarity_score, cluster_names,
+)
+from menu.management.commands.seed_global_tags import SEED_TAGS
+
+MODIFIERS = ["Grilled", "Spicy", "Special", "House", "Chef's", "Family", "Classic", "Mini", "Jumbo"]
+SUFFIXES = ["", "s", " Combo", " Platter", " Deals"]
+
+
+def synthetic_categories(count, seed=7):
+    rng = random.Random(seed)
+    words = SEED_TAGS + MODIFIERS
+    names = []
+    for _ in range(count):
+        if rng.random() < 0.6:
+            names.append(f"{rng.choice(words)} {rng.choice(words)}")
+        else:
+            names.append(rng.choice(words) + rng.choice(SUFFIXES))
+    return names
+
+
+def legacy_suggest(name, tags, threshold=0.5, limit=3):
+    scored = [(_similarity_score(name, tag_name), tag_id) for tag_id, tag_name in tags]
+    scored = [s for s in scored if s[0] >= threshold]
+    scored.sort(reverse=True)
+    return scored[:limit]
+
+
+def legacy_cluster(unmatched, cluster_threshold=0.75):
+    used, clusters = set(), 0
+    for i, item in enumerate(unmatched):
+        if i in used:
+            continue
+        used.add(i)
+        clusters += 1
+        for j in range(i + 1, len(unmatched)):
+            if j not in used and _similarity_score(item["name"], unmatched[j]["name"]) >= cluster_threshold:
+                used.add(j)
+    return clusters
+
+
+class Command(BaseCommand):
+    help = "Benchmark tag suggestion: pairwise SequenceMatcher vs n-gram index + MinHash clustering."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--categories", type=int, default=5000)
+        parser.add_argument("--skip-legacy-cluster", action="store_true", help="O(U^2), slow on large inputs.")
+
+    def handle(self, *args, **options):
+        tags = list(enumerate(SEED_TAGS, start=1))
+        names = synthetic_categories(options["categories"])
+
+        started = time.perf_counter()
+        index = TagIndex(tags)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        legacy = [legacy_suggest(n, tags) for n in names]
+        legacy_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        indexed = [index.score(n) for n in names]
+        index_s = time.perf_counter() - started
+
+        same_top = sum(
+            1 for a, b in zip(legacy, indexed)
+            if (round(a[0][0], 2) if a else None) == (b[0].score if b else None)
+        )
+
+        self.stdout.write(f"{len(tags)} tags, {len(names)} categories")
+        self.stdout.write(f"index build            {build_ms:>8.1f} ms")
+        self.stdout.write(f"suggest (pairwise)     {legacy_s:>8.2f} s")
+        self.stdout.write(f"suggest (n-gram index) {index_s:>8.2f} s   top-1 agreement {same_top / len(names):.1%}")
+
+        unmatched = [{"name": n, "usage_count": 1} for n in dict.fromkeys(names)]
+        started = time.perf_counter()
+        clusters = cluster_names(unmatched, lsh=MinHashLSH())
+        lsh_s = time.perf_counter() - started
+        self.stdout.write(f"cluster (minhash lsh)  {lsh_s:>8.2f} s   {len(clusters)} clusters from {len(unmatched)} names")
+
+        if not options["skip_legacy_cluster"]:
+            started = time.perf_counter()
+            legacy_clusters = legacy_cluster(unmatched)
+            self.stdout.write(
+                f"cluster (pairwise)     {time.perf_counter() - started:>8.2f} s   {legacy_clusters} clusters"
+            )
+
+
+# Run with: python manage.py benchmark_tagging --categories 5000
@@ -0,0 +1,21 @@
+# Generated by Django 5.1 on 2026-10-19 14:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('menu', '0029_baseitem_image_variants_menuitem_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['orderer', '-created_at', '-id'], name='menu_order_orderer_5c52cf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['driver', '-created_at', '-id'], name='menu_order_driver__0b2103_idx'),
+        ),
+    ]
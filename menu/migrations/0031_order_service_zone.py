@@ -0,0 +1,20 @@
+# Generated by Django 5.1 on 2026-10-19 18:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('addresses', '0005_servicezone'),
+        ('menu', '0030_order_menu_order_orderer_5c52cf_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='service_zone',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='orders', to='addresses.servicezone'),
+        ),
+    ]
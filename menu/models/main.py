@@ -17,6 +17,7 @@ class BaseItem(models.Model):
     description = models.TextField(blank=True)
     default_price = models.DecimalField(max_digits=10, decimal_places=2)
     image = models.URLField(max_length=500, null=True, blank=True)
+    image_variants = models.JSONField(default=dict, blank=True)  # image/pipeline.py
 
     @property
     def restaurant(self):
@@ -82,6 +83,7 @@ class MenuItem(models.Model):
     description = models.TextField(blank=True)
     price = models.DecimalField(max_digits=10, decimal_places=2)
     image = models.URLField(max_length=500, null=True, blank=True)
+    image_variants = models.JSONField(default=dict, blank=True)  # image/pipeline.py
     favorite = models.ManyToManyField(CustomerProfile) # check
 
     # objects = MenuItemManager()  # attach the custom manager
@@ -97,6 +99,11 @@ class MenuItem(models.Model):
     def effective_image(self):
         return self.image if self.image is not None else self.base_item.image
 
+    @property
+    def effective_image_variants(self):
+        owner = self if self.image is not None else self.base_item
+        return (owner.image_variants or {}).get("image")
+
 # extras, what about (addon and variant) availability?
 class VariantGroup(models.Model):
     item = models.ForeignKey("MenuItem", on_delete=models.CASCADE, related_name="variant_groups")
@@ -26,6 +26,10 @@ class Order(models.Model): # do we add a coupon snap shot or not also a discount
 
     # Fees
     delivery_price = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    # zone the delivery fee was priced in (its settings may change later)
+    service_zone = models.ForeignKey(
+        "addresses.ServiceZone", on_delete=models.SET_NULL, related_name="orders", blank=True, null=True
+    )
     ovena_commission = models.DecimalField(max_digits=5, decimal_places=2, default=10)
     # platform_fee = models.DecimalField(max_digits=10, decimal_places=2, default=0)
 
@@ -76,6 +80,9 @@ class Order(models.Model): # do we add a coupon snap shot or not also a discount
             models.Index(fields=['driver', 'status']),
             models.Index(fields=['branch', 'status']),
             models.Index(fields=['orderer', 'status', 'delivered_at']),
+            # keyset-paginated order lists (menu/pagifications.py KeysetPagination)
+            models.Index(fields=['orderer', '-created_at', '-id']),
+            models.Index(fields=['driver', '-created_at', '-id']),
         ]
     
     def __str__(self):
@@ -7,6 +7,7 @@ from ..models import (
 )
 from accounts.models import BusinessSubscription
 from menu.utils.helper import is_branch_hours_open, get_hours, is_branch_open
+from image.fields import BlurhashField, VariantImageField
 
 
 # ============================================================================
@@ -69,9 +70,10 @@ class MenuItemDetailSerializer(serializers.ModelSerializer):
     price = serializers.DecimalField(
         source='effective_price', max_digits=10, decimal_places=2, read_only=True
     )
-    image = serializers.URLField(
-        source='effective_image', read_only=True
+    image = VariantImageField(
+        source='effective_image', variants='effective_image_variants', width=640
     )
+    image_blurhash = BlurhashField(source='effective_image', variants='effective_image_variants')
     variant_groups = VariantGroupSerializer(many=True, read_only=True)
     addon_groups = MenuItemAddonGroupSerializer(many=True, read_only=True)
 
@@ -86,7 +88,8 @@ class MenuItemDetailSerializer(serializers.ModelSerializer):
             "price",          # effective_price (menu-level)
             "branch_price",   # override price for this branch (or null)
             "is_available",   # available at this branch?
-            "image",          # effective_image
+            "image",          # effective_image, 640px variant when available
+            "image_blurhash",
             "variant_groups",
             "addon_groups",
         ]
@@ -121,6 +124,7 @@ class MenuItemSimpleSerializer(serializers.ModelSerializer):
     price = serializers.DecimalField(
         source='effective_price', max_digits=10, decimal_places=2, read_only=True
     )
+    image = VariantImageField(width=320)
 
     class Meta:
         model = MenuItem
@@ -135,7 +139,8 @@ class MenuItemFeaturedSerializer(serializers.ModelSerializer):
     price = serializers.DecimalField(
         source='effective_price', max_digits=10, decimal_places=2, read_only=True
     )
-    image = serializers.URLField(source='effective_image', read_only=True)
+    image = VariantImageField(source='effective_image', variants='effective_image_variants', width=320)
+    image_blurhash = BlurhashField(source='effective_image', variants='effective_image_variants')
     variant_groups = VariantGroupSerializer(many=True, read_only=True)
     addon_groups = MenuItemAddonGroupSerializer(many=True, read_only=True)
 
@@ -143,7 +148,7 @@ class MenuItemFeaturedSerializer(serializers.ModelSerializer):
         model = MenuItem
         fields = [
             "id", "custom_name", "description",
-            "price", "image", "variant_groups", "addon_groups"
+            "price", "image", "image_blurhash", "variant_groups", "addon_groups"
         ]
 
 
@@ -243,13 +248,16 @@ class BusinessListSerializer(BaseWithNearestSerializer):
     Ultra-lightweight. Infinite scroll homepage list.
     2 queries total for 20 businesses.
     """
+    business_logo = VariantImageField(width=160)
+    business_image = VariantImageField(width=320)
+    business_image_blurhash = BlurhashField(source="business_image")
 
     class Meta:
         model = Business
         fields = [
             "id", "business_name", "business_type",
             "business_logo", "avg_rating", "rating_count",
-            "nearest_branch", "business_image"
+            "nearest_branch", "business_image", "business_image_blurhash",
         ]
 
 
@@ -273,6 +281,7 @@ class BusinessWithMenuNamesSerializer(BaseWithNearestSerializer):
     Requires prefetch: menus__categories__items
     """
     menus = MenuSimpleSerializer(many=True, read_only=True)
+    business_logo = VariantImageField(width=160)
 
     class Meta:
         model = Business
@@ -290,6 +299,7 @@ class BusinessFeaturedSerializer(BaseWithNearestSerializer):
     Requires prefetch with filtered queryset for items.
     """
     # featured_items = serializers.SerializerMethodField()
+    business_logo = VariantImageField(width=160)
 
     class Meta:
         model = Business
@@ -314,22 +324,28 @@ class BusinessFeaturedSerializer(BaseWithNearestSerializer):
 class BusinessDetailSerializer(serializers.ModelSerializer, BaseWithAddressMixin):
     """
     Full detail page serializer. Branch-aware pricing and availability.
-    Requires context['availability_map'] built in view.
+    Requires context['availability_map'] built in view, or context['menus']
+    already serialized (BusinessDetailView serves them from menu_cache).
     Passes context down so MenuItemDetailSerializer can use it.
     """
     menus = serializers.SerializerMethodField()
     nearest_branch = serializers.SerializerMethodField()
+    business_logo = VariantImageField(width=160)
+    business_image = VariantImageField(width=1080)
+    business_image_blurhash = BlurhashField(source="business_image")
 
     class Meta:
         model = Business
         fields = [
             "id", "business_name", "business_type",
-            "business_logo", "business_image", #"banner_image",
+            "business_logo", "business_image", "business_image_blurhash", #"banner_image",
             "avg_rating", "rating_count",
             "nearest_branch", "menus", #"description",
         ]
 
     def get_menus(self, obj):
+        if self.context.get("menus") is not None:
+            return self.context["menus"]
         return MenuDetailSerializer(
             obj.menus.all(),
             many=True,
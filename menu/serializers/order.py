@@ -1,9 +1,12 @@
+from dataclasses import dataclass
 from decimal import Decimal
+from django.conf import settings
 # from django.db import transaction
 from rest_framework import serializers
 
 from accounts.models import Branch
 from addresses.utils import get_cached_distance_km_from_2points
+from addresses.services.zones import find_zone_id, get_zone_settings
 from authflow.services import generate_passphrase, hash_phrase
 from coupons_discount.models import Coupons, UserCouponWallet
 from coupons_discount.services import CouponService, eligible_coupon_q, available_wallet_entry_q
@@ -16,13 +19,39 @@ MINIMUM_PRICE_KM = 100 #1000
 MIN_ORDER_SUBTOTAL = Decimal("5000.00")
 PLATFORM_FEES_PERCENT = 4#10
 
-def calculate_delivery_fee(is_delivery, distance_km)-> float:
-    delivery_fee = max(distance_km * PRICE_PER_KM, MINIMUM_PRICE_KM)
+def calculate_delivery_fee(is_delivery, distance_km, zone_settings=None)-> float:
+    zone_settings = zone_settings or {}
+    delivery_fee = max(
+        distance_km * zone_settings.get("per_km_fee", PRICE_PER_KM),
+        zone_settings.get("minimum_fee", MINIMUM_PRICE_KM),
+    )
     if not is_delivery:
         delivery_fee = 0
     return delivery_fee
 
 
+@dataclass(frozen=True)
+class DeliveryQuote:
+    zone_id: int | None
+    distance_km: float
+    fee: float
+
+
+def quote_delivery(is_delivery, user_location, branch) -> DeliveryQuote:
+    """
+    Zone and delivery fee for this customer and branch. The checkout quote
+    (OrderCalculationsView) and order creation both price through here, so
+    the fee quoted is the fee charged.
+    """
+    zone_id = find_zone_id(user_location)
+    distance_km = get_cached_distance_km_from_2points(user_location, branch.location)
+    return DeliveryQuote(
+        zone_id=zone_id,
+        distance_km=distance_km,
+        fee=calculate_delivery_fee(is_delivery, distance_km, get_zone_settings(zone_id)),
+    )
+
+
 class PaymentRetrySerializer(serializers.Serializer):
     order_id = serializers.IntegerField()
 
@@ -83,11 +112,14 @@ class OrderCreateSerializer(serializers.Serializer):
         attrs["branch"] = branch
         
         
-        # 3) Resolve the requesting user and delivery distance.
-        attrs["distance_km"] = get_cached_distance_km_from_2points(
-            user_loaction, branch.location
-        )
+        # 3) Resolve the requesting user, service zone and delivery fee
+        #    (zone-level pricing / dispatch settings hang off the zone).
         attrs["_user"] = user
+        attrs["delivery_quote"] = quote_delivery(attrs.get("is_delivery", True), user_loaction, branch)
+        if attrs["delivery_quote"].zone_id is None and settings.SERVICE_ZONES_ENFORCED:
+            raise serializers.ValidationError(
+                {"non_field_errors": "We don't deliver to this location yet."}
+            )
 
         # 4) Coupon resolution — mutually exclusive paths.
         coupon_code = (attrs.get("coupon_code") or "").strip()
@@ -289,18 +321,17 @@ class OrderCreateSerializer(serializers.Serializer):
         coupon: Coupons | None = validated_data.get("coupon")
         wallet_entry: UserCouponWallet | None = validated_data.get("wallet_entry")
         items = validated_data["items"]
-        distance_km = validated_data.get("distance_km", 0)
+        quote: DeliveryQuote = validated_data["delivery_quote"]
         is_delivery = validated_data["is_delivery"]
 
         phrase = generate_passphrase()
-        
-        delivery_fee = calculate_delivery_fee(is_delivery, distance_km)
 
         order = Order.objects.create(
             orderer=customer,
             branch=branch,
             delivery_secret_hash=hash_phrase(phrase),
-            delivery_price=delivery_fee,
+            delivery_price=quote.fee,
+            service_zone_id=quote.zone_id,
             picked_up_by_user= (not is_delivery),
             ovena_commission=PLATFORM_FEES_PERCENT,
         )
@@ -0,0 +1,155 @@
+"""
+Business menu payload cache for the business detail page (BusinessDetailView).
+
+    payload = menu_payload(business_id)      # serialized menus, cached per business version
+    overlay = branch_overlay(branch_id)      # {base_item_id: (override_price, is_available)}, per branch version
+    apply_overlay(payload, overlay)          -> the menus with branch_price / is_available filled in
+
+The menu tree (menus -> categories -> items -> variants / addons) changes when a
+business edits its menu and is viewed far more often, so it is serialized once,
+without any branch, and cached under `menu:payload:<business_id>:v<version>`.
+What differs per branch is only each item's branch_price and is_available; that
+overlay is cached on its own, so an availability toggle never re-serializes a
+menu and a menu edit never reloads availability.
+
+Writers invalidate explicitly, inside their transaction:
+    invalidate_menu(business_id)         upsert_menus, menu registration, the delete views
+    invalidate_availability(branch_id)   availability toggles
+Both bump the version now and again on commit, so a read racing the write
+cannot re-cache the old rows under the new version. MENU_PAYLOAD_TTL bounds
+anything that changes the tree without going through those paths (thumbnails
+recorded by image.tasks, admin edits).
+
+Each piece carries a digest of its content; the view builds its ETag from them.
+"""
+import hashlib
+import json
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Prefetch
+
+from menu.models import BaseItemAvailability, Menu, MenuItem
+
+PAYLOAD_KEY = "menu:payload:{}:v{}"
+OVERLAY_KEY = "menu:overlay:{}:v{}"
+PAYLOAD_VERSION_KEY = "menu:payload:version:{}"
+OVERLAY_VERSION_KEY = "menu:overlay:version:{}"
+
+
+@dataclass(frozen=True)
+class MenuPayload:
+    menus: list
+    base_item_ids: dict  # menu item id -> base_item_id, for the overlay
+    digest: str
+
+
+@dataclass(frozen=True)
+class BranchOverlay:
+    availability: dict  # base_item_id -> (override_price, is_available)
+    digest: str
+
+
+def digest(value) -> str:
+    return hashlib.md5(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _ttl():
+    return getattr(settings, "MENU_PAYLOAD_TTL", 60 * 60)
+
+
+# ===== VERSIONS =====
+
+def _bump(key):
+    if cache.add(key, 2, timeout=None):
+        return
+    try:
+        cache.incr(key)
+    except ValueError:  # evicted between add() and incr()
+        cache.set(key, 2, timeout=None)
+
+
+def _bump_now_and_on_commit(key):
+    _bump(key)
+    transaction.on_commit(lambda: _bump(key))
+
+
+def invalidate_menu(business_id):
+    _bump_now_and_on_commit(PAYLOAD_VERSION_KEY.format(business_id))
+
+
+def invalidate_availability(branch_id):
+    _bump_now_and_on_commit(OVERLAY_VERSION_KEY.format(branch_id))
+
+
+def _cached(version_key, key_format, owner_id, build):
+    key = key_format.format(owner_id, cache.get(version_key.format(owner_id), 1))
+    value = cache.get(key)
+    if value is None:
+        value = build(owner_id)
+        cache.set(key, value, timeout=_ttl())
+    return value
+
+
+# ===== MENU PAYLOAD =====
+
+def build_menu_payload(business_id) -> MenuPayload:
+    from menu.serializers.menu import MenuDetailSerializer
+
+    menus = list(
+        Menu.objects.filter(business_id=business_id).prefetch_related(
+            Prefetch("categories__items", queryset=MenuItem.objects.select_related("base_item")),
+            "categories__items__variant_groups__options",
+            "categories__items__addon_groups__addons__base_item",
+        )
+    )
+    base_item_ids = {
+        item.id: item.base_item_id
+        for menu in menus
+        for category in menu.categories.all()
+        for item in category.items.all()
+    }
+    # no availability_map: every item serializes as branch_price=None, is_available=True
+    data = json.loads(json.dumps(MenuDetailSerializer(menus, many=True).data, default=str))
+    return MenuPayload(menus=data, base_item_ids=base_item_ids, digest=digest(data))
+
+
+def menu_payload(business_id) -> MenuPayload:
+    return _cached(PAYLOAD_VERSION_KEY, PAYLOAD_KEY, business_id, build_menu_payload)
+
+
+# ===== BRANCH OVERLAY =====
+
+def build_branch_overlay(branch_id) -> BranchOverlay:
+    availability = {
+        base_item_id: (override_price, is_available)
+        for base_item_id, override_price, is_available in BaseItemAvailability.objects.filter(
+            branch_id=branch_id
+        ).values_list("base_item_id", "override_price", "is_available")
+    }
+    return BranchOverlay(availability=availability, digest=digest(sorted(availability.items())))
+
+
+def branch_overlay(branch_id) -> BranchOverlay:
+    return _cached(OVERLAY_VERSION_KEY, OVERLAY_KEY, branch_id, build_branch_overlay)
+
+
+def apply_overlay(payload: MenuPayload, overlay: BranchOverlay | None) -> list:
+    """The cached menus with this branch's prices and availability (no record = available)."""
+    if overlay is None or not overlay.availability:
+        return payload.menus
+    menus = []
+    for menu in payload.menus:
+        categories = []
+        for category in menu["categories"]:
+            items = []
+            for item in category["items"]:
+                override_price, is_available = overlay.availability.get(
+                    payload.base_item_ids.get(item["id"]), (None, True)
+                )
+                items.append({**item, "branch_price": override_price, "is_available": is_available})
+            categories.append({**category, "items": items})
+        menus.append({**menu, "categories": categories})
+    return menus
@@ -1,11 +1,19 @@
+import random
 import re
+import threading
+import time
+import zlib
+from collections import defaultdict
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 from typing import List
+from django.core.cache import cache
 from menu.models import MenuCategory
 from menu.models.categories import GlobalTag
 from django.db.models import Count
 
+TAG_INDEX_VERSION_KEY = "tagging:index:version"
+
 def _normalize(text: str) -> str:
     text = text.lower().strip()
     text = re.sub(r"[^a-z0-9\s]", "", text)
@@ -33,6 +41,14 @@ def _similarity_score(category_name: str, tag_name: str) -> float:
     return max(ratio, overlap)
 
 
+def _ngrams(normalized: str, n: int = 3) -> set:
+    """Character n-grams of ' text ' — padding lets 1-2 letter words still produce grams."""
+    padded = f" {normalized} "
+    if len(padded) <= n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
 @dataclass
 class TagSuggestion:
     tag_id: int
@@ -40,19 +56,96 @@ class TagSuggestion:
     score: float
 
 
+class TagIndex:
+    """
+    Character n-gram inverted index over GlobalTag names.
+
+    A query only looks at tags that share at least one n-gram (the posting
+    lists), ranks them by shared n-gram count and re-scores the best
+    `candidates` with the same _similarity_score the admin flow always used.
+    Cost is proportional to posting-list length, not to the number of tags.
+    """
+
+    def __init__(self, tags, n: int = 3, candidates: int = 25):
+        self.n = n
+        self.candidates = candidates
+        self.tags = [(tag_id, name) for tag_id, name in tags]
+        self.postings = defaultdict(list)
+        for pos, (_, name) in enumerate(self.tags):
+            for gram in _ngrams(_normalize(name), n):
+                self.postings[gram].append(pos)
+
+    @classmethod
+    def from_tags(cls, tags, **kwargs):
+        return cls([(t.id, t.name) for t in tags], **kwargs)
+
+    @classmethod
+    def from_db(cls, **kwargs):
+        return cls(GlobalTag.objects.values_list("id", "name"), **kwargs)
+
+    def __len__(self):
+        return len(self.tags)
+
+    def candidates_for(self, name: str):
+        counts = defaultdict(int)
+        for gram in _ngrams(_normalize(name), self.n):
+            for pos in self.postings.get(gram, ()):
+                counts[pos] += 1
+        ranked = sorted(counts.items(), key=lambda kv: kv[1], reverse=True)
+        return [pos for pos, _ in ranked[:self.candidates]]
+
+    def score(self, name: str, threshold: float = 0.5, limit: int = 3) -> List["TagSuggestion"]:
+        scored = []
+        for pos in self.candidates_for(name):
+            tag_id, tag_name = self.tags[pos]
+            score = _similarity_score(name, tag_name)
+            if score >= threshold:
+                scored.append(TagSuggestion(tag_id=tag_id, name=tag_name, score=round(score, 2)))
+        scored.sort(key=lambda s: s.score, reverse=True)
+        return scored[:limit]
+
+    def best_score(self, name: str) -> float:
+        return max(
+            (_similarity_score(name, self.tags[pos][1]) for pos in self.candidates_for(name)),
+            default=0.0,
+        )
+
+
+_tag_index = None
+_tag_index_version = None
+_tag_index_lock = threading.Lock()
+
+
+def get_tag_index() -> TagIndex:
+    """Process-wide TagIndex, rebuilt when a GlobalTag change bumps the shared version."""
+    global _tag_index, _tag_index_version
+    version = cache.get(TAG_INDEX_VERSION_KEY)
+    if version is None:
+        cache.add(TAG_INDEX_VERSION_KEY, time.time(), timeout=None)
+        version = cache.get(TAG_INDEX_VERSION_KEY)
+
+    if _tag_index is None or version != _tag_index_version:
+        with _tag_index_lock:
+            if _tag_index is None or version != _tag_index_version:
+                _tag_index = TagIndex.from_db()
+                _tag_index_version = version
+    return _tag_index
+
+
+def invalidate_tag_index():
+    global _tag_index
+    cache.set(TAG_INDEX_VERSION_KEY, time.time(), timeout=None)
+    _tag_index = None
+
+
 def suggest_tags_for_category(
     category_name: str,
     all_tags,
     threshold: float = 0.5,
     limit: int = 3,
 ) -> List[TagSuggestion]:
-    scored = []
-    for tag in all_tags:
-        score = _similarity_score(category_name, tag.name)
-        if score >= threshold:
-            scored.append(TagSuggestion(tag_id=tag.id, name=tag.name, score=round(score, 2)))
-    scored.sort(key=lambda s: s.score, reverse=True)
-    return scored[:limit]
+    index = all_tags if isinstance(all_tags, TagIndex) else TagIndex.from_tags(all_tags)
+    return index.score(category_name, threshold, limit)
 
 
 def suggest_tags_for_business(business, threshold: float = 0.5, limit: int = 3):
@@ -72,7 +165,7 @@ def suggest_tags_for_business(business, threshold: float = 0.5, limit: int = 3):
     ]
     """
 
-    all_tags = list(GlobalTag.objects.all())
+    index = get_tag_index()
     categories = (
         MenuCategory.objects
         .filter(menu__business=business)
@@ -81,13 +174,23 @@ def suggest_tags_for_business(business, threshold: float = 0.5, limit: int = 3):
         .order_by("menu__name", "sort_order")
     )
 
+    # one pass: categories with the same name (across menus) are scored once
+    scored_by_name = {}
     results = []
     for category in categories:
-        current = list(category.global_tags.values("id", "name"))
+        current = [{"id": t.id, "name": t.name} for t in category.global_tags.all()]
         current_ids = {t["id"] for t in current}
 
-        suggestions = suggest_tags_for_category(category.name, all_tags, threshold, limit)
-        suggestions = [s for s in suggestions if s.tag_id not in current_ids]
+        key = _normalize(category.name)
+        # over-fetch so dropping already-attached tags still leaves `limit`
+        wanted = limit + len(current_ids)
+        fetched, scored = scored_by_name.get(key, (0, []))
+        # a shorter list than asked for means every match is already in it;
+        # otherwise a same-named category with more tags attached needs a re-score
+        if wanted > fetched and len(scored) == fetched:
+            scored = index.score(category.name, threshold, wanted)
+            scored_by_name[key] = (wanted, scored)
+        suggestions = [s for s in scored if s.tag_id not in current_ids][:limit]
 
         results.append({
             "menu_id": category.menu_id,
@@ -102,49 +205,109 @@ def suggest_tags_for_business(business, threshold: float = 0.5, limit: int = 3):
     return results
 
 
-def find_new_tag_candidates(threshold: float = 0.5, min_usage: int = 1, cluster_threshold: float = 0.75):
-    
+# ===== MinHash / LSH clustering =====
 
-    existing_tags = list(GlobalTag.objects.all())
+_MERSENNE = (1 << 61) - 1
 
-    # distinct category names platform-wide, with how many rows use each
-    category_counts = (
-        MenuCategory.objects
-        .values("name")
-        .annotate(usage_count=Count("id"))
-        .order_by("-usage_count")
-    )
 
-    # keep only names that don't already match an existing tag well
-    unmatched = []
-    for row in category_counts:
-        name, count = row["name"], row["usage_count"]
-        if count < min_usage:
-            continue
-        best_score = max((_similarity_score(name, t.name) for t in existing_tags), default=0.0)
-        if best_score < threshold:
-            unmatched.append({"name": name, "usage_count": count})
+class MinHashLSH:
+    """
+    Banded MinHash over character n-grams. Names that land in the same
+    bucket for any band are candidate pairs; everything else is never
+    compared. With bands*rows = num_perm the usual S-curve applies:
+    pairs with Jaccard >= ~(1/bands)^(1/rows) almost always collide.
+    """
+
+    def __init__(self, num_perm: int = 32, bands: int = 16, n: int = 3, seed: int = 1):
+        assert num_perm % bands == 0, "num_perm must be divisible by bands"
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.n = n
+        rng = random.Random(seed)
+        self.perms = [
+            (rng.randrange(1, _MERSENNE), rng.randrange(0, _MERSENNE)) for _ in range(num_perm)
+        ]
+
+    def signature(self, name: str):
+        hashes = [zlib.crc32(g.encode()) for g in _ngrams(_normalize(name), self.n)]
+        return [min((a * h + b) % _MERSENNE for h in hashes) for a, b in self.perms]
+
+    def buckets(self, names):
+        buckets = defaultdict(list)
+        for idx, name in enumerate(names):
+            sig = self.signature(name)
+            for band in range(self.bands):
+                chunk = tuple(sig[band * self.rows:(band + 1) * self.rows])
+                buckets[(band, chunk)].append(idx)
+        return buckets
+
+    def candidate_pairs(self, names):
+        pairs = set()
+        for members in self.buckets(names).values():
+            if len(members) < 2:
+                continue
+            for i, a in enumerate(members):
+                for b in members[i + 1:]:
+                    pairs.add((a, b) if a < b else (b, a))
+        return pairs
+
+
+def cluster_names(unmatched, cluster_threshold: float = 0.75, lsh: MinHashLSH = None):
+    """
+    unmatched: [{"name", "usage_count"}] sorted by usage desc. Same greedy
+    semantics as before — the highest-usage name seeds a cluster and absorbs
+    later names scoring >= cluster_threshold — but only LSH candidate pairs
+    are scored instead of all O(U^2) pairs.
+    """
+    lsh = lsh or MinHashLSH()
+    names = [item["name"] for item in unmatched]
+    neighbours = defaultdict(list)
+    for a, b in lsh.candidate_pairs(names):
+        neighbours[a].append(b)
 
-    # cluster near-duplicate unmatched names together
     clusters = []
     used = set()
     for i, item in enumerate(unmatched):
-        if item["name"] in used:
+        if i in used:
             continue
         cluster = {
             "suggested_name": item["name"],  # highest-usage variant becomes the display name
             "matched_category_names": [item["name"]],
             "usage_count": item["usage_count"],
         }
-        used.add(item["name"])
-        for other in unmatched[i + 1:]:
-            if other["name"] in used:
+        used.add(i)
+        for j in sorted(neighbours[i]):
+            if j in used:
                 continue
-            if _similarity_score(item["name"], other["name"]) >= cluster_threshold:
-                cluster["matched_category_names"].append(other["name"])
-                cluster["usage_count"] += other["usage_count"]
-                used.add(other["name"])
+            if _similarity_score(item["name"], unmatched[j]["name"]) >= cluster_threshold:
+                cluster["matched_category_names"].append(unmatched[j]["name"])
+                cluster["usage_count"] += unmatched[j]["usage_count"]
+                used.add(j)
         clusters.append(cluster)
 
     clusters.sort(key=lambda c: c["usage_count"], reverse=True)
     return clusters
+
+
+def find_new_tag_candidates(threshold: float = 0.5, min_usage: int = 1, cluster_threshold: float = 0.75):
+    index = get_tag_index()
+
+    # distinct category names platform-wide, with how many rows use each
+    category_counts = (
+        MenuCategory.objects
+        .values("name")
+        .annotate(usage_count=Count("id"))
+        .filter(usage_count__gte=min_usage)
+        .order_by("-usage_count")
+    )
+
+    # keep only names that don't already match an existing tag well
+    unmatched = [
+        {"name": row["name"], "usage_count": row["usage_count"]}
+        for row in category_counts
+        if index.best_score(row["name"]) < threshold
+    ]
+
+    # cluster near-duplicate unmatched names together
+    return cluster_names(unmatched, cluster_threshold)
@@ -0,0 +1,12 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from menu.models.categories import GlobalTag
+from menu.services.tagging import invalidate_tag_index
+
+
+@receiver(post_save, sender=GlobalTag)
+@receiver(post_delete, sender=GlobalTag)
+def _rebuild_tag_index(sender, instance: GlobalTag, **kwargs):
+    transaction.on_commit(invalidate_tag_index)
@@ -0,0 +1,117 @@
+"""
+Business detail menu cache (menu/services/menu_cache.py).
+
+Goals covered here:
+- a warm detail view serves the menu tree and branch availability without touching the menu tables;
+- the payload is the same as one serialized straight from the models, overlay included;
+- ETag / If-None-Match answers 304 until the menu or the branch's availability changes;
+- upsert_menus and availability toggles invalidate only what they change.
+"""
+from decimal import Decimal
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from accounts.models import Branch, Business
+from addresses.utils.gis_point import make_point
+from menu.models import BaseItem, BaseItemAvailability, Menu, MenuCategory, MenuItem
+from menu.serializers.menu import MenuDetailSerializer
+from menu.services import menu_cache
+from menu.utils import upsert_menus
+
+MENU_TABLES = ("menu_menu", "menu_menucategory", "menu_menuitem", "menu_baseitemavailability")
+
+
+@pytest.fixture
+def shop(db):
+    cache.clear()
+    business = Business.objects.create(business_name="Cached Kitchen", onboarding_complete=True)
+    branch = Branch.objects.create(business=business, name="Cached Branch", location=make_point(3.35, 6.6))
+    category = MenuCategory.objects.create(menu=Menu.objects.create(business=business, name="Main"), name="Meals")
+    items = []
+    for i in range(3):
+        base = BaseItem.objects.create(business=business, name=f"Dish {i}", default_price=Decimal("1000"))
+        items.append(MenuItem.objects.create(category=category, base_item=base, custom_name=f"Dish {i}", price=Decimal("1000")))
+        BaseItemAvailability.objects.create(branch=branch, base_item=base, is_available=i != 1)
+    yield {"business": business, "branch": branch, "category": category, "items": items}
+    cache.clear()
+
+
+def detail(client, shop, **headers):
+    return client.get(reverse("business-detail", args=[shop["business"].id]), {"lat": 6.6, "lng": 3.35}, **headers)
+
+
+def menu_queries(queries):
+    return [q["sql"] for q in queries.captured_queries if any(f'"{table}"' in q["sql"] for table in MENU_TABLES)]
+
+
+def test_warm_view_reads_no_menu_tables(shop):
+    client = APIClient()
+    first = detail(client, shop)
+
+    with CaptureQueriesContext(connection) as queries:
+        second = detail(client, shop)
+
+    assert first.status_code == second.status_code == 200
+    assert second.data == first.data
+    assert menu_queries(queries) == []
+
+
+def test_payload_matches_direct_serialization_with_the_overlay(shop):
+    response = detail(APIClient(), shop)
+
+    availability_map = {a.base_item_id: a for a in BaseItemAvailability.objects.filter(branch=shop["branch"])}
+    expected = MenuDetailSerializer(
+        Menu.objects.filter(business=shop["business"]), many=True, context={"availability_map": availability_map}
+    ).data
+    items = response.data["menus"][0]["categories"][0]["items"]
+    assert [item["is_available"] for item in items] == [True, False, True]
+    assert items == [dict(item) for item in expected[0]["categories"][0]["items"]]
+
+
+def test_etag_revalidation(shop):
+    client = APIClient()
+    etag = detail(client, shop)["ETag"]
+
+    not_modified = detail(client, shop, HTTP_IF_NONE_MATCH=etag)
+    weak = detail(client, shop, HTTP_IF_NONE_MATCH=f"W/{etag}")
+    other = detail(client, shop, HTTP_IF_NONE_MATCH='"something-else"')
+
+    assert (not_modified.status_code, weak.status_code, other.status_code) == (304, 304, 200)
+    assert not_modified["ETag"] == etag and not not_modified.content
+
+
+def test_upsert_menus_invalidates_the_business_payload(shop):
+    client = APIClient()
+    etag = detail(client, shop)["ETag"]
+    item = shop["items"][0]
+
+    upsert_menus(shop["business"], [
+        {"id": item.category.menu_id, "categories": [{"id": shop["category"].id, "items": [{"id": item.id, "custom_name": "Renamed"}]}]}
+    ])
+    response = detail(client, shop, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+    assert response.data["menus"][0]["categories"][0]["items"][0]["custom_name"] == "Renamed"
+
+
+def test_availability_toggle_only_rebuilds_the_overlay(shop):
+    client = APIClient()
+    etag = detail(client, shop)["ETag"]
+    payload_digest = menu_cache.menu_payload(shop["business"].id).digest
+
+    # what AvaliabilityView.patch does
+    BaseItemAvailability.objects.filter(branch=shop["branch"]).update(is_available=False)
+    menu_cache.invalidate_availability(shop["branch"].id)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = detail(client, shop, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+    assert [i["is_available"] for i in response.data["menus"][0]["categories"][0]["items"]] == [False, False, False]
+    assert all('"menu_baseitemavailability"' in sql for sql in menu_queries(queries))  # the menu tree stayed cached
+    assert menu_cache.menu_payload(shop["business"].id).digest == payload_digest
@@ -0,0 +1,138 @@
+"""
+Keyset-paginated order lists (menu/pagifications.py KeysetPagination).
+
+Goals covered here:
+- every order of a 5,000-order history is served exactly once, newest first, ties broken by id;
+- a page costs the same queries and about the same time at the end of the history as at the start;
+- the list is a summary with one row per order; items come from the detail endpoint;
+- drivers page through their own orders the same way.
+"""
+import time
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import Branch, Business, CustomerProfile, DriverProfile, User
+from menu.models import BaseItem, Menu, MenuCategory, MenuItem, Order, OrderItem
+
+HISTORY = 5000
+
+
+def authenticate(client, user):
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(user).access_token}")
+    return client
+
+
+@pytest.fixture
+def history(db):
+    business = Business.objects.create(business_name="History Rest")
+    branch = Branch.objects.create(business=business, name="History Branch", address="1 History Road")
+    user = User.objects.create(email="history@example.com", name="History")
+    customer = CustomerProfile.objects.create(user=user)
+    Order.objects.bulk_create(
+        [Order(orderer=customer, branch=branch, delivery_secret_hash=f"h-{i}", status="delivered") for i in range(HISTORY)],
+        batch_size=1000,
+    )
+    # three timestamp groups, so pages cross both created_at changes and created_at ties
+    ids = list(Order.objects.filter(orderer=customer).order_by("id").values_list("id", flat=True))
+    now = timezone.now()
+    Order.objects.filter(id__lt=ids[HISTORY // 3]).update(created_at=now - timedelta(days=2))
+    Order.objects.filter(id__gte=ids[HISTORY // 3], id__lt=ids[2 * HISTORY // 3]).update(created_at=now - timedelta(days=1))
+    return {"user": user, "customer": customer, "branch": branch}
+
+
+def walk(client, url, page_size=100):
+    """Follow `next` to the end; returns (ids in order, [(queries, seconds) per page])."""
+    ids, costs = [], []
+    url = f"{url}?page_size={page_size}"
+    while url:
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            response = client.get(url)
+            elapsed = time.perf_counter() - started
+        assert response.status_code == 200
+        costs.append((len(queries.captured_queries), elapsed))
+        ids += [row["id"] for row in response.data["results"]]
+        url = response.data["next"]
+    return ids, costs
+
+
+@pytest.mark.django_db
+def test_every_order_is_listed_once_newest_first(history):
+    client = authenticate(APIClient(), history["user"])
+
+    ids, costs = walk(client, reverse("order"))
+
+    expected = list(
+        Order.objects.filter(orderer=history["customer"]).order_by("-created_at", "-id").values_list("id", flat=True)
+    )
+    assert ids == expected
+    assert len(costs) == HISTORY // 100
+
+
+@pytest.mark.django_db
+def test_page_cost_does_not_grow_with_depth(history):
+    client = authenticate(APIClient(), history["user"])
+
+    _, costs = walk(client, reverse("order"))
+
+    queries = {count for count, _ in costs}
+    assert len(queries) == 1  # page 50 runs the same queries as page 1
+    first, last = costs[0][1], costs[-1][1]
+    assert last < max(first * 5, 0.25)
+
+
+@pytest.mark.django_db
+def test_list_is_a_summary_and_detail_carries_the_items(history):
+    client = authenticate(APIClient(), history["user"])
+    order = Order.objects.filter(orderer=history["customer"]).latest("created_at", "id")
+    category = MenuCategory.objects.create(menu=Menu.objects.create(business=history["branch"].business, name="Main"), name="Meals")
+    for i in range(3):
+        item = MenuItem.objects.create(
+            category=category,
+            base_item=BaseItem.objects.create(business=history["branch"].business, name=f"Meal {i}", default_price=10),
+            custom_name=f"Meal {i}",
+            price=10,
+        )
+        OrderItem.objects.create(order=order, menu_item=item, price=10, quantity=1, line_total=10)
+
+    page = client.get(reverse("order"), {"page_size": 5}).data["results"]
+    detail = client.get(reverse("order-detail", args=[order.id])).data
+
+    assert [row["id"] for row in page].count(order.id) == 1  # not one row per item
+    assert set(page[0]) == {"id", "order_number", "status", "created_at", "grand_total", "branch__name", "coupons__code"}
+    assert sorted(item["name"] for item in detail["items"]) == ["Meal 0", "Meal 1", "Meal 2"]
+
+
+@pytest.mark.django_db
+def test_status_filter_and_bad_cursor(history):
+    client = authenticate(APIClient(), history["user"])
+    Order.objects.create(orderer=history["customer"], branch=history["branch"], delivery_secret_hash="p", status="pending")
+
+    pending = client.get(reverse("order"), {"status": "pending"}).data
+
+    assert [row["status"] for row in pending["results"]] == ["pending"]
+    assert pending["next"] is None
+    assert client.get(reverse("order"), {"cursor": "not-a-cursor"}).status_code == 404
+
+
+@pytest.mark.django_db
+def test_driver_pages_through_own_orders(history):
+    user = User.objects.create(email="history-driver@example.com", name="Driver")
+    driver = DriverProfile.objects.create(user=user, first_name="History", last_name="Driver")
+    mine = list(Order.objects.filter(orderer=history["customer"]).order_by("id")[:250])
+    Order.objects.filter(id__in=[o.id for o in mine]).update(driver=driver)
+    client = authenticate(APIClient(), user)
+
+    ids, costs = walk(client, reverse("driver-order"), page_size=100)
+    detail = client.get(reverse("driver-order-detail", args=[mine[0].id])).data
+
+    assert sorted(ids) == [o.id for o in mine]
+    assert len(costs) == 3 and len({count for count, _ in costs}) == 1
+    assert detail["branch_address"] == "1 History Road" and detail["items"] == []
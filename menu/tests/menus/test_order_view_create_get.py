@@ -140,6 +140,7 @@ def test_order_get_list_returns_only_current_customer_orders(order_context):
     response = client.get(reverse("order"))
 
     assert response.status_code == 200
-    assert len(response.data) == 1
-    assert response.data[0]["id"] == own_order.id
+    assert len(response.data["results"]) == 1
+    assert response.data["results"][0]["id"] == own_order.id
+    assert response.data["next"] is None
 
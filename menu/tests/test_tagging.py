@@ -0,0 +1,94 @@
+import pytest
+
+from menu.services.tagging import MinHashLSH, TagIndex, cluster_names, suggest_tags_for_category
+
+TAGS = [(1, "Burgers"), (2, "Pizza"), (3, "Fried Chicken"), (4, "Jollof Rice"), (5, "Fried Rice"), (6, "Chicken")]
+
+
+def test_index_only_scores_posting_list_candidates():
+    index = TagIndex(TAGS)
+
+    assert {TAGS[pos][1] for pos in index.candidates_for("pizzas")} == {"Pizza"}
+    assert index.candidates_for("xyz") == []
+
+
+def test_index_matches_legacy_strong_suggestions():
+    index = TagIndex(TAGS)
+
+    assert [s.name for s in index.score("Burger")] == ["Burgers"]
+    assert [s.name for s in index.score("Grilled Chicken")][:1] == ["Chicken"]
+    top = index.score("Jollof")
+    assert top[0].name == "Jollof Rice" and top[0].score == 0.9
+
+
+def test_suggest_tags_for_category_accepts_plain_tags():
+    class Tag:
+        def __init__(self, id, name):
+            self.id, self.name = id, name
+
+    suggestions = suggest_tags_for_category("pizza", [Tag(i, n) for i, n in TAGS])
+    assert [(s.tag_id, s.score) for s in suggestions] == [(2, 1.0)]
+
+
+def test_lsh_only_pairs_similar_names():
+    names = ["Shawarma", "Shawarmas", "Chicken Shawarma", "Pepper Soup", "Peppersoup", "Ice Cream"]
+    pairs = MinHashLSH().candidate_pairs(names)
+
+    assert (0, 1) in pairs
+    assert (3, 4) in pairs
+    assert not any(5 in pair for pair in pairs)
+
+
+def test_cluster_names_groups_near_duplicates_by_usage():
+    unmatched = [
+        {"name": "Shawarma", "usage_count": 5},
+        {"name": "Pepper Soup", "usage_count": 4},
+        {"name": "Shawarmas", "usage_count": 2},
+        {"name": "Peppersoup", "usage_count": 1},
+        {"name": "Asaro", "usage_count": 1},
+    ]
+    clusters = cluster_names(unmatched)
+
+    assert clusters[0] == {
+        "suggested_name": "Shawarma", "matched_category_names": ["Shawarma", "Shawarmas"], "usage_count": 7,
+    }
+    assert clusters[1]["matched_category_names"] == ["Pepper Soup", "Peppersoup"]
+    assert clusters[2]["suggested_name"] == "Asaro"
+
+
+@pytest.mark.django_db
+def test_tag_index_rebuilds_on_tag_change(django_capture_on_commit_callbacks):
+    from menu.models.categories import GlobalTag
+    from menu.services.tagging import get_tag_index
+
+    with django_capture_on_commit_callbacks(execute=True):
+        GlobalTag.objects.create(name="Suya")
+    assert [s.name for s in get_tag_index().score("suya")] == ["Suya"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        GlobalTag.objects.create(name="Asun")
+    assert [s.name for s in get_tag_index().score("asun")] == ["Asun"]
+
+
+@pytest.mark.django_db
+def test_business_suggestions_rescore_when_a_same_named_category_has_more_tags():
+    from accounts.models import Business
+    from menu.models import Menu, MenuCategory
+    from menu.models.categories import GlobalTag
+    from menu.services.tagging import get_tag_index, invalidate_tag_index, suggest_tags_for_business
+
+    for name in ("Chicken", "Fried Chicken", "Grilled Chicken", "Chicken Wings"):
+        GlobalTag.objects.create(name=name)
+    invalidate_tag_index()
+    top = get_tag_index().score("Chicken", 0.5, 3)
+    assert len(top) == 3
+
+    business = Business.objects.create(business_name="Test Business")
+    bare = MenuCategory.objects.create(menu=Menu.objects.create(business=business, name="A Menu"), name="Chicken")
+    tagged = MenuCategory.objects.create(menu=Menu.objects.create(business=business, name="B Menu"), name="Chicken")
+    tagged.global_tags.set([s.tag_id for s in top[:2]])
+
+    rows = {row["category_id"]: row for row in suggest_tags_for_business(business, limit=1)}
+
+    assert [s["id"] for s in rows[bare.id]["suggested_tags"]] == [top[0].tag_id]
+    assert [s["id"] for s in rows[tagged.id]["suggested_tags"]] == [top[2].tag_id]
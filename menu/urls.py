@@ -77,6 +77,7 @@ category_urls = [
 urlpatterns = [
     path("restaurant-order/", views.ResturantOrderView.as_view(), name="restaurant-order"),
     path("driver-order/", views.DriverOrderView.as_view(), name="driver-order"),
+    path("driver-order/<int:order_id>/", views.DriverOrderView.as_view(), name="driver-order-detail"),
     path("order/", views.OrderView.as_view(), name="order"),
     path("orders/<int:order_id>/", views.OrderView.as_view(), name="order-detail"),
     path("order/payment/<int:order_id>/", views.OrderPaymentView.as_view(), name="order-payment"),
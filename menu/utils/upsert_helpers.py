@@ -4,6 +4,7 @@ from menu.models import(
     VariantOption, BaseItemAvailability, 
 )
 from django.db import transaction
+from menu.services.menu_cache import invalidate_menu
 # might be problematc
 # ─────────────────────────────────────────────────────────────────────────────
 # upsert_helpers.py  —  All bulk upsert logic
@@ -232,6 +233,7 @@ def upsert_menus(business, menus_vd: list[dict]) -> dict:
     if menus_with_cats:
         _upsert_categories(business, menus_with_cats, stats)
 
+    invalidate_menu(business.id)
     return stats
 
 
@@ -13,6 +13,7 @@ from menu.models import (
     Order
 )
 from menu.pagifications import StandardResultsSetPagination
+from menu.services.menu_cache import invalidate_availability
 
 from accounts.models import User
 from authflow.permissions import IsBusinessAdmin, IsBusinessStaff
@@ -195,6 +196,7 @@ class AvaliabilityView(AbstractBuStAdBranchView):
 
         with transaction.atomic():
             BaseItemAvailability.objects.bulk_update(updated_objects, ["is_available"])
+            invalidate_availability(self.branch.id)
 
         return Response(
             {
@@ -13,7 +13,8 @@ from authflow.authentication import CustomBAdminAuth
 from drf_spectacular.utils import extend_schema
 import menu.serializers.input_ser.delete as delete_selerizers
 from django.db.models import Count
-from image.services import BulkS3StorageService
+from image.gc import tombstone_queryset
+from menu.services.menu_cache import invalidate_menu
 
 
 def get_user_business(buisness_admin: BusinessAdmin):
@@ -59,10 +60,8 @@ def _cleanup_orphaned_base_items(business, base_item_ids: list):
         # Fetch target BaseItems belonging to this business to clean up S3
         qs = BaseItem.objects.filter(id__in=deleted_base_ids, business=business)
         
-        # Extract images and trigger batch S3 deletion
-        image_urls = list(qs.exclude(image="").values_list("image", flat=True))
-        if image_urls:
-            BulkS3StorageService.batch_delete_urls(image_urls)
+        # Queue images for the storage GC (same transaction as the delete)
+        tombstone_queryset(qs, reason="base_item_deleted")
 
         # Delete from DB (ON DELETE CASCADE handles BaseItemAvailability automatically)
         qs.delete()
@@ -183,7 +182,7 @@ class BulkDeleteMenuView(BaseBuisAdminAPIView):
             if item_ids:
                 qs = MenuItem.objects.filter(id__in=item_ids, category__menu__business=business)
                 counts["items"] = qs.count()
-                BulkS3StorageService.batch_delete_urls(list(qs.values_list("image", flat=True)))
+                tombstone_queryset(qs, reason="item_deleted")
                 qs.delete()
 
             if addon_ids:
@@ -224,6 +223,7 @@ class BulkDeleteMenuView(BaseBuisAdminAPIView):
 
             # ── Cleanup orphaned BaseItems once ───────────────────────────────
             deleted_base_ids = _cleanup_orphaned_base_items(business, list(affected_base_ids))
+            invalidate_menu(business.id)
 
         return Response({
             "message": "Bulk delete completed.",
@@ -281,19 +281,14 @@ class BulkDeleteMenuImagesView(BaseBuisAdminAPIView):
             )
 
         counts = {"items": 0, "addons": 0}
-        images_url = set()
 
         with transaction.atomic():
 
             if item_ids:
                 qs = MenuItem.objects.filter(id__in=item_ids, category__menu__business=business)
                 counts["items"] = qs.count()
-                images_url.update(
-                    qs.exclude(image__isnull=True)
-                          .exclude(image="")
-                          .values_list("image", flat=True)
-                )
-                qs.update(image=None)
+                tombstone_queryset(qs, reason="image_deleted")
+                qs.update(image=None, image_variants={})
                 
 
             if addon_ids:
@@ -302,16 +297,10 @@ class BulkDeleteMenuImagesView(BaseBuisAdminAPIView):
                     as_addon__groups__item__category__menu__business=business,
                 )
                 counts["addons"] = qs.count()
-                image_urls.update(
-                    qs.exclude(image__isnull=True)
-                        .exclude(image="")
-                        .values_list("image", flat=True)
-                )
-                qs.update(image=None)
+                tombstone_queryset(qs, reason="image_deleted")
+                qs.update(image=None, image_variants={})
 
-            transaction.on_commit(
-                lambda: BulkS3StorageService.batch_delete_urls(list(images_url))
-            )
+            invalidate_menu(business.id)
 
         return Response({
             "message": "Bulk Image delete completed.",
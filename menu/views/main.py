@@ -41,6 +41,9 @@ from menu.utils.helper import (
 )
 from accounts.models import BranchOperatingHours
 from django.utils import timezone
+from django.utils.cache import quote_etag
+from django.utils.http import parse_etags
+from menu.services import menu_cache
 
 from customer_api.home.cache import IDListCache
 from customer_api.home.regions import resolve_region
@@ -446,7 +449,9 @@ class BusinessDetailView(LocationDependantMixin, GenericAPIView):
     - Full menu with variants and addons
     - Branch-aware: shows correct price + availability for user's nearest branch
     - Tracks recently viewed in session
-    - Queries: ~6-8 (optimized)
+    - Menu tree and branch availability come from menu/services/menu_cache.py;
+      a warm view is the business row and the nearest-branch lookup
+    - ETag / If-None-Match: an unchanged page is a 304 with no body
     """
     
     def get(self, request, business_id):
@@ -455,21 +460,8 @@ class BusinessDetailView(LocationDependantMixin, GenericAPIView):
         if not user_point:
             return self.point_error()
         
-        try:
-            business = (
-                Business.objects
-                .prefetch_related(
-                    # Optimize MenuItem prefetch with select_related for base_item
-                    Prefetch(
-                        'menus__categories__items',
-                        queryset=MenuItem.objects.select_related('base_item')
-                    ),
-                    'menus__categories__items__variant_groups__options',
-                    'menus__categories__items__addon_groups__addons__base_item',
-                )
-                .get(id=business_id)
-            )
-        except Business.DoesNotExist:
+        business = Business.objects.filter(id=business_id).first()
+        if business is None:
             return Response(
                 {"error": "Business not found"},
                 status=status.HTTP_404_NOT_FOUND
@@ -482,9 +474,10 @@ class BusinessDetailView(LocationDependantMixin, GenericAPIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         
-        branch, distance, availability_map = self._get_branch_context(
+        branch, distance, overlay = self._get_branch_context(
             business_id, user_point
         )
+        payload = menu_cache.menu_payload(business_id)
         
         # Track recently viewed
         self._track_recently_viewed(request, business_id)
@@ -494,18 +487,29 @@ class BusinessDetailView(LocationDependantMixin, GenericAPIView):
             context={
                 "branch": branch,
                 "distance": distance,
-                "availability_map": availability_map,
+                "menus": menu_cache.apply_overlay(payload, overlay),
             }
         )
-        return Response(serializer.data)
+        data = serializer.data
+        etag = quote_etag(menu_cache.digest([
+            payload.digest,
+            overlay.digest if overlay else None,
+            {key: value for key, value in data.items() if key != "menus"},
+        ]))
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+        matches = parse_etags(request.headers.get("If-None-Match", "").replace("W/", ""))
+        if etag in matches or "*" in matches:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(data, headers=headers)
     
     def _get_branch_context(self, business_id, user_point):
         """
-        Find nearest active branch and get availability map.
-        Returns: (branch, distance, availability_map)
+        Find nearest active branch and its cached availability overlay.
+        Returns: (branch, distance, BranchOverlay)
         """
         if not user_point:
-            return None, None, {}
+            return None, None, None
 
         today = timezone.localtime().weekday()
 
@@ -532,19 +536,9 @@ class BusinessDetailView(LocationDependantMixin, GenericAPIView):
         
                 
         if not branch:
-            return None, None, {}
-        
-        distance = branch.distance
-        
-        # Fetch all availability overrides for this branch
-        availability_map = {
-            av.base_item_id: av
-            for av in BaseItemAvailability.objects.filter(
-                branch_id=branch.id
-            ).select_related('base_item')
-        }
+            return None, None, None
         
-        return branch, distance, availability_map
+        return branch, branch.distance, menu_cache.branch_overlay(branch.id)
     
     def _track_recently_viewed(self, request, business_id):
         """Track recently viewed businesses in session."""
@@ -14,7 +14,7 @@ from authflow.permissions import IsBusinessStaff
 from authflow.services import verify_delivery_phrase, mint_driver_pin
 
 from menu.models import Order, OrderEvent, OrderItem, DriverProfile, OrderStatus
-from menu.pagifications import StandardResultsSetPagination
+from menu.pagifications import KeysetPagination, StandardResultsSetPagination
 from menu.websocket_utils import (
     notify_order_created,
     notify_order_ready,
@@ -35,17 +35,15 @@ from menu.payment_services import initialize_order_sale
 from django.db import transaction
 from menu.serializers import OrderCreateSerializer, PaymentRetrySerializer, PaymentMethodSerializer
 from django.db.models import Prefetch
-from referrals.services import convert_referral_once
+from referrals.services import record_conversion
 from payments.services.sale_service import complete_service, assign_driver
-from driver_api.services import ledger_credit_for_delivered_order
 from common.customer.view import BaseCustomerAPIView
 from driver_api.views import BaseDriverAPIView
 from addresses.serializers import LocationGetSerializer
 from addresses.utils import make_point
 from support_center.services import Role
 from support_center.task import create_system_ticket
-from common.mail.services import send_order_thankyou_email
-from points.tasks import award_referred_first_order_task
+from notifications.outbox import enqueue_email
 from payments.integrations.errors import TemporaryPaymentError, PermanentPaymentError
 from menu.services.order_cancel import cancel_order, ACTORS
 from points.services import pay_order_with_points, InsufficientPoints
@@ -137,11 +135,61 @@ def send_thank_you_email(order:Order):
             .first()
         )
 
-    if profile:
-        try:
-            send_order_thankyou_email(profile.user.email, order.pk, order.grand_total, profile.name)
-        except Exception as e:
-            logger.error("Error occured while sending email: " + str(e))
+    if not profile or not profile.user.email:
+        return  # phone-only customers have no address to thank
+
+    # queued in the completion transaction; the dispatcher talks to the provider.
+    # The savepoint keeps a failed enqueue from breaking the order status change.
+    try:
+        with transaction.atomic():
+            enqueue_email(
+                profile.user.email,
+                "order_thankyou",
+                {
+                    "user_name": profile.name or profile.user.email,
+                    "order_number": order.pk,
+                    "order_total": str(order.grand_total),
+                },
+            )
+    except Exception as e:
+        logger.error("Error occured while sending email: " + str(e))
+
+CUSTOMER_ORDER_SUMMARY_FIELDS = (
+    "id", "order_number", "status", "created_at", "grand_total", "branch__name", "coupons__code",
+)
+DRIVER_ORDER_SUMMARY_FIELDS = (
+    "id", "order_number", "status", "created_at", "branch__name", "branch__address",
+)
+
+
+def order_items_payload(order):
+    """Item lines of an order fetched with its items prefetched (menu_item, base_item)."""
+    items_payload = []
+    for item in order.items.all():
+        snap = item.snapshot or {}
+
+        name = (getattr(item.menu_item, "custom_name", None) or "").strip()
+        if not name:
+            # fallback: base_item name
+            if item.menu_item_id and item.menu_item.base_item_id:
+                name = item.menu_item.base_item.name
+        if not name:
+            # fallback: snapshot
+            name = snap.get("menu_item", {}).get("name")
+
+        items_payload.append(
+            {
+                "name": name,
+                "quantity": item.quantity,
+                "price": str(item.price),
+                "added_total": str(item.added_total),
+                "line_total": str(item.line_total),
+                # OPTIONAL: only include snapshot details if you want
+                # "snapshot": snap,
+            }
+        )
+    return items_payload
+
 
 # 'NoneType' object has no attribute 'referrer_profile'
 # update with new system
@@ -164,65 +212,33 @@ class OrderView(BaseCustomerAPIView):
 
     def get(self, request, order_id=None, *args, **kwargs):
         """
-        This function retrieves order details and items information based on the order ID or returns a
-        list of orders with specific fields.
-
-        :param request: The `get` method you provided is a part of a Django REST framework view. It
-        handles GET requests for retrieving order details based on the `order_id` provided in the URL.
-        Here's a breakdown of the parameters used in the method:
-        :param order_id: The `order_id` parameter in the `get` method is used to retrieve a specific
-        order based on its ID. If the `order_id` is provided, the method fetches the order details and
-        related items to construct a response for that specific order. If `order_id` is not provided
-        :return: The `get` method returns a response containing order details if an `order_id` is
-        provided. If no `order_id` is provided, it returns a list of orders with limited details such as
-        order id, status, creation date, branch name, and coupon code.
+        GET /order/                  the customer's orders, newest first, a page at a time
+        GET /order/?status=delivered only orders in that status
+        GET /orders/<order_id>/      one order with its items
+
+        The list is a lean summary (one indexed query per page, see
+        KeysetPagination); items are only loaded for the order being opened.
         """
 
         if order_id:
-            qs = self.get_list_queryset(request)
-            order = get_object_or_404(qs, id=order_id)
-            items_payload = []
-            for item in order.items.all():
-                snap = item.snapshot or {}
-
-                name = (getattr(item.menu_item, "custom_name", None) or "").strip()
-                if not name:
-                    # fallback: base_item name
-                    if item.menu_item_id and item.menu_item.base_item_id:
-                        name = item.menu_item.base_item.name
-                if not name:
-                    # fallback: snapshot
-                    name = snap.get("menu_item", {}).get("name")
-
-                items_payload.append(
-                    {
-                        "name": name,
-                        "quantity": item.quantity,
-                        "price": str(item.price),
-                        "added_total": str(item.added_total),
-                        "line_total": str(item.line_total),
-                        # OPTIONAL: only include snapshot details if you want
-                        # "snapshot": snap,
-                    }
-                )
-
+            order = get_object_or_404(self.get_detail_queryset(request), id=order_id)
             data = {
                 "id": order.id,
                 "status": order.status,
                 "created_at": order.created_at,
                 "branch": order.branch.name if order.branch else None,
                 "coupon": order.coupons.code if order.coupons else None,
-                # "items": list(order.items.values("menu_item__name", "quantity", "price")),
-                "items": items_payload,
+                "items": order_items_payload(order),
                 "websocket_url": f"{settings.WEBSOCKET_URL}/ws/orders/{order.id}/",  # Update domain
             }
             return Response(data)
 
-        qs = self.get_detail_queryset(request)
-        orders = qs.order_by("-created_at").values(
-            "id", "status", "created_at", "branch__name", "coupons__code"
-        )
-        return Response(list(orders))
+        qs = Order.objects.filter(orderer=self.get_customer_profile(request))
+        if request.query_params.get("status"):
+            qs = qs.filter(status=request.query_params["status"])
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(qs.values(*CUSTOMER_ORDER_SUMMARY_FIELDS), request, view=self)
+        return paginator.get_paginated_response(page)
 
     def post(self, request):
         user = request.user
@@ -731,11 +747,8 @@ class ResturantOrderView(GenericAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        if convert_referral_once(referee_profile=order.orderer):
-            idempotency_key = f"referred-order:{order.id}:{order.orderer.id}"
-            award_referred_first_order_task.delay(
-                referred_id= order.orderer.id, sale_id= order.sale.id, idempotency_key=idempotency_key
-            )
+        # converted (and the referrer's points queued) by referrals.apply_referral_conversions
+        record_conversion(referee_profile=order.orderer, order=order)
 
         # Log event
         OrderEvent.objects.create(
@@ -752,7 +765,7 @@ class ResturantOrderView(GenericAPIView):
         # 🔥 Notify all parties of successful delivery
         notify_order_delivered(order)
         # trigger first split and crediting
-        sale_result = complete_service(order.sale.id, order.picked_up_by_user) # attach the refund too
+        sale_result = complete_service(order.sale.id)
         logger.info(f"sale info: {sale_result}")
 
         logger.info(
@@ -789,25 +802,39 @@ class DriverOrderView(BaseDriverAPIView):
         driver = self.get_driver(self.request)
         return Order.objects.filter(driver=driver)
 
-    def get(self, request, *args, **kwargs):
-        qs = (
-            self.get_queryset()
-            .select_related("branch", "orderer__user")
-            .values(
-                "id",
-                "order_number",
-                "status",
-                "created_at",
-                "branch__name",
-                "branch__location",
-                "items__id",
-                "items__menu_item_id",
-                "items__quantity",
-                "items__price",
+    def get(self, request, order_id=None, *args, **kwargs):
+        """
+        GET /driver-order/                  the driver's orders, newest first, a page at a time
+        GET /driver-order/?status=assigned  only orders in that status
+        GET /driver-order/<order_id>/       one order with its items and pickup point
+        """
+        if order_id:
+            order = get_object_or_404(
+                self.get_queryset().select_related("branch").prefetch_related(
+                    Prefetch("items", queryset=OrderItem.objects.select_related("menu_item", "menu_item__base_item"))
+                ),
+                id=order_id,
             )
-        )
-        page = self.paginate_queryset(qs)
-        return self.get_paginated_response(list(page))
+            location = order.branch.location
+            return Response(
+                {
+                    "id": order.id,
+                    "order_number": order.order_number,
+                    "status": order.status,
+                    "created_at": order.created_at,
+                    "branch": order.branch.name,
+                    "branch_address": order.branch.address,
+                    "branch_location": {"lat": location.y, "lng": location.x} if location else None,
+                    "items": order_items_payload(order),
+                }
+            )
+
+        qs = self.get_queryset()
+        if request.query_params.get("status"):
+            qs = qs.filter(status=request.query_params["status"])
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(qs.values(*DRIVER_ORDER_SUMMARY_FIELDS), request, view=self)
+        return paginator.get_paginated_response(page)
 
     def post(self, request):
         action = request.data.get("action")
@@ -903,18 +930,10 @@ class DriverOrderView(BaseDriverAPIView):
         # Conversion criteria:
         # - referee customer converts on first delivered order
         # - referee driver converts on first completed delivery
-        # convert_referral_once(referee_profile=order.orderer)
-
-        reffered = False
-        reffered = convert_referral_once(referee_profile=order.orderer)
+        # Both are converted (and the referrer's points queued) by referrals.apply_referral_conversions
+        record_conversion(referee_profile=order.orderer, order=order)
         if driver:
-            reffered = convert_referral_once(referee_profile=driver)
-
-        if reffered:
-            idempotency_key = f"referred-order:{order.id}:{order.orderer.id}"
-            award_referred_first_order_task.delay(
-                referred_id= order.orderer.id, sale_id = order.sale.id, idempotency_key=idempotency_key
-            )
+            record_conversion(referee_profile=driver, order=order)
 
         # Log event
         OrderEvent.objects.create(
@@ -931,8 +950,8 @@ class DriverOrderView(BaseDriverAPIView):
         # 🔥 Notify all parties of successful delivery
         notify_order_delivered(order)
         # trigger first split and crediting
+        # credits are posted by payments.post_sale_credits after this commits
         sale_result = complete_service(order.sale.id)
-        ledger_credit_for_delivered_order(order)
         logger.info(f"sale info: {sale_result}")
 
         # TODO: Process payments to branch and driver
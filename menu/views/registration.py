@@ -14,6 +14,8 @@ from storages.backends.s3boto3 import S3Boto3Storage # type: ignore
 from ulid import ULID # type: ignore
 from drf_spectacular.utils import extend_schema, inline_serializer # type: ignore
 from menu.utils import upsert_menus, bootstrap_base_item_availability_for_business
+from menu.services.menu_cache import invalidate_menu
+from image.tasks import enqueue_business_menu_variants
 
 # edit permissions later
 # first in order split the json into section all the branches and all the categories and etc one by one 
@@ -338,6 +340,10 @@ class RegisterMenusPhase3View(GenericAPIView):
             bootstrap_base_item_availability_for_business(business, base_ids, save_point=False) 
             # returns total items
 
+            # thumbnails for the uploaded item images (bulk writes send no post_save)
+            enqueue_business_menu_variants(business.id)
+            invalidate_menu(business.id)
+
             errors = verify_menu_registration(business, created_menu_ids, all_base_names)
             if errors:
                 # logger.error("Menu registration integrity issues: %s", errors)
@@ -494,5 +500,6 @@ class UpdateMenusView(GenericAPIView):
 
         with transaction.atomic():
             stats = upsert_menus(business, serializer.validated_data)
+            enqueue_business_menu_variants(business.id)
 
         return Response({"message": "Update successful.", "stats": stats}, status=200)
@@ -0,0 +1,19 @@
+from django.contrib import admin
+from django.utils import timezone
+
+from .models import OutboxMessage
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = ("recipient", "channel", "priority", "template_name", "status", "attempts", "provider", "created_at")
+    list_filter = ("status", "channel", "priority")
+    search_fields = ("recipient",)
+    actions = ["requeue"]
+
+    @admin.action(description="Requeue for sending")
+    def requeue(self, request, queryset):
+        # OTPs are scrubbed once finished with and would be stale anyway; the user asks for a new code
+        queryset.exclude(status=OutboxMessage.STATUS_SENT).exclude(priority=OutboxMessage.PRIORITY_OTP).update(
+            status=OutboxMessage.STATUS_PENDING, attempts=0, not_before=timezone.now(), claimed_at=None
+        )
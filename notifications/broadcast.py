@@ -0,0 +1,172 @@
+"""
+Broadcast fan-out.
+
+    campaign = start_broadcast(audience="customers", title=..., body=...)
+        -> BroadcastCampaign row + notifications.run_broadcast_campaign on commit
+
+The worker never materializes the audience. It walks it in user id order:
+
+    SELECT id FROM user WHERE <audience> AND id > :cursor ORDER BY id LIMIT :chunk
+
+then bulk_creates one Notification per id and moves the cursor, all in one
+transaction per chunk. Memory is bounded by chunk_size and a crash or redeploy
+loses at most the uncommitted chunk; running the task again picks up from the
+cursor. Each task run stops after BROADCAST_TASK_TIME_BUDGET seconds and
+re-enqueues itself, so no single task holds a worker for a million rows.
+
+Unread counters are bumped per chunk after it commits (one pipelined redis
+round trip); sockets get a single audience-group push when the campaign
+completes (notifications/realtime.py).
+"""
+import logging
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from notifications.models import BroadcastCampaign, Notification
+from notifications.realtime import push_broadcast
+from notifications.unread import get_unread_counter
+from payments.observability.metrics import increment, observe_ms
+
+logger = logging.getLogger(__name__)
+
+
+def audience_queryset(audience):
+    """Active users in the segment. EXISTS, not joins, so ids come back unique without DISTINCT."""
+    from accounts.models import ProfileBase
+
+    User = get_user_model()
+    qs = User.objects.filter(is_active=True)
+    if audience in (BroadcastCampaign.AUDIENCE_CUSTOMERS, BroadcastCampaign.AUDIENCE_DRIVERS):
+        profile_type = "customer" if audience == BroadcastCampaign.AUDIENCE_CUSTOMERS else "driver"
+        qs = qs.filter(Exists(
+            ProfileBase.objects.filter(user_id=OuterRef("pk"), profile_type=profile_type)
+        ))
+    elif audience == BroadcastCampaign.AUDIENCE_BUSINESS_ADMINS:
+        qs = qs.filter(business_admin__isnull=False)
+    return qs
+
+
+def start_broadcast(*, audience, title, body, notification_type=Notification.TYPE_SYSTEM,
+                    payload=None, created_by=None, chunk_size=None):
+    campaign = BroadcastCampaign.objects.create(
+        audience=audience,
+        title=title,
+        body=body,
+        notification_type=notification_type,
+        payload_json=payload or {},
+        created_by=created_by,
+        chunk_size=chunk_size or getattr(settings, "BROADCAST_CHUNK_SIZE", 2000),
+    )
+    from notifications.tasks import run_broadcast_campaign
+
+    transaction.on_commit(lambda: run_broadcast_campaign.delay(campaign.id))
+    return campaign
+
+
+def deliver_chunk(campaign_id):
+    """
+    Deliver the next chunk after the checkpoint.
+    :return: (notifications created, done) — done is also True when the
+             campaign is not runnable or another worker holds it.
+    """
+    with transaction.atomic():
+        campaign = (
+            BroadcastCampaign.objects
+            .select_for_update(skip_locked=True)
+            .filter(id=campaign_id, status__in=[BroadcastCampaign.STATUS_QUEUED, BroadcastCampaign.STATUS_RUNNING])
+            .first()
+        )
+        if campaign is None:
+            return 0, True
+
+        started = time.perf_counter()
+        user_ids = list(
+            audience_queryset(campaign.audience)
+            .filter(id__gt=campaign.cursor)
+            .order_by("id")
+            .values_list("id", flat=True)[:campaign.chunk_size]
+        )
+
+        now = timezone.now()
+        fields = ["cursor", "delivered_count", "status", "updated_at"]
+        if campaign.started_at is None:
+            campaign.started_at = now
+            fields.append("started_at")
+
+        if user_ids:
+            Notification.objects.bulk_create(
+                [
+                    Notification(
+                        user_id=user_id,
+                        title=campaign.title,
+                        body=campaign.body,
+                        notification_type=campaign.notification_type,
+                        payload_json=campaign.payload_json,
+                    )
+                    for user_id in user_ids
+                ],
+                batch_size=campaign.chunk_size,
+            )
+            campaign.cursor = user_ids[-1]
+            campaign.delivered_count += len(user_ids)
+            transaction.on_commit(lambda: get_unread_counter().adjust_many(user_ids, 1))
+
+        done = len(user_ids) < campaign.chunk_size
+        if done:
+            campaign.status = BroadcastCampaign.STATUS_COMPLETED
+            campaign.finished_at = now
+            fields.append("finished_at")
+            # one push per audience once every row exists, not one per recipient
+            data = {
+                "campaign_id": campaign.id,
+                "notification_type": campaign.notification_type,
+                "title": campaign.title,
+                "body": campaign.body,
+                "payload_json": campaign.payload_json,
+            }
+            transaction.on_commit(lambda: push_broadcast(campaign.audience, data))
+        else:
+            campaign.status = BroadcastCampaign.STATUS_RUNNING
+        campaign.save(update_fields=fields)
+
+    increment("notifications.broadcast.delivered", value=len(user_ids), tags={"audience": campaign.audience})
+    observe_ms("notifications.broadcast.chunk_ms", (time.perf_counter() - started) * 1000)
+    return len(user_ids), done
+
+
+def run_campaign(campaign_id, time_budget=None):
+    """
+    Deliver chunks until done or the time budget is spent.
+    :return: (delivered in this run, finished?)
+    """
+    budget = time_budget if time_budget is not None else getattr(settings, "BROADCAST_TASK_TIME_BUDGET", 60)
+    deadline = time.monotonic() + budget
+    delivered = 0
+    while True:
+        count, done = deliver_chunk(campaign_id)
+        delivered += count
+        if done:
+            return delivered, True
+        if time.monotonic() >= deadline:
+            return delivered, False
+
+
+def mark_failed(campaign_id, error):
+    BroadcastCampaign.objects.filter(id=campaign_id).exclude(
+        status=BroadcastCampaign.STATUS_COMPLETED
+    ).update(status=BroadcastCampaign.STATUS_FAILED, last_error=str(error)[:2000], updated_at=timezone.now())
+
+
+def resume_broadcast(campaign_id):
+    """Re-enqueue a failed or stalled campaign; delivery continues after its cursor."""
+    BroadcastCampaign.objects.filter(id=campaign_id, status=BroadcastCampaign.STATUS_FAILED).update(
+        status=BroadcastCampaign.STATUS_RUNNING, last_error="", updated_at=timezone.now()
+    )
+    from notifications.tasks import run_broadcast_campaign
+
+    transaction.on_commit(lambda: run_broadcast_campaign.delay(campaign_id))
@@ -0,0 +1,77 @@
+import resource
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db.models import Max
+
+from common.benchmark import measure_memory, rolled_back
+from notifications.broadcast import deliver_chunk
+from notifications.models import BroadcastCampaign, Notification
+
+
+class Command(BaseCommand):
+    help = (
+        "Broadcast fan-out against N synthetic users: throughput and memory ceiling of the "
+        "chunked worker (and optionally the old load-everything path). Everything is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1_000_000)
+        parser.add_argument("--chunk", type=int, default=2000)
+        parser.add_argument("--legacy", action="store_true", help="Also time list(users) + one bulk_create.")
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            self.run(options)
+        self.stdout.write("Rolled back synthetic users and notifications.")
+
+    def run(self, options):
+        User = get_user_model()
+        n, chunk = options["users"], options["chunk"]
+        floor = User.objects.aggregate(m=Max("id"))["m"] or 0
+
+        self.stdout.write(f"Creating {n} synthetic users ...")
+        for start in range(0, n, 10_000):
+            User.objects.bulk_create(
+                [User(email=f"bench-{i}@bench.invalid") for i in range(start, min(start + 10_000, n))],
+                batch_size=10_000,
+            )
+
+        # start the keyset walk right after the real users so only synthetic ones are targeted
+        campaign = BroadcastCampaign.objects.create(
+            audience=BroadcastCampaign.AUDIENCE_ALL, title="Benchmark", body="Benchmark", cursor=floor, chunk_size=chunk,
+        )
+
+        def chunked():
+            chunks = 0
+            while True:
+                _, done = deliver_chunk(campaign.id)
+                chunks += 1
+                if done:
+                    return chunks
+
+        chunks, seconds, peak = measure_memory(chunked)
+        campaign.refresh_from_db()
+        self.report("chunked", campaign.delivered_count, seconds, peak, f"{chunks} chunks of {chunk}")
+
+        if options["legacy"]:
+            def legacy():
+                users = list(User.objects.filter(is_active=True, id__gt=floor))
+                return len(Notification.objects.bulk_create(
+                    [Notification(user=u, title="Benchmark", body="Benchmark") for u in users]
+                ))
+
+            created, seconds, peak = measure_memory(legacy)
+            self.report("legacy", created, seconds, peak, "list(users) + bulk_create")
+
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        self.stdout.write(f"process max RSS: {rss:.0f} MiB (includes the user seeding)")
+
+    def report(self, label, rows, seconds, peak, note):
+        self.stdout.write(
+            f"{label:<8} {rows:>9} rows  {seconds:8.1f}s  {rows / seconds if seconds else 0:>9.0f} rows/s  "
+            f"peak {peak:7.1f} MiB  ({note})"
+        )
+
+
+# Run with: python manage.py benchmark_broadcast --users 1000000 --legacy
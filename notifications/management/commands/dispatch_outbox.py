@@ -0,0 +1,43 @@
+"""
+Outbox safety-net sweep for cron (same approach as image/storage_gc). Commits
+kick the dispatcher directly; this picks up retries that came due and kicks
+that were lost.
+
+    * * * * *   python manage.py dispatch_outbox --async
+    15 4 * * *  python manage.py dispatch_outbox --purge --async
+"""
+from django.core.management.base import BaseCommand
+
+from notifications.models import OutboxMessage
+from notifications.outbox import dispatch, purge_sent
+
+
+class Command(BaseCommand):
+    help = "Send due outbox emails/SMS in priority order, or purge delivered rows past retention."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--max-priority", type=int, default=None, help="Only lanes up to this priority (0 = OTP).")
+        parser.add_argument("--purge", action="store_true", help="Delete sent rows older than OUTBOX_RETENTION.")
+        parser.add_argument("--async", dest="run_async", action="store_true", help="Queue the celery task instead.")
+
+    def handle(self, *args, **options):
+        if options["run_async"]:
+            from notifications.tasks import dispatch_outbox, purge_outbox
+
+            if options["purge"]:
+                purge_outbox.delay()
+            else:
+                dispatch_outbox.delay(max_priority=options["max_priority"])
+            self.stdout.write("Queued.")
+            return
+
+        if options["purge"]:
+            self.stdout.write(self.style.SUCCESS(f"Purged {purge_sent()} sent messages."))
+            return
+
+        stats = dispatch(max_priority=options["max_priority"])
+        dead = OutboxMessage.objects.filter(status=OutboxMessage.STATUS_DEAD).count()
+        self.stdout.write(self.style.SUCCESS(
+            f"sent={stats['sent']} deferred={stats['deferred']} retried={stats['retried']} "
+            f"dead={stats['dead']} (dead total: {dead})"
+        ))
@@ -0,0 +1,27 @@
+"""
+Unread counter drift correction for cron (same approach as image/storage_gc):
+
+    */15 * * * *  python manage.py reconcile_unread_counters --async
+"""
+from django.core.management.base import BaseCommand
+
+from notifications.unread import get_unread_counter
+
+
+class Command(BaseCommand):
+    help = "Compare every live redis unread counter with the DB and rewrite the ones that drifted."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--user", type=int, action="append", dest="user_ids", help="Only these user ids (repeatable).")
+        parser.add_argument("--async", dest="run_async", action="store_true", help="Queue the celery task instead.")
+
+    def handle(self, *args, **options):
+        if options["run_async"]:
+            from notifications.tasks import reconcile_unread_counters
+
+            reconcile_unread_counters.delay()
+            self.stdout.write("Queued.")
+            return
+
+        stats = get_unread_counter().reconcile(user_ids=options["user_ids"])
+        self.stdout.write(self.style.SUCCESS(f"checked={stats['checked']} corrected={stats['corrected']}"))
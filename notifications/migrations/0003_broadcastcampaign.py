@@ -0,0 +1,37 @@
+# Generated by Django 5.1 on 2026-10-19 10:12
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_rename_notificatio_user_id_868d25_idx_notificatio_user_id_f2ad08_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BroadcastCampaign',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('audience', models.CharField(choices=[('all', 'All'), ('customers', 'Customers'), ('drivers', 'Drivers'), ('business_admins', 'Business admins')], max_length=20)),
+                ('notification_type', models.CharField(choices=[('generic', 'Generic'), ('order', 'Order'), ('earning', 'Earning'), ('withdrawal', 'Withdrawal'), ('support', 'Support'), ('system', 'System')], default='system', max_length=20)),
+                ('title', models.CharField(max_length=160)),
+                ('body', models.TextField()),
+                ('payload_json', models.JSONField(blank=True, default=dict)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='queued', max_length=10)),
+                ('cursor', models.BigIntegerField(default=0)),
+                ('delivered_count', models.PositiveIntegerField(default=0)),
+                ('chunk_size', models.PositiveIntegerField(default=2000)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='broadcast_campaigns', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
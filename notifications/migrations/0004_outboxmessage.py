@@ -0,0 +1,37 @@
+# Generated by Django 5.1 on 2026-10-19 10:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0003_broadcastcampaign'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxMessage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('channel', models.CharField(choices=[('email', 'Email'), ('sms', 'SMS')], max_length=10)),
+                ('priority', models.PositiveSmallIntegerField(choices=[(0, 'OTP'), (5, 'Transactional'), (9, 'Bulk')], default=5)),
+                ('recipient', models.CharField(max_length=254)),
+                ('template_name', models.CharField(blank=True, default='', max_length=50)),
+                ('context', models.JSONField(blank=True, default=dict)),
+                ('body', models.TextField(blank=True, default='')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('sent', 'Sent'), ('dead', 'Dead')], default='pending', max_length=10)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('not_before', models.DateTimeField(default=django.utils.timezone.now)),
+                ('claimed_at', models.DateTimeField(blank=True, null=True)),
+                ('provider', models.CharField(blank=True, default='', max_length=30)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('sent_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'priority', 'not_before'], name='notificatio_status_b03548_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1 on 2026-10-19 18:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0004_outboxmessage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outboxmessage',
+            name='not_after',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
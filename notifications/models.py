@@ -2,6 +2,7 @@
 
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class Notification(models.Model):
@@ -50,4 +51,137 @@ class Notification(models.Model):
         ]
 
     def __str__(self):
-        return f"{self.user} - {self.title}"
\ No newline at end of file
+        return f"{self.user} - {self.title}"
+
+class BroadcastCampaign(models.Model):
+    """
+    One admin broadcast. The fan-out worker (notifications/broadcast.py) walks
+    the audience by user id and checkpoints `cursor` in the same transaction
+    as each chunk of Notification rows, so a restarted worker resumes exactly
+    where the last committed chunk ended.
+    """
+
+    AUDIENCE_ALL = "all"
+    AUDIENCE_CUSTOMERS = "customers"
+    AUDIENCE_DRIVERS = "drivers"
+    AUDIENCE_BUSINESS_ADMINS = "business_admins"
+
+    AUDIENCE_CHOICES = [
+        (AUDIENCE_ALL, "All"),
+        (AUDIENCE_CUSTOMERS, "Customers"),
+        (AUDIENCE_DRIVERS, "Drivers"),
+        (AUDIENCE_BUSINESS_ADMINS, "Business admins"),
+    ]
+
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_COMPLETED = "completed"
+    STATUS_FAILED = "failed"
+
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, "Queued"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_COMPLETED, "Completed"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="broadcast_campaigns",
+    )
+    audience = models.CharField(max_length=20, choices=AUDIENCE_CHOICES)
+
+    notification_type = models.CharField(
+        max_length=20,
+        choices=Notification.TYPE_CHOICES,
+        default=Notification.TYPE_SYSTEM,
+    )
+    title = models.CharField(max_length=160)
+    body = models.TextField()
+    payload_json = models.JSONField(default=dict, blank=True)
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    cursor = models.BigIntegerField(default=0)  # last user id delivered
+    delivered_count = models.PositiveIntegerField(default=0)
+    chunk_size = models.PositiveIntegerField(default=2000)
+    last_error = models.TextField(blank=True, default="")
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.audience}: {self.title} ({self.status})"
+
+
+class OutboxMessage(models.Model):
+    """
+    One outgoing email or SMS, written in the caller's transaction so it is
+    sent if and only if the caller commits. notifications/outbox.py claims
+    rows with SKIP LOCKED and talks to the providers outside any request.
+
+    Lower priority numbers are claimed first; an OTP never waits behind a
+    batch of marketing mail. OTP rows carry a `not_after`: past it they are
+    dead-lettered and their code scrubbed instead of being sent late.
+    """
+
+    CHANNEL_EMAIL = "email"
+    CHANNEL_SMS = "sms"
+
+    CHANNEL_CHOICES = [
+        (CHANNEL_EMAIL, "Email"),
+        (CHANNEL_SMS, "SMS"),
+    ]
+
+    PRIORITY_OTP = 0
+    PRIORITY_TRANSACTIONAL = 5
+    PRIORITY_BULK = 9
+
+    PRIORITY_CHOICES = [
+        (PRIORITY_OTP, "OTP"),
+        (PRIORITY_TRANSACTIONAL, "Transactional"),
+        (PRIORITY_BULK, "Bulk"),
+    ]
+
+    STATUS_PENDING = "pending"
+    STATUS_SENDING = "sending"
+    STATUS_SENT = "sent"
+    STATUS_DEAD = "dead"
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_SENDING, "Sending"),
+        (STATUS_SENT, "Sent"),
+        (STATUS_DEAD, "Dead"),
+    ]
+
+    channel = models.CharField(max_length=10, choices=CHANNEL_CHOICES)
+    priority = models.PositiveSmallIntegerField(choices=PRIORITY_CHOICES, default=PRIORITY_TRANSACTIONAL)
+    recipient = models.CharField(max_length=254)
+
+    template_name = models.CharField(max_length=50, blank=True, default="")  # email only
+    context = models.JSONField(default=dict, blank=True)  # email template context
+    body = models.TextField(blank=True, default="")  # sms text
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    not_before = models.DateTimeField(default=timezone.now)
+    not_after = models.DateTimeField(null=True, blank=True)  # OTPs: useless (and not to be kept) after this
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    provider = models.CharField(max_length=30, blank=True, default="")
+    last_error = models.TextField(blank=True, default="")
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "priority", "not_before"]),
+        ]
+
+    def __str__(self):
+        return f"{self.channel} to {self.recipient} ({self.status})"
@@ -0,0 +1,301 @@
+"""
+Transactional outbox for email and SMS.
+
+    enqueue_email(to, "otp", {"code": code, ...}, priority=OutboxMessage.PRIORITY_OTP)
+    enqueue_sms(phone, text, priority=OutboxMessage.PRIORITY_OTP)
+        -> OutboxMessage row in the caller's transaction
+        -> notifications.dispatch_outbox(max_priority=<priority>) on commit
+
+Requests only pay for one INSERT. dispatch() claims due rows in priority
+order with SELECT ... FOR UPDATE SKIP LOCKED, marks them sending and commits,
+then talks to providers outside any transaction. A dispatcher kicked for an
+OTP only claims OTP rows, so it never queues behind marketing mail.
+
+Providers are guarded by a shared circuit breaker and concurrency limit
+(common/utils/circuit.py). A row whose providers are all open or saturated is
+deferred without spending an attempt. Real failures back off exponentially
+and dead-letter after OUTBOX_MAX_ATTEMPTS.
+
+OTP rows expire with the code (OTP_EXPIRY): one not sent by then is
+dead-lettered rather than retried. Their code is scrubbed from the row
+whichever way it ends (sent, dead or expired).
+
+Delivery is at-least-once: a worker that dies mid-send leaves its rows in
+`sending`, and they are released after OUTBOX_CLAIM_TIMEOUT. The cron sweep
+(`python manage.py dispatch_outbox --async`) also picks up rows whose kick
+was lost.
+"""
+import copy
+import json
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from common.mail.router import EmailRouter
+from common.mail.services import build_templated_message
+from common.mail.templates import TEMPLATES
+from common.phone.services import get_sms_providers
+from common.utils.circuit import provider_guards
+from notifications.models import OutboxMessage
+from payments.observability.metrics import increment, observe_ms
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 50
+
+
+# ===== ENQUEUE =====
+
+def _not_after(priority):
+    if priority != OutboxMessage.PRIORITY_OTP:
+        return None
+    return timezone.now() + timedelta(seconds=getattr(settings, "OTP_EXPIRY", 5 * 60))
+
+
+def _scrubbed(priority):
+    """Fields to blank once an OTP row is finished with, so the code is not kept around."""
+    return {"context": {}, "body": ""} if priority == OutboxMessage.PRIORITY_OTP else {}
+
+
+def enqueue_email(to, template_name, context, priority=OutboxMessage.PRIORITY_TRANSACTIONAL):
+    """Queue one templated email; it is sent only if the caller's transaction commits."""
+    if template_name not in TEMPLATES:
+        available = ", ".join(sorted(TEMPLATES))
+        raise KeyError(f"Unknown email template '{template_name}'. Available: {available}")
+
+    message = OutboxMessage.objects.create(
+        channel=OutboxMessage.CHANNEL_EMAIL,
+        priority=priority,
+        recipient=to,
+        template_name=template_name,
+        context=context,
+        not_after=_not_after(priority),
+    )
+    _kick(priority)
+    return message
+
+
+def enqueue_emails(recipients, template_name, context, priority=OutboxMessage.PRIORITY_BULK):
+    """Bulk variant: one INSERT and one dispatcher kick for the whole list."""
+    if template_name not in TEMPLATES:
+        raise KeyError(f"Unknown email template '{template_name}'")
+
+    not_after = _not_after(priority)
+    messages = OutboxMessage.objects.bulk_create(
+        [
+            OutboxMessage(
+                channel=OutboxMessage.CHANNEL_EMAIL,
+                priority=priority,
+                recipient=to,
+                template_name=template_name,
+                context=context,
+                not_after=not_after,
+            )
+            for to in recipients
+        ],
+        batch_size=1000,
+    )
+    if messages:
+        _kick(priority)
+    return messages
+
+
+def enqueue_sms(phone_number, body, priority=OutboxMessage.PRIORITY_TRANSACTIONAL):
+    message = OutboxMessage.objects.create(
+        channel=OutboxMessage.CHANNEL_SMS,
+        priority=priority,
+        recipient=phone_number,
+        body=body,
+        not_after=_not_after(priority),
+    )
+    _kick(priority)
+    return message
+
+
+def _kick(priority):
+    from notifications.tasks import dispatch_outbox
+
+    # a lane can get its own celery queue (and worker) via OUTBOX_LANE_QUEUES
+    queue = getattr(settings, "OUTBOX_LANE_QUEUES", {}).get(priority)
+    options = {"queue": queue} if queue else {}
+    transaction.on_commit(lambda: dispatch_outbox.apply_async(kwargs={"max_priority": priority}, **options))
+
+
+# ===== DISPATCH =====
+
+def release_stale_claims():
+    """Rows left in `sending` by a dead worker go back to the queue."""
+    cutoff = timezone.now() - timedelta(seconds=getattr(settings, "OUTBOX_CLAIM_TIMEOUT", 300))
+    return OutboxMessage.objects.filter(
+        status=OutboxMessage.STATUS_SENDING, claimed_at__lt=cutoff
+    ).update(status=OutboxMessage.STATUS_PENDING, claimed_at=None)
+
+
+def expire_overdue():
+    """Pending OTPs past their not_after are dead-lettered and scrubbed; a late code is no use."""
+    expired = OutboxMessage.objects.filter(
+        status=OutboxMessage.STATUS_PENDING, not_after__lt=timezone.now()
+    ).update(status=OutboxMessage.STATUS_DEAD, last_error="expired before delivery", claimed_at=None, **_scrubbed(OutboxMessage.PRIORITY_OTP))
+    if expired:
+        increment("notifications.outbox.expired", value=expired)
+    return expired
+
+
+def claim(max_priority=None, batch_size=BATCH_SIZE):
+    now = timezone.now()
+    with transaction.atomic():
+        qs = OutboxMessage.objects.select_for_update(skip_locked=True).filter(
+            Q(not_after__isnull=True) | Q(not_after__gte=now),
+            status=OutboxMessage.STATUS_PENDING,
+            not_before__lte=now,
+        )
+        if max_priority is not None:
+            qs = qs.filter(priority__lte=max_priority)
+        rows = list(qs.order_by("priority", "id")[:batch_size])
+        if rows:
+            OutboxMessage.objects.filter(id__in=[row.id for row in rows]).update(
+                status=OutboxMessage.STATUS_SENDING, claimed_at=now
+            )
+    return rows
+
+
+def dispatch(max_priority=None, batch_size=BATCH_SIZE, time_budget=None):
+    """
+    Send due messages until the queue is drained or the time budget is spent.
+    :return: {"sent": n, "deferred": n, "retried": n, "dead": n}
+    """
+    budget = time_budget if time_budget is not None else getattr(settings, "OUTBOX_TASK_TIME_BUDGET", 60)
+    deadline = time.monotonic() + budget
+    stats = {"sent": 0, "deferred": 0, "retried": 0, "dead": 0}
+
+    release_stale_claims()
+    stats["dead"] += expire_overdue()
+    while True:
+        rows = claim(max_priority, batch_size)
+        if not rows:
+            break
+        rendered = {}
+        for row in rows:
+            stats[deliver(row, rendered)] += 1
+        if time.monotonic() >= deadline:
+            break
+    return stats
+
+
+def deliver(row, rendered=None):
+    """Send one claimed row and record the outcome; returns the stats bucket."""
+    try:
+        if row.channel == OutboxMessage.CHANNEL_EMAIL:
+            result = _send_email(row, rendered if rendered is not None else {})
+        else:
+            result = _send_sms(row)
+    except Exception as exc:  # bad template / context: count it like a provider failure
+        logger.exception(f"[outbox] message {row.id} could not be built")
+        result = {"success": False, "error": str(exc)}
+
+    now = timezone.now()
+    tags = {"channel": row.channel, "priority": str(row.priority)}
+    if result.get("success"):
+        OutboxMessage.objects.filter(id=row.id).update(
+            status=OutboxMessage.STATUS_SENT, sent_at=now, provider=result["provider"], last_error="",
+            **_scrubbed(row.priority),
+        )
+        increment("notifications.outbox.sent", tags={**tags, "provider": result["provider"]})
+        observe_ms("notifications.outbox.lag_ms", (now - row.created_at).total_seconds() * 1000, tags=tags)
+        return "sent"
+
+    deferred = bool(result.get("deferred"))
+    attempts = row.attempts if deferred else row.attempts + 1
+    retry_at = now + (timedelta(seconds=getattr(settings, "OUTBOX_DEFER_SECONDS", 15)) if deferred else backoff(attempts))
+    error = "provider unavailable" if deferred else str(result.get("error", ""))[:2000]
+    expired = row.not_after is not None and row.not_after < retry_at
+
+    if expired or (not deferred and attempts >= getattr(settings, "OUTBOX_MAX_ATTEMPTS", 6)):
+        if expired:
+            error = f"expired before delivery: {error}"
+        OutboxMessage.objects.filter(id=row.id).update(
+            status=OutboxMessage.STATUS_DEAD, attempts=attempts, last_error=error, claimed_at=None,
+            **_scrubbed(row.priority),
+        )
+        logger.error(f"[outbox] message {row.id} to {row.recipient} dead after {attempts} attempts: {error}")
+        increment("notifications.outbox.dead", tags=tags)
+        return "dead"
+
+    if deferred:
+        OutboxMessage.objects.filter(id=row.id).update(
+            status=OutboxMessage.STATUS_PENDING, claimed_at=None, not_before=retry_at
+        )
+        increment("notifications.outbox.deferred", tags=tags)
+        return "deferred"
+
+    OutboxMessage.objects.filter(id=row.id).update(
+        status=OutboxMessage.STATUS_PENDING,
+        attempts=attempts,
+        last_error=error,
+        claimed_at=None,
+        not_before=retry_at,
+    )
+    increment("notifications.outbox.retried", tags=tags)
+    return "retried"
+
+
+def backoff(attempts):
+    base = getattr(settings, "OUTBOX_RETRY_BASE_SECONDS", 30)
+    return timedelta(seconds=min(base * 2 ** (attempts - 1), 60 * 60))
+
+
+def _send_email(row, rendered):
+    # a batch of the same template + context (bulk mail) is rendered once
+    key = (row.template_name, json.dumps(row.context, sort_keys=True, default=str))
+    if key not in rendered:
+        rendered[key] = build_templated_message(row.recipient, row.template_name, row.context)
+    message = copy.copy(rendered[key])
+    message.to = [row.recipient]
+    return EmailRouter().send(message)
+
+
+def _send_sms(row):
+    last_exception = None
+    attempted = False
+    for provider_name, send in get_sms_providers():
+        breaker, slots = provider_guards(f"sms:{provider_name}")
+        if not breaker.allow():
+            continue
+        with slots.acquire() as acquired:
+            if not acquired:
+                continue
+            attempted = True
+            try:
+                send(row.recipient, row.body)
+            except Exception as exc:
+                last_exception = exc
+                breaker.record_failure()
+                logger.warning(f"[outbox] sms provider {provider_name} failed: {exc}")
+                continue
+        breaker.record_success()
+        return {"success": True, "provider": provider_name}
+
+    if not attempted:
+        return {"success": False, "deferred": True}
+    return {"success": False, "error": str(last_exception)}
+
+
+def purge_sent(older_than=None, batch_size=5000):
+    """Delete delivered rows past retention, in batches."""
+    older_than = older_than or timedelta(seconds=getattr(settings, "OUTBOX_RETENTION", 7 * 24 * 60 * 60))
+    cutoff = timezone.now() - older_than
+    deleted = 0
+    while True:
+        ids = list(
+            OutboxMessage.objects
+            .filter(status=OutboxMessage.STATUS_SENT, sent_at__lt=cutoff)
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            return deleted
+        deleted += OutboxMessage.objects.filter(id__in=ids).delete()[0]
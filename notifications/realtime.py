@@ -0,0 +1,77 @@
+"""
+Websocket push for in-app notifications (ws/notifications/).
+
+Every socket joins its user's group plus the audience groups broadcasts fan
+out to, so a campaign reaching a million users is one group_send per audience
+instead of one per recipient.
+
+Callers push from transaction.on_commit. Pushes never raise: a dead channel
+layer must not fail the write that created the notification. Clients that miss
+a push still get the right badge from the unread counter on reconnect.
+"""
+import logging
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+
+logger = logging.getLogger(__name__)
+
+
+def get_user_notifications_group_name(user_id):
+    return f"notifications_user_{user_id}"
+
+
+def get_audience_notifications_group_name(audience):
+    return f"notifications_audience_{audience}"
+
+
+def _group_send(group_name, message):
+    try:
+        channel_layer = get_channel_layer()
+        if channel_layer is None:
+            return
+        async_to_sync(channel_layer.group_send)(group_name, message)
+    except Exception as exc:
+        logger.warning(f"[notifications] push to {group_name} failed: {exc}")
+
+
+def serialize_notification(notification):
+    from notifications.serializers import NotificationSerializer
+
+    return NotificationSerializer(notification).data
+
+
+def push_notification(user_id, data, unread_count=None):
+    _group_send(get_user_notifications_group_name(user_id), {
+        "type": "notification_new",
+        "data": data,
+        "unread_count": unread_count,
+    })
+
+
+def push_unread_count(user_id, unread_count):
+    _group_send(get_user_notifications_group_name(user_id), {
+        "type": "notification_unread",
+        "unread_count": unread_count,
+    })
+
+
+def push_verification_status(user_id, job_id, check, status):
+    """An async KYC check finished (verification/jobs.py); the client fetches the result."""
+    _group_send(get_user_notifications_group_name(user_id), {
+        "type": "verification_status",
+        "job_id": job_id,
+        "check": check,
+        "status": status,
+    })
+
+
+def push_broadcast(audience, data):
+    """
+    One message for a whole campaign audience. Carries no unread count; each
+    client bumps its badge locally (or refetches unread_count).
+    """
+    _group_send(get_audience_notifications_group_name(audience), {
+        "type": "notification_broadcast",
+        "data": data,
+    })
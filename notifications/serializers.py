@@ -1,7 +1,7 @@
 # notifications/serializers.py
 
 from rest_framework import serializers
-from notifications.models import Notification
+from notifications.models import BroadcastCampaign, Notification
 
 
 class NotificationSerializer(serializers.ModelSerializer):
@@ -18,4 +18,24 @@ class NotificationSerializer(serializers.ModelSerializer):
             "is_read",
             "read_at",
             "created_at",
-        ]
\ No newline at end of file
+        ]
+
+
+class BroadcastCampaignSerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = BroadcastCampaign
+
+        fields = [
+            "id",
+            "audience",
+            "notification_type",
+            "title",
+            "body",
+            "status",
+            "delivered_count",
+            "last_error",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
@@ -1,7 +1,30 @@
+from django.db import transaction
 from django.utils import timezone
 from django.shortcuts import get_object_or_404
 
 from notifications.models import Notification
+from notifications.realtime import push_notification, push_unread_count, serialize_notification
+from notifications.unread import get_unread_counter
+
+
+def _on_created(notifications):
+    """After commit: bump each owner's counter and push the new rows."""
+    data = [(n.user_id, dict(serialize_notification(n))) for n in notifications]
+
+    def publish():
+        counter = get_unread_counter()
+        counts = counter.adjust_many([user_id for user_id, _ in data], 1)
+        for (user_id, payload), count in zip(data, counts):
+            push_notification(user_id, payload, unread_count=count)
+
+    transaction.on_commit(publish)
+
+
+def _on_read(user_id, count):
+    def publish():
+        push_unread_count(user_id, get_unread_counter().adjust(user_id, -count))
+
+    transaction.on_commit(publish)
 
 
 def create_notification(
@@ -12,13 +35,15 @@ def create_notification(
     notification_type: str = Notification.TYPE_GENERIC,
     payload: dict | None = None,
 ):
-    return Notification.objects.create(
+    notification = Notification.objects.create(
         user=user,
         title=title,
         body=body,
         notification_type=notification_type,
         payload_json=payload or {},
     )
+    _on_created([notification])
+    return notification
 
 
 def create_bulk_notifications(users, title, body, notification_type="generic", payload=None):
@@ -33,7 +58,9 @@ def create_bulk_notifications(users, title, body, notification_type="generic", p
         for user in users
     ]
 
-    return Notification.objects.bulk_create(notifications)
+    created = Notification.objects.bulk_create(notifications)
+    _on_created(created)
+    return created
 
 
 def get_user_notifications_queryset(user):
@@ -45,10 +72,8 @@ def get_user_notifications_queryset(user):
 
 
 def get_unread_count(user):
-    return Notification.objects.filter(
-        user=user,
-        is_read=False
-    ).count()
+    """Served from the redis counter; the DB is only counted on a cold key."""
+    return get_unread_counter().get(user.id)
 
 
 def get_notification_for_user(user, notification_id):
@@ -66,7 +91,12 @@ def mark_notification_read(notification: Notification):
     notification.is_read = True
     notification.read_at = timezone.now()
 
-    notification.save(update_fields=["is_read", "read_at"])
+    # conditional update so two racing requests decrement the counter once
+    updated = Notification.objects.filter(pk=notification.pk, is_read=False).update(
+        is_read=True, read_at=notification.read_at
+    )
+    if updated:
+        _on_read(notification.user_id, 1)
 
     return notification
 
@@ -74,8 +104,12 @@ def mark_notification_read(notification: Notification):
 def mark_all_notifications_read(user):
     now = timezone.now()
 
-    return (
+    updated = (
         Notification.objects
         .filter(user=user, is_read=False)
         .update(is_read=True, read_at=now)
     )
+    # subtract what was marked rather than SET 0: rows created meanwhile stay counted
+    if updated:
+        _on_read(user.id, updated)
+    return updated
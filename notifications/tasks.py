@@ -0,0 +1,58 @@
+from celery import shared_task
+import logging
+
+from notifications.broadcast import mark_failed, run_campaign
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    bind=True,
+    name="notifications.run_broadcast_campaign",
+    acks_late=True,
+    max_retries=5,
+    retry_backoff=True,
+)
+def run_broadcast_campaign(self, campaign_id):
+    """
+    Fan a campaign out for one time budget, then hand over to a fresh task.
+    Safe to redeliver: every chunk commits together with its checkpoint.
+    """
+    try:
+        delivered, finished = run_campaign(campaign_id)
+    except Exception as exc:
+        logger.exception(f"[broadcast] campaign {campaign_id} chunk failed")
+        if self.request.retries >= self.max_retries:
+            mark_failed(campaign_id, exc)
+            return 0
+        raise self.retry(exc=exc)
+
+    if not finished:
+        run_broadcast_campaign.delay(campaign_id)
+    return delivered
+
+
+@shared_task(name="notifications.reconcile_unread_counters")
+def reconcile_unread_counters():
+    """Periodic: rewrite redis unread counters that drifted from the DB."""
+    from notifications.unread import get_unread_counter
+
+    stats = get_unread_counter().reconcile()
+    if stats["corrected"]:
+        logger.info(f"[notifications] corrected {stats['corrected']}/{stats['checked']} unread counters")
+    return stats
+
+
+@shared_task(name="notifications.dispatch_outbox", acks_late=True)
+def dispatch_outbox(max_priority=None):
+    """Kicked on commit by notifications.outbox.enqueue_*; also the cron sweep."""
+    from notifications.outbox import dispatch
+
+    return dispatch(max_priority=max_priority)
+
+
+@shared_task(name="notifications.purge_outbox")
+def purge_outbox():
+    from notifications.outbox import purge_sent
+
+    return purge_sent()
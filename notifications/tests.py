@@ -0,0 +1,346 @@
+import pytest
+
+from accounts.models import ProfileBase, User
+from notifications.broadcast import deliver_chunk, run_campaign, start_broadcast
+from notifications.models import BroadcastCampaign, Notification
+
+
+def make_users(n, profile_type=None, prefix="u"):
+    users = [User.objects.create_user(email=f"{prefix}{i}@example.com", password="x") for i in range(n)]
+    if profile_type:
+        for user in users:
+            ProfileBase.objects.create(user=user, profile_type=profile_type)
+    return users
+
+
+@pytest.mark.django_db
+def test_broadcast_is_queued_not_delivered_in_request(django_capture_on_commit_callbacks, monkeypatch):
+    from notifications import tasks
+
+    queued = []
+    monkeypatch.setattr(tasks.run_broadcast_campaign, "delay", queued.append)
+    make_users(3)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        campaign = start_broadcast(audience="all", title="Hi", body="Hello")
+
+    assert queued == [campaign.id]
+    assert not Notification.objects.exists()
+
+
+@pytest.mark.django_db
+def test_chunks_checkpoint_and_resume(django_capture_on_commit_callbacks):
+    customers = make_users(5, profile_type=ProfileBase.PROFILE_CUSTOMER, prefix="c")
+    make_users(2, profile_type=ProfileBase.PROFILE_DRIVER, prefix="d")
+    with django_capture_on_commit_callbacks():
+        campaign = start_broadcast(audience="customers", title="Promo", body="20% off", chunk_size=2)
+
+    assert deliver_chunk(campaign.id) == (2, False)
+    campaign.refresh_from_db()
+    assert (campaign.status, campaign.delivered_count, campaign.cursor) == ("running", 2, customers[1].id)
+
+    # a new worker picks up after the checkpoint without duplicating anyone
+    assert run_campaign(campaign.id) == (3, True)
+    campaign.refresh_from_db()
+    assert campaign.status == BroadcastCampaign.STATUS_COMPLETED
+    assert campaign.delivered_count == 5
+    assert sorted(Notification.objects.values_list("user_id", flat=True)) == [u.id for u in customers]
+
+    assert deliver_chunk(campaign.id) == (0, True)  # finished campaigns are a no-op
+
+
+@pytest.mark.django_db
+def test_time_budget_hands_over(django_capture_on_commit_callbacks):
+    make_users(4)
+    with django_capture_on_commit_callbacks():
+        campaign = start_broadcast(audience="all", title="Hi", body="Hello", chunk_size=1)
+
+    assert run_campaign(campaign.id, time_budget=0) == (1, False)
+    assert BroadcastCampaign.objects.get(id=campaign.id).delivered_count == 1
+
+
+@pytest.mark.django_db
+def test_chunk_queries_do_not_grow_with_audience(django_capture_on_commit_callbacks, django_assert_max_num_queries):
+    make_users(30)
+    with django_capture_on_commit_callbacks():
+        campaign = start_broadcast(audience="all", title="Hi", body="Hello", chunk_size=30)
+
+    # lock campaign, read ids, insert, save checkpoint (+ savepoint statements)
+    with django_assert_max_num_queries(6):
+        deliver_chunk(campaign.id)
+    assert Notification.objects.count() == 30
+
+
+# ===== REAL-TIME + UNREAD COUNTERS =====
+
+@pytest.fixture
+def pushes(monkeypatch):
+    """Counters on the (locmem) django cache, channel layer replaced by a recorder."""
+    from django.core.cache import cache
+    from notifications import realtime
+    from notifications.unread import UnreadCounter, set_unread_counter
+
+    cache.clear()
+    previous = set_unread_counter(UnreadCounter(client=False))
+    sent = []
+    monkeypatch.setattr(realtime, "_group_send", lambda group, message: sent.append((group, message)))
+    yield sent
+    set_unread_counter(previous)
+
+
+@pytest.mark.django_db
+def test_unread_count_served_from_counter(pushes, django_capture_on_commit_callbacks, django_assert_num_queries):
+    from notifications.services import create_notification, get_unread_count
+
+    user = make_users(1)[0]
+    assert get_unread_count(user) == 0  # cold: one COUNT, then cached
+
+    with django_capture_on_commit_callbacks(execute=True):
+        create_notification(user=user, title="Order", body="On the way")
+        create_notification(user=user, title="Order", body="Delivered")
+
+    with django_assert_num_queries(0):
+        assert get_unread_count(user) == 2
+    assert [(group, message["type"], message["unread_count"]) for group, message in pushes] == [
+        (f"notifications_user_{user.id}", "notification_new", 1),
+        (f"notifications_user_{user.id}", "notification_new", 2),
+    ]
+    assert pushes[1][1]["data"]["body"] == "Delivered"
+
+
+@pytest.mark.django_db
+def test_mark_read_paths_adjust_counter(pushes, django_capture_on_commit_callbacks):
+    from notifications.services import (
+        create_bulk_notifications, get_unread_count, mark_all_notifications_read, mark_notification_read,
+    )
+
+    user = make_users(1)[0]
+    with django_capture_on_commit_callbacks(execute=True):
+        first, *_ = create_bulk_notifications([user, user, user], "Promo", "Hi")
+    assert get_unread_count(user) == 3
+
+    with django_capture_on_commit_callbacks(execute=True):
+        mark_notification_read(first)
+        mark_notification_read(Notification.objects.get(pk=first.pk))  # already read: no double decrement
+    assert get_unread_count(user) == 2
+
+    with django_capture_on_commit_callbacks(execute=True):
+        assert mark_all_notifications_read(user) == 2
+    assert get_unread_count(user) == 0
+    assert [message["unread_count"] for _, message in pushes if message["type"] == "notification_unread"] == [2, 0]
+
+
+@pytest.mark.django_db
+def test_broadcast_bumps_warm_counters_and_pushes_once(pushes, django_capture_on_commit_callbacks):
+    from notifications.services import get_unread_count
+    from notifications.unread import KEY
+    from django.core.cache import cache
+
+    warm, cold = make_users(2)
+    get_unread_count(warm)
+    with django_capture_on_commit_callbacks():
+        campaign = start_broadcast(audience="all", title="Hi", body="Hello", chunk_size=10)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        deliver_chunk(campaign.id)
+
+    assert cache.get(KEY.format(warm.id)) == 1
+    assert cache.get(KEY.format(cold.id)) is None  # never guessed; filled on first read
+    assert get_unread_count(cold) == 1
+    assert [(group, message["type"]) for group, message in pushes] == [
+        ("notifications_audience_all", "notification_broadcast"),
+    ]
+
+
+@pytest.mark.django_db
+def test_reconcile_rewrites_drifted_counters(pushes, django_capture_on_commit_callbacks):
+    from notifications.services import create_notification, get_unread_count
+    from notifications.unread import get_unread_counter
+
+    user, other = make_users(2)
+    with django_capture_on_commit_callbacks(execute=True):
+        create_notification(user=user, title="A", body="a")
+    get_unread_count(user)
+    Notification.objects.filter(user=user).update(is_read=True)  # bypasses the services
+
+    assert get_unread_count(user) == 1
+    stats = get_unread_counter().reconcile(user_ids=[user.id, other.id])
+    assert stats == {"checked": 1, "corrected": 1}
+    assert get_unread_count(user) == 0
+
+
+# ===== EMAIL / SMS OUTBOX =====
+
+class FakeEmailBackend:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.sent = []
+
+    def send_messages(self, messages):
+        if self.fail:
+            raise ConnectionError("provider down")
+        self.sent.extend(messages)
+        return len(messages)
+
+
+@pytest.fixture
+def fake_providers(settings, monkeypatch):
+    from django.core.cache import cache
+    from common.mail import router
+    from notifications import outbox
+
+    cache.clear()
+    settings.PROVIDER_BREAKER_THRESHOLD = 2
+    providers = {"email": FakeEmailBackend(), "sms": []}
+    monkeypatch.setattr(router, "_cached_providers", lambda: [("fake", providers["email"])])
+    monkeypatch.setattr(outbox, "get_sms_providers", lambda: [
+        ("fake", lambda phone, body: providers["sms"].append((phone, body))),
+    ])
+    return providers
+
+
+@pytest.mark.django_db(transaction=True)
+def test_outbox_row_rolls_back_with_caller(fake_providers):
+    from django.db import transaction
+    from notifications.models import OutboxMessage
+    from notifications.outbox import enqueue_email
+
+    with pytest.raises(RuntimeError):
+        with transaction.atomic():
+            enqueue_email("a@example.com", "welcome", {"user_name": "Ada"})
+            raise RuntimeError("request failed")
+
+    assert not OutboxMessage.objects.exists()
+
+
+@pytest.mark.django_db
+def test_thank_you_email_skips_customers_without_email(fake_providers):
+    from accounts.models import Branch, Business, CustomerProfile
+    from menu.models import Order
+    from menu.views.order import send_thank_you_email
+    from notifications.models import OutboxMessage
+
+    branch = Branch.objects.create(business=Business.objects.create(business_name="Thanks"), name="Main", address="1 Road")
+    phone_only = CustomerProfile.objects.create(user=User.objects.create(phone_number="+2348012345678"))
+    order = Order.objects.create(orderer=phone_only, branch=branch, delivery_secret_hash="t-1", status="delivered")
+
+    send_thank_you_email(order)
+
+    assert not OutboxMessage.objects.exists()
+
+
+@pytest.mark.django_db
+def test_thank_you_email_failure_does_not_break_the_order_flow(fake_providers, monkeypatch):
+    from accounts.models import Branch, Business, CustomerProfile
+    from menu.models import Order
+    from menu.views import order as order_views
+
+    def broken(*args, **kwargs):
+        raise RuntimeError("outbox down")
+
+    monkeypatch.setattr(order_views, "enqueue_email", broken)
+    branch = Branch.objects.create(business=Business.objects.create(business_name="Thanks"), name="Main", address="1 Road")
+    customer = CustomerProfile.objects.create(user=User.objects.create_user(email="thanks@example.com", password="x"))
+    order = Order.objects.create(orderer=customer, branch=branch, delivery_secret_hash="t-2", status="delivered")
+
+    order_views.send_thank_you_email(order)  # logged, not raised
+
+    order.status = "cancelled"
+    order.save(update_fields=["status"])  # the surrounding transaction is still usable
+
+
+@pytest.mark.django_db
+def test_enqueue_kicks_dispatcher_for_its_lane_on_commit(fake_providers, django_capture_on_commit_callbacks, monkeypatch):
+    from notifications import tasks
+    from notifications.models import OutboxMessage
+    from notifications.outbox import enqueue_sms
+
+    kicked = []
+    monkeypatch.setattr(tasks.dispatch_outbox, "apply_async", lambda kwargs, **options: kicked.append(kwargs))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        enqueue_sms("+2348000000000", "Your code is 1234", priority=OutboxMessage.PRIORITY_OTP)
+
+    assert kicked == [{"max_priority": OutboxMessage.PRIORITY_OTP}]
+    assert fake_providers["sms"] == []  # nothing sent inside the request
+
+
+@pytest.mark.django_db
+def test_dispatch_sends_otp_lane_first_and_scrubs_codes(fake_providers, django_capture_on_commit_callbacks):
+    from notifications.models import OutboxMessage
+    from notifications.outbox import dispatch, enqueue_email, enqueue_emails
+
+    with django_capture_on_commit_callbacks():
+        enqueue_emails(["m1@example.com", "m2@example.com"], "congrats", {"user_name": "You", "message": "Sale!"})
+        otp = enqueue_email("otp@example.com", "otp", {"code": "482913", "minutes_valid": 10},
+                            priority=OutboxMessage.PRIORITY_OTP)
+
+    assert dispatch(max_priority=OutboxMessage.PRIORITY_OTP) == {"sent": 1, "deferred": 0, "retried": 0, "dead": 0}
+    assert [m.to for m in fake_providers["email"].sent] == [["otp@example.com"]]
+    assert "482913" in fake_providers["email"].sent[0].body
+    otp.refresh_from_db()
+    assert (otp.status, otp.provider, otp.context) == (OutboxMessage.STATUS_SENT, "fake", {})
+
+    assert dispatch()["sent"] == 2
+    assert [m.to for m in fake_providers["email"].sent[1:]] == [["m1@example.com"], ["m2@example.com"]]
+
+
+@pytest.mark.django_db
+def test_failures_back_off_then_breaker_defers_without_spending_attempts(fake_providers, django_capture_on_commit_callbacks):
+    from django.utils import timezone
+    from notifications.models import OutboxMessage
+    from notifications.outbox import dispatch, enqueue_email
+
+    fake_providers["email"].fail = True
+    with django_capture_on_commit_callbacks():
+        for n in range(3):
+            enqueue_email(f"u{n}@example.com", "welcome", {"user_name": "Ada"})
+
+    # two real failures open the breaker (threshold 2); the third row is deferred
+    assert dispatch() == {"sent": 0, "deferred": 1, "retried": 2, "dead": 0}
+    rows = list(OutboxMessage.objects.order_by("id"))
+    assert [r.attempts for r in rows] == [1, 1, 0]
+    assert all(r.status == OutboxMessage.STATUS_PENDING and r.not_before > timezone.now() for r in rows)
+    assert "provider down" in rows[0].last_error
+
+    assert dispatch()["sent"] == 0  # nothing due yet
+
+
+@pytest.mark.django_db
+def test_otp_rows_are_scrubbed_when_dead_lettered(fake_providers, django_capture_on_commit_callbacks, settings):
+    from notifications.models import OutboxMessage
+    from notifications.outbox import dispatch, enqueue_email
+
+    settings.OUTBOX_MAX_ATTEMPTS = 1
+    fake_providers["email"].fail = True
+    with django_capture_on_commit_callbacks():
+        otp = enqueue_email("otp@example.com", "otp", {"code": "482913", "minutes_valid": 5},
+                            priority=OutboxMessage.PRIORITY_OTP)
+        welcome = enqueue_email("w@example.com", "welcome", {"user_name": "Ada"})
+
+    assert dispatch()["dead"] == 2
+    otp.refresh_from_db()
+    welcome.refresh_from_db()
+    assert (otp.status, otp.context) == (OutboxMessage.STATUS_DEAD, {})
+    assert welcome.context == {"user_name": "Ada"}  # only codes are scrubbed
+
+
+@pytest.mark.django_db
+def test_expired_otp_is_dead_lettered_instead_of_sent(fake_providers, django_capture_on_commit_callbacks):
+    from datetime import timedelta
+
+    from django.utils import timezone
+    from notifications.models import OutboxMessage
+    from notifications.outbox import dispatch, enqueue_sms
+
+    with django_capture_on_commit_callbacks():
+        otp = enqueue_sms("+2348000000000", "Your code is 1234", priority=OutboxMessage.PRIORITY_OTP)
+    assert otp.not_after is not None
+
+    OutboxMessage.objects.filter(id=otp.id).update(not_after=timezone.now() - timedelta(seconds=1))
+
+    assert dispatch() == {"sent": 0, "deferred": 0, "retried": 0, "dead": 1}
+    assert fake_providers["sms"] == []
+    otp.refresh_from_db()
+    assert (otp.status, otp.body) == (OutboxMessage.STATUS_DEAD, "")
+    assert otp.last_error == "expired before delivery"
@@ -0,0 +1,252 @@
+"""
+Per-user unread notification counters in redis.
+
+    notif:unread:<user_id> -> int   (TTL UNREAD_COUNTER_TTL, refreshed on read)
+
+Reads never COUNT(*) once the key exists; a missing key is filled from the DB
+once. Writers (notifications/services.py, notifications/broadcast.py) adjust
+the counter after their transaction commits, and only when the key already
+exists — bumping a missing key would turn "unknown" into a wrong number.
+
+The counter can still drift (a write racing a fill, a crashed worker between
+commit and increment, a raw UPDATE somewhere); reconcile() runs periodically
+(`python manage.py reconcile_unread_counters --async`) and rewrites any key
+that disagrees with the DB.
+
+Without REDIS_URL (local dev), or with client=False, the Django cache is
+used instead. get_unread_counter() builds the shared counter on first use and
+rebuilds it when REDIS_URL / UNREAD_COUNTER_TTL change; tests inject their own
+with set_unread_counter().
+"""
+import logging
+import threading
+
+import redis
+from django.conf import settings
+from django.core.cache import cache
+from django.core.signals import setting_changed
+from django.db.models import Count
+from django.dispatch import receiver
+
+from payments.observability.metrics import increment
+
+logger = logging.getLogger(__name__)
+
+KEY = "notif:unread:{}"
+KEY_PATTERN = "notif:unread:*"
+
+# KEYS[1] counter, ARGV: delta. Only touches existing keys, never below 0.
+_ADJUST_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return nil
+end
+local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+if value < 0 then
+    redis.call('SET', KEYS[1], 0, 'KEEPTTL')
+    return 0
+end
+return value
+"""
+
+
+def count_unread_db(user_id):
+    from notifications.models import Notification
+
+    return Notification.objects.filter(user_id=user_id, is_read=False).count()
+
+
+class UnreadCounter:
+    def __init__(self, client=None, ttl=None):
+        self._client = client
+        self._script = None
+        self.ttl = ttl or getattr(settings, "UNREAD_COUNTER_TTL", 7 * 24 * 60 * 60)
+
+    def _get_client(self):
+        if self._client is None:
+            url = getattr(settings, "REDIS_URL", None)
+            if not url:
+                return None
+            self._client = redis.from_url(url)
+        return self._client
+
+    def _adjust_script(self, client):
+        if self._script is None:
+            self._script = client.register_script(_ADJUST_LUA)
+        return self._script
+
+    # --- reads ---
+
+    def get(self, user_id):
+        key = KEY.format(user_id)
+        client = self._get_client()
+        if client:
+            try:
+                value = client.get(key)
+                if value is not None:
+                    increment("notifications.unread.lookup", tags={"result": "hit"})
+                    return int(value)
+                count = count_unread_db(user_id)
+                client.set(key, count, ex=self.ttl, nx=True)
+                increment("notifications.unread.lookup", tags={"result": "miss"})
+                return count
+            except redis.RedisError as exc:
+                logger.warning(f"[notifications] unread counter unavailable: {exc}")
+                return count_unread_db(user_id)
+
+        value = cache.get(key)
+        if value is None:
+            value = count_unread_db(user_id)
+            cache.add(key, value, timeout=self.ttl)
+        return value
+
+    # --- writes ---
+
+    def adjust_many(self, user_ids, delta):
+        """
+        Add delta to every existing counter (missing counters stay missing).
+        :return: new values in user_ids order, None where there was no counter
+        """
+        user_ids = list(user_ids)
+        if not user_ids or not delta:
+            return [None] * len(user_ids)
+        client = self._get_client()
+        if client:
+            try:
+                script = self._adjust_script(client)
+                pipe = client.pipeline(transaction=False)
+                for user_id in user_ids:
+                    script(keys=[KEY.format(user_id)], args=[delta], client=pipe)
+                return pipe.execute()
+            except redis.RedisError as exc:
+                # drop the keys rather than leave them wrong
+                logger.warning(f"[notifications] unread counter adjust failed, invalidating: {exc}")
+                self.invalidate_many(user_ids)
+                return [None] * len(user_ids)
+
+        values = []
+        for user_id in user_ids:
+            key = KEY.format(user_id)
+            try:
+                value = cache.incr(key, delta)
+            except ValueError:
+                values.append(None)  # missing key
+                continue
+            if value < 0:
+                value = 0
+                cache.set(key, value, timeout=self.ttl)
+            values.append(value)
+        return values
+
+    def adjust(self, user_id, delta):
+        """:return: the new count (filled from the DB when there was no counter)"""
+        value = self.adjust_many([user_id], delta)[0]
+        return self.get(user_id) if value is None else value
+
+    def set(self, user_id, value):
+        key = KEY.format(user_id)
+        client = self._get_client()
+        if client:
+            try:
+                client.set(key, value, ex=self.ttl)
+                return
+            except redis.RedisError as exc:
+                logger.warning(f"[notifications] unread counter set failed: {exc}")
+                self.invalidate_many([user_id])
+                return
+        cache.set(key, value, timeout=self.ttl)
+
+    def invalidate_many(self, user_ids):
+        keys = [KEY.format(user_id) for user_id in user_ids]
+        client = self._get_client()
+        if client:
+            try:
+                client.delete(*keys)
+                return
+            except redis.RedisError:
+                pass
+        cache.delete_many(keys)
+
+    # --- drift correction ---
+
+    def reconcile(self, user_ids=None, batch_size=1000):
+        """
+        Rewrite counters that disagree with the DB.
+        :param user_ids: limit to these users; default every user with a live key (redis SCAN)
+        :return: {"checked": n, "corrected": n}
+        """
+        from notifications.models import Notification
+
+        stats = {"checked": 0, "corrected": 0}
+        for batch in self._batches(user_ids, batch_size):
+            actual = dict(
+                Notification.objects
+                .filter(user_id__in=batch, is_read=False)
+                .values("user_id")
+                .annotate(n=Count("id"))
+                .values_list("user_id", "n")
+            )
+            for user_id, cached in zip(batch, self._peek_many(batch)):
+                if cached is None:
+                    continue
+                stats["checked"] += 1
+                expected = actual.get(user_id, 0)
+                if cached != expected:
+                    self.set(user_id, expected)
+                    stats["corrected"] += 1
+                    increment("notifications.unread.drift", value=abs(cached - expected))
+        return stats
+
+    def _peek_many(self, user_ids):
+        keys = [KEY.format(user_id) for user_id in user_ids]
+        client = self._get_client()
+        if client:
+            return [None if v is None else int(v) for v in client.mget(keys)]
+        values = cache.get_many(keys)
+        return [values.get(key) for key in keys]
+
+    def _batches(self, user_ids, batch_size):
+        if user_ids is not None:
+            user_ids = list(user_ids)
+            for i in range(0, len(user_ids), batch_size):
+                yield user_ids[i:i + batch_size]
+            return
+
+        client = self._get_client()
+        if not client:
+            return  # locmem cannot be scanned; counters there expire via TTL
+        batch = []
+        for key in client.scan_iter(match=KEY_PATTERN, count=batch_size):
+            batch.append(int(key.rsplit(b":", 1)[-1]))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+_counter = None
+_counter_lock = threading.Lock()
+
+
+def get_unread_counter():
+    global _counter
+    if _counter is None:
+        with _counter_lock:
+            if _counter is None:
+                _counter = UnreadCounter()
+    return _counter
+
+
+def set_unread_counter(counter):
+    """Replace the shared counter (tests: UnreadCounter(client=False) or a fake redis); returns the old one."""
+    global _counter
+    with _counter_lock:
+        previous, _counter = _counter, counter
+    return previous
+
+
+@receiver(setting_changed)
+def _reset_on_settings_change(setting, **kwargs):
+    # the counter caches its redis client and TTL; rebuild from the new settings on next use
+    if setting in ("REDIS_URL", "UNREAD_COUNTER_TTL"):
+        set_unread_counter(None)
@@ -1,35 +1,17 @@
 from __future__ import annotations
 
-from datetime import timedelta
-
-from django.db.models import Sum
 from django.utils import timezone
 
-from payments.models import Withdrawal
-# from payments.models import UserAccount
-from payments.services.split_calculator import get_ledger_balance
-
 # These are read from services.py to stay DRY
-from payments.payouts.helper import (
-    _pending_total,
-    _normalize_ledger_role,
-)
+from payments.payouts.helper import _normalize_ledger_role
 from payments.payouts.constants import (
     DAILY_WITHDRAWAL_LIMIT_AMOUNT,
     DAILY_WITHDRAWAL_LIMIT_COUNT,
     WITHDRAWAL_COOLDOWN_HOURS,
     MINIMUM_BY_ROLE
 )
-from payments.payouts.bridge import resolve_payout_account
-from dataclasses import dataclass
-
-
-@dataclass
-class WithdrawalDecision:
-    eligible: bool
-    checks: dict
-    minimum_amount_kobo: int
-    available_balance_kobo: int
+from payments.eligibility.inputs import load_inputs
+from payments.eligibility.rules import EligibilityInputs, WithdrawalDecision, decide
 
 
 # ---------------------------------------------------------------------------
@@ -38,15 +20,16 @@ class WithdrawalDecision:
 
 class WithdrawalEligibilityEvaluator:
     """
-    Base eligibility evaluator. Performs all shared checks:
+    Loads a user's eligibility inputs in one query (inputs.py) and applies
+    the rule table for the role (rules.py):
       - recipient ready
       - minimum amount
       - sufficient balance
       - cooldown
       - daily count
       - daily amount
-
-    Subclasses call super().evaluate() and then layer on role-specific logic.
+    plus the role's own rules (KYC for businesses, bank/ticket/suspension
+    checks for drivers).
     """
 
     role: str  # must be set by subclass __init__
@@ -57,214 +40,35 @@ class WithdrawalEligibilityEvaluator:
         self.role = _normalize_ledger_role(role)
         self.now = timezone.now()
 
-    # ------------------------------------------------------------------
-    # Overridable data accessors
-    # ------------------------------------------------------------------
-
-    def get_balance(self) -> int:
-        return get_ledger_balance(self.user)
-
-    def get_pending(self) -> int:
-        return _pending_total(self.user)
-
-    def get_payout_account(self):
-        """
-        Resolve the concrete payout account for this actor.
-        Subclasses override to point at the right model.
-        Default: UserAccount (individuals).
-        """
-        return resolve_payout_account(self.user, self.role)
-
-    def get_minimum(self) -> int:
-        return MINIMUM_BY_ROLE.get(self.role, 0)
-
-    # ------------------------------------------------------------------
-    # Individual check methods (overridable)
-    # ------------------------------------------------------------------
-
-    def check_recipient_ready(self, account) -> bool:
-        return bool(account and account.get_recipient_code())
-
-    def check_cooldown(self) -> bool:
-        last = (
-            Withdrawal.objects
-            .filter(user=self.user, status="complete")
-            .order_by("-completed_at")
-            .first()
-        )
-        if not last or not last.completed_at:
-            return True
-        return (self.now - last.completed_at) >= timedelta(hours=WITHDRAWAL_COOLDOWN_HOURS)
-
-    def check_daily_limits(self):
-        today_start = self.now.replace(hour=0, minute=0, second=0, microsecond=0)
-        today_qs = Withdrawal.objects.filter(
-            user=self.user,
-            status__in=["pending_batch", "processing", "complete"],
-            requested_at__gte=today_start,
-        )
-        count = today_qs.count()
-        amount = today_qs.aggregate(total=Sum("amount"))["total"] or 0
-        return (
-            count < DAILY_WITHDRAWAL_LIMIT_COUNT,
-            amount + self.amount_kobo <= DAILY_WITHDRAWAL_LIMIT_AMOUNT,
-        )
-
-    # ------------------------------------------------------------------
-    # Core evaluate — subclasses call super() then extend checks dict
-    # ------------------------------------------------------------------
+    def load_inputs(self) -> EligibilityInputs:
+        return load_inputs(self.user, self.role, self.now)
 
     def evaluate(self) -> WithdrawalDecision:
-        balance = self.get_balance()
-        pending = self.get_pending()
-        available = balance - pending
-        minimum = self.get_minimum()
-        account = self.get_payout_account()
-
-        daily_count_ok, daily_amount_ok = self.check_daily_limits()
-
-        checks = {
-            "recipient_ready": self.check_recipient_ready(account),
-            "role_eligible": self.role in MINIMUM_BY_ROLE,
-            "minimum_amount": self.amount_kobo >= minimum,
-            "sufficient_balance": available >= self.amount_kobo,
-            "cooldown_ok": self.check_cooldown(),
-            "daily_count_ok": daily_count_ok,
-            "daily_amount_ok": daily_amount_ok,
-        }
-
-        return WithdrawalDecision(
-            eligible=all(checks.values()),
-            checks=checks,
-            minimum_amount_kobo=minimum,
-            available_balance_kobo=available,
-        )
+        return decide(self.role, self.amount_kobo, self.load_inputs(), self.now)
 
 
 # ---------------------------------------------------------------------------
-# Business evaluator
+# Role evaluators
 # ---------------------------------------------------------------------------
 
 class BusinessWithdrawalEvaluator(WithdrawalEligibilityEvaluator):
-    """
-    Eligibility evaluator for business_owner role.
-
-    Resolves the payout account from BusinessPayoutAccount (via business
-    entity) rather than UserAccount. Adds a check that the business has
-    completed KYC onboarding before any withdrawal is allowed.
-    """
+    """business_owner: payout account on the business, KYC onboarding must be complete."""
 
     def __init__(self, user, amount_kobo: int):
         super().__init__(user, amount_kobo, role="business_owner")
 
-    def get_payout_account(self):
-        # Bridge resolves BusinessPayoutAccount for this role
-        return resolve_payout_account(self.user, self.role)
-
-    def _check_kyc_complete(self) -> bool:
-        try:
-            admin = self.user.business_admin
-            status = admin.cerd  # BusinessOnboardStatus
-            return status.is_onboarding_complete
-        except Exception:
-            # If onboarding model doesn't exist yet, don't hard-block —
-            # fail open here and tighten once onboarding is enforced.
-            return True
-
-    def evaluate(self) -> WithdrawalDecision:
-        decision = super().evaluate()
-
-        extra = {
-            "kyc_complete": self._check_kyc_complete(),
-        }
-
-        merged_checks = {**decision.checks, **extra}
-        return WithdrawalDecision(
-            eligible=all(merged_checks.values()),
-            checks=merged_checks,
-            minimum_amount_kobo=decision.minimum_amount_kobo,
-            available_balance_kobo=decision.available_balance_kobo,
-        )
-
-
-# ---------------------------------------------------------------------------
-# Driver evaluator
-# ---------------------------------------------------------------------------
 
 class DriverWithdrawalEvaluator(WithdrawalEligibilityEvaluator):
-    """
-    Eligibility evaluator for driver role.
-
-    Resolves payout account from UserAccount (personal account).
-    Hook point for future driver-specific checks: active ride lock,
-    vehicle document status, suspension flags, etc.
-    """
+    """driver: bank account on the driver profile, verified, no blocking support ticket."""
 
     def __init__(self, user, amount_kobo: int):
         super().__init__(user, amount_kobo, role="driver")
 
-    def get_payout_account(self):
-        return resolve_payout_account(self.user, self.role)
-
-    def _check_driver_active(self) -> bool:
-        """
-        Guard: don't allow withdrawal if driver profile is suspended.
-        Extend this as driver lifecycle states expand.
-        """
-        try:
-            profile = self.user.driver_profile
-            return not getattr(profile, "suspended", False)
-        except Exception:
-            return True
-
-    def _check_bank_verified(self) -> bool:
-        try:
-            return bool(self.user.driver_profile.bank_account.is_verified)
-        except Exception:
-            return False
-
-    def _check_no_blocking_ticket(self) -> bool:
-        try:
-            from support_center.models import SupportTicket
-
-            return not SupportTicket.objects.filter(
-                owner_id=self.user_id if hasattr(self, "user_id") else self.user.id,
-                owner_role=SupportTicket.OWNER_DRIVER,
-                status__in=[SupportTicket.STATUS_OPEN, SupportTicket.STATUS_IN_PROGRESS],
-                is_blocking=True,
-            ).exists()
-        except Exception:
-            return True
-
-    def evaluate(self) -> WithdrawalDecision:
-        decision = super().evaluate()
-
-        extra = {
-            "driver_active": self._check_driver_active(),
-            "bank_verified": self._check_bank_verified(),
-            "no_blocking_ticket": self._check_no_blocking_ticket(),
-        }
-
-        merged_checks = {**decision.checks, **extra}
-        return WithdrawalDecision(
-            eligible=all(merged_checks.values()),
-            checks=merged_checks,
-            minimum_amount_kobo=decision.minimum_amount_kobo,
-            available_balance_kobo=decision.available_balance_kobo,
-        )
-
-
-# ---------------------------------------------------------------------------
-# Referral evaluator (thin — no extra checks yet)
-# ---------------------------------------------------------------------------
 
 class ReferralWithdrawalEvaluator(WithdrawalEligibilityEvaluator):
     def __init__(self, user, amount_kobo: int):
         super().__init__(user, amount_kobo, role="referral")
 
-    def get_payout_account(self):
-        return resolve_payout_account(self.user, self.role)
-
 
 # ---------------------------------------------------------------------------
 # Dispatcher — replaces the old standalone evaluate_eligibility()
@@ -0,0 +1,108 @@
+"""
+Everything the withdrawal rules need about one user, in one query.
+
+    SELECT user.id,
+           (SELECT SUM(amount) FROM ledger WHERE user = ...)          AS balance,
+           (SELECT SUM(amount) FROM withdrawal WHERE pending ...)      AS pending,
+           (SELECT MAX(completed_at) FROM withdrawal WHERE complete)   AS last_completed_at,
+           (SELECT COUNT(*) / SUM(amount) ... requested today)         AS today_count / today_amount,
+           <role columns: recipient code, KYC, bank verification, blocking ticket>
+    FROM user WHERE id = ...
+
+The role columns follow payouts/bridge.py: business accounts hang off the
+business, driver accounts off the driver profile, referral users have a
+UserAccount.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+
+from django.db.models import BigIntegerField, BooleanField, Count, Exists, Max, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from payments.eligibility.rules import EligibilityInputs
+from payments.models import LedgerEntry, User, Withdrawal
+
+PENDING_STATUSES = ("pending_batch", "processing")
+DAILY_STATUSES = ("pending_batch", "processing", "complete")
+
+
+def _scalar(queryset, aggregate, default):
+    column = queryset.order_by().values("user").annotate(value=aggregate).values("value")[:1]
+    return Coalesce(Subquery(column), Value(default), output_field=BigIntegerField())
+
+
+def _first(queryset, field, default, output_field):
+    return Coalesce(Subquery(queryset.values(field)[:1]), Value(default), output_field=output_field)
+
+
+def _business_inputs():
+    from accounts.models import BusinessOnboardStatus, BusinessPayoutAccount
+
+    return {
+        "recipient_code": _first(
+            BusinessPayoutAccount.objects.filter(business__admin__user=OuterRef("pk")), "paystack_recipient_code", "", None
+        ),
+        # no onboarding record yet: fail open, as before
+        "kyc_complete": _first(
+            BusinessOnboardStatus.objects.filter(admin__user=OuterRef("pk")), "is_onboarding_complete", True, BooleanField()
+        ),
+    }
+
+
+def _driver_inputs():
+    from accounts.models import DriverBankAccount, DriverProfile
+    from support_center.models import SupportTicket
+
+    profiles = DriverProfile.objects.filter(user=OuterRef("pk"), profile_type="driver")
+    accounts = DriverBankAccount.objects.filter(driver__user=OuterRef("pk"), driver__profile_type="driver")
+    has_suspension = any(field.name == "suspended" for field in DriverProfile._meta.get_fields())
+    return {
+        "recipient_code": _first(accounts, "paystack_recipient_code", "", None),
+        "bank_verified": _first(accounts, "is_verified", False, BooleanField()),
+        "driver_suspended": (
+            _first(profiles, "suspended", False, BooleanField()) if has_suspension else Value(False)
+        ),
+        "blocking_ticket": Exists(
+            SupportTicket.objects.filter(
+                owner=OuterRef("pk"),
+                owner_role=SupportTicket.OWNER_DRIVER,
+                status__in=[SupportTicket.STATUS_OPEN, SupportTicket.STATUS_IN_PROGRESS],
+                is_blocking=True,
+            )
+        ),
+    }
+
+
+def _referral_inputs():
+    from payments.models import UserAccount
+
+    return {
+        "recipient_code": _first(UserAccount.objects.filter(user=OuterRef("pk")), "paystack_recipient_code", "", None),
+    }
+
+
+ROLE_INPUTS = {
+    "business_owner": _business_inputs,
+    "driver": _driver_inputs,
+    "referral": _referral_inputs,
+}
+
+
+def load_inputs(user, role: str, now: datetime) -> EligibilityInputs:
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    withdrawals = Withdrawal.objects.filter(user=OuterRef("pk"))
+    today = withdrawals.filter(status__in=DAILY_STATUSES, requested_at__gte=today_start)
+
+    columns = {
+        "balance_kobo": _scalar(LedgerEntry.objects.filter(user=OuterRef("pk")), Sum("amount"), 0),
+        "pending_kobo": _scalar(withdrawals.filter(status__in=PENDING_STATUSES), Sum("amount"), 0),
+        "last_completed_at": Subquery(
+            withdrawals.filter(status="complete").order_by().values("user").annotate(value=Max("completed_at")).values("value")[:1]
+        ),
+        "today_count": _scalar(today, Count("id"), 0),
+        "today_amount_kobo": _scalar(today, Sum("amount"), 0),
+        **ROLE_INPUTS.get(role, dict)(),
+    }
+    row = User.objects.filter(pk=user.pk).annotate(**columns).values(*columns).first()
+    return EligibilityInputs(**(row or {}))
@@ -0,0 +1,148 @@
+"""
+Withdrawal policy as a rule table of pure functions.
+
+    decide("driver", amount_kobo, inputs, now)
+
+`inputs` is an EligibilityInputs, everything the rules need about one user,
+loaded in a single query by inputs.load_inputs(). A rule takes
+(amount_kobo, inputs, policy, now) and returns whether that check passes.
+BASE_RULES apply to every role; ROLE_RULES add the role-specific checks.
+The decision's `checks` dict is keyed by rule name, in table order.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from payments.payouts.constants import (
+    DAILY_WITHDRAWAL_LIMIT_AMOUNT,
+    DAILY_WITHDRAWAL_LIMIT_COUNT,
+    MINIMUM_BY_ROLE,
+    WITHDRAWAL_COOLDOWN_HOURS,
+)
+
+
+@dataclass
+class WithdrawalDecision:
+    eligible: bool
+    checks: dict
+    minimum_amount_kobo: int
+    available_balance_kobo: int
+
+
+@dataclass(frozen=True)
+class EligibilityInputs:
+    balance_kobo: int = 0
+    pending_kobo: int = 0
+    last_completed_at: datetime | None = None
+    today_count: int = 0
+    today_amount_kobo: int = 0
+    recipient_code: str = ""
+    kyc_complete: bool = True
+    driver_suspended: bool = False
+    bank_verified: bool = False
+    blocking_ticket: bool = False
+
+    @property
+    def available_kobo(self) -> int:
+        return self.balance_kobo - self.pending_kobo
+
+
+@dataclass(frozen=True)
+class Policy:
+    role: str
+    minimum_kobo: int
+    cooldown: timedelta
+    daily_count: int
+    daily_amount_kobo: int
+
+
+def policy_for(role: str) -> Policy:
+    return Policy(
+        role=role,
+        minimum_kobo=MINIMUM_BY_ROLE.get(role, 0),
+        cooldown=timedelta(hours=WITHDRAWAL_COOLDOWN_HOURS),
+        daily_count=DAILY_WITHDRAWAL_LIMIT_COUNT,
+        daily_amount_kobo=DAILY_WITHDRAWAL_LIMIT_AMOUNT,
+    )
+
+
+# ===== RULES =====
+
+def recipient_ready(amount_kobo, inputs, policy, now):
+    return bool(inputs.recipient_code)
+
+
+def role_eligible(amount_kobo, inputs, policy, now):
+    return policy.role in MINIMUM_BY_ROLE
+
+
+def minimum_amount(amount_kobo, inputs, policy, now):
+    return amount_kobo >= policy.minimum_kobo
+
+
+def sufficient_balance(amount_kobo, inputs, policy, now):
+    return inputs.available_kobo >= amount_kobo
+
+
+def cooldown_ok(amount_kobo, inputs, policy, now):
+    return inputs.last_completed_at is None or now - inputs.last_completed_at >= policy.cooldown
+
+
+def daily_count_ok(amount_kobo, inputs, policy, now):
+    return inputs.today_count < policy.daily_count
+
+
+def daily_amount_ok(amount_kobo, inputs, policy, now):
+    return inputs.today_amount_kobo + amount_kobo <= policy.daily_amount_kobo
+
+
+def kyc_complete(amount_kobo, inputs, policy, now):
+    return inputs.kyc_complete
+
+
+def driver_active(amount_kobo, inputs, policy, now):
+    return not inputs.driver_suspended
+
+
+def bank_verified(amount_kobo, inputs, policy, now):
+    return inputs.bank_verified
+
+
+def no_blocking_ticket(amount_kobo, inputs, policy, now):
+    return not inputs.blocking_ticket
+
+
+BASE_RULES = (
+    ("recipient_ready", recipient_ready),
+    ("role_eligible", role_eligible),
+    ("minimum_amount", minimum_amount),
+    ("sufficient_balance", sufficient_balance),
+    ("cooldown_ok", cooldown_ok),
+    ("daily_count_ok", daily_count_ok),
+    ("daily_amount_ok", daily_amount_ok),
+)
+
+ROLE_RULES = {
+    "business_owner": (("kyc_complete", kyc_complete),),
+    "driver": (
+        ("driver_active", driver_active),
+        ("bank_verified", bank_verified),
+        ("no_blocking_ticket", no_blocking_ticket),
+    ),
+    "referral": (),
+}
+
+
+def decide(role: str, amount_kobo: int, inputs: EligibilityInputs, now: datetime, policy: Policy | None = None) -> WithdrawalDecision:
+    policy = policy or policy_for(role)
+    checks = {
+        name: bool(rule(amount_kobo, inputs, policy, now))
+        for name, rule in BASE_RULES + ROLE_RULES.get(role, ())
+    }
+    return WithdrawalDecision(
+        eligible=all(checks.values()),
+        checks=checks,
+        minimum_amount_kobo=policy.minimum_kobo,
+        available_balance_kobo=inputs.available_kobo,
+    )
@@ -1,41 +1,233 @@
+"""
+Idempotency keys for money-moving endpoints, in two tiers.
+
+    payments:idem:<scope>:<actor_id>:<key> -> {"hash", "state", "token", "response"}
+
+begin_idempotent_request() claims the key with one atomic SET NX carrying the
+request fingerprint (state "pending", TTL IDEMPOTENCY_CLAIM_TTL). Whoever
+wins runs the request; a duplicate that arrives meanwhile gets
+IdempotencyInProgressError, one with another payload IdempotencyConflictError,
+and neither touches a row lock. save_idempotent_response() writes the
+response to PaymentIdempotencyKey (durable, audited) and then to redis
+(state "done", TTL IDEMPOTENCY_RESPONSE_TTL), where replays are served from.
+Once that expires the DB row still answers, it is read when a key is claimed.
+
+release_idempotent_request() drops a pending claim when the request failed,
+so the client can retry straight away instead of waiting out the claim TTL.
+
+Without REDIS_URL (tests / local dev) the Django cache holds the keys; if
+redis is down the old path (select_for_update on the DB row) is used.
+"""
 from __future__ import annotations
 
 import hashlib
 import json
+import logging
+import uuid
+from dataclasses import dataclass, field
 
+import redis
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
 
 from payments.models import PaymentIdempotencyKey
+from payments.observability.metrics import increment
+
+logger = logging.getLogger(__name__)
+
+KEY = "payments:idem:{}:{}:{}"
+
+# KEYS[1] idempotency key, ARGV[1] claim token. Only deletes our own pending claim.
+_RELEASE_LUA = """
+local value = redis.call('GET', KEYS[1])
+if value and cjson.decode(value)['token'] == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
 
 
 class IdempotencyConflictError(ValueError):
     pass
 
 
+class IdempotencyInProgressError(IdempotencyConflictError):
+    pass
+
+
+@dataclass
+class IdempotentRequest:
+    """What begin_idempotent_request() hands the view; replaces the locked DB row."""
+
+    scope: str
+    actor_id: str
+    key: str
+    request_hash: str
+    response_snapshot: dict = field(default_factory=dict)
+    token: str = ""
+
+
 def _stable_hash(payload: dict) -> str:
     canonical = json.dumps(payload or {}, sort_keys=True, separators=(",", ":"))
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
 
 
-@transaction.atomic
+class IdempotencyStore:
+    def __init__(self, client=None, claim_ttl=None, response_ttl=None):
+        self._client = client
+        self._script = None
+        self._claim_ttl = claim_ttl
+        self._response_ttl = response_ttl
+
+    @property
+    def claim_ttl(self):
+        return int(self._claim_ttl or getattr(settings, "IDEMPOTENCY_CLAIM_TTL", 60))
+
+    @property
+    def response_ttl(self):
+        return int(self._response_ttl or getattr(settings, "IDEMPOTENCY_RESPONSE_TTL", 24 * 60 * 60))
+
+    def _get_client(self):
+        if self._client is None:
+            url = getattr(settings, "REDIS_URL", None)
+            if not url:
+                return None
+            self._client = redis.from_url(url)
+        return self._client
+
+    def claim(self, key: str, value: dict) -> dict | None:
+        """SET NX. :return: None if claimed, else what the key already holds"""
+        encoded = json.dumps(value, cls=DjangoJSONEncoder)
+        client = self._get_client()
+        for _ in range(3):  # the holder can expire between SET NX and GET
+            if client:
+                pipe = client.pipeline()
+                pipe.set(key, encoded, ex=self.claim_ttl, nx=True)
+                pipe.get(key)
+                claimed, current = pipe.execute()
+            else:
+                claimed = cache.add(key, encoded, timeout=self.claim_ttl)
+                current = None if claimed else cache.get(key)
+            if claimed:
+                return None
+            if current:
+                return json.loads(current)
+        return {"state": "pending"}
+
+    def store(self, key: str, value: dict):
+        encoded = json.dumps(value, cls=DjangoJSONEncoder)
+        client = self._get_client()
+        if client:
+            client.set(key, encoded, ex=self.response_ttl)
+            return
+        cache.set(key, encoded, timeout=self.response_ttl)
+
+    def release(self, key: str, token: str):
+        client = self._get_client()
+        if client:
+            if self._script is None:
+                self._script = client.register_script(_RELEASE_LUA)
+            self._script(keys=[key], args=[token])
+            return
+        current = cache.get(key)
+        if current and json.loads(current).get("token") == token:
+            cache.delete(key)
+
+
+store = IdempotencyStore()
+
+
 def begin_idempotent_request(scope: str, actor_id: str, key: str, payload: dict):
-    request_hash = _stable_hash(payload)
-    row = PaymentIdempotencyKey.objects.select_for_update().filter(scope=scope, actor_id=str(actor_id), key=key).first()
+    """
+    :return: (IdempotentRequest, has_response); replay `request.response_snapshot` when has_response
+    :raises IdempotencyConflictError: the key was used with a different payload
+    :raises IdempotencyInProgressError: the same request is still running
+    """
+    request = IdempotentRequest(scope=scope, actor_id=str(actor_id), key=key, request_hash=_stable_hash(payload))
+    redis_key = KEY.format(scope, request.actor_id, key)
+    request.token = uuid.uuid4().hex
+    try:
+        current = store.claim(redis_key, {"hash": request.request_hash, "state": "pending", "token": request.token})
+    except redis.RedisError as exc:
+        logger.warning(f"[idempotency] redis unavailable, locking in the DB: {exc}")
+        increment("payments.idempotency.lookup", tags={"result": "db_fallback"})
+        return _begin_in_db(request)
+
+    if current is not None:
+        if current.get("hash", request.request_hash) != request.request_hash:
+            increment("payments.idempotency.lookup", tags={"result": "conflict"})
+            raise IdempotencyConflictError("Idempotency-Key already used with a different payload")
+        if current.get("state") == "done":
+            increment("payments.idempotency.lookup", tags={"result": "replay"})
+            request.response_snapshot = current.get("response") or {}
+            return request, True
+        increment("payments.idempotency.lookup", tags={"result": "in_progress"})
+        raise IdempotencyInProgressError("A request with this Idempotency-Key is still being processed")
+
+    # claimed: a response older than the redis TTL may still be in the DB
+    row = PaymentIdempotencyKey.objects.filter(scope=scope, actor_id=request.actor_id, key=key).first()
+    if row and (row.request_hash != request.request_hash or row.response_snapshot):
+        store.release(redis_key, request.token)
+        if row.request_hash != request.request_hash:
+            increment("payments.idempotency.lookup", tags={"result": "conflict"})
+            raise IdempotencyConflictError("Idempotency-Key already used with a different payload")
+        _cache_response(redis_key, row.request_hash, row.response_snapshot)
+        increment("payments.idempotency.lookup", tags={"result": "replay_db"})
+        request.response_snapshot = row.response_snapshot
+        return request, True
+
+    increment("payments.idempotency.lookup", tags={"result": "claimed"})
+    return request, False
+
+
+@transaction.atomic
+def _begin_in_db(request: IdempotentRequest):
+    row = (
+        PaymentIdempotencyKey.objects.select_for_update()
+        .filter(scope=request.scope, actor_id=request.actor_id, key=request.key)
+        .first()
+    )
+    request.token = ""
     if row:
-        if row.request_hash != request_hash:
+        if row.request_hash != request.request_hash:
             raise IdempotencyConflictError("Idempotency-Key already used with a different payload")
-        return row, bool(row.response_snapshot)
+        request.response_snapshot = row.response_snapshot
+        return request, bool(row.response_snapshot)
 
-    row = PaymentIdempotencyKey.objects.create(
-        scope=scope,
-        actor_id=str(actor_id),
-        key=key,
-        request_hash=request_hash,
+    PaymentIdempotencyKey.objects.create(
+        scope=request.scope,
+        actor_id=request.actor_id,
+        key=request.key,
+        request_hash=request.request_hash,
     )
-    return row, False
+    return request, False
 
 
-@transaction.atomic
-def save_idempotent_response(row: PaymentIdempotencyKey, response_snapshot: dict):
-    row.response_snapshot = response_snapshot
-    row.save(update_fields=["response_snapshot", "updated_at"])
+def _cache_response(redis_key: str, request_hash: str, response_snapshot: dict):
+    try:
+        store.store(redis_key, {"hash": request_hash, "state": "done", "response": response_snapshot})
+    except redis.RedisError as exc:
+        logger.warning(f"[idempotency] could not cache response, replays will read the DB: {exc}")
+
+
+def save_idempotent_response(request: IdempotentRequest, response_snapshot: dict):
+    PaymentIdempotencyKey.objects.update_or_create(
+        scope=request.scope,
+        actor_id=request.actor_id,
+        key=request.key,
+        defaults={"request_hash": request.request_hash, "response_snapshot": response_snapshot},
+    )
+    request.response_snapshot = response_snapshot
+    _cache_response(KEY.format(request.scope, request.actor_id, request.key), request.request_hash, response_snapshot)
+
+
+def release_idempotent_request(request: IdempotentRequest | None):
+    """Drop our pending claim after a failed request so a retry can run."""
+    if request is None or not request.token or request.response_snapshot:
+        return
+    try:
+        store.release(KEY.format(request.scope, request.actor_id, request.key), request.token)
+    except redis.RedisError as exc:
+        logger.warning(f"[idempotency] could not release claim, it expires on its own: {exc}")
@@ -68,7 +68,21 @@ class PaystackClient:
 
     def fetch_transfer(self, transfer_code: str) -> dict[str, Any]:
         return self._call(self._client.transfer.verify, {"reference": transfer_code})
-    
+
+    def list_transfers(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """
+        One page of transfers, newest first.
+
+        payload = {
+            "perPage": int,
+            "page": int,
+            "from": "YYYY-MM-DD",  # optional, by creation date
+            "to": "YYYY-MM-DD",    # optional
+        }
+        Response "meta" carries total / page / pageCount.
+        """
+        return self._call(self._client.transfer.list, payload)
+
     def verfy_bvn_match(self, payload: dict[str, Any]) -> dict[str, Any]:
         return self._call(self._client.verification.verify_bvn_match, payload)
     
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any
+
+from django.utils import timezone
+
+from payments.integrations.paystack.errors import PaystackAPIError, PaystackRequestError
+
+
+class FakePaystack:
+    """
+    In-memory stand-in for the Paystack transfer endpoints with the same
+    method names and response shapes as `PaystackClient`.
+
+    Used by the reconciliation and payout scheduler tests and benchmarks:
+    `latency` simulates the network round trip, `calls` counts requests per
+    endpoint and `max_in_flight` records the highest concurrency seen.
+    `list_available=False` makes list-transfers fail, as during an incident.
+    Bulk transfers to `rejected_recipients` come back failed, the next
+    `bulk_request_failures` bulk requests time out, the next
+    `bulk_lost_responses` are accepted but time out before responding, and
+    requests over `bulk_limit` transfers are refused.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        failing_codes: set[str] | None = None,
+        list_available: bool = True,
+        rejected_recipients: set[str] | None = None,
+        bulk_request_failures: int = 0,
+        bulk_lost_responses: int = 0,
+        bulk_limit: int = 100,
+    ):
+        self.latency = latency
+        self.list_available = list_available
+        self.failing_codes = set(failing_codes or ())
+        self.rejected_recipients = set(rejected_recipients or ())
+        self.bulk_request_failures = bulk_request_failures
+        self.bulk_lost_responses = bulk_lost_responses
+        self.bulk_limit = bulk_limit
+        self.bulk_sizes: list[int] = []
+        self.transfers: dict[str, dict[str, Any]] = {}
+        self._by_reference: dict[str, str] = {}
+        self.calls: Counter = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def add_transfer(
+        self,
+        *,
+        transfer_code: str,
+        amount: int,
+        status: str,
+        recipient_code: str,
+        reference: str = "",
+        created_at: datetime | None = None,
+        failure_reason: str = "",
+    ) -> dict[str, Any]:
+        transfer = {
+            "transfer_code": transfer_code,
+            "reference": reference,
+            "amount": amount,
+            "status": status,
+            "failure_reason": failure_reason,
+            "recipient": {"recipient_code": recipient_code},
+            "createdAt": (created_at or timezone.now()).isoformat(),
+        }
+        self.transfers[transfer_code] = transfer
+        if reference:
+            self._by_reference[reference] = transfer_code
+        return transfer
+
+    def _request(self, endpoint: str):
+        with self._lock:
+            self.calls[endpoint] += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def fetch_transfer(self, transfer_code: str) -> dict[str, Any]:
+        self._request("fetch")
+        if transfer_code in self.failing_codes:
+            raise PaystackRequestError(f"timeout fetching {transfer_code}")
+        code = self._by_reference.get(transfer_code, transfer_code)
+        if code not in self.transfers:
+            raise PaystackAPIError(message="Transfer not found", payload={"status": False})
+        return {"status": True, "message": "Transfer retrieved", "data": dict(self.transfers[code])}
+
+    def list_transfers(self, payload: dict[str, Any]) -> dict[str, Any]:
+        self._request("list")
+        if not self.list_available:
+            raise PaystackRequestError("list-transfers unavailable")
+        per_page = int(payload.get("perPage", 50))
+        page = int(payload.get("page", 1))
+        rows = sorted(self.transfers.values(), key=lambda t: t["createdAt"], reverse=True)
+        if payload.get("from"):
+            rows = [t for t in rows if t["createdAt"][:10] >= payload["from"]]
+        if payload.get("to"):
+            rows = [t for t in rows if t["createdAt"][:10] <= payload["to"]]
+        start = (page - 1) * per_page
+        return {
+            "status": True,
+            "message": "Transfers retrieved",
+            "data": [dict(t) for t in rows[start:start + per_page]],
+            "meta": {
+                "total": len(rows),
+                "perPage": per_page,
+                "page": page,
+                "pageCount": max(1, -(-len(rows) // per_page)),
+            },
+        }
+
+    def bulk_transfer(self, payload: dict[str, Any]) -> dict[str, Any]:
+        self._request("bulk")
+        transfers = payload.get("transfers") or []
+        with self._lock:
+            if self.bulk_request_failures:
+                self.bulk_request_failures -= 1
+                raise PaystackRequestError("timeout initiating bulk transfer")
+            if len(transfers) > self.bulk_limit:
+                raise PaystackAPIError(message=f"Bulk transfer limit is {self.bulk_limit}", payload={"status": False})
+            self.bulk_sizes.append(len(transfers))
+
+            rows = []
+            for transfer in transfers:
+                if transfer["recipient"] in self.rejected_recipients:
+                    rows.append({"reference": transfer["reference"], "status": "failed", "message": "Invalid recipient"})
+                    continue
+                code = f"TRF_{len(self.transfers) + 1}"
+                self.add_transfer(
+                    transfer_code=code,
+                    reference=transfer["reference"],
+                    amount=transfer["amount"],
+                    status="pending",
+                    recipient_code=transfer["recipient"],
+                )
+                rows.append({"reference": transfer["reference"], "transfer_code": code, "status": "received"})
+            if self.bulk_lost_responses:
+                self.bulk_lost_responses -= 1
+                raise PaystackRequestError("timeout reading bulk transfer response")
+        return {"status": True, "message": f"{len(rows)} transfers queued.", "data": rows}
@@ -0,0 +1,118 @@
+"""
+Journal posting for the ledger.
+
+    post_journal(Journal(sale=sale, total=500000, legs=[
+        Leg(business_owner, "business_owner", "credit", 450000),
+        Leg(driver, "driver", "credit", 30000),
+        Leg(None, "platform", "credit", 20000),
+    ]))
+
+A journal holds every leg of one business event. It has to balance: the legs
+add up to `total`, the amount leaving escrow. A leg without a user stays with
+the platform (its cut, or a delivery fee no driver earned). LedgerEntry has
+no platform account, so such legs count towards the balance check but are
+not written.
+
+post_journal() locks the users' rows in id order. This is the same User row
+lock create_withdrawal_request() takes, so postings and withdrawal holds for
+one user serialise without deadlocking. It then reads every user's balance
+with one grouped SUM and computes running balances and row hashes in memory.
+All entries are written with one bulk_create.
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from payments.models import LedgerEntry, User
+from payments.observability.metrics import increment, observe_ms
+
+ENTRY_SIGNS = {"credit": 1, "debit": -1, "reversal": -1}
+
+
+class UnbalancedJournal(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class Leg:
+    user: User | None
+    role: str
+    type: str
+    amount: int
+    notes: str = ""
+
+
+@dataclass
+class Journal:
+    sale: object | None
+    total: int
+    legs: list[Leg] = field(default_factory=list)
+
+    def validate(self) -> None:
+        posted = sum(leg.amount for leg in self.legs)
+        if posted != self.total:
+            raise UnbalancedJournal(f"Journal legs sum to {posted}, expected {self.total}")
+        for leg in self.legs:
+            if leg.user is None:
+                continue
+            sign = ENTRY_SIGNS.get(leg.type)
+            if sign is None:
+                raise UnbalancedJournal(f"Unknown entry type {leg.type!r}")
+            if leg.amount * sign < 0:
+                raise UnbalancedJournal(f"{leg.type} leg for {leg.role} has amount {leg.amount}")
+
+
+def post_journal(journal: Journal) -> list[LedgerEntry]:
+    """Validate and write a journal's user legs; returns the created entries."""
+    journal.validate()
+    legs = [leg for leg in journal.legs if leg.user is not None and leg.amount]
+    if not legs:
+        return []
+
+    started = time.monotonic()
+    user_ids = {leg.user.pk for leg in legs}
+    with transaction.atomic():
+        list(User.objects.select_for_update().filter(id__in=user_ids).order_by("id").values_list("id", flat=True))
+        balances = dict(
+            LedgerEntry.objects.filter(user_id__in=user_ids)
+            .values("user_id")
+            .annotate(total=Sum("amount"))
+            .values_list("user_id", "total")
+        )
+
+        now = timezone.now()
+        sale_key = str(journal.sale.pk) if journal.sale else "withdrawal"
+        entries = []
+        for leg in legs:
+            balance = (balances.get(leg.user.pk) or 0) + leg.amount
+            balances[leg.user.pk] = balance
+            entries.append(
+                LedgerEntry(
+                    user=leg.user,
+                    sale=journal.sale,
+                    role=leg.role,
+                    type=leg.type,
+                    amount=leg.amount,
+                    balance_after=balance,
+                    row_hash=LedgerEntry.generate_hash(
+                        sale_id=sale_key,
+                        user_id=str(leg.user.pk),
+                        amount=leg.amount,
+                        entry_type=leg.type,
+                        role=leg.role,
+                        created_at=now.isoformat(),
+                    ),
+                    notes=leg.notes,
+                    created_at=now,
+                )
+            )
+        LedgerEntry.objects.bulk_create(entries)
+
+    increment("payments.ledger.postings_total", value=len(entries))
+    observe_ms("payments.ledger.post_ms", (time.monotonic() - started) * 1000)
+    return entries
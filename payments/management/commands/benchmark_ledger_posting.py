@@ -0,0 +1,82 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.models import User
+from common.benchmark import rolled_back
+from payments.models import LedgerEntry, Sale
+from payments.ledger.posting import post_journal
+from payments.services.split_calculator import _create_ledger_entry, order_v1_split, sale_journal
+
+
+class Command(BaseCommand):
+    help = (
+        "Ledger credits for completed sales: one bulk-written journal per sale (and optionally the old "
+        "one-SUM-and-INSERT-per-entry path). Reports postings per second. Everything is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sales", type=int, default=2000)
+        parser.add_argument("--drivers", type=int, default=50, help="Sales are spread over this many drivers.")
+        parser.add_argument("--legacy", action="store_true", help="Also time the per-entry _create_ledger_entry loop.")
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            self.run(options)
+        self.stdout.write("Rolled back synthetic sales and ledger entries.")
+
+    def run(self, options):
+        n = options["sales"]
+        payer = User.objects.create_user(email="bench-ledger-payer@bench.invalid", password=None)
+        business = User.objects.create_user(email="bench-ledger-business@bench.invalid", password=None)
+        drivers = [
+            User.objects.create_user(email=f"bench-ledger-driver-{i}@bench.invalid", password=None)
+            for i in range(options["drivers"])
+        ]
+        split = order_v1_split(0, False, {"items_total_kobo": 450000, "delivery_fee_kobo": 30000})
+
+        self.stdout.write(f"Creating {n} completed sales ...")
+        sales = Sale.objects.bulk_create(
+            [
+                Sale(
+                    reference=f"BENCH_LEDGER_{i}",
+                    payer=payer,
+                    business_owner=business,
+                    driver=drivers[i % len(drivers)],
+                    total_amount=split["total"],
+                    status="completed",
+                    split_snapshot=split,
+                )
+                for i in range(n)
+            ],
+            batch_size=1000,
+        )
+
+        if options["legacy"]:
+            with rolled_back():
+                started = time.perf_counter()
+                for sale in sales:
+                    for party, role in ((sale.business_owner, "business_owner"), (sale.driver, "driver")):
+                        _create_ledger_entry(
+                            user=party,
+                            sale=sale,
+                            role=role,
+                            entry_type="credit",
+                            amount=split["amounts"][role],
+                            notes=f"Credit for sale {sale.reference}",
+                        )
+                self.report("legacy", time.perf_counter() - started)
+
+        started = time.perf_counter()
+        for sale in sales:
+            post_journal(sale_journal(sale, split))
+        self.report("journal", time.perf_counter() - started)
+
+    def report(self, label, seconds):
+        postings = LedgerEntry.objects.filter(sale__reference__startswith="BENCH_LEDGER_").count()
+        self.stdout.write(
+            f"{label:<8} {postings:>7} postings  {seconds:8.2f}s  {postings / seconds if seconds else 0:>8.0f} postings/s"
+        )
+
+
+# Run with: LEDGER_HASH_SALT=bench python manage.py benchmark_ledger_posting --sales 2000 --legacy
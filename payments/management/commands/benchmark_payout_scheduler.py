@@ -0,0 +1,79 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.models import DriverProfile, User
+from common.benchmark import rolled_back
+from common.ratelimit import GCRALimiter
+from common.ratelimit import limiter as limiter_module
+from payments.integrations.paystack.fake import FakePaystack
+from payments.models import Withdrawal
+from payments.payouts.scheduler import BatchLimits, dispatch
+
+
+class Command(BaseCommand):
+    help = (
+        "Batch payout dispatch against a fake Paystack with simulated latency: transfers/s with bulk requests "
+        "submitted concurrently (and optionally one at a time). Everything is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--withdrawals", type=int, default=5000)
+        parser.add_argument("--latency-ms", type=float, default=400, help="Simulated bulk-transfer round trip.")
+        parser.add_argument("--rate", type=int, default=None, help="Provider calls/second (default: RATE_LIMITS).")
+        parser.add_argument("--concurrency", type=int, default=None, help="Default: PAYOUT_SUBMIT_CONCURRENCY.")
+        parser.add_argument("--reject-every", type=int, default=100, help="Every nth recipient is rejected (0: none).")
+        parser.add_argument("--sequential", action="store_true", help="Also time one bulk request at a time.")
+
+    def handle(self, *args, **options):
+        if options["rate"]:
+            limiter_module._limiters["paystack_api"] = GCRALimiter("paystack_api", options["rate"], 1, client=False)
+        with rolled_back():
+            self.run(options)
+        self.stdout.write("Rolled back synthetic withdrawals.")
+
+    def run(self, options):
+        n = options["withdrawals"]
+        limits = BatchLimits.from_settings()
+        user = User.objects.create_user(email="bench-payouts@bench.invalid", password=None)
+        DriverProfile.objects.create(user=user, first_name="Bench", last_name="Driver")
+
+        self.stdout.write(f"Creating {n} pending batch withdrawals ...")
+        every = options["reject_every"]
+        Withdrawal.objects.bulk_create(
+            [
+                Withdrawal(
+                    user=user,
+                    amount=limits.large_transfer_kobo if i % 25 == 0 else 50_000 + i,
+                    status="pending_batch",
+                    strategy=Withdrawal.STRATEGY_BATCH,
+                    paystack_recipient_code="RCP_BENCH_REJECTED" if every and i % every == 0 else f"RCP_BENCH_{i}",
+                )
+                for i in range(n)
+            ],
+            batch_size=1000,
+        )
+
+        runs = [("sequential", 1)] if options["sequential"] else []
+        runs.append(("concurrent", options["concurrency"]))
+        for label, concurrency in runs:
+            fake = FakePaystack(
+                latency=options["latency_ms"] / 1000,
+                rejected_recipients={"RCP_BENCH_REJECTED"},
+                bulk_limit=limits.max_transfers,
+            )
+            with rolled_back():
+                started = time.perf_counter()
+                result = dispatch(fake, limits=limits, concurrency=concurrency)
+                self.report(label, result, time.perf_counter() - started, fake)
+
+    def report(self, label, result, seconds, fake):
+        transfers = result["queued"] + result["retried"] + result["failed"]
+        self.stdout.write(
+            f"{label:<10} {transfers:>6} transfers in {result['batches']} batches  {seconds:8.1f}s  "
+            f"{transfers / seconds if seconds else 0:>7.0f} transfers/s  queued {result['queued']}  "
+            f"retried {result['retried']}  max in flight {fake.max_in_flight}"
+        )
+
+
+# Run with: python manage.py benchmark_payout_scheduler --withdrawals 5000 --sequential
@@ -0,0 +1,110 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from accounts.models import DriverProfile, User
+from common.benchmark import rolled_back
+from common.ratelimit import GCRALimiter
+from common.ratelimit import limiter as limiter_module
+from payments.integrations.paystack.fake import FakePaystack
+from payments.models import Withdrawal
+from payments.payouts.services import mark_withdrawal_failed, mark_withdrawal_paid
+from payments.reconciliation.engine import reconcile_stale_withdrawals
+
+
+class Command(BaseCommand):
+    help = (
+        "Stale-withdrawal reconciliation against a fake Paystack with simulated latency: the concurrent "
+        "list + bulk-apply engine (and optionally the old one-fetch-per-row loop). Everything is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--withdrawals", type=int, default=5000)
+        parser.add_argument("--latency-ms", type=float, default=80, help="Simulated Paystack round trip.")
+        parser.add_argument("--rate", type=int, default=None, help="Provider calls/second (default: RATE_LIMITS).")
+        parser.add_argument("--no-list", action="store_true", help="Per-transfer fetches only (list-transfers down).")
+        parser.add_argument("--legacy", action="store_true", help="Also time the sequential fetch + save loop.")
+
+    def handle(self, *args, **options):
+        if options["rate"]:
+            limiter_module._limiters["paystack_api"] = GCRALimiter("paystack_api", options["rate"], 1, client=False)
+        with rolled_back():
+            self.run(options)
+        self.stdout.write("Rolled back synthetic withdrawals.")
+
+    def run(self, options):
+        n = options["withdrawals"]
+        fake = FakePaystack(latency=options["latency_ms"] / 1000, list_available=not options["no_list"])
+
+        user = User.objects.create_user(email="bench-recon@bench.invalid", password=None)
+        DriverProfile.objects.create(user=user, first_name="Bench", last_name="Driver")
+        processed_at = timezone.now() - timedelta(hours=12)
+
+        self.stdout.write(f"Creating {n} stale withdrawals ...")
+        Withdrawal.objects.bulk_create(
+            [
+                Withdrawal(
+                    user=user,
+                    amount=1000,
+                    status="processing",
+                    processed_at=processed_at,
+                    paystack_transfer_code=f"BENCH_TRF_{i}",
+                    paystack_transfer_ref=f"BENCH_REF_{i}",
+                    paystack_recipient_code="RCP_BENCH",
+                )
+                for i in range(n)
+            ],
+            batch_size=1000,
+        )
+        for i in range(n):
+            # mostly settled, a few failed, some still in flight
+            status = "failed" if i % 50 == 0 else "pending" if i % 20 == 0 else "success"
+            fake.add_transfer(
+                transfer_code=f"BENCH_TRF_{i}",
+                reference=f"BENCH_REF_{i}",
+                amount=1000,
+                status=status,
+                recipient_code="RCP_BENCH",
+                created_at=processed_at,
+            )
+
+        if options["legacy"]:
+            with rolled_back():
+                started = time.perf_counter()
+                rows = self.legacy(fake)
+                self.report("legacy", rows, time.perf_counter() - started, fake)
+            fake.calls.clear()
+            fake.max_in_flight = 0
+
+        started = time.perf_counter()
+        stats = reconcile_stale_withdrawals(fake, older_than=timedelta(hours=6))
+        self.report("engine", stats["reconciled"], time.perf_counter() - started, fake)
+        self.stdout.write(f"engine stats: {stats}")
+
+    def legacy(self, fake):
+        """The pre-engine loop: one fetch and one save per withdrawal, in order."""
+        reconciled = 0
+        for withdrawal in Withdrawal.objects.filter(
+            status="processing", paystack_transfer_code__startswith="BENCH_TRF_"
+        ).select_related("user"):
+            ps = fake.fetch_transfer(withdrawal.paystack_transfer_code).get("data", {})
+            status = (ps.get("status") or "").lower()
+            if status == "success":
+                mark_withdrawal_paid(withdrawal)
+                reconciled += 1
+            elif status in {"failed", "reversed"}:
+                mark_withdrawal_failed(withdrawal, "Paystack marked transfer as failed")
+                reconciled += 1
+        return reconciled
+
+    def report(self, label, rows, seconds, fake):
+        calls = ", ".join(f"{endpoint}={count}" for endpoint, count in sorted(fake.calls.items()))
+        self.stdout.write(
+            f"{label:<7} {rows:>6} settled  {seconds:8.1f}s  {rows / seconds if seconds else 0:>7.0f} rows/s  "
+            f"provider calls: {calls}  max in flight {fake.max_in_flight}"
+        )
+
+
+# Run with: python manage.py benchmark_reconciliation --withdrawals 5000 --legacy
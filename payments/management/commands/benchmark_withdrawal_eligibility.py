@@ -0,0 +1,54 @@
+from django.core.management.base import BaseCommand
+
+from accounts.models import DriverBankAccount, DriverProfile, User
+from common.benchmark import latency, rolled_back, sample
+from payments.eligibility import evaluate_eligibility
+from payments.models import LedgerEntry, Withdrawal
+
+
+class Command(BaseCommand):
+    help = (
+        "Withdrawal eligibility for a driver with a long ledger and withdrawal history: queries and "
+        "latency per evaluation. Everything is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--evaluations", type=int, default=500)
+        parser.add_argument("--ledger-entries", type=int, default=5000)
+        parser.add_argument("--withdrawals", type=int, default=500)
+
+    def handle(self, *args, **options):
+        with rolled_back():
+            self.run(options)
+        self.stdout.write("Rolled back synthetic driver.")
+
+    def run(self, options):
+        user = User.objects.create_user(email="bench-eligibility@bench.invalid", password=None)
+        profile = DriverProfile.objects.create(user=user, first_name="Bench", last_name="Driver")
+        DriverBankAccount.objects.create(driver=profile, paystack_recipient_code="RCP_BENCH", is_verified=True)
+
+        self.stdout.write(f"Creating {options['ledger_entries']} ledger entries, {options['withdrawals']} withdrawals ...")
+        LedgerEntry.objects.bulk_create(
+            [
+                LedgerEntry(user=user, role="driver", type="credit", amount=1000, balance_after=1000 * (i + 1), row_hash="bench")
+                for i in range(options["ledger_entries"])
+            ],
+            batch_size=1000,
+        )
+        Withdrawal.objects.bulk_create(
+            [
+                Withdrawal(user=user, amount=500, status="complete" if i % 10 else "failed", paystack_recipient_code="RCP_BENCH")
+                for i in range(options["withdrawals"])
+            ],
+            batch_size=1000,
+        )
+
+        decision, timings, queries = sample(
+            options["evaluations"], lambda: evaluate_eligibility(user, 100_000, role="driver")
+        )
+        self.stdout.write(
+            f"{len(timings)} evaluations  queries/eval {queries:.1f}  "
+            f"{latency(timings, 95)}  eligible={decision.eligible}"
+        )
+
+# Run with: python manage.py benchmark_withdrawal_eligibility --evaluations 500
@@ -0,0 +1,32 @@
+"""
+Webhook queue sweep for cron (same approach as image/storage_gc):
+
+    * * * * *  python manage.py process_webhooks --async
+
+Picks up events whose retry backoff expired or whose on-commit kick was lost.
+"""
+from django.core.management.base import BaseCommand
+
+from payments.webhooks.queue import process_pending, requeue
+
+
+class Command(BaseCommand):
+    help = "Process due Paystack webhook events (or requeue dead-lettered ones)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requeue", nargs="+", metavar="LOG_ID", help="Requeue these dead-lettered events first.")
+        parser.add_argument("--async", dest="run_async", action="store_true", help="Queue the celery task instead.")
+
+    def handle(self, *args, **options):
+        if options["requeue"]:
+            self.stdout.write(f"Requeued {requeue(options['requeue'])} events.")
+
+        if options["run_async"]:
+            from payments.tasks import process_webhooks
+
+            process_webhooks.delay()
+            self.stdout.write("Queued.")
+            return
+
+        stats, drained = process_pending()
+        self.stdout.write(self.style.SUCCESS(f"{stats} drained={drained}"))
@@ -0,0 +1,31 @@
+"""
+Batch payout window check for cron (same approach as process_webhooks):
+
+    * * * * *  python manage.py schedule_payouts --async
+
+Submits the pending batch withdrawals once the window closes on count,
+amount or age (PAYOUT_WINDOW_* settings); `--now` submits them regardless.
+"""
+from django.core.management.base import BaseCommand
+
+from payments.payouts.scheduler import dispatch_if_due
+from payments.payouts.services import execute_batch
+
+
+class Command(BaseCommand):
+    help = "Submit pending batch withdrawals once the payout window has closed."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--now", action="store_true", help="Submit everything pending without waiting for the window.")
+        parser.add_argument("--async", dest="run_async", action="store_true", help="Queue the celery task instead.")
+
+    def handle(self, *args, **options):
+        if options["run_async"]:
+            from payments.payouts.tasks import execute_batch_payouts, schedule_payouts
+
+            (execute_batch_payouts if options["now"] else schedule_payouts).delay()
+            self.stdout.write("Queued.")
+            return
+
+        result = execute_batch() if options["now"] else dispatch_if_due()
+        self.stdout.write(self.style.SUCCESS(str(result)))
@@ -0,0 +1,50 @@
+# Generated by Django 5.1 on 2026-10-19 10:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def dead_letter_unprocessed(apps, schema_editor):
+    # events that failed under the old inline handler must not be replayed
+    # blindly by the new worker; they land in the dead-letter list instead
+    PaystackWebhookLog = apps.get_model("payments", "PaystackWebhookLog")
+    PaystackWebhookLog.objects.filter(processed=False).update(dead_at=django.utils.timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payments', '0016_sale_payment_source_sale_responsible_party_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='paystackwebhooklog',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='paystackwebhooklog',
+            name='not_before',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name='paystackwebhooklog',
+            name='claimed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='paystackwebhooklog',
+            name='dead_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='paystackwebhooklog',
+            index=models.Index(fields=['processed', 'not_before'], name='payments_pa_process_652c67_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='paystackwebhooklog',
+            index=models.Index(fields=['paystack_reference', 'received_at'], name='payments_pa_paystac_9ed45e_idx'),
+        ),
+        migrations.RunPython(dead_letter_unprocessed, migrations.RunPython.noop),
+    ]
@@ -3,6 +3,7 @@ import os
 import uuid
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.utils import timezone
 from accounts.models import User
 from authflow.services.model import ULIDField
 from .accounts import AbstractPayoutAccount
@@ -274,6 +275,12 @@ class PaystackWebhookLog(models.Model):
     error_reason = models.TextField(blank=True)
     received_at = models.DateTimeField(auto_now_add=True)
 
+    # processing queue (payments/webhooks/queue.py)
+    attempts = models.PositiveIntegerField(default=0)
+    not_before = models.DateTimeField(default=timezone.now)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    dead_at = models.DateTimeField(null=True, blank=True)
+
     def save(self, *args, **kwargs):
         if self.pk and PaystackWebhookLog.objects.filter(pk=self.pk).exists():
             original = PaystackWebhookLog.objects.get(pk=self.pk)
@@ -288,6 +295,10 @@ class PaystackWebhookLog(models.Model):
 
     class Meta:
         verbose_name = "Paystack Webhook Log"
+        indexes = [
+            models.Index(fields=["processed", "not_before"]),
+            models.Index(fields=["paystack_reference", "received_at"]),
+        ]
         constraints = [
             models.UniqueConstraint(fields=["event_hash"], name="uniq_paystack_event_hash"),
             models.UniqueConstraint(fields=["event_id"], condition=~models.Q(event_id=""), name="uniq_paystack_event_id"),
@@ -0,0 +1,55 @@
+"""
+Prometheus exposition for multi-process servers.
+
+prometheus_client switches to multiprocess mode when PROMETHEUS_MULTIPROC_DIR
+is set before it is imported: each process then writes its samples to
+`<dir>/<type>_<pid>.db` and a scrape merges all files in the directory.
+Give every service its own directory.
+
+- gunicorn: gunicorn.conf.py clears the directory when the master starts and
+  marks exited workers dead. django_prometheus' `/metrics` merges the files.
+- Celery: core/celery.py starts an HTTP exporter on WORKER_METRICS_PORT in the
+  worker's main process. It serves the merged samples of the whole pool.
+"""
+from __future__ import annotations
+
+import glob
+import logging
+import os
+
+from prometheus_client import REGISTRY, CollectorRegistry, multiprocess, start_http_server
+
+logger = logging.getLogger(__name__)
+
+
+def multiprocess_dir() -> str:
+    return os.environ.get("PROMETHEUS_MULTIPROC_DIR", "")
+
+
+def collector_registry(path: str | None = None) -> CollectorRegistry:
+    """Registry that aggregates every process's samples in the multiprocess directory."""
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry, path=path or multiprocess_dir())
+    return registry
+
+
+def clear_multiprocess_dir() -> None:
+    """Drop samples left by a previous run; call once per service start, before workers fork."""
+    path = multiprocess_dir()
+    if not path:
+        return
+    os.makedirs(path, exist_ok=True)
+    for db_file in glob.glob(os.path.join(path, "*.db")):
+        os.remove(db_file)
+
+
+def mark_process_dead(pid: int) -> None:
+    """Fold an exited process's live gauges away; its counters keep counting in the merge."""
+    if multiprocess_dir():
+        multiprocess.mark_process_dead(pid)
+
+
+def start_worker_exporter(port: int) -> None:
+    registry = collector_registry() if multiprocess_dir() else REGISTRY
+    start_http_server(port, registry=registry)
+    logger.info("metrics.exporter.started", extra={"port": port, "multiprocess": bool(multiprocess_dir())})
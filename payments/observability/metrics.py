@@ -1,56 +1,97 @@
+"""
+Application metrics, published through prometheus_client.
+
+    increment("payments.webhook.processed_total", tags={"event": "transfer.success"})
+        -> payments_webhook_processed_total{event="transfer.success"}
+    observe_ms("payments.webhook.queue_lag_ms", 840, tags={"event": "transfer.success"})
+        -> payments_webhook_queue_lag_ms_bucket / _sum / _count
+
+Dots become underscores and tags become labels. A metric's label names are
+fixed by its first call; later calls fill missing tags with "" and drop
+unknown ones (logged once per metric).
+
+Everything registers on the default prometheus_client registry, which the
+django_prometheus `/metrics` view already exports. With
+PROMETHEUS_MULTIPROC_DIR set, every gunicorn worker / Celery pool process
+writes its samples there and the exporters merge them (see exporter.py).
+"""
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
+import re
 from threading import Lock
 from typing import Mapping
 
+from prometheus_client import REGISTRY, Counter, Histogram
+
 logger = logging.getLogger(__name__)
 _lock = Lock()
-_counters = defaultdict(float)
-_hist_sums = defaultdict(float)
-_hist_counts = defaultdict(int)
+_metrics: dict[str, tuple[Counter | Histogram, tuple[str, ...]]] = {}
+_dropped_tags_logged: set[str] = set()
 
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000, 30_000, 60_000, 300_000, float("inf"))
 
-def _tags_key(tags: Mapping[str, str] | None) -> tuple[tuple[str, str], ...]:
-    if not tags:
-        return tuple()
-    return tuple(sorted((str(k), str(v)) for k, v in tags.items()))
 
+def prometheus_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_:]", "_", name)
 
-def increment(name: str, value: float = 1.0, tags: Mapping[str, str] | None = None) -> None:
-    key = (name, _tags_key(tags))
+
+def _metric(kind: type, name: str, tags: Mapping[str, str] | None):
+    tags = tags or {}
     with _lock:
-        _counters[key] += float(value)
+        entry = _metrics.get(name)
+        if entry is None:
+            labelnames = tuple(sorted(str(k) for k in tags))
+            if kind is Counter:
+                metric = Counter(prometheus_name(name), name, labelnames)
+            else:
+                metric = Histogram(prometheus_name(name), name, labelnames, buckets=LATENCY_BUCKETS_MS)
+            entry = _metrics[name] = (metric, labelnames)
+        metric, labelnames = entry
+        dropped = set(map(str, tags)) - set(labelnames)
+        if dropped and name not in _dropped_tags_logged:
+            _dropped_tags_logged.add(name)
+            logger.warning("metrics.tags_dropped", extra={"metric_name": name, "metric_tags": sorted(dropped)})
+
+    if not labelnames:
+        return metric
+    values = {str(k): str(v) for k, v in tags.items()}
+    return metric.labels(**{label: values.get(label, "") for label in labelnames})
+
+
+def increment(name: str, value: float = 1.0, tags: Mapping[str, str] | None = None) -> None:
+    _metric(Counter, name, tags).inc(float(value))
     logger.info("metrics.counter", extra={"metric_name": name, "metric_value": value, "metric_tags": dict(tags or {})})
 
 
 def observe_ms(name: str, value_ms: float, tags: Mapping[str, str] | None = None) -> None:
-    key = (name, _tags_key(tags))
-    with _lock:
-        _hist_sums[key] += float(value_ms)
-        _hist_counts[key] += 1
+    _metric(Histogram, name, tags).observe(float(value_ms))
     logger.info("metrics.histogram", extra={"metric_name": name, "metric_value": value_ms, "metric_tags": dict(tags or {})})
 
 
 def snapshot() -> dict:
+    """This process's values, keyed "name|{tags}" as before the prometheus backend."""
     with _lock:
-        counters = {
-            f"{name}|{dict(tags)}": value
-            for (name, tags), value in _counters.items()
-        }
-        histograms = {
-            f"{name}|{dict(tags)}": {
-                "sum": _hist_sums[(name, tags)],
-                "count": _hist_counts[(name, tags)],
-            }
-            for (name, tags) in _hist_counts.keys()
-        }
+        entries = list(_metrics.items())
+
+    counters, histograms = {}, {}
+    for name, (metric, _labelnames) in entries:
+        for family in metric.collect():
+            for sample in family.samples:
+                key = f"{name}|{dict(sorted(sample.labels.items()))}"
+                if isinstance(metric, Counter):
+                    if sample.name.endswith("_total"):
+                        counters[key] = sample.value
+                elif sample.name.endswith("_sum"):
+                    histograms.setdefault(key, {})["sum"] = sample.value
+                elif sample.name.endswith("_count"):
+                    histograms.setdefault(key, {})["count"] = int(sample.value)
     return {"counters": counters, "histograms": histograms}
 
 
 def reset_for_tests() -> None:
     with _lock:
-        _counters.clear()
-        _hist_sums.clear()
-        _hist_counts.clear()
+        for metric, _labelnames in _metrics.values():
+            REGISTRY.unregister(metric)
+        _metrics.clear()
+        _dropped_tags_logged.clear()
@@ -0,0 +1,338 @@
+"""
+Batch payout scheduler.
+
+    dispatch_if_due()      # every minute: only when the window has closed
+    dispatch()             # execute_batch(): whatever is pending, now
+
+Pending batch withdrawals accumulate in one window that closes when it holds
+PAYOUT_WINDOW_MAX_COUNT withdrawals, PAYOUT_WINDOW_MAX_AMOUNT_KOBO in total,
+or its oldest request is PAYOUT_WINDOW_MAX_AGE old. A closed window is
+claimed (status -> processing, reference assigned) and planned into bulk
+requests that fit the provider's limits: at most PAYSTACK_BULK_TRANSFER_LIMIT
+transfers and PAYOUT_BATCH_MAX_AMOUNT_KOBO per request, with transfers of
+PAYOUT_LARGE_TRANSFER_KOBO and above kept apart from the small ones.
+
+Requests go out on PAYOUT_SUBMIT_CONCURRENCY threads under the shared
+`paystack_api` rate limit; the database is only touched from the calling
+thread. Each transfer in a response is settled on its own: accepted ones keep
+their transfer code, rejected ones go back to pending_batch with a new
+reference until `max_retries`, then fail and release their hold. A transfer
+whose outcome is unknown (the whole request failed, or the response left it
+out) may still have been accepted, so it is looked up by reference first:
+found and not failed, it is queued; reported failed, it is rejected as above.
+Anything the provider cannot confirm stays in `processing` under its
+reference for reconcile_stale_withdrawals(); its hold is never released
+without the provider's word that the transfer did not happen. A lookup that
+still answers "not found" PAYOUT_NOT_FOUND_GRACE after submission is that
+word: the withdrawal is rejected like any other (reject_withdrawals()).
+"""
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Sequence
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Min, Sum
+from django.utils import timezone
+
+from payments.models import Withdrawal
+from payments.observability.metrics import increment, observe_ms
+from payments.reconciliation.engine import (
+    FAILED_STATUSES,
+    _capture,
+    _throttled,
+    fetch_transfer_states,
+    normalize_status,
+    not_found_past_grace,
+)
+
+logger = logging.getLogger(__name__)
+
+REJECTED_STATUSES = {"failed", "reversed", "rejected"}
+
+
+@dataclass(frozen=True)
+class WindowPolicy:
+    max_count: int
+    max_amount_kobo: int
+    max_age: timedelta
+
+    @classmethod
+    def from_settings(cls) -> "WindowPolicy":
+        return cls(
+            max_count=int(getattr(settings, "PAYOUT_WINDOW_MAX_COUNT", 200)),
+            max_amount_kobo=int(getattr(settings, "PAYOUT_WINDOW_MAX_AMOUNT_KOBO", 1_000_000_000)),
+            max_age=timedelta(seconds=int(getattr(settings, "PAYOUT_WINDOW_MAX_AGE", 30 * 60))),
+        )
+
+
+@dataclass(frozen=True)
+class BatchLimits:
+    max_transfers: int
+    max_amount_kobo: int
+    large_transfer_kobo: int
+
+    @classmethod
+    def from_settings(cls) -> "BatchLimits":
+        return cls(
+            max_transfers=int(getattr(settings, "PAYSTACK_BULK_TRANSFER_LIMIT", 100)),
+            max_amount_kobo=int(getattr(settings, "PAYOUT_BATCH_MAX_AMOUNT_KOBO", 500_000_000)),
+            large_transfer_kobo=int(getattr(settings, "PAYOUT_LARGE_TRANSFER_KOBO", 50_000_000)),
+        )
+
+
+def _pending():
+    return Withdrawal.objects.filter(status="pending_batch", strategy=Withdrawal.STRATEGY_BATCH)
+
+
+# ===== WINDOW =====
+
+def window_state() -> dict[str, Any]:
+    return _pending().aggregate(count=Count("id"), amount=Sum("amount"), oldest=Min("requested_at"))
+
+
+def window_closed(state: dict[str, Any], policy: WindowPolicy, now=None) -> str | None:
+    """Why the window is closed ("count", "amount" or "age"), or None while it is still filling."""
+    if not state.get("count"):
+        return None
+    if state["count"] >= policy.max_count:
+        return "count"
+    if (state.get("amount") or 0) >= policy.max_amount_kobo:
+        return "amount"
+    if state.get("oldest") and (now or timezone.now()) - state["oldest"] >= policy.max_age:
+        return "age"
+    return None
+
+
+# ===== PLAN =====
+
+def plan_batches(withdrawals: Sequence, limits: BatchLimits) -> list[list]:
+    """
+    Split withdrawals (in order) into bulk requests within the provider limits.
+    Large transfers are planned separately so one of them cannot push a batch
+    of small ones over the amount cap; a single transfer above the cap still
+    gets a batch of its own.
+    """
+    large = [w for w in withdrawals if w.amount >= limits.large_transfer_kobo]
+    small = [w for w in withdrawals if w.amount < limits.large_transfer_kobo]
+
+    batches: list[list] = []
+    for band in (small, large):
+        batch, total = [], 0
+        for withdrawal in band:
+            if batch and (len(batch) >= limits.max_transfers or total + withdrawal.amount > limits.max_amount_kobo):
+                batches.append(batch)
+                batch, total = [], 0
+            batch.append(withdrawal)
+            total += withdrawal.amount
+        if batch:
+            batches.append(batch)
+    return batches
+
+
+def transfer_reference(withdrawal) -> str:
+    """Reference for this attempt; a retry gets a new one, the provider would reject a reused reference."""
+    reference = f"BATCH_{str(withdrawal.id).replace('-', '')[:20]}"
+    return f"{reference}R{withdrawal.retry_count}" if withdrawal.retry_count else reference
+
+
+# ===== CLAIM =====
+
+@transaction.atomic
+def claim(run_date: date, limit: int | None = None) -> list[Withdrawal]:
+    """Move pending batch withdrawals to processing; concurrent schedulers skip each other's rows."""
+    queryset = _pending().select_for_update(skip_locked=True).order_by("requested_at")
+    withdrawals = list(queryset[:limit] if limit else queryset)
+    now = timezone.now()
+    for withdrawal in withdrawals:
+        withdrawal.status = "processing"
+        withdrawal.batch_date = run_date
+        withdrawal.processed_at = now
+        # recorded before submitting so a transfer whose response was lost can be looked up
+        withdrawal.paystack_transfer_ref = transfer_reference(withdrawal)
+    Withdrawal.objects.bulk_update(
+        withdrawals, ["status", "batch_date", "processed_at", "paystack_transfer_ref"], batch_size=500
+    )
+    return withdrawals
+
+
+# ===== SUBMIT =====
+
+def _payload(batch: list[Withdrawal], run_date: date) -> dict[str, Any]:
+    return {
+        "currency": "NGN",
+        "source": "balance",
+        "transfers": [
+            {
+                "amount": int(w.amount),
+                "recipient": w.paystack_recipient_code,
+                "reference": w.paystack_transfer_ref,
+                "reason": f"Batch payout {run_date.isoformat()}",
+            }
+            for w in batch
+        ],
+    }
+
+
+def _confirm(withdrawals: list[Withdrawal], client) -> tuple[dict[Any, dict], dict[Any, str]]:
+    """Provider state (and lookup errors) by withdrawal id for transfers whose outcome is unknown."""
+    if not withdrawals or client is None:
+        return {}, {}
+    return fetch_transfer_states([(w.id, w.paystack_transfer_ref) for w in withdrawals], client)
+
+
+def reject_withdrawals(reasons: dict[Any, str]) -> dict[str, int]:
+    """
+    Settle withdrawals the provider refused or never received: a batch one goes
+    back to pending_batch under a new reference until `max_retries`, anything
+    else fails and releases its hold. Rows a webhook settled meanwhile (no
+    longer `processing`) are left alone.
+    :param reasons: {withdrawal id: failure reason}
+    :return: {"retried": n, "failed": n}
+    """
+    from payments.payouts.services import mark_withdrawal_failed
+
+    stats = {"retried": 0, "failed": 0}
+    if not reasons:
+        return stats
+    with transaction.atomic():
+        withdrawals = (
+            Withdrawal.objects.select_for_update(of=("self",))
+            .select_related("user")
+            .filter(id__in=list(reasons), status="processing")
+            .order_by("id")
+        )
+        retry = []
+        for withdrawal in withdrawals:
+            reason = reasons[withdrawal.id]
+            if withdrawal.strategy != Withdrawal.STRATEGY_BATCH or withdrawal.retry_count + 1 >= withdrawal.max_retries:
+                mark_withdrawal_failed(withdrawal, reason)
+                stats["failed"] += 1
+                continue
+            withdrawal.status = "pending_batch"
+            withdrawal.retry_count += 1
+            # the provider has seen this reference and would refuse it again
+            withdrawal.paystack_transfer_ref = None
+            withdrawal.failure_reason = reason
+            retry.append(withdrawal)
+        Withdrawal.objects.bulk_update(
+            retry, ["status", "retry_count", "paystack_transfer_ref", "failure_reason"], batch_size=500
+        )
+        stats["retried"] = len(retry)
+    return stats
+
+
+def settle_batch(batch: list[Withdrawal], outcome, client=None) -> dict[str, int]:
+    """
+    Apply one bulk response transfer by transfer. `outcome` is the response or
+    the exception the request raised. Transfers the outcome says nothing about
+    are confirmed with `client` by reference; those it cannot confirm stay in
+    processing, reference kept, for the stale reconciler.
+    """
+    stats = {"queued": 0, "retried": 0, "failed": 0, "unconfirmed": 0}
+    if isinstance(outcome, Exception):
+        rows = {}
+    else:
+        data = outcome.get("data") or []
+        rows = {row.get("reference"): row for row in data if isinstance(row, dict) and row.get("reference")}
+        # responses without references line up with the request
+        for withdrawal, row in zip(batch, data):
+            if isinstance(row, dict) and not row.get("reference"):
+                rows.setdefault(withdrawal.paystack_transfer_ref, row)
+
+    unknown = [w for w in batch if w.paystack_transfer_ref not in rows]
+    confirmed, errors = _confirm(unknown, client)
+
+    accepted, rejected = [], {}
+    now = timezone.now()
+    for withdrawal in batch:
+        if withdrawal.paystack_transfer_ref in rows:
+            row = rows[withdrawal.paystack_transfer_ref]
+            status = str(row.get("status") or "").lower()
+            if row.get("transfer_code") and status not in REJECTED_STATUSES:
+                withdrawal.paystack_transfer_code = row["transfer_code"]
+                accepted.append(withdrawal)
+            else:
+                rejected[withdrawal.id] = row.get("message") or row.get("failure_reason") or "Rejected by provider"
+        elif withdrawal.id in confirmed:
+            transfer = confirmed[withdrawal.id]
+            if normalize_status(transfer) in FAILED_STATUSES | REJECTED_STATUSES:
+                rejected[withdrawal.id] = transfer.get("failure_reason") or "Paystack marked transfer as failed"
+            else:
+                withdrawal.paystack_transfer_code = transfer.get("transfer_code") or ""
+                accepted.append(withdrawal)
+        elif not_found_past_grace(withdrawal, errors.get(withdrawal.id, ""), now):
+            rejected[withdrawal.id] = "Paystack has no record of this transfer"
+        else:
+            # may have been accepted: no retry, no release until the provider says otherwise
+            stats["unconfirmed"] += 1
+            logger.warning(
+                "payments.withdrawal.batch.unconfirmed",
+                extra={"withdrawal_id": str(withdrawal.id), "reason": errors.get(withdrawal.id, "")},
+            )
+
+    with transaction.atomic():
+        Withdrawal.objects.bulk_update(accepted, ["paystack_transfer_code"], batch_size=500)
+        stats["queued"] = len(accepted)
+        stats.update(reject_withdrawals(rejected))
+
+    increment("payments.payout.transfers_queued_total", value=stats["queued"])
+    increment("payments.payout.transfers_retried_total", value=stats["retried"])
+    increment("payments.payout.transfers_unconfirmed_total", value=stats["unconfirmed"])
+    return stats
+
+
+def dispatch(client=None, run_date: date | None = None, limits: BatchLimits | None = None, concurrency: int | None = None) -> dict:
+    from payments.payouts import services
+
+    client = client or services.paystack_client
+    run_date = run_date or date.today()
+    limits = limits or BatchLimits.from_settings()
+    concurrency = concurrency or int(getattr(settings, "PAYOUT_SUBMIT_CONCURRENCY", 4))
+    result = {"batch_date": str(run_date), "count": 0, "queued": 0, "batches": 0, "retried": 0, "failed": 0, "unconfirmed": 0}
+
+    claimed = claim(run_date)
+    if not claimed:
+        return result
+
+    batches = plan_batches(claimed, limits)
+    result.update(count=len(claimed), batches=len(batches))
+    logger.info(
+        "payments.withdrawal.batch.start",
+        extra={
+            "request_id": "",
+            "idempotency_key": "",
+            "withdrawal_id": "",
+            "provider_ref": "",
+            "count": len(claimed),
+            "batches": len(batches),
+            "batch_date": run_date.isoformat(),
+        },
+    )
+
+    started = time.monotonic()
+    submit = _throttled(client.bulk_transfer)
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="paystack-payout") as pool:
+        outcomes = pool.map(lambda batch: _capture(submit, _payload(batch, run_date)), batches)
+        for batch, outcome in zip(batches, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning(f"[payouts] bulk transfer of {len(batch)} failed: {outcome}")
+            for key, value in settle_batch(batch, outcome, client).items():
+                result[key] += value
+
+    observe_ms("payments.payout.dispatch_ms", (time.monotonic() - started) * 1000)
+    increment("payments.payout.batches_total", value=len(batches))
+    return result
+
+
+def dispatch_if_due(client=None, policy: WindowPolicy | None = None) -> dict:
+    reason = window_closed(window_state(), policy or WindowPolicy.from_settings())
+    if reason is None:
+        return {"dispatched": False}
+    increment("payments.payout.window_closed_total", tags={"reason": reason})
+    return {"dispatched": True, "reason": reason, **dispatch(client)}
@@ -7,7 +7,7 @@ Core withdrawal service layer. The public API surface is unchanged:
   - get_balance_summary(user_id, role)
   - create_withdrawal_request(user_id, amount_kobo, idempotency_key, ...)
   - execute_realtime(withdrawal)
-  - execute_batch(batch_date)
+  - execute_batch(batch_date)         (payouts/scheduler.py does the work)
   - mark_withdrawal_paid(withdrawal)
   - mark_withdrawal_failed(withdrawal, reason)
 
@@ -233,55 +233,15 @@ def execute_realtime(withdrawal: Withdrawal):
     return withdrawal
 
 
-@transaction.atomic
 def execute_batch(batch_date: date | None = None) -> dict:
-    run_date = batch_date or date.today()
-    pending = list(
-        Withdrawal.objects.select_for_update()
-        .filter(status="pending_batch", strategy=STRATEGY_BATCH)
-        .order_by("requested_at")
-    )
-    if not pending:
-        return {"batch_date": str(run_date), "count": 0, "queued": 0}
-
-    logger.info(
-        "payments.withdrawal.batch.start",
-        extra={
-            "request_id": "",
-            "idempotency_key": "",
-            "withdrawal_id": "",
-            "provider_ref": "",
-            "count": len(pending),
-            "batch_date": run_date.isoformat(),
-        },
-    )
-
-    for withdrawal in pending:
-        withdrawal.status = "processing"
-        withdrawal.batch_date = run_date
-        withdrawal.processed_at = timezone.now()
-        withdrawal.save(update_fields=["status", "batch_date", "processed_at"])
-
-    transfers = [
-        {
-            "amount": int(w.amount),
-            "recipient": w.paystack_recipient_code,
-            "reference": f"BATCH_{str(w.id).replace('-', '')[:20]}",
-            "reason": f"Batch payout {run_date.isoformat()}",
-        }
-        for w in pending
-    ]
-
-    result = paystack_client.bulk_transfer({"currency": "NGN", "transfers": transfers})
-    payloads = result.get("data", [])
-
-    for idx, withdrawal in enumerate(pending):
-        row = payloads[idx] if idx < len(payloads) else {}
-        withdrawal.paystack_transfer_ref = row.get("reference") or transfers[idx]["reference"]
-        withdrawal.paystack_transfer_code = row.get("transfer_code", "")
-        withdrawal.save(update_fields=["paystack_transfer_ref", "paystack_transfer_code"])
-
-    return {"batch_date": str(run_date), "count": len(pending), "queued": len(pending)}
+    """
+    Submit every pending batch withdrawal now, whatever the window says.
+    Planning, concurrent submission and per-transfer retries live in
+    payouts/scheduler.py; the scheduled path is `dispatch_if_due()`.
+    """
+    from payments.payouts.scheduler import dispatch
+
+    return dispatch(paystack_client, run_date=batch_date)
 
 
 @transaction.atomic
@@ -7,7 +7,7 @@ from django.utils import timezone
 
 from payments.integrations.paystack.client import PaystackClient
 from payments.models import Withdrawal, UserAccount
-from payments.payouts.services import execute_batch, execute_realtime, mark_withdrawal_failed, mark_withdrawal_paid
+from payments.payouts.services import execute_batch, execute_realtime
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +35,13 @@ def execute_batch_payouts():
     return execute_batch()
 
 
+@shared_task(name="payments.payouts.schedule_payouts")
+def schedule_payouts():
+    from payments.payouts.scheduler import dispatch_if_due
+
+    return dispatch_if_due()
+
+
 # Backward compatibility alias used by existing callers.
 @shared_task(name="payments.payouts.process_withdrawal")
 def process_withdrawal(withdrawal_id: str):
@@ -63,56 +70,22 @@ def retry_pending_withdrawals():
 
 @shared_task(name="payments.payouts.reconcile_stale_processing_withdrawals")
 def reconcile_stale_processing_withdrawals():
+    from payments.reconciliation.engine import reconcile_stale_withdrawals
+
     hours = int(getattr(settings, "PAYMENTS_STALE_WITHDRAWAL_HOURS", 6))
-    cutoff = timezone.now() - timedelta(hours=hours)
-    paystack_client = PaystackClient()
-
-    reconciled = 0
-    skipped = 0
-    errors = 0
-
-    qs = Withdrawal.objects.filter(status="processing", processed_at__lt=cutoff)
-    for withdrawal in qs.select_related("user"):
-        transfer_code = withdrawal.paystack_transfer_code or withdrawal.paystack_transfer_ref
-        if not transfer_code:
-            skipped += 1
-            continue
-        try:
-            ps = paystack_client.fetch_transfer(transfer_code).get("data", {})
-        except Exception as exc:
-            errors += 1
-            logger.warning(
-                "payments.withdrawal.reconcile.fetch_failed",
-                extra={
-                    "withdrawal_id": str(withdrawal.id),
-                    "user_id": str(withdrawal.user_id),
-                    "provider_ref": transfer_code,
-                    "reason": str(exc),
-                },
-            )
-            continue
-
-        status = (ps.get("status") or "").lower().strip()
-        if status == "success":
-            mark_withdrawal_paid(withdrawal)
-            reconciled += 1
-        elif status in {"failed", "reversed"}:
-            reason = ps.get("failure_reason") or ps.get("gateway_response") or "Paystack marked transfer as failed"
-            mark_withdrawal_failed(withdrawal, reason)
-            reconciled += 1
-        else:
-            skipped += 1
+    stats = reconcile_stale_withdrawals(PaystackClient(), older_than=timedelta(hours=hours))
 
     logger.info(
         "payments.withdrawal.reconcile.stale_complete",
         extra={
             "hours": hours,
-            "reconciled": reconciled,
-            "skipped": skipped,
-            "errors": errors,
+            "reconciled": stats["reconciled"],
+            "rejected": stats["rejected"],
+            "skipped": stats["skipped"],
+            "errors": stats["errors"],
         },
     )
-    return f"reconciled={reconciled} skipped={skipped} errors={errors}"
+    return f"reconciled={stats['reconciled']} skipped={stats['skipped']} errors={stats['errors']}"
 
 @shared_task(name="payments.payouts.ensure_paystack_recipient_for_driver")
 def ensure_paystack_recipient_for_driver(driver_id: int):
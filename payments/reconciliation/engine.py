@@ -0,0 +1,311 @@
+"""
+Provider lookups and state application for withdrawal reconciliation.
+
+    reconcile_stale_withdrawals(PaystackClient(), older_than=timedelta(hours=6))
+        = fetch_transfer_states(refs, client, window=(since, until))
+        + apply_transfer_states(states)
+
+fetch_transfer_states() looks transfers up by code or reference:
+
+1. With at least PAYSTACK_RECONCILE_LIST_THRESHOLD refs and a date window,
+   it pages through list-transfers (100 per call), stopping once every ref is
+   found. Pages after the first are fetched concurrently.
+2. Any ref the listing did not cover is fetched on its own.
+
+All calls run on a pool of PAYSTACK_RECONCILE_CONCURRENCY threads. Each call
+first takes a token from the shared "paystack_api" rate limit
+(RATE_LIMITS, redis-backed), so concurrent reconcilers across workers
+stay under one provider budget.
+
+apply_transfer_states() moves every withdrawal still in `processing` that
+Paystack reports as `success` to `complete` with one UPDATE per chunk.
+Failed and reversed transfers go through mark_withdrawal_failed() one at a
+time, because each one posts a ledger credit that chains on the user's
+balance.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from typing import Any, Iterable
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from common.ratelimit import get_limiter
+from payments.integrations.paystack.errors import PaystackAPIError
+from payments.models import Withdrawal
+from payments.observability.metrics import increment, observe_ms
+
+logger = logging.getLogger(__name__)
+
+LIST_PAGE_SIZE = 100
+APPLY_CHUNK_SIZE = 500
+
+SUCCESS_STATUSES = {"success"}
+FAILED_STATUSES = {"failed", "reversed"}
+
+# fetch error for a transfer Paystack answered it has no record of
+TRANSFER_NOT_FOUND = "transfer not found"
+
+
+def normalize_status(transfer: dict[str, Any]) -> str:
+    return (transfer.get("status") or "").lower().strip()
+
+
+def _throttled(call):
+    """Wait for a token from the shared provider rate limit, then call."""
+    limiter = get_limiter("paystack_api")
+
+    def wrapped(*args, **kwargs):
+        while True:
+            result = limiter.hit("paystack")
+            if result.allowed:
+                break
+            time.sleep(min(result.retry_after, 1.0))
+        return call(*args, **kwargs)
+
+    return wrapped
+
+
+# ===== FETCH =====
+
+def fetch_transfer_states(
+    refs: Iterable[tuple[Any, str]],
+    client,
+    window: tuple[date, date] | None = None,
+    concurrency: int | None = None,
+) -> tuple[dict[Any, dict], dict[Any, str]]:
+    """
+    :param refs: (key, transfer code or reference) pairs; key is usually the withdrawal id
+    :param window: creation-date range to list, or None to only fetch one by one
+    :return: ({key: paystack transfer}, {key: error})
+    """
+    keys_by_ref: dict[str, list] = defaultdict(list)
+    for key, ref in refs:
+        keys_by_ref[ref].append(key)
+
+    concurrency = concurrency or getattr(settings, "PAYSTACK_RECONCILE_CONCURRENCY", 8)
+    threshold = getattr(settings, "PAYSTACK_RECONCILE_LIST_THRESHOLD", 50)
+    found: dict[str, dict] = {}
+    errors: dict[Any, str] = {}
+    started = time.monotonic()
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="paystack-reconcile") as pool:
+        if window and len(keys_by_ref) >= threshold and hasattr(client, "list_transfers"):
+            try:
+                found = _list_matching(client, pool, set(keys_by_ref), window, concurrency)
+            except Exception as exc:
+                logger.warning(f"[reconcile] list-transfers failed, fetching one by one: {exc}")
+
+        missing = [ref for ref in keys_by_ref if ref not in found]
+        fetch = _throttled(client.fetch_transfer)
+        for ref, outcome in zip(missing, pool.map(lambda ref: _capture(fetch, ref), missing)):
+            if isinstance(outcome, Exception):
+                for key in keys_by_ref[ref]:
+                    errors[key] = _fetch_error(outcome)
+            else:
+                found[ref] = outcome.get("data", {}) or {}
+
+    states = {key: found[ref] for ref, keys in keys_by_ref.items() if ref in found for key in keys}
+    observe_ms("payments.reconcile.fetch_ms", (time.monotonic() - started) * 1000)
+    increment("payments.reconcile.fetched_total", value=len(states))
+    increment("payments.reconcile.fetch_errors_total", value=len(errors))
+    return states, errors
+
+
+def _fetch_error(exc: Exception) -> str:
+    """A definitive "not found" from the provider, as opposed to a lookup that failed."""
+    if isinstance(exc, PaystackAPIError) and "not found" in str(exc).lower():
+        return TRANSFER_NOT_FOUND
+    return str(exc)
+
+
+def not_found_past_grace(withdrawal, reason: str, now=None) -> bool:
+    """
+    True when the provider still has no record of the transfer PAYOUT_NOT_FOUND_GRACE
+    after it was submitted. It never happened, so the withdrawal can be rejected.
+    """
+    if reason != TRANSFER_NOT_FOUND:
+        return False
+    submitted = withdrawal.processed_at or withdrawal.requested_at
+    grace = timedelta(seconds=int(getattr(settings, "PAYOUT_NOT_FOUND_GRACE", 60 * 60)))
+    return submitted is not None and submitted <= (now or timezone.now()) - grace
+
+
+def _capture(call, *args):
+    try:
+        return call(*args)
+    except Exception as exc:
+        return exc
+
+
+def _list_matching(client, pool, wanted: set[str], window, concurrency) -> dict[str, dict]:
+    list_page = _throttled(client.list_transfers)
+    since, until = window
+    params = {"perPage": LIST_PAGE_SIZE, "from": since.isoformat(), "to": until.isoformat()}
+
+    found: dict[str, dict] = {}
+
+    def collect(response):
+        for transfer in response.get("data") or []:
+            for ref in (transfer.get("transfer_code"), transfer.get("reference")):
+                if ref in wanted:
+                    found[ref] = transfer
+
+    first = list_page({**params, "page": 1})
+    collect(first)
+    page_count = int((first.get("meta") or {}).get("pageCount") or 1)
+
+    page = 2
+    while page <= page_count and len(found) < len(wanted):
+        wave = range(page, min(page + concurrency, page_count + 1))
+        for response in pool.map(lambda p: list_page({**params, "page": p}), wave):
+            collect(response)
+        page = wave.stop
+    return found
+
+
+def transfer_window(withdrawals) -> tuple[date, date] | None:
+    """Creation-date range (padded a day each side) to list for these withdrawals."""
+    days = [
+        timezone.localdate(w.processed_at or w.requested_at)
+        for w in withdrawals
+        if (w.processed_at or w.requested_at)
+    ]
+    if not days:
+        return None
+    return min(days) - timedelta(days=1), max(days) + timedelta(days=1)
+
+
+# ===== STALE SWEEP =====
+
+def reconcile_stale_withdrawals(client, older_than: timedelta) -> dict[str, int]:
+    """
+    Settle `processing` withdrawals older than `older_than` from provider state.
+    Transfers the provider has no record of past PAYOUT_NOT_FOUND_GRACE are
+    rejected (re-planned or failed, see payouts.scheduler.reject_withdrawals);
+    any other lookup error leaves the row for the next run and is counted in
+    payments.withdrawal.unconfirmed_total.
+    :return: {"reconciled": n, "rejected": n, "skipped": n, "errors": n}
+    """
+    from payments.payouts.scheduler import reject_withdrawals
+
+    cutoff = timezone.now() - older_than
+    candidates = list(
+        Withdrawal.objects.filter(status="processing", processed_at__lt=cutoff).only(
+            "id", "paystack_transfer_code", "paystack_transfer_ref", "processed_at", "requested_at"
+        )
+    )
+    refs = [
+        (withdrawal.id, withdrawal.paystack_transfer_code or withdrawal.paystack_transfer_ref)
+        for withdrawal in candidates
+        if withdrawal.paystack_transfer_code or withdrawal.paystack_transfer_ref
+    ]
+    states, errors = fetch_transfer_states(refs, client, window=transfer_window(candidates))
+
+    now = timezone.now()
+    by_id = {withdrawal.id: withdrawal for withdrawal in candidates}
+    not_found = {
+        withdrawal_id: "Paystack has no record of this transfer"
+        for withdrawal_id, reason in errors.items()
+        if not_found_past_grace(by_id[withdrawal_id], reason, now)
+    }
+    for withdrawal_id, reason in errors.items():
+        if withdrawal_id in not_found:
+            continue
+        logger.error(
+            "payments.withdrawal.reconcile.unconfirmed",
+            extra={
+                "withdrawal_id": str(withdrawal_id),
+                "reason": reason,
+                "processing_since": by_id[withdrawal_id].processed_at.isoformat(),
+            },
+        )
+    increment("payments.withdrawal.unconfirmed_total", value=len(errors) - len(not_found))
+
+    applied = apply_transfer_states(states)
+    rejected = reject_withdrawals(not_found)
+    reconciled = applied["completed"] + applied["failed"]
+    return {
+        "reconciled": reconciled,
+        "rejected": rejected["retried"] + rejected["failed"],
+        "skipped": len(candidates) - reconciled - len(errors),
+        "errors": len(errors) - len(not_found),
+    }
+
+
+# ===== APPLY =====
+
+def apply_transfer_states(states: dict[Any, dict]) -> dict[str, int]:
+    """
+    Apply provider outcomes to withdrawals that are still `processing`.
+    :param states: {withdrawal id: paystack transfer}
+    :return: {"completed": n, "failed": n, "unchanged": n}
+    """
+    from payments.payouts.services import mark_withdrawal_failed
+
+    succeeded, failed = [], {}
+    for withdrawal_id, transfer in states.items():
+        status = normalize_status(transfer)
+        if status in SUCCESS_STATUSES:
+            succeeded.append(withdrawal_id)
+        elif status in FAILED_STATUSES:
+            failed[withdrawal_id] = (
+                transfer.get("failure_reason") or transfer.get("gateway_response") or "Paystack marked transfer as failed"
+            )
+
+    completed = 0
+    for start in range(0, len(succeeded), APPLY_CHUNK_SIZE):
+        completed += _complete(succeeded[start:start + APPLY_CHUNK_SIZE])
+
+    failed_count = 0
+    for withdrawal_id, reason in failed.items():
+        with transaction.atomic():
+            withdrawal = (
+                Withdrawal.objects.select_for_update(of=("self",))
+                .select_related("user")
+                .filter(id=withdrawal_id, status="processing")
+                .first()
+            )
+            if withdrawal is None:  # settled by a webhook meanwhile
+                continue
+            mark_withdrawal_failed(withdrawal, reason)
+            failed_count += 1
+
+    return {"completed": completed, "failed": failed_count, "unchanged": len(states) - completed - failed_count}
+
+
+def _complete(ids) -> int:
+    from admin_api.metrics import adjust_counters_on_commit
+
+    with transaction.atomic():
+        rows = list(
+            Withdrawal.objects.select_for_update()
+            .filter(id__in=ids, status="processing")
+            .values_list("id", "amount", "strategy")
+        )
+        if not rows:
+            return 0
+        Withdrawal.objects.filter(id__in=[row[0] for row in rows]).update(
+            status="complete", completed_at=timezone.now()
+        )
+        # the UPDATE skips model signals, so the dashboard counters are told directly
+        adjust_counters_on_commit(
+            {
+                "withdrawals.pending_or_processing_count": -len(rows),
+                "withdrawals.pending_or_processing_amount_kobo": -sum(row[1] for row in rows),
+            }
+        )
+
+    for strategy, count in Counter(row[2] for row in rows).items():
+        increment("payments.payout.success_total", value=count, tags={"strategy": strategy})
+    logger.info(
+        "payments.withdrawal.reconcile.bulk_complete",
+        extra={"count": len(rows), "withdrawal_ids": [str(row[0]) for row in rows[:20]]},
+    )
+    return len(rows)
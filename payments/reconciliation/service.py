@@ -6,6 +6,7 @@ from django.db.models import Q
 
 from payments.integrations.paystack.client import PaystackClient
 from payments.models import ReconciliationLog, Withdrawal
+from payments.reconciliation.engine import fetch_transfer_states, transfer_window
 
 
 SEVERITY_BY_ISSUE = {
@@ -32,7 +33,7 @@ def _local_vs_provider_status(local_status: str, provider_status: str) -> bool:
 
 
 def _collect_candidates(run_date: date):
-    return Withdrawal.objects.select_related("user").filter(
+    return Withdrawal.objects.filter(
         Q(batch_date=run_date)
         | Q(strategy=Withdrawal.STRATEGY_REALTIME, processed_at__date=run_date)
     ).exclude(paystack_transfer_code="")
@@ -43,21 +44,27 @@ def run_reconciliation(*, run_date: date, alert_callback=None) -> dict:
     mismatches: list[dict] = []
     checked = 0
 
-    for withdrawal in _collect_candidates(run_date):
-        try:
-            ps = paystack_client.fetch_transfer(withdrawal.paystack_transfer_code).get("data", {})
-            checked += 1
-        except Exception as exc:
+    candidates = list(_collect_candidates(run_date))
+    states, errors = fetch_transfer_states(
+        [(withdrawal.id, withdrawal.paystack_transfer_code) for withdrawal in candidates],
+        paystack_client,
+        window=transfer_window(candidates),
+    )
+
+    for withdrawal in candidates:
+        if withdrawal.id in errors:
             mismatches.append(
                 {
                     "severity": _severity("provider_fetch_error"),
                     "issue": "provider_fetch_error",
                     "withdrawal_id": str(withdrawal.id),
                     "user_id": str(withdrawal.user_id),
-                    "error": str(exc),
+                    "error": errors[withdrawal.id],
                 }
             )
             continue
+        ps = states[withdrawal.id]
+        checked += 1
 
         if ps.get("amount") != withdrawal.amount:
             mismatches.append(
@@ -33,7 +33,7 @@ from django.db import transaction
 from django.utils import timezone
 
 from payments.models import Sale
-from payments.services.split_calculator import reverse_ledger_entries
+from payments.services.split_calculator import post_sale_credits, reverse_ledger_entries
 from accounts.services.penalties import record_sales_penalty
 
 logger = logging.getLogger(__name__)
@@ -58,6 +58,7 @@ def process_refund(sale_id, reason, responsible_party: str = "business", respons
         raise ValueError(f"Cannot refund sale with status: {sale.status}")
 
     if sale.status == "completed":
+        post_sale_credits(sale.id)  # the credits task may not have run yet
         reverse_ledger_entries(sale, reason, responsible_party=responsible_party)
 
     # Award compensation points to customer
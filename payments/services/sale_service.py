@@ -6,7 +6,7 @@ import uuid
 from django.db import transaction
 from django.utils import timezone
 from payments.models import Sale, User
-from payments.services.split_calculator import calculate_split, credit_all_parties, load_split_config
+from payments.services.split_calculator import calculate_split, load_split_config, sale_journal
 from payments.integrations.paystack.client import PaystackClient
 from referrals.services import referred_by
 from payments.services.sale_extention import *
@@ -130,21 +130,25 @@ def assign_driver(order, driver_id):
     Sale.objects.filter(id=order.sale_id).update(driver_id=driver_id)
 
 @transaction.atomic
-def complete_service(sale_id, picked_up: bool= False):
+def complete_service(sale_id):
     """
     STEP 2: Service is done. Credit all parties from the frozen split snapshot.
+    The ledger journal is posted by payments.post_sale_credits once this commits.
     """
+    from payments import tasks
+
     sale = Sale.objects.select_for_update().get(id=sale_id)
 
     if sale.status != "in_escrow":
         raise ValueError(f"Cannot complete sale with status: {sale.status}")
 
     split = sale.split_snapshot
-    credit_all_parties(sale, split, picked_up)
+    sale_journal(sale, split).validate()  # fail here, not in the task
 
     sale.status = "completed"
     sale.service_completed_at = timezone.now()
     sale.save()
+    transaction.on_commit(lambda: tasks.post_sale_credits.delay(str(sale.id)))
 
     return {
         "success": True,
@@ -108,34 +108,67 @@ def get_ledger_balance(user) -> int:
     result = LedgerEntry.objects.filter(user=user).aggregate(total=Sum("amount"))
     return result["total"] or 0
 
-# this is where we can refund the user
-@transaction.atomic
-def credit_all_parties(sale, split: dict, picked_up: bool= False):
-    """Credit all parties after service completion. All or nothing."""
-    parties = [
-        # {"user": sale.driver, "role": "driver", "amount": split["amounts"]["driver"]},
-        {"user": sale.business_owner, "role": "business_owner", "amount": split["amounts"]["business_owner"]},
+class UnpaidDeliveryFee(ValueError):
+    """A delivered order's sale has a delivery fee but no driver to pay it to."""
+
+
+def sale_journal(sale, split: dict):
+    """
+    Ledger legs for a completed sale; the platform keeps whatever has no payee.
+    A pickup's delivery fee stays with the platform (so does a driver cut on a
+    sale with no order). A delivered order with no driver on the sale raises
+    UnpaidDeliveryFee: that fee belongs to a driver, or back to the customer,
+    and is never posted to the platform silently.
+    """
+    from payments.ledger.posting import Journal, Leg
+
+    amounts = split["amounts"]
+    notes = f"Credit for sale {sale.reference}"
+    legs = [
+        Leg(sale.business_owner, "business_owner", "credit", amounts["business_owner"], notes),
+        Leg(None, "platform", "credit", amounts["platform"]),
     ]
-    if sale.driver != None: 
-        # the order was delivered with out a driver now we just check if it was a pickup or not.
-        parties.append({"user": sale.driver, "role": "driver", "amount": split["amounts"]["driver"]})
-    else:
-        if not picked_up:
-            # note it as a refund is it is not a split
-            # parties.append({"user": sale.payer, "role": "customer", "amount": split["amounts"]["driver"]})
-            ...
-    if sale.referral_user and split["amounts"]["referral"] > 0:
-        parties.append({"user": sale.referral_user, "role": "referral", "amount": split["amounts"]["referral"]})
-
-    for party in parties:
-        _create_ledger_entry(
-            user=party["user"],
-            sale=sale,
-            role=party["role"],
-            entry_type="credit",
-            amount=party["amount"],
-            notes=f"Credit for sale {sale.reference}",
+    if sale.driver is not None:
+        legs.append(Leg(sale.driver, "driver", "credit", amounts["driver"], notes))
+    elif amounts["driver"] and hasattr(sale, "order") and not sale.order.picked_up_by_user:
+        raise UnpaidDeliveryFee(
+            f"Sale {sale.reference} was delivered without a driver; "
+            f"delivery fee {amounts['driver']} has no payee"
         )
+    else:
+        legs.append(Leg(None, "driver", "credit", amounts["driver"]))
+    if sale.referral_user and amounts["referral"] > 0:
+        legs.append(Leg(sale.referral_user, "referral", "credit", amounts["referral"], notes))
+    else:
+        legs.append(Leg(None, "referral", "credit", amounts["referral"]))
+    return Journal(sale=sale, total=split.get("total", sum(amounts.values())), legs=legs)
+
+
+@transaction.atomic
+def credit_all_parties(sale, split: dict):
+    """Credit all parties after service completion. All or nothing."""
+    from payments.ledger.posting import post_journal
+
+    return post_journal(sale_journal(sale, split))
+
+
+def post_sale_credits(sale_id) -> int:
+    """
+    Credit a completed sale's parties once. Runs from payments.post_sale_credits
+    after complete_service() commits, and inline before a refund reverses them.
+    :return: number of ledger entries written
+    """
+    from payments.models import LedgerEntry, Sale
+
+    with transaction.atomic():
+        sale = Sale.objects.select_for_update().select_related(
+            "business_owner", "driver", "referral_user"
+        ).get(id=sale_id)
+        if sale.status != "completed":
+            return 0
+        if LedgerEntry.objects.filter(sale=sale, type="credit").exists():
+            return 0
+        return len(credit_all_parties(sale, sale.split_snapshot))
 
 
 @transaction.atomic
@@ -0,0 +1,30 @@
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="payments.process_webhooks", acks_late=True)
+def process_webhooks():
+    """Kicked on commit by the Paystack webhook view; also the cron sweep."""
+    from payments.webhooks.queue import process_pending
+
+    stats, drained = process_pending()
+    if not drained:
+        process_webhooks.delay()  # time budget spent: hand over to a fresh task
+    return stats
+
+
+@shared_task(
+    name="payments.post_sale_credits",
+    acks_late=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    max_retries=5,
+)
+def post_sale_credits(sale_id):
+    """Post a completed sale's ledger journal; queued on commit by complete_service()."""
+    from payments.services.split_calculator import post_sale_credits as post
+
+    return post(sale_id)
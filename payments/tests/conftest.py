@@ -0,0 +1,22 @@
+import pytest
+
+from common.ratelimit import GCRALimiter
+from common.ratelimit import limiter as limiter_module
+from payments.integrations.paystack.fake import FakePaystack
+
+
+@pytest.fixture
+def fake_paystack():
+    """In-memory Paystack transfer API (see payments/integrations/paystack/fake.py)."""
+    return FakePaystack()
+
+
+@pytest.fixture
+def paystack_rate_limit(monkeypatch):
+    """In-process "paystack_api" limiter; generous unless the test asks otherwise."""
+    def register(limit=10_000, period=1):
+        limiter = GCRALimiter("paystack_api", limit, period, client=False)
+        monkeypatch.setitem(limiter_module._limiters, "paystack_api", limiter)
+        return limiter
+    register()
+    return register
@@ -0,0 +1,155 @@
+"""Two-tier idempotency keys (SET NX claim in the cache, response persisted to the DB).
+
+Goals covered here:
+- parallel duplicates of one request run it once; the rest get 409 while it runs, then the replay;
+- a different payload under the same key is a conflict, in flight or after;
+- claims expire on their TTL and are released when the request fails;
+- replays outlive the cached response through the DB row, and the DB path takes over if redis is down.
+"""
+
+import threading
+import time
+
+import pytest
+import redis
+from django.core.cache import cache
+from django.db import connection
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from payments import idempotency
+from payments import views as payment_views
+from payments.idempotency import (
+    IdempotencyConflictError,
+    IdempotencyInProgressError,
+    begin_idempotent_request,
+    save_idempotent_response,
+)
+from payments.models import PaymentIdempotencyKey, User
+
+
+@pytest.fixture
+def local_store(settings):
+    settings.REDIS_URL = ""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def _initialize(user, payload, key="idem-par"):
+    request = APIRequestFactory().post("/api/sales/initialize/", payload, format="json", HTTP_IDEMPOTENCY_KEY=key)
+    force_authenticate(request, user=user)
+    return payment_views.initialize_sale_view(request)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_parallel_duplicates_run_once(local_store, monkeypatch):
+    user = User.objects.create_user(email="idem-par@gmail.com", password="x")
+    payload = {"business_owner_id": str(user.id), "amount_kobo": 10000, "metadata": {}}
+    calls, release = [], threading.Event()
+
+    def slow_initialize_sale(**kwargs):
+        calls.append(kwargs)
+        release.wait(5)
+        return {"sale_id": "s-par"}
+
+    monkeypatch.setattr(payment_views, "initialize_sale", slow_initialize_sale)
+
+    statuses, lock = [], threading.Lock()
+
+    def fire():
+        try:
+            response = _initialize(user, payload)
+            with lock:
+                statuses.append(response.status_code)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=fire) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while len(statuses) < 7 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(statuses) == [201] + [409] * 7
+    assert len(calls) == 1
+
+    replay = _initialize(user, payload)
+    assert (replay.status_code, replay.data) == (200, {"sale_id": "s-par"})
+    assert PaymentIdempotencyKey.objects.get(key="idem-par").response_snapshot == {"sale_id": "s-par"}
+
+
+@pytest.mark.django_db
+def test_fingerprint_mismatch_is_a_conflict_in_flight_and_after(local_store):
+    request, has_response = begin_idempotent_request("scope", "actor", "k1", {"amount": 1})
+    assert has_response is False
+
+    with pytest.raises(IdempotencyInProgressError):
+        begin_idempotent_request("scope", "actor", "k1", {"amount": 1})
+    with pytest.raises(IdempotencyConflictError) as exc_info:
+        begin_idempotent_request("scope", "actor", "k1", {"amount": 2})
+    assert not isinstance(exc_info.value, IdempotencyInProgressError)
+
+    save_idempotent_response(request, {"ok": True})
+    with pytest.raises(IdempotencyConflictError):
+        begin_idempotent_request("scope", "actor", "k1", {"amount": 2})
+    replay, has_response = begin_idempotent_request("scope", "actor", "k1", {"amount": 1})
+    assert (has_response, replay.response_snapshot) == (True, {"ok": True})
+
+
+@pytest.mark.django_db
+def test_claim_expires_on_its_ttl(local_store, settings):
+    settings.IDEMPOTENCY_CLAIM_TTL = 1
+    begin_idempotent_request("scope", "actor", "k-ttl", {"amount": 1})
+
+    time.sleep(1.1)
+    _, has_response = begin_idempotent_request("scope", "actor", "k-ttl", {"amount": 1})
+
+    assert has_response is False
+
+
+@pytest.mark.django_db
+def test_failed_request_releases_its_claim(local_store, monkeypatch):
+    user = User.objects.create_user(email="idem-fail@gmail.com", password="x")
+    payload = {"business_owner_id": str(user.id), "amount_kobo": 10000, "metadata": {}}
+
+    def failing_initialize_sale(**kwargs):
+        raise RuntimeError("paystack down")
+
+    monkeypatch.setattr(payment_views, "initialize_sale", failing_initialize_sale)
+    assert _initialize(user, payload, key="idem-fail").status_code == 400
+
+    monkeypatch.setattr(payment_views, "initialize_sale", lambda **kwargs: {"sale_id": "s-retry"})
+    assert _initialize(user, payload, key="idem-fail").status_code == 201
+
+
+@pytest.mark.django_db
+def test_replay_outlives_the_cached_response(local_store):
+    request, _ = begin_idempotent_request("scope", "actor", "k-db", {"amount": 1})
+    save_idempotent_response(request, {"ok": True})
+    cache.clear()  # the response TTL ran out
+
+    replay, has_response = begin_idempotent_request("scope", "actor", "k-db", {"amount": 1})
+
+    assert (has_response, replay.response_snapshot) == (True, {"ok": True})
+    replay, has_response = begin_idempotent_request("scope", "actor", "k-db", {"amount": 1})
+    assert has_response is True  # cached again
+
+
+@pytest.mark.django_db
+def test_redis_outage_falls_back_to_db_lock(local_store, monkeypatch):
+    def unavailable(key, value):
+        raise redis.ConnectionError("down")
+
+    monkeypatch.setattr(idempotency.store, "claim", unavailable)
+
+    request, has_response = begin_idempotent_request("scope", "actor", "k-down", {"amount": 1})
+    assert has_response is False
+    assert PaymentIdempotencyKey.objects.filter(key="k-down", response_snapshot={}).exists()
+
+    save_idempotent_response(request, {"ok": True})
+    replay, has_response = begin_idempotent_request("scope", "actor", "k-down", {"amount": 1})
+    assert (has_response, replay.response_snapshot) == (True, {"ok": True})
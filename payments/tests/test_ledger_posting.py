@@ -0,0 +1,149 @@
+"""Ledger journals for completed sales.
+
+Goals covered here:
+- a journal must balance against the escrowed total before anything is written;
+- running balances are computed in memory and all legs land in one INSERT;
+- completing a sale queues the credits, which post exactly once after commit;
+- a refund that beats the credits task still reverses real credits;
+- a pickup's delivery fee stays with the platform, a delivered order without a driver is refused.
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from payments import tasks
+from payments.ledger.posting import Journal, Leg, UnbalancedJournal, post_journal
+from payments.models import LedgerEntry, Sale, User
+from payments.services.sale_service import complete_service, process_refund
+from payments.services.split_calculator import (
+    UnpaidDeliveryFee,
+    _create_ledger_entry,
+    order_v1_split,
+    post_sale_credits,
+)
+
+
+@pytest.fixture
+def sale(db, monkeypatch):
+    monkeypatch.setenv("LEDGER_HASH_SALT", "test-salt")
+    split = order_v1_split(0, False, {"items_total_kobo": 450000, "delivery_fee_kobo": 30000})
+    return Sale.objects.create(
+        reference="SALE_LEDGER_1",
+        payer=User.objects.create_user(email="ledger-payer@gmail.com", password="x"),
+        business_owner=User.objects.create_user(email="ledger-business@gmail.com", password="x"),
+        driver=User.objects.create_user(email="ledger-driver@gmail.com", password="x"),
+        total_amount=split["total"],
+        status="in_escrow",
+        split_snapshot=split,
+    )
+
+
+@pytest.mark.django_db
+def test_journal_must_balance_before_anything_is_written(sale):
+    with pytest.raises(UnbalancedJournal):
+        post_journal(Journal(sale=sale, total=1000, legs=[Leg(sale.driver, "driver", "credit", 900)]))
+    with pytest.raises(UnbalancedJournal):
+        post_journal(
+            Journal(
+                sale=sale,
+                total=0,
+                legs=[Leg(sale.driver, "driver", "credit", -500), Leg(None, "platform", "credit", 500)],
+            )
+        )
+    assert not LedgerEntry.objects.exists()
+
+
+@pytest.mark.django_db
+def test_running_balances_are_computed_in_memory_and_written_once(sale):
+    _create_ledger_entry(user=sale.driver, sale=None, role="driver", entry_type="credit", amount=1000, notes="seed")
+    journal = Journal(
+        sale=sale,
+        total=700,
+        legs=[
+            Leg(sale.driver, "driver", "credit", 500),
+            Leg(sale.business_owner, "business_owner", "credit", 400),
+            Leg(sale.driver, "driver", "debit", -200),
+            Leg(None, "platform", "credit", 0),
+        ],
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        entries = post_journal(journal)
+
+    assert [(e.user_id, e.amount, e.balance_after) for e in entries] == [
+        (sale.driver.id, 500, 1500),
+        (sale.business_owner.id, 400, 400),
+        (sale.driver.id, -200, 1300),
+    ]
+    inserts = [q["sql"] for q in queries.captured_queries if q["sql"].startswith('INSERT INTO "payments_ledgerentry"')]
+    assert len(inserts) == 1
+
+
+@pytest.mark.django_db
+def test_completed_sale_is_credited_once_after_commit(sale, django_capture_on_commit_callbacks, monkeypatch):
+    queued = []
+    monkeypatch.setattr(tasks.post_sale_credits, "delay", lambda *args: queued.append(args))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        complete_service(sale.id)
+
+    assert queued == [(str(sale.id),)]
+    assert not LedgerEntry.objects.filter(sale=sale).exists()
+
+    assert post_sale_credits(sale.id) == 2
+    assert post_sale_credits(sale.id) == 0  # redelivered task
+    credits = dict(LedgerEntry.objects.filter(sale=sale).values_list("role", "amount"))
+    assert credits == {"business_owner": 450000, "driver": 30000}
+
+
+@pytest.mark.django_db
+def test_refund_before_credits_task_reverses_real_credits(sale, monkeypatch):
+    monkeypatch.setattr(tasks.post_sale_credits, "delay", lambda *args: None)
+    monkeypatch.setattr("points.service.award_refund_compensation", lambda **kwargs: None)
+    complete_service(sale.id)
+
+    process_refund(sale.id, "cold food", responsible_party="driver")
+
+    entries = LedgerEntry.objects.filter(sale=sale, user=sale.driver).order_by("created_at")
+    assert [(e.type, e.amount) for e in entries] == [("credit", 30000), ("reversal", -30000)]
+    assert post_sale_credits(sale.id) == 0  # the late task sees a refunded sale
+
+
+def _order_for(sale, picked_up):
+    from accounts.models import Branch, Business, CustomerProfile
+    from menu.models import Order
+
+    branch = Branch.objects.create(
+        business=Business.objects.create(business_name="Ledger Biz"), name="Main", address="1 Test Street"
+    )
+    return Order.objects.create(
+        orderer=CustomerProfile.objects.create(user=sale.payer), branch=branch, sale=sale, delivery_secret_hash="s-ledger",
+        order_number=1, picked_up_by_user=picked_up,
+    )
+
+
+@pytest.mark.django_db
+def test_pickup_without_driver_leaves_the_fee_with_the_platform(sale, monkeypatch):
+    monkeypatch.setattr(tasks.post_sale_credits, "delay", lambda *args: None)
+    Sale.objects.filter(id=sale.id).update(driver=None)
+    _order_for(sale, picked_up=True)
+
+    complete_service(sale.id)
+
+    assert post_sale_credits(sale.id) == 1
+    assert list(LedgerEntry.objects.filter(sale=sale).values_list("role", "amount")) == [("business_owner", 450000)]
+
+
+@pytest.mark.django_db
+def test_delivered_order_without_driver_is_not_completed(sale, monkeypatch):
+    monkeypatch.setattr(tasks.post_sale_credits, "delay", lambda *args: None)
+    Sale.objects.filter(id=sale.id).update(driver=None)
+    _order_for(sale, picked_up=False)
+
+    with pytest.raises(UnpaidDeliveryFee):
+        complete_service(sale.id)
+
+    sale.refresh_from_db()
+    assert sale.status == "in_escrow"
+    assert not LedgerEntry.objects.filter(sale=sale).exists()
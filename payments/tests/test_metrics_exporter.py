@@ -0,0 +1,76 @@
+"""Payments metrics published through prometheus_client.
+
+Goals covered here:
+- existing increment/observe_ms call sites keep their names and tags as labels;
+- in multiprocess mode a scrape sums samples written by every worker process.
+"""
+
+import os
+
+import pytest
+from prometheus_client import REGISTRY, generate_latest, values
+
+from payments.observability import exporter, metrics
+
+
+@pytest.fixture
+def fresh_metrics():
+    metrics.reset_for_tests()
+    yield
+    metrics.reset_for_tests()
+
+
+@pytest.fixture
+def simulated_processes(tmp_path, monkeypatch, fresh_metrics):
+    """Multiprocess mode where the test picks the current "pid"; switching it behaves like a fork."""
+    current = {"pid": 101}
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    monkeypatch.setattr(values, "ValueClass", values.MultiProcessValue(lambda: current["pid"]))
+    return current
+
+
+def test_call_sites_keep_names_and_tags_as_labels(fresh_metrics):
+    metrics.increment("payments.webhook.processed_total", tags={"event": "transfer.success"})
+    metrics.increment("payments.webhook.processed_total", tags={"event": "transfer.success"})
+    metrics.increment("payments.webhook.processed_total")  # missing tag -> ""
+    metrics.increment("payments.webhook.processed_total", tags={"event": "charge.success", "extra": "dropped"})
+    metrics.observe_ms("payments.webhook.queue_lag_ms", 40, tags={"event": "transfer.success"})
+
+    text = generate_latest(REGISTRY).decode()
+    assert 'payments_webhook_processed_total{event="transfer.success"} 2.0' in text
+    assert 'payments_webhook_processed_total{event=""} 1.0' in text
+    assert 'payments_webhook_processed_total{event="charge.success"} 1.0' in text
+    assert 'payments_webhook_queue_lag_ms_bucket{event="transfer.success",le="50.0"} 1.0' in text
+
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"]["payments.webhook.processed_total|{'event': 'transfer.success'}"] == 2.0
+    assert snapshot["histograms"]["payments.webhook.queue_lag_ms|{'event': 'transfer.success'}"] == {"sum": 40.0, "count": 1}
+
+
+def test_scrape_aggregates_samples_across_processes(simulated_processes, tmp_path):
+    for pid, lag_ms in ((101, 30), (102, 40), (103, 45)):
+        simulated_processes["pid"] = pid
+        metrics.increment("payments.webhook.processed_total", tags={"event": "transfer.success"})
+        metrics.increment("payments.payout.success_total", value=2, tags={"strategy": "batch"})
+        metrics.observe_ms("payments.webhook.queue_lag_ms", lag_ms, tags={"event": "transfer.success"})
+
+    assert sorted(os.listdir(tmp_path)) == [f"{kind}_{pid}.db" for kind in ("counter", "histogram") for pid in (101, 102, 103)]
+
+    registry = exporter.collector_registry(str(tmp_path))
+    lag = {"event": "transfer.success"}
+    assert registry.get_sample_value("payments_webhook_processed_total", lag) == 3
+    assert registry.get_sample_value("payments_payout_success_total", {"strategy": "batch"}) == 6
+    assert registry.get_sample_value("payments_webhook_queue_lag_ms_count", lag) == 3
+    assert registry.get_sample_value("payments_webhook_queue_lag_ms_sum", lag) == 30 + 40 + 45
+    assert registry.get_sample_value("payments_webhook_queue_lag_ms_bucket", {**lag, "le": "25.0"}) == 0
+    assert registry.get_sample_value("payments_webhook_queue_lag_ms_bucket", {**lag, "le": "50.0"}) == 3
+
+
+def test_clearing_the_directory_drops_a_previous_run(simulated_processes, tmp_path):
+    metrics.increment("payments.webhook.processed_total")
+    assert os.listdir(tmp_path)
+
+    exporter.clear_multiprocess_dir()
+
+    assert os.listdir(tmp_path) == []
+    assert exporter.collector_registry(str(tmp_path)).get_sample_value("payments_webhook_processed_total") is None
@@ -0,0 +1,219 @@
+"""Batch payout scheduler against the fake Paystack transfer API.
+
+Goals covered here:
+- the window closes on count, amount or age and stays open otherwise;
+- batches respect the provider's transfer and amount limits, large transfers apart;
+- bulk requests are submitted concurrently under the configured concurrency;
+- rejected transfers are retried with a new reference, then failed with a ledger release;
+- a transfer with an unknown outcome is looked up first and never retried or released unconfirmed;
+- one the provider still cannot find after PAYOUT_NOT_FOUND_GRACE is rejected and re-planned.
+"""
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from django.utils import timezone
+
+from accounts.models import DriverProfile
+from payments.integrations.paystack.fake import FakePaystack
+from payments.models import LedgerEntry, User, Withdrawal
+from payments.payouts.scheduler import (
+    BatchLimits,
+    WindowPolicy,
+    claim,
+    dispatch,
+    dispatch_if_due,
+    plan_batches,
+    settle_batch,
+    window_closed,
+    window_state,
+)
+
+
+@pytest.fixture
+def driver_user(db, monkeypatch):
+    monkeypatch.setenv("LEDGER_HASH_SALT", "test-salt")
+    user = User.objects.create_user(email="payout-driver@gmail.com", password="x")
+    DriverProfile.objects.create(user=user, first_name="Payout", last_name="Driver")
+    return user
+
+
+def _pending(user, amounts, recipient="RCP_OK"):
+    return [
+        Withdrawal.objects.create(
+            user=user,
+            amount=amount,
+            status="pending_batch",
+            strategy=Withdrawal.STRATEGY_BATCH,
+            paystack_recipient_code=recipient,
+        )
+        for amount in amounts
+    ]
+
+
+def test_plan_batches_respects_limits_and_keeps_large_transfers_apart():
+    limits = BatchLimits(max_transfers=3, max_amount_kobo=1000, large_transfer_kobo=500)
+    withdrawals = [SimpleNamespace(amount=a) for a in (100, 600, 100, 100, 100, 2000, 700, 100)]
+
+    batches = [[w.amount for w in batch] for batch in plan_batches(withdrawals, limits)]
+
+    assert batches == [[100, 100, 100], [100, 100], [600], [2000], [700]]
+
+
+def test_window_closes_on_count_amount_or_age():
+    policy = WindowPolicy(max_count=10, max_amount_kobo=5000, max_age=timedelta(minutes=30))
+    now = timezone.now()
+    fresh = now - timedelta(minutes=1)
+
+    assert window_closed({"count": 0, "amount": None, "oldest": None}, policy, now) is None
+    assert window_closed({"count": 3, "amount": 1000, "oldest": fresh}, policy, now) is None
+    assert window_closed({"count": 10, "amount": 1000, "oldest": fresh}, policy, now) == "count"
+    assert window_closed({"count": 3, "amount": 5000, "oldest": fresh}, policy, now) == "amount"
+    assert window_closed({"count": 3, "amount": 1000, "oldest": now - timedelta(minutes=31)}, policy, now) == "age"
+
+
+@pytest.mark.django_db
+def test_dispatch_if_due_waits_for_the_window(settings, driver_user, fake_paystack, paystack_rate_limit):
+    settings.PAYOUT_WINDOW_MAX_COUNT = 3
+    _pending(driver_user, [1000, 1000])
+
+    assert dispatch_if_due(fake_paystack) == {"dispatched": False}
+    assert fake_paystack.calls["bulk"] == 0
+
+    _pending(driver_user, [1000])
+    result = dispatch_if_due(fake_paystack)
+
+    assert result["dispatched"] is True
+    assert result["reason"] == "count"
+    assert result["queued"] == 3
+    assert window_state()["count"] == 0
+
+
+@pytest.mark.django_db
+def test_dispatch_submits_batches_concurrently(settings, driver_user, paystack_rate_limit):
+    settings.PAYOUT_SUBMIT_CONCURRENCY = 4
+    fake = FakePaystack(latency=0.05, bulk_limit=10)
+    withdrawals = _pending(driver_user, [1000] * 95)
+
+    result = dispatch(fake, limits=BatchLimits(max_transfers=10, max_amount_kobo=10**9, large_transfer_kobo=10**9))
+
+    assert result["count"] == 95
+    assert result["batches"] == 10
+    assert result["queued"] == 95
+    assert fake.bulk_sizes.count(10) == 9
+    assert 1 < fake.max_in_flight <= 4
+    rows = Withdrawal.objects.filter(id__in=[w.id for w in withdrawals])
+    assert rows.filter(status="processing").exclude(paystack_transfer_code="").count() == 95
+    assert len(set(rows.values_list("paystack_transfer_ref", flat=True))) == 95
+
+
+@pytest.mark.django_db
+def test_rejected_transfers_are_retried_then_failed(driver_user, fake_paystack, paystack_rate_limit):
+    fake_paystack.rejected_recipients = {"RCP_BAD"}
+    good = _pending(driver_user, [1000, 2000])
+    (bad,) = _pending(driver_user, [3000], recipient="RCP_BAD")
+
+    first = dispatch(fake_paystack)
+    bad.refresh_from_db()
+
+    assert (first["queued"], first["retried"], first["failed"]) == (2, 1, 0)
+    assert bad.status == "pending_batch"
+    assert bad.retry_count == 1
+    assert bad.paystack_transfer_ref is None
+    assert bad.failure_reason == "Invalid recipient"
+    assert all(Withdrawal.objects.get(id=w.id).status == "processing" for w in good)
+
+    second = dispatch(fake_paystack)
+    bad.refresh_from_db()
+    assert (second["count"], second["retried"]) == (1, 1)
+    assert bad.retry_count == 2
+
+    third = dispatch(fake_paystack)
+    bad.refresh_from_db()
+    assert third["failed"] == 1
+    assert bad.status == "failed"
+    assert LedgerEntry.objects.filter(user=driver_user, type="credit", amount=3000).count() == 1
+
+
+@pytest.mark.django_db
+def test_failed_request_leaves_unconfirmed_transfers_processing(driver_user, fake_paystack, paystack_rate_limit):
+    fake_paystack.bulk_request_failures = 1
+    (withdrawal,) = _pending(driver_user, [1000])
+
+    result = dispatch(fake_paystack)
+    withdrawal.refresh_from_db()
+
+    assert (result["queued"], result["retried"], result["failed"], result["unconfirmed"]) == (0, 0, 0, 1)
+    assert fake_paystack.calls["fetch"] == 1
+    assert withdrawal.status == "processing"
+    assert withdrawal.paystack_transfer_ref
+    assert withdrawal.retry_count == 0
+    assert not LedgerEntry.objects.filter(user=driver_user, type="credit").exists()
+    assert dispatch(fake_paystack)["count"] == 0  # left to the stale reconciler, not resubmitted
+
+
+@pytest.mark.django_db
+def test_lost_response_is_confirmed_and_queued_once(driver_user, fake_paystack, paystack_rate_limit):
+    fake_paystack.bulk_lost_responses = 1
+    (withdrawal,) = _pending(driver_user, [1000])
+
+    result = dispatch(fake_paystack)
+    withdrawal.refresh_from_db()
+
+    assert (result["queued"], result["retried"], result["unconfirmed"]) == (1, 0, 0)
+    assert withdrawal.status == "processing"
+    assert withdrawal.paystack_transfer_code == "TRF_1"
+    assert len(fake_paystack.transfers) == 1
+
+
+@pytest.mark.django_db
+def test_unknown_outcome_reported_failed_is_retried_under_a_new_reference(driver_user, fake_paystack, paystack_rate_limit):
+    (withdrawal,) = _pending(driver_user, [1000])
+    claimed = claim(timezone.localdate())
+    reference = claimed[0].paystack_transfer_ref
+    fake_paystack.add_transfer(
+        transfer_code="TRF_X", reference=reference, amount=1000, status="failed",
+        recipient_code="RCP_OK", failure_reason="Account closed",
+    )
+
+    stats = settle_batch(claimed, TimeoutError("read timed out"), fake_paystack)
+    withdrawal.refresh_from_db()
+
+    assert stats == {"queued": 0, "retried": 1, "failed": 0, "unconfirmed": 0}
+    assert withdrawal.status == "pending_batch"
+    assert withdrawal.paystack_transfer_ref is None
+    assert withdrawal.failure_reason == "Account closed"
+
+
+@pytest.mark.django_db
+def test_rejection_does_not_touch_a_withdrawal_settled_meanwhile(driver_user, fake_paystack, paystack_rate_limit):
+    (withdrawal,) = _pending(driver_user, [1000])
+    claimed = claim(timezone.localdate())
+    Withdrawal.objects.filter(id=withdrawal.id).update(status="complete")
+
+    stats = settle_batch(claimed, {"data": [{"reference": claimed[0].paystack_transfer_ref, "status": "failed"}]})
+
+    assert stats == {"queued": 0, "retried": 0, "failed": 0, "unconfirmed": 0}
+    assert Withdrawal.objects.get(id=withdrawal.id).status == "complete"
+
+
+@pytest.mark.django_db
+def test_unknown_outcome_not_found_past_the_grace_is_replanned(settings, driver_user, fake_paystack, paystack_rate_limit):
+    settings.PAYOUT_NOT_FOUND_GRACE = 60
+    (withdrawal,) = _pending(driver_user, [1000])
+    claimed = claim(timezone.localdate())
+
+    # within the grace a "not found" may just be provider lag
+    assert settle_batch(claimed, TimeoutError("read timed out"), fake_paystack)["unconfirmed"] == 1
+
+    for row in claimed:
+        row.processed_at = timezone.now() - timedelta(minutes=5)
+    stats = settle_batch(claimed, TimeoutError("read timed out"), fake_paystack)
+    withdrawal.refresh_from_db()
+
+    assert stats == {"queued": 0, "retried": 1, "failed": 0, "unconfirmed": 0}
+    assert withdrawal.status == "pending_batch"
+    assert withdrawal.paystack_transfer_ref is None
+    assert withdrawal.failure_reason == "Paystack has no record of this transfer"
+    assert not LedgerEntry.objects.filter(user=driver_user, type="credit").exists()
@@ -0,0 +1,164 @@
+"""Concurrent payout reconciliation against the fake Paystack transfer API.
+
+Goals covered here:
+- stale `processing` withdrawals are settled from list-transfers pages, with
+  per-transfer fetches only for what the listing missed;
+- provider calls stay within the configured concurrency and rate limit;
+- successes are applied in bulk without overwriting rows a webhook settled first;
+- a transfer the provider has no record of is rejected (re-planned or failed with its hold
+  released) instead of sitting in `processing`; other lookup errors are left and counted.
+"""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from accounts.models import DriverProfile
+from payments.models import LedgerEntry, User, Withdrawal
+from payments.payouts.tasks import reconcile_stale_processing_withdrawals
+from payments.observability import metrics
+from payments.reconciliation.engine import (
+    TRANSFER_NOT_FOUND,
+    apply_transfer_states,
+    fetch_transfer_states,
+    reconcile_stale_withdrawals,
+)
+
+
+@pytest.fixture
+def driver_user(db):
+    user = User.objects.create_user(email="recon-driver@gmail.com", password="x")
+    DriverProfile.objects.create(user=user, first_name="Recon", last_name="Driver")
+    return user
+
+
+def _stale_withdrawals(user, fake, statuses, hours_ago=12):
+    processed_at = timezone.now() - timedelta(hours=hours_ago)
+    withdrawals = []
+    for i, status in enumerate(statuses):
+        withdrawal = Withdrawal.objects.create(
+            user=user,
+            amount=1000 + i,
+            status="processing",
+            strategy=Withdrawal.STRATEGY_BATCH,
+            processed_at=processed_at,
+            paystack_transfer_code=f"TRF_{i}",
+            paystack_transfer_ref=f"REF_{i}",
+            paystack_recipient_code="RCP",
+        )
+        if status:
+            fake.add_transfer(
+                transfer_code=f"TRF_{i}",
+                reference=f"REF_{i}",
+                amount=withdrawal.amount,
+                status=status,
+                recipient_code="RCP",
+                created_at=processed_at,
+                failure_reason="Account closed" if status == "failed" else "",
+            )
+        withdrawals.append(withdrawal)
+    return withdrawals
+
+
+@pytest.mark.django_db
+def test_stale_reconcile_lists_pages_and_applies_in_bulk(
+    settings, monkeypatch, driver_user, fake_paystack, paystack_rate_limit
+):
+    settings.PAYSTACK_RECONCILE_CONCURRENCY = 4
+    monkeypatch.setattr("payments.payouts.tasks.PaystackClient", lambda: fake_paystack)
+    statuses = ["success"] * 200 + ["failed"] * 3 + ["pending"] * 10
+    withdrawals = _stale_withdrawals(driver_user, fake_paystack, statuses)
+    # created long before the listed window: only reachable by a direct fetch
+    fake_paystack.transfers["TRF_0"]["createdAt"] = (timezone.now() - timedelta(days=30)).isoformat()
+
+    result = reconcile_stale_processing_withdrawals()
+
+    assert result == "reconciled=203 skipped=10 errors=0"
+    counts = {
+        status: Withdrawal.objects.filter(id__in=[w.id for w in withdrawals], status=status).count()
+        for status in ("complete", "failed", "processing")
+    }
+    assert counts == {"complete": 200, "failed": 3, "processing": 10}
+    assert LedgerEntry.objects.filter(user=driver_user, type="credit").count() == 3
+    assert fake_paystack.calls["list"] == 3  # 213 transfers, 100 per page
+    assert fake_paystack.calls["fetch"] == 1
+    assert fake_paystack.max_in_flight <= 4
+
+
+@pytest.mark.django_db
+def test_fetch_falls_back_to_bounded_concurrent_fetches(settings, fake_paystack, paystack_rate_limit):
+    settings.PAYSTACK_RECONCILE_CONCURRENCY = 3
+    fake_paystack.latency = 0.01
+    fake_paystack.failing_codes = {"TRF_BAD"}
+    for i in range(20):
+        fake_paystack.add_transfer(transfer_code=f"TRF_{i}", amount=100, status="success", recipient_code="RCP")
+
+    refs = [(i, f"TRF_{i}") for i in range(20)] + [("bad", "TRF_BAD"), ("gone", "TRF_MISSING")]
+    states, errors = fetch_transfer_states(refs, fake_paystack, window=None)
+
+    assert len(states) == 20
+    assert set(errors) == {"bad", "gone"}
+    assert fake_paystack.calls["list"] == 0
+    assert fake_paystack.max_in_flight == 3
+
+
+@pytest.mark.django_db
+def test_every_provider_call_takes_a_rate_limit_token(fake_paystack, paystack_rate_limit):
+    limiter = paystack_rate_limit()
+    hits = []
+    original = limiter.hit
+    limiter.hit = lambda identifier: hits.append(identifier) or original(identifier)
+    for i in range(60):
+        fake_paystack.add_transfer(transfer_code=f"TRF_{i}", amount=100, status="success", recipient_code="RCP")
+
+    today = timezone.localdate()
+    fetch_transfer_states(
+        [(i, f"TRF_{i}") for i in range(60)] + [("x", "TRF_OTHER")],
+        fake_paystack,
+        window=(today - timedelta(days=1), today + timedelta(days=1)),
+    )
+
+    assert len(hits) == sum(fake_paystack.calls.values()) == 2  # one list page + one fetch
+
+
+@pytest.mark.django_db
+def test_apply_skips_rows_already_settled_by_webhook(driver_user, fake_paystack):
+    first, second = _stale_withdrawals(driver_user, fake_paystack, ["success", "failed"])
+    Withdrawal.objects.filter(id__in=[first.id, second.id]).update(status="complete")
+
+    applied = apply_transfer_states(
+        {first.id: {"status": "success"}, second.id: {"status": "failed", "failure_reason": "late"}}
+    )
+
+    assert applied == {"completed": 0, "failed": 0, "unchanged": 2}
+    assert not LedgerEntry.objects.filter(user=driver_user).exists()
+
+
+@pytest.mark.django_db
+def test_stale_reconcile_rejects_transfers_the_provider_never_saw(
+    monkeypatch, driver_user, fake_paystack, paystack_rate_limit
+):
+    monkeypatch.setenv("LEDGER_HASH_SALT", "test-salt")
+    metrics.reset_for_tests()
+    batch, realtime, flaky = _stale_withdrawals(driver_user, fake_paystack, [None, None, None])
+    Withdrawal.objects.filter(id=realtime.id).update(strategy=Withdrawal.STRATEGY_REALTIME)
+    fake_paystack.failing_codes = {"TRF_2"}
+
+    stats = reconcile_stale_withdrawals(fake_paystack, older_than=timedelta(hours=6))
+
+    assert stats == {"reconciled": 0, "rejected": 2, "skipped": 0, "errors": 1}
+    batch.refresh_from_db()
+    assert (batch.status, batch.retry_count, batch.paystack_transfer_ref) == ("pending_batch", 1, None)
+    assert Withdrawal.objects.get(id=realtime.id).status == "failed"
+    assert LedgerEntry.objects.filter(user=driver_user, type="credit", amount=realtime.amount).count() == 1
+    assert Withdrawal.objects.get(id=flaky.id).status == "processing"  # timeout: not a "no"
+    assert metrics.snapshot()["counters"]["payments.withdrawal.unconfirmed_total|{}"] == 1
+
+
+def test_only_a_provider_not_found_is_a_definitive_answer(fake_paystack, paystack_rate_limit):
+    fake_paystack.failing_codes = {"TRF_SLOW"}
+    _, errors = fetch_transfer_states([("gone", "TRF_GONE"), ("slow", "TRF_SLOW")], fake_paystack)
+
+    assert errors["gone"] == TRANSFER_NOT_FOUND
+    assert errors["slow"] != TRANSFER_NOT_FOUND
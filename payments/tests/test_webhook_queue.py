@@ -0,0 +1,154 @@
+"""Paystack webhook ingestion queue, driven by recorded payloads.
+
+Goals covered here:
+- the webhook request only verifies and records the event; handlers run in the worker;
+- events sharing a reference are applied in arrival order, even across retries;
+- failures back off, dead-letter after WEBHOOK_MAX_ATTEMPTS and can be requeued;
+- queue lag is observable.
+"""
+
+import hashlib
+import hmac
+import json
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+
+import payments.webhooks.paystack as paystack_webhooks
+from payments import views as payment_views
+from payments.models import PaystackWebhookLog, User, Withdrawal
+from payments.models.subscription import Invoice, Plan, Subscription
+from payments.webhooks import queue as webhook_queue
+
+FIXTURES = Path(__file__).parent / "fixtures" / "paystack_webhooks"
+
+
+def replay(name):
+    """POST a recorded payload to the webhook view exactly as Paystack sent it."""
+    raw = (FIXTURES / f"{name}.json").read_bytes()
+    signature = hmac.new(b"sk_test_secret", raw, hashlib.sha512).hexdigest()
+    request = APIRequestFactory().post(
+        "/api/webhooks/paystack/", raw, content_type="application/json", HTTP_X_PAYSTACK_SIGNATURE=signature
+    )
+    return payment_views.paystack_webhook_view(request)
+
+
+def make_due():
+    PaystackWebhookLog.objects.update(not_before=timezone.now() - timedelta(seconds=1))
+
+
+@pytest.fixture
+def processing_withdrawal(db):
+    user = User.objects.create_user(email="webhook-driver@gmail.com", password="x")
+    return Withdrawal.objects.create(
+        user=user,
+        amount=150000,
+        status="processing",
+        paystack_transfer_code="TRF_1ptvuv321ahaa7q",
+        paystack_transfer_ref="wd-ref-0001",
+        paystack_recipient_code="RCP_a8wkxiychzdzfgs",
+    )
+
+
+@pytest.mark.django_db
+@override_settings(PAYSTACK_SECRET_KEY="sk_test_secret")
+def test_webhook_is_acknowledged_before_handlers_run(processing_withdrawal, django_capture_on_commit_callbacks, monkeypatch):
+    from payments import tasks
+
+    kicked = []
+    monkeypatch.setattr(tasks.process_webhooks, "delay", lambda: kicked.append(True))
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = replay("transfer_success")
+
+    assert response.status_code == 200
+    assert response.data["detail"] == "Webhook queued"
+    assert kicked == [True]
+    processing_withdrawal.refresh_from_db()
+    assert processing_withdrawal.status == "processing"
+
+    assert webhook_queue.process_pending() == ({"processed": 1, "retried": 0, "dead": 0}, True)
+    processing_withdrawal.refresh_from_db()
+    assert processing_withdrawal.status == "complete"
+    log = PaystackWebhookLog.objects.get()
+    assert (log.processed, log.attempts, log.paystack_reference) == (True, 1, "wd-ref-0001")
+
+
+@pytest.mark.django_db
+@override_settings(PAYSTACK_SECRET_KEY="sk_test_secret")
+def test_events_for_one_subscription_apply_in_arrival_order():
+    User.objects.create_user(email="subscriber@example.com", password="x")
+    replay("subscription_create")
+    replay("invoice_create")
+
+    # the plan is missing, so subscription.create fails and the invoice must wait behind it
+    stats, _ = webhook_queue.process_pending()
+    assert stats == {"processed": 0, "retried": 1, "dead": 0}
+    invoice_log = PaystackWebhookLog.objects.get(event_type="invoice.create")
+    assert invoice_log.attempts == 0
+    assert not Invoice.objects.exists()
+
+    Plan.objects.create(name="Pro Monthly", paystack_plan_code="PLN_gx2wn530m0i3w3m", amount=500000)
+    make_due()
+    stats, _ = webhook_queue.process_pending()
+
+    assert stats == {"processed": 2, "retried": 0, "dead": 0}
+    subscription = Subscription.objects.get(paystack_subscription_code="SUB_vsyqdmlzble3uii")
+    assert Invoice.objects.get(paystack_invoice_code="INV_thy2vkmirn2urwv").subscription == subscription
+
+
+@pytest.mark.django_db
+@override_settings(PAYSTACK_SECRET_KEY="sk_test_secret", WEBHOOK_MAX_ATTEMPTS=2)
+def test_failing_event_backs_off_dead_letters_and_requeues(processing_withdrawal, monkeypatch):
+    def broken(_withdrawal, reason):
+        raise RuntimeError("ledger unavailable")
+
+    monkeypatch.setattr(paystack_webhooks, "mark_withdrawal_failed", broken)
+    replay("transfer_reversed")
+
+    assert webhook_queue.process_pending()[0] == {"processed": 0, "retried": 1, "dead": 0}
+    log = PaystackWebhookLog.objects.get()
+    assert log.not_before > timezone.now()
+    assert webhook_queue.process_pending()[0] == {"processed": 0, "retried": 0, "dead": 0}  # backing off
+
+    make_due()
+    assert webhook_queue.process_pending()[0] == {"processed": 0, "retried": 0, "dead": 1}
+    log.refresh_from_db()
+    assert log.dead_at is not None
+    assert "ledger unavailable" in log.error_reason
+
+    # a dead event no longer holds back later events for the same transfer
+    replay("transfer_success")
+    assert webhook_queue.process_pending()[0] == {"processed": 1, "retried": 0, "dead": 0}
+
+    monkeypatch.setattr(paystack_webhooks, "mark_withdrawal_failed", lambda withdrawal, reason: None)
+    assert webhook_queue.requeue([log.id]) == 1
+    assert webhook_queue.process_pending()[0] == {"processed": 1, "retried": 0, "dead": 0}
+    log.refresh_from_db()
+    assert log.processed is True
+
+
+@pytest.mark.django_db
+@override_settings(PAYSTACK_SECRET_KEY="sk_test_secret")
+def test_worker_records_queue_lag(processing_withdrawal, monkeypatch):
+    captured = []
+    monkeypatch.setattr(paystack_webhooks, "observe_ms", lambda name, value, tags=None: captured.append((name, value, tags)))
+
+    replay("transfer_success")
+    PaystackWebhookLog.objects.update(received_at=timezone.now() - timedelta(seconds=5))
+    captured.clear()
+    webhook_queue.process_pending()
+
+    lags = {name: value for name, value, _tags in captured}
+    assert lags["payments.webhook.queue_lag_ms"] >= 5000
+    assert "payments.webhook.end_to_end_lag_ms" in lags
+
+
+def test_recorded_payloads_are_valid_json():
+    for path in FIXTURES.glob("*.json"):
+        body = json.loads(path.read_text())
+        assert body["event"] and body["data"]
@@ -7,7 +7,12 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
-from payments.idempotency import IdempotencyConflictError, begin_idempotent_request, save_idempotent_response
+from payments.idempotency import (
+    IdempotencyConflictError,
+    begin_idempotent_request,
+    release_idempotent_request,
+    save_idempotent_response,
+)
 from payments.models import Withdrawal
 from payments.services.sale_service import complete_service, initialize_sale, process_refund
 from payments.payouts.services import create_withdrawal_request, get_balance_summary
@@ -32,6 +37,7 @@ def initialize_sale_view(request):
     if not idempotency_key:
         return Response({"error": "Idempotency-Key header is required"}, status=status.HTTP_400_BAD_REQUEST)
 
+    row = None
     try:
         row, has_response = begin_idempotent_request(
             scope="sale_initialize",
@@ -56,6 +62,7 @@ def initialize_sale_view(request):
         return Response({"error": str(exc)}, status=status.HTTP_409_CONFLICT)
     except Exception as exc:
         logger.error(f"initialize_sale error: {exc}")
+        release_idempotent_request(row)
         return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -92,6 +99,7 @@ def refund_sale_view(request, sale_id):
         "responsible_party_reason": responsible_party_reason,
     }
 
+    row = None
     try:
         row, has_response = begin_idempotent_request(
             scope="refund_request",
@@ -113,6 +121,7 @@ def refund_sale_view(request, sale_id):
     except IdempotencyConflictError as exc:
         return Response({"error": str(exc)}, status=status.HTTP_409_CONFLICT)
     except Exception as exc:
+        release_idempotent_request(row)
         return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -144,6 +153,7 @@ def request_withdrawal_view(request):
     if not idempotency_key:
         return Response({"error": "Idempotency-Key header is required"}, status=status.HTTP_400_BAD_REQUEST)
 
+    row = None
     try:
         row, has_response = begin_idempotent_request(
             scope="withdrawal_request",
@@ -183,6 +193,7 @@ def request_withdrawal_view(request):
     except IdempotencyConflictError as exc:
         return Response({"error": str(exc)}, status=status.HTTP_409_CONFLICT)
     except ValueError as exc:
+        release_idempotent_request(row)
         return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -8,11 +8,13 @@ from typing import Any
 
 from django.conf import settings
 from django.db import IntegrityError
+from django.db.models import Q
 from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 
 from payments.models import PaystackWebhookLog, Sale, Withdrawal
 from payments.observability.metrics import increment, observe_ms
+from payments.webhooks import queue as webhook_queue
 from payments.payouts.services import mark_withdrawal_failed, mark_withdrawal_paid
 from menu.payment_handlers import order_fail, order_update
 from payments.models.subscription import (
@@ -44,7 +46,15 @@ def _verify_signature(payload_bytes: bytes, signature: str) -> bool:
 def _event_keys(body: dict[str, Any], payload_bytes: bytes) -> tuple[str, str, str, str]:
     event_type = body.get("event", "unknown")
     data = body.get("data", {})
-    ref = data.get("reference") or data.get("transfer_code", "")
+    if not isinstance(data, dict):  # subscription.expiring_cards sends a list
+        data = {}
+    # also the queue's ordering key: subscription/invoice events share the subscription code
+    ref = (
+        data.get("reference")
+        or data.get("transfer_code")
+        or data.get("subscription_code")
+        or (data.get("subscription") or {}).get("subscription_code", "")
+    )
     event_id = str(data.get("id") or "")
     event_hash = hashlib.sha256(payload_bytes or b"{}").hexdigest()
     return event_type, ref, event_id, event_hash
@@ -54,8 +64,20 @@ def _find_payment_withdrawal(reference: str, transfer_code: str) -> Withdrawal |
     return Withdrawal.objects.filter(paystack_transfer_ref=reference).first() or Withdrawal.objects.filter(paystack_transfer_code=transfer_code).first()
 
 
-def _record_webhook_lag(body: dict[str, Any], event_type: str) -> None:
+def _record_webhook_lag(body: dict[str, Any], event_type: str, received_at=None) -> None:
+    """
+    On receipt: provider event time -> now (processing_lag_ms).
+    From the queue worker (received_at given): receipt -> now (queue_lag_ms)
+    and provider event time -> now (end_to_end_lag_ms).
+    """
+    now = timezone.now()
+    if received_at is not None:
+        queue_lag_ms = max((now - received_at).total_seconds() * 1000.0, 0.0)
+        observe_ms("payments.webhook.queue_lag_ms", queue_lag_ms, tags={"event": event_type})
+
     data = body.get("data", {})
+    if not isinstance(data, dict):
+        return
     raw_time = data.get("paid_at") or data.get("createdAt") or data.get("created_at") or data.get("transferred_at")
     if not raw_time:
         return
@@ -64,8 +86,9 @@ def _record_webhook_lag(body: dict[str, Any], event_type: str) -> None:
         return
     if timezone.is_naive(event_time):
         event_time = timezone.make_aware(event_time, timezone.utc)
-    lag_ms = max((timezone.now() - event_time).total_seconds() * 1000.0, 0.0)
-    observe_ms("payments.webhook.processing_lag_ms", lag_ms, tags={"event": event_type})
+    lag_ms = max((now - event_time).total_seconds() * 1000.0, 0.0)
+    name = "payments.webhook.end_to_end_lag_ms" if received_at is not None else "payments.webhook.processing_lag_ms"
+    observe_ms(name, lag_ms, tags={"event": event_type})
 
 # payload = {
 #     "email": user.email,
@@ -342,7 +365,9 @@ def handle_paystack_webhook(
             },
         )
     except IntegrityError:
-        webhook_log = PaystackWebhookLog.objects.filter(event_hash=event_hash).first()
+        # same event_id redelivered with a different body
+        duplicate = Q(event_hash=event_hash) | (Q(event_id=event_id) if event_id else Q(pk__in=[]))
+        webhook_log = PaystackWebhookLog.objects.filter(duplicate).first()
         created = False
 
     if not created and webhook_log and webhook_log.processed:
@@ -376,41 +401,21 @@ def handle_paystack_webhook(
         )
         return 400, "Invalid webhook signature"
 
-    try:
-        process_event(body)
-        if webhook_log:
-            webhook_log.processed = True
-            webhook_log.processed_at = timezone.now()
-            webhook_log.error_reason = ""
-            webhook_log.save(update_fields=["processed", "processed_at", "error_reason"])
-
-        increment("payments.webhook.processed_total", tags={"event": event_type})
-        logger.info(
-            "payments.webhook.processed",
-            extra={
-                "request_id": request_id,
-                "idempotency_key": "",
-                "withdrawal_id": "",
-                "provider_ref": ref,
-                "event_id": event_id,
-            },
-        )
-    except Exception as exc:
-        logger.error("[WEBHOOK] Error processing %s: %s", event_type, exc)
-        if webhook_log:
-            webhook_log.error_reason = str(exc)
-            webhook_log.save(update_fields=["error_reason"])
-        increment("payments.webhook.error_total", tags={"event": event_type})
-        logger.error(
-            "payments.webhook.error",
-            extra={
-                "request_id": request_id,
-                "idempotency_key": "",
-                "withdrawal_id": "",
-                "provider_ref": ref,
-                "event_id": event_id,
-                "reason": str(exc),
-            },
-        )
+    # handlers run in the queue worker (payments/webhooks/queue.py)
+    if created:
+        webhook_queue.kick()
+    elif webhook_log and webhook_log.signature_valid and webhook_log.dead_at is None:
+        webhook_queue.retry_now(webhook_log)
 
-    return 200, "Webhook processed"
+    increment("payments.webhook.queued_total", tags={"event": event_type})
+    logger.info(
+        "payments.webhook.queued",
+        extra={
+            "request_id": request_id,
+            "idempotency_key": "",
+            "withdrawal_id": "",
+            "provider_ref": ref,
+            "event_id": event_id,
+        },
+    )
+    return 200, "Webhook queued"
@@ -0,0 +1,151 @@
+"""
+Processing queue for Paystack webhooks.
+
+    POST /api/webhooks/paystack/
+        -> verify HMAC, get_or_create PaystackWebhookLog (unique event_hash), 200
+        -> payments.process_webhooks on commit
+
+The request only pays for the signature check and one INSERT, so Paystack
+gets its 200 before any handler runs. process_pending() claims due events
+oldest first with SELECT ... FOR UPDATE SKIP LOCKED. An event is skipped
+while an older unfinished event with the same reference exists, so events
+for one transfer / charge / subscription apply in the order they arrived,
+even across workers.
+
+Each event's handler and its `processed` flag commit together. Failures back
+off exponentially and dead-letter after WEBHOOK_MAX_ATTEMPTS. Dead events
+block nothing and are listed at admin_api `webhooks/dead/` for requeue(). The
+cron sweep (`python manage.py process_webhooks --async`) wakes events whose
+backoff expired.
+"""
+import logging
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from payments.models import PaystackWebhookLog
+from payments.observability.metrics import increment
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 50
+
+
+def kick():
+    from payments.tasks import process_webhooks
+
+    transaction.on_commit(lambda: process_webhooks.delay())
+
+
+def unfinished():
+    return PaystackWebhookLog.objects.filter(processed=False, dead_at__isnull=True, signature_valid=True)
+
+
+def release_stale_claims():
+    """Events left claimed by a dead worker go back to the queue."""
+    cutoff = timezone.now() - timedelta(seconds=getattr(settings, "WEBHOOK_CLAIM_TIMEOUT", 300))
+    return unfinished().filter(claimed_at__lt=cutoff).update(claimed_at=None)
+
+
+def claim(batch_size=BATCH_SIZE):
+    now = timezone.now()
+    older_same_reference = unfinished().filter(
+        paystack_reference=OuterRef("paystack_reference"),
+        received_at__lt=OuterRef("received_at"),
+    )
+    with transaction.atomic():
+        rows = list(
+            unfinished()
+            .select_for_update(skip_locked=True)
+            .filter(claimed_at__isnull=True, not_before__lte=now)
+            .filter(Q(paystack_reference="") | ~Exists(older_same_reference))
+            .order_by("received_at")[:batch_size]
+        )
+        if rows:
+            PaystackWebhookLog.objects.filter(id__in=[row.id for row in rows]).update(claimed_at=now)
+    return rows
+
+
+def process_pending(batch_size=BATCH_SIZE, time_budget=None):
+    """
+    Handle due events until none are left or the time budget is spent.
+    :return: ({"processed": n, "retried": n, "dead": n}, drained)
+    """
+    budget = time_budget if time_budget is not None else getattr(settings, "WEBHOOK_TASK_TIME_BUDGET", 60)
+    deadline = time.monotonic() + budget
+    stats = {"processed": 0, "retried": 0, "dead": 0}
+
+    release_stale_claims()
+    while True:
+        rows = claim(batch_size)
+        if not rows:
+            return stats, True
+        for row in rows:
+            stats[process(row)] += 1
+        if time.monotonic() >= deadline:
+            return stats, False
+
+
+def process(log):
+    """Run one claimed event's handler; returns the stats bucket."""
+    from payments.webhooks import paystack
+
+    paystack._record_webhook_lag(log.payload, log.event_type, received_at=log.received_at)
+    extra = {"request_id": "", "idempotency_key": "", "withdrawal_id": "", "provider_ref": log.paystack_reference, "event_id": log.event_id}
+    try:
+        with transaction.atomic():
+            paystack.process_event(log.payload)
+            PaystackWebhookLog.objects.filter(id=log.id).update(
+                processed=True,
+                processed_at=timezone.now(),
+                error_reason="",
+                attempts=log.attempts + 1,
+                claimed_at=None,
+            )
+    except Exception as exc:
+        return _failed(log, exc, extra)
+
+    increment("payments.webhook.processed_total", tags={"event": log.event_type})
+    logger.info("payments.webhook.processed", extra=extra)
+    return "processed"
+
+
+def _failed(log, exc, extra):
+    attempts = log.attempts + 1
+    update = {"attempts": attempts, "error_reason": str(exc), "claimed_at": None}
+    increment("payments.webhook.error_total", tags={"event": log.event_type})
+
+    if attempts >= getattr(settings, "WEBHOOK_MAX_ATTEMPTS", 8):
+        PaystackWebhookLog.objects.filter(id=log.id).update(dead_at=timezone.now(), **update)
+        increment("payments.webhook.dead_total", tags={"event": log.event_type})
+        logger.error("payments.webhook.dead", extra={**extra, "reason": str(exc), "attempts": attempts})
+        return "dead"
+
+    PaystackWebhookLog.objects.filter(id=log.id).update(not_before=timezone.now() + backoff(attempts), **update)
+    logger.warning("payments.webhook.error", extra={**extra, "reason": str(exc), "attempts": attempts})
+    return "retried"
+
+
+def backoff(attempts):
+    base = getattr(settings, "WEBHOOK_RETRY_BASE_SECONDS", 30)
+    return timedelta(seconds=min(base * 2 ** (attempts - 1), 6 * 60 * 60))
+
+
+def retry_now(log):
+    """Paystack redelivered an event we haven't handled yet: make it due and wake a worker."""
+    PaystackWebhookLog.objects.filter(id=log.id, processed=False, dead_at__isnull=True).update(not_before=timezone.now())
+    kick()
+
+
+def requeue(ids):
+    """Put dead-lettered events back in the queue with a fresh attempt budget."""
+    count = PaystackWebhookLog.objects.filter(id__in=ids, processed=False, dead_at__isnull=False).update(
+        dead_at=None, attempts=0, not_before=timezone.now(), claimed_at=None
+    )
+    if count:
+        kick()
+    return count
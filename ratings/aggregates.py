@@ -0,0 +1,170 @@
+"""
+Rating aggregates (rating_sum / rating_count / avg_rating) on drivers, branches
+and businesses, maintained from a delta log.
+
+    rating saved/deleted  ->  RatingDelta rows, same transaction (signals.py)
+    fold_deltas()         ->  per batch: one UPDATE per target table, then the
+                              folded deltas are deleted, all in one transaction
+
+A delta is written exactly once (it commits or rolls back with its rating) and
+folded exactly once (concurrent folds claim disjoint rows with SKIP LOCKED and
+the rows go away with the UPDATE that applied them), so the aggregates never
+drift. Branch deltas roll up into the branch's business, and folded drivers
+get their quality score (scoring.py) recomputed in the same transaction.
+
+Folding runs every minute (`python manage.py fold_rating_deltas --async`);
+`python manage.py recalc_ratings` verifies stored aggregates against the
+ratings and can repair them.
+"""
+import logging
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, FloatField, IntegerField, Sum, Count, Value, When
+from django.db.models.functions import Cast
+from django.db.models.lookups import GreaterThan
+
+from payments.observability.metrics import increment
+from ratings.models import BranchRating, DriverRating, RatingDelta
+from ratings.scoring import refresh_scores
+
+logger = logging.getLogger(__name__)
+
+
+def _targets():
+    from accounts.models import Branch, Business, DriverProfile
+
+    return {"driver": DriverProfile, "branch": Branch, "business": Business}
+
+
+def log_delta(target: str, target_id: int, stars: int, count: int):
+    if stars or count:
+        RatingDelta.objects.create(target=target, target_id=target_id, stars=stars, count=count)
+
+
+# ===== FOLD =====
+
+def _case(values: dict, field):
+    return Case(
+        *[When(pk=pk, then=Value(value)) for pk, value in values.items()],
+        default=Value(0),
+        output_field=field,
+    )
+
+
+def apply_totals(model, totals: dict) -> int:
+    """One UPDATE adding {pk: (stars, count)} to model's aggregates."""
+    if not totals:
+        return 0
+    new_sum = F("rating_sum") + _case({pk: stars for pk, (stars, _) in totals.items()}, IntegerField())
+    new_count = F("rating_count") + _case({pk: count for pk, (_, count) in totals.items()}, IntegerField())
+    return model.objects.filter(pk__in=totals).update(
+        rating_sum=new_sum,
+        rating_count=new_count,
+        avg_rating=Case(
+            When(GreaterThan(new_count, 0), then=Cast(new_sum, FloatField()) / Cast(new_count, FloatField())),
+            default=Value(0.0),
+            output_field=FloatField(),
+        ),
+    )
+
+
+@transaction.atomic
+def fold_batch(batch_size: int) -> int:
+    rows = list(
+        RatingDelta.objects.select_for_update(skip_locked=True)
+        .order_by("id")
+        .values_list("id", "target", "target_id", "stars", "count")[:batch_size]
+    )
+    if not rows:
+        return 0
+
+    totals = defaultdict(lambda: defaultdict(lambda: [0, 0]))
+    for _, target, target_id, stars, count in rows:
+        totals[target][target_id][0] += stars
+        totals[target][target_id][1] += count
+
+    targets = _targets()
+    branch_totals = totals.get("branch", {})
+    if branch_totals:
+        businesses = targets["branch"].objects.filter(pk__in=branch_totals, business__isnull=False)
+        for branch_id, business_id in businesses.values_list("pk", "business_id"):
+            totals["business"][business_id][0] += branch_totals[branch_id][0]
+            totals["business"][business_id][1] += branch_totals[branch_id][1]
+
+    # fixed table order so concurrent folds lock aggregate rows in the same order
+    for target in ("driver", "branch", "business"):
+        apply_totals(targets[target], {pk: tuple(total) for pk, total in sorted(totals.get(target, {}).items())})
+    refresh_scores(sorted(totals.get("driver", {})))
+
+    RatingDelta.objects.filter(id__in=[row[0] for row in rows]).delete()
+    return len(rows)
+
+
+def fold_deltas(batch_size: int | None = None, max_batches: int | None = None) -> int:
+    batch_size = batch_size or getattr(settings, "RATING_FOLD_BATCH_SIZE", 5000)
+    folded = batches = 0
+    while max_batches is None or batches < max_batches:
+        count = fold_batch(batch_size)
+        if not count:
+            break
+        folded += count
+        batches += 1
+    increment("ratings.deltas_folded_total", value=folded)
+    return folded
+
+
+# ===== VERIFY =====
+
+def _pending(target: str) -> dict:
+    rows = (
+        RatingDelta.objects.filter(target=target)
+        .values("target_id")
+        .annotate(stars=Sum("stars"), count=Sum("count"))
+    )
+    return {row["target_id"]: (row["stars"], row["count"]) for row in rows}
+
+
+def _expected(rating_model, fk: str) -> dict:
+    rows = rating_model.objects.values(fk).annotate(stars=Sum("stars"), count=Count("id"))
+    return {row[fk]: (row["stars"], row["count"]) for row in rows}
+
+
+def verify(fix: bool = False) -> dict[str, list]:
+    """
+    Compare every stored aggregate (plus its unfolded deltas) with the ratings.
+    :param fix: rewrite the aggregates that disagree, leaving pending deltas to the next fold
+    :return: {target: [(pk, stored + pending, expected), ...]} for the ones that disagree
+    """
+    targets = _targets()
+    expected = {
+        "driver": _expected(DriverRating, "driver_id"),
+        "branch": _expected(BranchRating, "branch_id"),
+        "business": _expected(BranchRating, "branch__business_id"),
+    }
+    pending = {"driver": _pending("driver"), "branch": _pending("branch"), "business": defaultdict(lambda: (0, 0))}
+    for branch_id, business_id in targets["branch"].objects.filter(business__isnull=False).values_list("pk", "business_id"):
+        stars, count = pending["branch"].get(branch_id, (0, 0))
+        rolled = pending["business"][business_id]
+        pending["business"][business_id] = (rolled[0] + stars, rolled[1] + count)
+
+    mismatches = {}
+    for target, model in targets.items():
+        wrong = []
+        for pk, stored_sum, stored_count in model.objects.values_list("pk", "rating_sum", "rating_count").iterator():
+            pending_sum, pending_count = pending[target].get(pk, (0, 0))
+            actual = (stored_sum + pending_sum, stored_count + pending_count)
+            want = expected[target].get(pk, (0, 0))
+            if actual != want:
+                wrong.append((pk, actual, want))
+        mismatches[target] = wrong
+        increment("ratings.aggregate_mismatches", value=len(wrong), tags={"target": target})
+
+        if fix and wrong:
+            logger.warning(f"[ratings] repairing {len(wrong)} {target} aggregates")
+            with transaction.atomic():
+                for pk, actual, want in wrong:
+                    # stored + pending must come out at want
+                    apply_totals(model, {pk: (want[0] - actual[0], want[1] - actual[1])})
+    return mismatches
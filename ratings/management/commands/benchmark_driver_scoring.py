@@ -0,0 +1,75 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.models import DriverProfile, User
+from common.benchmark import rolled_back
+from ratings.scoring import DriverStats, STAT_FIELDS, quality_score, refresh_scores
+
+
+class Command(BaseCommand):
+    help = (
+        "Driver quality score throughput: scores/s computed in memory, and a bulk rescore of synthetic "
+        "drivers through refresh_scores(). Everything is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--drivers", type=int, default=50000)
+
+    def handle(self, *args, **options):
+        n = options["drivers"]
+        rng = random.Random(7)
+        stats = []
+        for _ in range(n):
+            count = rng.randint(0, 400)
+            accepts = rng.randint(0, 400)
+            timed = rng.randint(0, accepts)
+            stats.append(
+                DriverStats(
+                    rating_sum=sum(rng.randint(1, 5) for _ in range(count)),
+                    rating_count=count,
+                    dispatch_accepts=accepts,
+                    dispatch_rejects=rng.randint(0, 100),
+                    timed_deliveries=timed,
+                    on_time_deliveries=rng.randint(0, timed),
+                    driver_cancellations=rng.randint(0, 10),
+                )
+            )
+
+        started = time.perf_counter()
+        for item in stats:
+            quality_score(item)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f"in memory: {n} scores in {elapsed * 1000:.0f} ms ({n / elapsed:,.0f}/s)")
+
+        with rolled_back():
+            self.run(stats)
+        self.stdout.write("Rolled back synthetic drivers.")
+
+    def run(self, stats):
+        n = len(stats)
+        self.stdout.write(f"Creating {n} drivers ...")
+        users = User.objects.bulk_create(
+            [User(email=f"bench-score-{i}@bench.invalid") for i in range(n)], batch_size=2000
+        )
+        drivers = DriverProfile.objects.bulk_create(
+            [
+                DriverProfile(user=user, **{field: getattr(item, field) for field in STAT_FIELDS})
+                for user, item in zip(users, stats)
+            ],
+            batch_size=2000,
+        )
+
+        started = time.perf_counter()
+        changed = 0
+        ids = [driver.pk for driver in drivers]
+        for i in range(0, n, 5000):
+            changed += refresh_scores(ids[i : i + 5000])
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(f"refresh_scores: {changed} of {n} drivers rescored in {elapsed:.2f}s ({n / elapsed:,.0f}/s)")
+        )
+
+
+# Run with: python manage.py benchmark_driver_scoring --drivers 50000
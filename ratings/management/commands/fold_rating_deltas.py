@@ -0,0 +1,29 @@
+"""
+Rating aggregate fold for cron (same approach as process_webhooks):
+
+    * * * * *  python manage.py fold_rating_deltas --async
+
+Applies the logged rating deltas to driver/branch/business aggregates.
+"""
+from django.core.management.base import BaseCommand
+
+from ratings.aggregates import fold_deltas
+
+
+class Command(BaseCommand):
+    help = "Fold pending rating deltas into the rating aggregates."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument("--async", dest="run_async", action="store_true", help="Queue the celery task instead.")
+
+    def handle(self, *args, **options):
+        if options["run_async"]:
+            from ratings.tasks import fold_rating_deltas
+
+            fold_rating_deltas.delay()
+            self.stdout.write("Queued.")
+            return
+
+        folded = fold_deltas(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Folded {folded} rating deltas."))
@@ -1,48 +1,39 @@
+"""
+Verifier for the rating aggregates maintained by ratings/aggregates.py:
+
+    python manage.py recalc_ratings          # report drivers/branches/businesses that disagree
+    python manage.py recalc_ratings --fix    # and repair them
+
+Stored aggregates plus their unfolded deltas are compared with SUM/COUNT over
+the ratings; nothing should disagree unless rows were changed behind the
+ORM's back (raw SQL, queryset.update()/delete() on ratings).
+"""
 from django.core.management.base import BaseCommand
-from django.db.models import Avg, Count, Model
-from django.db.models.functions import Coalesce
-from django.db import transaction
-
-from ratings.models import DriverRating, BranchRating, RatingBase
-from accounts.models import DriverProfile, Branch
-
-@transaction.atomic
-def refresh_rating_stats(basemode: Model, rating: RatingBase, fk_field: str, batch_size: int = 2000) -> None:
-    basemode.objects.update(avg_rating=0.0, rating_count=0)
-
-    driver_stats_qs = (
-        rating.objects
-        .values(fk_field)
-        .annotate(avg=Coalesce(Avg("stars"), 0.0), cnt=Count("id"))
-        .iterator()
-    )
-
-    buffer = []
-    for row in driver_stats_qs:
-        buffer.append(
-            basemode(
-                id=row[fk_field],
-                avg_rating=float(row["avg"]),
-                rating_count=int(row["cnt"]),
-            )
-        )
-        if len(buffer) >= batch_size:
-            basemode.objects.bulk_update(buffer, ["avg_rating", "rating_count"], batch_size=batch_size)
-            buffer.clear()
-
-    if buffer:
-        basemode.objects.bulk_update(buffer, ["avg_rating", "rating_count"], batch_size=batch_size)
+
+from ratings.aggregates import verify
+
 
 class Command(BaseCommand):
-    help = "Recalculate avg_rating and rating_count on drivers and branches."
+    help = "Verify rating_sum/rating_count on drivers, branches and businesses against the ratings."
 
     def add_arguments(self, parser):
-        parser.add_argument("--batch-size", type=int, default=3000)
+        parser.add_argument("--fix", action="store_true", help="Rewrite the aggregates that disagree.")
 
     def handle(self, *args, **options):
-        refresh_rating_stats(DriverProfile, DriverRating, "driver_id", batch_size=options["batch_size"])
-        refresh_rating_stats(Branch, BranchRating, "branch_id", batch_size=options["batch_size"])
-        self.stdout.write(self.style.SUCCESS("Ratings stats recalculated."))
-
-
-# Run with: python manage.py recalc_ratings
\ No newline at end of file
+        mismatches = verify(fix=options["fix"])
+        for target, wrong in mismatches.items():
+            for pk, actual, want in wrong[:20]:
+                self.stdout.write(f"{target} {pk}: stored {actual[0]}/{actual[1]}, ratings say {want[0]}/{want[1]}")
+            if len(wrong) > 20:
+                self.stdout.write(f"... and {len(wrong) - 20} more {target}s")
+
+        total = sum(len(wrong) for wrong in mismatches.values())
+        if not total:
+            self.stdout.write(self.style.SUCCESS("Rating aggregates match the ratings."))
+        elif options["fix"]:
+            self.stdout.write(self.style.WARNING(f"Repaired {total} aggregates."))
+        else:
+            self.stdout.write(self.style.ERROR(f"{total} aggregates disagree; rerun with --fix to repair."))
+
+
+# Run with: python manage.py recalc_ratings
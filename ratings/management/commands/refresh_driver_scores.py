@@ -0,0 +1,21 @@
+"""
+Rebuilds the driver dispatch counters (accepts, rejects, on-time, cancellations)
+from OrderEvent history and recomputes every DriverProfile.quality_score.
+
+Day to day the counters move with each OrderEvent (ratings/scoring.py); run this
+once after deploying the score, or after changing the weights in scoring.py.
+"""
+from django.core.management.base import BaseCommand
+
+from ratings.scoring import backfill_counters
+
+
+class Command(BaseCommand):
+    help = "Rebuild driver quality-score counters from order events and rescore every driver."
+
+    def handle(self, *args, **options):
+        updated = backfill_counters()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt counters for {updated} drivers and rescored all drivers."))
+
+
+# Run with: python manage.py refresh_driver_scores
@@ -1,2 +1,3 @@
 from .base import *
-from .mixin import *
\ No newline at end of file
+from .mixin import *
+from .delta import *
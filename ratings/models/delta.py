@@ -0,0 +1,24 @@
+from django.db import models
+
+
+class RatingDelta(models.Model):
+    """
+    One change to a driver's or branch's rating aggregate, written in the same
+    transaction as the rating itself and folded into the aggregate later
+    (ratings/aggregates.py). Folded rows are deleted in the fold's transaction.
+    """
+    TARGET_DRIVER = "driver"
+    TARGET_BRANCH = "branch"
+    TARGET_CHOICES = [
+        (TARGET_DRIVER, "Driver"),
+        (TARGET_BRANCH, "Branch"),
+    ]
+
+    target = models.CharField(max_length=16, choices=TARGET_CHOICES)
+    target_id = models.BigIntegerField()
+    stars = models.IntegerField()  # change to rating_sum
+    count = models.SmallIntegerField()  # change to rating_count: 1, 0 or -1
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.target} {self.target_id}: {self.stars:+d} stars, {self.count:+d}"
@@ -0,0 +1,195 @@
+"""
+Driver quality score for dispatch, stored on DriverProfile.quality_score (0..1).
+
+    score = 0.40 * rating        Bayesian average of stars, mapped 1..5 -> 0..1
+          + 0.20 * acceptance    accepted / (accepted + rejected) assignments
+          + 0.25 * on_time       delivered by the estimate / delivered with an estimate
+          + 0.15 * reliability   1 - driver-caused cancellations / accepted
+
+Every rate is smoothed towards a prior as if the driver had PRIOR_WEIGHT
+observations already, so one bad order does not sink a new driver and a
+driver with no history scores DEFAULT_SCORE.
+
+The counters behind it move with OrderEvent transitions (record_event, from
+ratings/signals.py) and the rating columns with the rating fold
+(aggregates.py); both rescore the affected drivers in the same transaction.
+Dispatch (addresses/utils/calculation_utils.py) reads the column.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from django.db import transaction
+
+PRIOR_WEIGHT = 10
+PRIOR_RATING = 4.0
+PRIOR_ACCEPTANCE = 0.8
+PRIOR_ON_TIME = 0.85
+PRIOR_CANCELLATION = 0.05
+
+WEIGHTS = {"rating": 0.40, "acceptance": 0.20, "on_time": 0.25, "reliability": 0.15}
+
+STAT_FIELDS = (
+    "rating_sum",
+    "rating_count",
+    "dispatch_accepts",
+    "dispatch_rejects",
+    "timed_deliveries",
+    "on_time_deliveries",
+    "driver_cancellations",
+)
+
+
+@dataclass(frozen=True)
+class DriverStats:
+    rating_sum: int = 0
+    rating_count: int = 0
+    dispatch_accepts: int = 0
+    dispatch_rejects: int = 0
+    timed_deliveries: int = 0
+    on_time_deliveries: int = 0
+    driver_cancellations: int = 0
+
+
+# ===== SCORING =====
+
+def smoothed(successes: float, trials: float, prior: float, weight: float = PRIOR_WEIGHT) -> float:
+    return (successes + prior * weight) / (trials + weight)
+
+
+def rating_component(stats: DriverStats) -> float:
+    stars = smoothed(stats.rating_sum, stats.rating_count, PRIOR_RATING)
+    return (stars - 1.0) / 4.0
+
+
+def acceptance_component(stats: DriverStats) -> float:
+    return smoothed(stats.dispatch_accepts, stats.dispatch_accepts + stats.dispatch_rejects, PRIOR_ACCEPTANCE)
+
+
+def on_time_component(stats: DriverStats) -> float:
+    return smoothed(stats.on_time_deliveries, stats.timed_deliveries, PRIOR_ON_TIME)
+
+
+def reliability_component(stats: DriverStats) -> float:
+    cancellation = smoothed(stats.driver_cancellations, stats.dispatch_accepts, PRIOR_CANCELLATION)
+    return 1.0 - min(cancellation, 1.0)
+
+
+def quality_score(stats: DriverStats) -> float:
+    score = (
+        WEIGHTS["rating"] * rating_component(stats)
+        + WEIGHTS["acceptance"] * acceptance_component(stats)
+        + WEIGHTS["on_time"] * on_time_component(stats)
+        + WEIGHTS["reliability"] * reliability_component(stats)
+    )
+    return round(min(max(score, 0.0), 1.0), 4)
+
+
+DEFAULT_SCORE = quality_score(DriverStats())
+
+
+# ===== STORAGE =====
+
+def refresh_scores(driver_ids) -> int:
+    """Rescore these drivers from their stored counters (one read, one bulk write)."""
+    from accounts.models import DriverProfile
+
+    drivers = list(DriverProfile.objects.filter(pk__in=list(driver_ids)).only("pk", "quality_score", *STAT_FIELDS))
+    changed = []
+    for driver in drivers:
+        score = quality_score(DriverStats(**{field: getattr(driver, field) for field in STAT_FIELDS}))
+        if score != driver.quality_score:
+            driver.quality_score = score
+            changed.append(driver)
+    DriverProfile.objects.bulk_update(changed, ["quality_score"], batch_size=1000)
+    return len(changed)
+
+
+def _metadata(event) -> dict:
+    return event.metadata if isinstance(event.metadata, dict) else {}
+
+
+def event_counters(event) -> tuple[int | None, dict[str, int]]:
+    """:return: (driver id, {counter: increment}) for an OrderEvent; (None, {}) if it does not score"""
+    metadata = _metadata(event)
+    if event.event_type == "picked_up" and event.actor_type == "driver":
+        return event.actor_id, {"dispatch_accepts": 1}
+    if event.event_type == "driver_rejected":
+        return event.actor_id or metadata.get("driver_id"), {"dispatch_rejects": 1}
+    if event.event_type == "delivered" and event.actor_type == "driver":
+        estimate = event.order.estimated_delivery_time
+        if estimate is None:
+            return None, {}
+        return event.actor_id, {"timed_deliveries": 1, "on_time_deliveries": int(event.timestamp <= estimate)}
+    if event.event_type == "cancelled" and metadata.get("responsible_party") == "driver":
+        return event.order.driver_id, {"driver_cancellations": 1}
+    return None, {}
+
+
+@transaction.atomic
+def record_event(event) -> float | None:
+    """Apply one OrderEvent to its driver's counters and rescore. :return: the new score, if any"""
+    from accounts.models import DriverProfile
+
+    driver_id, counters = event_counters(event)
+    if not driver_id or not counters:
+        return None
+    driver = DriverProfile.objects.select_for_update().only("pk", "quality_score", *STAT_FIELDS).filter(pk=driver_id).first()
+    if driver is None:
+        return None
+    for field, value in counters.items():
+        setattr(driver, field, getattr(driver, field) + value)
+    driver.quality_score = quality_score(DriverStats(**{field: getattr(driver, field) for field in STAT_FIELDS}))
+    driver.save(update_fields=[*counters, "quality_score"])
+    return driver.quality_score
+
+
+def backfill_counters() -> int:
+    """Rebuild the dispatch counters from OrderEvent history and rescore everyone."""
+    from django.db.models import Count, F
+
+    from accounts.models import DriverProfile
+    from menu.models import OrderEvent
+
+    counters: dict[int, dict[str, int]] = {}
+
+    def add(rows, key, field):
+        for row in rows:
+            if row[key]:
+                counters.setdefault(int(row[key]), {})[field] = counters.get(int(row[key]), {}).get(field, 0) + row["n"]
+
+    events = OrderEvent.objects.order_by()
+    add(events.filter(event_type="picked_up", actor_type="driver").values("actor_id").annotate(n=Count("id")), "actor_id", "dispatch_accepts")
+    add(events.filter(event_type="driver_rejected", actor_id__isnull=False).values("actor_id").annotate(n=Count("id")), "actor_id", "dispatch_rejects")
+    add(
+        events.filter(event_type="driver_rejected", actor_id__isnull=True).values("metadata__driver_id").annotate(n=Count("id")),
+        "metadata__driver_id",
+        "dispatch_rejects",
+    )
+    timed = events.filter(event_type="delivered", actor_type="driver", order__estimated_delivery_time__isnull=False)
+    add(timed.values("actor_id").annotate(n=Count("id")), "actor_id", "timed_deliveries")
+    add(
+        timed.filter(timestamp__lte=F("order__estimated_delivery_time")).values("actor_id").annotate(n=Count("id")),
+        "actor_id",
+        "on_time_deliveries",
+    )
+    add(
+        events.filter(event_type="cancelled", metadata__responsible_party="driver").values("order__driver_id").annotate(n=Count("id")),
+        "order__driver_id",
+        "driver_cancellations",
+    )
+
+    updated = 0
+    with transaction.atomic():
+        DriverProfile.objects.update(**{field: 0 for field in STAT_FIELDS[2:]})
+        for driver_id, values in counters.items():
+            updated += DriverProfile.objects.filter(pk=driver_id).update(**values)
+        ids = DriverProfile.objects.values_list("pk", flat=True).iterator(chunk_size=5000)
+        batch = []
+        for driver_id in ids:
+            batch.append(driver_id)
+            if len(batch) >= 5000:
+                refresh_scores(batch)
+                batch = []
+        refresh_scores(batch)
+    return updated
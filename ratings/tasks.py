@@ -0,0 +1,9 @@
+from celery import shared_task
+
+from ratings.aggregates import fold_deltas
+
+
+@shared_task(name="ratings.fold_rating_deltas", acks_late=True)
+def fold_rating_deltas():
+    # a bounded run; whatever is left waits for the next minute
+    return fold_deltas(max_batches=20)
@@ -1,8 +1,13 @@
+from datetime import timedelta
+
 import pytest
+from django.utils import timezone
 
 from accounts.models import User, CustomerProfile, DriverProfile, Branch, Business
-from menu.models import Order
-from ratings.models import DriverRating, BranchRating
+from menu.models import Order, OrderEvent
+from ratings.aggregates import fold_deltas, verify
+from ratings.models import DriverRating, BranchRating, RatingDelta
+from ratings.scoring import DEFAULT_SCORE
 from ratings.services import RatingService
 
 
@@ -77,6 +82,7 @@ def test_driver_rating_signals_create_update_delete(order, customer_profile, dri
         review="",
     )
 
+    fold_deltas()
     driver_profile.refresh_from_db()
     assert driver_profile.rating_sum == 4
     assert driver_profile.rating_count == 1
@@ -85,6 +91,7 @@ def test_driver_rating_signals_create_update_delete(order, customer_profile, dri
     rating.stars = 2
     rating.save()
 
+    fold_deltas()
     driver_profile.refresh_from_db()
     assert driver_profile.rating_sum == 2
     assert driver_profile.rating_count == 1
@@ -92,6 +99,7 @@ def test_driver_rating_signals_create_update_delete(order, customer_profile, dri
 
     rating.delete()
 
+    fold_deltas()
     driver_profile.refresh_from_db()
     assert driver_profile.rating_sum == 0
     assert driver_profile.rating_count == 0
@@ -107,6 +115,7 @@ def test_branch_rating_signals_create_update_delete(order, customer_profile, bra
         review="",
     )
 
+    fold_deltas()
     branch.refresh_from_db()
     assert branch.rating_sum == 5
     assert branch.rating_count == 1
@@ -115,6 +124,7 @@ def test_branch_rating_signals_create_update_delete(order, customer_profile, bra
     rating.stars = 3
     rating.save()
 
+    fold_deltas()
     branch.refresh_from_db()
     assert branch.rating_sum == 3
     assert branch.rating_count == 1
@@ -122,6 +132,7 @@ def test_branch_rating_signals_create_update_delete(order, customer_profile, bra
 
     rating.delete()
 
+    fold_deltas()
     branch.refresh_from_db()
     assert branch.rating_sum == 0
     assert branch.rating_count == 0
@@ -179,6 +190,7 @@ def test_submit_for_order_creates_ratings(order, customer_profile, driver_profil
     assert results["driver_rating"].stars == 5
     assert results["branch_rating"].stars == 4
 
+    fold_deltas()
     driver_profile.refresh_from_db()
     branch.refresh_from_db()
 
@@ -204,6 +216,7 @@ def test_submit_for_order_updates_driver_rating(order, customer_profile, driver_
         driver_payload={"stars": 3},
     )
 
+    fold_deltas()
     driver_profile.refresh_from_db()
     assert driver_profile.rating_sum == 3
     assert driver_profile.rating_count == 1
@@ -224,7 +237,128 @@ def test_submit_for_order_updates_branch_rating(order, customer_profile, branch)
         branch_payload={"stars": 2},
     )
 
+    fold_deltas()
     branch.refresh_from_db()
     assert branch.rating_sum == 2
     assert branch.rating_count == 1
     assert branch.avg_rating == 2.0
+
+
+def test_ratings_are_folded_once_and_roll_up_to_the_business(order, customer_profile, driver_profile, branch, restaurant):
+    RatingService.submit_for_order(
+        order=order,
+        rater=customer_profile,
+        driver_payload={"stars": 5},
+        branch_payload={"stars": 4},
+    )
+    # the second save() inside submit_for_order changes nothing and logs nothing
+    assert RatingDelta.objects.count() == 2
+
+    assert fold_deltas() == 2
+    assert fold_deltas() == 0
+    restaurant.refresh_from_db()
+    assert (restaurant.rating_sum, restaurant.rating_count, restaurant.avg_rating) == (4, 1, 4.0)
+    assert verify() == {"driver": [], "branch": [], "business": []}
+
+
+def test_concurrent_ratings_on_one_branch_are_exact(branch, restaurant, driver_profile):
+    import threading
+
+    from django.db import connection
+
+    raters = 24
+    orders = []
+    for n in range(raters):
+        user = User.objects.create(email=f"rater{n}@example.com", name=f"Rater {n}")
+        customer = CustomerProfile.objects.create(user=user)
+        orders.append(Order.objects.create(
+            orderer=customer,
+            branch=branch,
+            driver=driver_profile,
+            delivery_secret_hash=f"secret-c{n}",
+            status="delivered",
+            order_number=100 + n,
+        ))
+
+    start = threading.Barrier(raters + 2)
+    errors = []
+
+    def rate(order, stars):
+        try:
+            start.wait()
+            RatingService.submit_for_order(order=order, rater=order.orderer, branch_payload={"stars": stars})
+            # re-rate: only the difference is logged
+            RatingService.submit_for_order(order=order, rater=order.orderer, branch_payload={"stars": 1 + stars % 5})
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            connection.close()
+
+    def fold():
+        try:
+            start.wait()
+            for _ in range(10):
+                fold_deltas(batch_size=5)
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=rate, args=(order, 1 + n % 5)) for n, order in enumerate(orders)]
+    threads += [threading.Thread(target=fold) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    fold_deltas()
+
+    assert errors == []
+    expected_sum = sum(1 + (1 + n % 5) % 5 for n in range(raters))
+    branch.refresh_from_db()
+    restaurant.refresh_from_db()
+    assert (branch.rating_sum, branch.rating_count) == (expected_sum, raters)
+    assert branch.avg_rating == pytest.approx(expected_sum / raters)
+    assert (restaurant.rating_sum, restaurant.rating_count) == (expected_sum, raters)
+    assert not RatingDelta.objects.exists()
+    assert verify() == {"driver": [], "branch": [], "business": []}
+
+
+def test_verify_reports_and_repairs_drift(order, customer_profile, branch):
+    BranchRating.objects.create(order=order, rater=customer_profile, branch=branch, stars=5)
+    fold_deltas()
+    Branch.objects.filter(pk=branch.pk).update(rating_sum=50, rating_count=3)  # written behind the log's back
+
+    assert verify()["branch"] == [(branch.pk, (50, 3), (5, 1))]
+    verify(fix=True)
+
+    branch.refresh_from_db()
+    assert (branch.rating_sum, branch.rating_count, branch.avg_rating) == (5, 1, 5.0)
+    assert verify()["branch"] == []
+
+
+def test_order_events_and_ratings_move_the_driver_score(order, customer_profile, driver_profile):
+    assert driver_profile.quality_score == DEFAULT_SCORE
+
+    order.estimated_delivery_time = timezone.now() + timedelta(minutes=30)
+    order.save(update_fields=["estimated_delivery_time"])
+    OrderEvent.objects.create(order=order, event_type="picked_up", actor_type="driver", actor_id=driver_profile.id, metadata="code")
+    OrderEvent.objects.create(order=order, event_type="delivered", actor_type="driver", actor_id=driver_profile.id)
+    OrderEvent.objects.create(
+        order=order, event_type="driver_rejected", actor_type="system", metadata={"reason": "timeout", "driver_id": driver_profile.id}
+    )
+
+    driver_profile.refresh_from_db()
+    assert (driver_profile.dispatch_accepts, driver_profile.dispatch_rejects) == (1, 1)
+    assert (driver_profile.timed_deliveries, driver_profile.on_time_deliveries) == (1, 1)
+    after_events = driver_profile.quality_score
+
+    DriverRating.objects.create(order=order, rater=customer_profile, driver=driver_profile, stars=5, review="")
+    fold_deltas()
+    driver_profile.refresh_from_db()
+    assert driver_profile.quality_score > after_events
+
+    OrderEvent.objects.create(
+        order=order, event_type="cancelled", actor_type="driver", metadata={"responsible_party": "driver"}
+    )
+    driver_profile.refresh_from_db()
+    assert driver_profile.driver_cancellations == 1
@@ -0,0 +1,36 @@
+"""Driver quality score (ratings/scoring.py): pure scoring, no database."""
+
+from accounts.models import DriverProfile
+from ratings.scoring import DEFAULT_SCORE, DriverStats, quality_score
+
+
+def test_new_driver_scores_the_model_default():
+    assert quality_score(DriverStats()) == DEFAULT_SCORE
+    assert DriverProfile._meta.get_field("quality_score").default == DEFAULT_SCORE
+
+
+def test_one_bad_order_does_not_sink_a_new_driver():
+    one_star = quality_score(DriverStats(rating_sum=1, rating_count=1))
+    assert DEFAULT_SCORE - 0.05 < one_star < DEFAULT_SCORE
+
+
+def test_score_rewards_every_component():
+    base = DriverStats(rating_sum=200, rating_count=50, dispatch_accepts=50, dispatch_rejects=10, timed_deliveries=50, on_time_deliveries=40)
+    better = [
+        DriverStats(**{**base.__dict__, "rating_sum": 240}),
+        DriverStats(**{**base.__dict__, "dispatch_rejects": 0}),
+        DriverStats(**{**base.__dict__, "on_time_deliveries": 50}),
+    ]
+    worse = DriverStats(**{**base.__dict__, "driver_cancellations": 10})
+
+    for stats in better:
+        assert quality_score(stats) > quality_score(base)
+    assert quality_score(worse) < quality_score(base)
+
+
+def test_score_stays_in_range():
+    perfect = DriverStats(rating_sum=5000, rating_count=1000, dispatch_accepts=1000, timed_deliveries=1000, on_time_deliveries=1000)
+    awful = DriverStats(rating_sum=1000, rating_count=1000, dispatch_rejects=1000, timed_deliveries=1000, driver_cancellations=5000)
+
+    assert 0.95 < quality_score(perfect) <= 1.0
+    assert 0.0 <= quality_score(awful) < 0.1
@@ -0,0 +1,114 @@
+"""
+Referral conversions, applied in batches.
+
+    order delivered  ->  services.record_conversion(): one ReferralConversion
+                         row if the referee has an unconverted referral
+    apply_conversions()  per batch, in one transaction:
+        claim candidate rows (SKIP LOCKED, so concurrent runs take disjoint rows)
+        group them by referrer; per referrer, in a fixed order:
+            lock its ReferralStats row, then its still-unconverted referrals
+            convert those referrals with one UPDATE
+            bump ReferralStats.successful by the number converted
+        queue the referrer's points award for each referral converted (on commit)
+        delete the claimed rows
+
+A campaign burst on one referrer becomes one row lock per batch instead of one
+per completion. Two candidates for the same referee (a second order, or a
+retried request) can only convert it once: the referrer lock serialises the
+batches that touch it, and the referral row locks serialise them with
+convert_referred_user_once() (admin), which does not take the referrer lock.
+
+Cron runs it every minute (`python manage.py apply_referral_conversions --async`).
+"""
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from payments.observability.metrics import increment
+from referrals.models import ProfileReferral, ReferralConversion, ReferralStats
+
+
+def award_key(order_id, referee_profile_id) -> str:
+    # same key the synchronous path used, so history and batches never double-award
+    return f"referred-order:{order_id}:{referee_profile_id}"
+
+
+def _queue_awards(converted):
+    from points.tasks import award_referred_first_order_task
+
+    for referee_profile_id, sale_id, key in converted:
+        award_referred_first_order_task.delay(referred_id=referee_profile_id, sale_id=sale_id, idempotency_key=key)
+
+
+@transaction.atomic
+def apply_batch(batch_size: int) -> int:
+    rows = list(
+        ReferralConversion.objects.select_for_update(skip_locked=True, of=("self",))
+        .order_by("id")
+        .values_list("id", "referee_user_id", "order_id", "order__sale_id")[:batch_size]
+    )
+    if not rows:
+        return 0
+
+    # first candidate per referee wins: its order is the one rewarded
+    first = {}
+    for _, referee_user_id, order_id, sale_id in rows:
+        first.setdefault(referee_user_id, (order_id, sale_id))
+
+    referrals = defaultdict(list)
+    for referral_id, referrer_user_id, referee_user_id, referee_profile_id in ProfileReferral.objects.filter(
+        referee_user_id__in=first, converted_at__isnull=True
+    ).values_list("id", "referrer_user_id", "referee_user_id", "referee_profile_id"):
+        referrals[referrer_user_id].append((referral_id, referee_user_id, referee_profile_id))
+
+    now = timezone.now()
+    converted_total = 0
+    awards = []
+    for referrer_user_id in sorted(referrals, key=str):
+        ReferralStats.objects.get_or_create(user_id=referrer_user_id)
+        ReferralStats.objects.select_for_update().filter(user_id=referrer_user_id).values_list("pk").get()
+
+        candidates = {referral_id: (referee_user_id, profile_id) for referral_id, referee_user_id, profile_id in referrals[referrer_user_id]}
+        # re-read and lock: an earlier batch or an admin conversion may have converted some of these
+        still_open = list(
+            ProfileReferral.objects.select_for_update()
+            .filter(id__in=candidates, converted_at__isnull=True)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        if not still_open:
+            continue
+        converted = ProfileReferral.objects.filter(id__in=still_open, converted_at__isnull=True).update(converted_at=now)
+        if converted != len(still_open):  # cannot happen while the rows are locked; award only what this batch converted
+            still_open = list(
+                ProfileReferral.objects.filter(id__in=still_open, converted_at=now).values_list("id", flat=True)
+            )
+        ReferralStats.objects.filter(user_id=referrer_user_id).update(successful=F("successful") + converted)
+        converted_total += converted
+
+        for referral_id in still_open:
+            referee_user_id, referee_profile_id = candidates[referral_id]
+            order_id, sale_id = first[referee_user_id]
+            if sale_id is not None:
+                awards.append((referee_profile_id, sale_id, award_key(order_id, referee_profile_id)))
+
+    ReferralConversion.objects.filter(id__in=[row[0] for row in rows]).delete()
+    if awards:
+        transaction.on_commit(lambda: _queue_awards(awards))
+    increment("referrals.conversions_total", value=converted_total)
+    return len(rows)
+
+
+def apply_conversions(batch_size: int | None = None, max_batches: int | None = None) -> int:
+    batch_size = batch_size or getattr(settings, "REFERRAL_CONVERSION_BATCH_SIZE", 1000)
+    applied = batches = 0
+    while max_batches is None or batches < max_batches:
+        count = apply_batch(batch_size)
+        if not count:
+            break
+        applied += count
+        batches += 1
+    return applied
@@ -0,0 +1,30 @@
+"""
+Referral conversion batches for cron (same approach as fold_rating_deltas):
+
+    * * * * *  python manage.py apply_referral_conversions --async
+
+Converts the referrals behind recorded completions, bumps the referrers'
+stats and queues their points awards (referrals/conversions.py).
+"""
+from django.core.management.base import BaseCommand
+
+from referrals.conversions import apply_conversions
+
+
+class Command(BaseCommand):
+    help = "Apply pending referral conversion candidates in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument("--async", dest="run_async", action="store_true", help="Queue the celery task instead.")
+
+    def handle(self, *args, **options):
+        if options["run_async"]:
+            from referrals.tasks import apply_referral_conversions
+
+            apply_referral_conversions.delay()
+            self.stdout.write("Queued.")
+            return
+
+        applied = apply_conversions(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Applied {applied} referral conversion candidates."))
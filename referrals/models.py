@@ -89,3 +89,51 @@ class ReferralPayout(AbstractBaseModel):
 
     def __str__(self):
         return f"Payout({self.user_id}) units={self.units_paid}"
+
+
+class ReferralConversion(models.Model):
+    """
+    A completion that may convert the referee's referral, appended by
+    services.record_conversion() and applied in batches by
+    referrals/conversions.py. Applied rows are deleted in the batch's
+    transaction; a referral converts (and is rewarded) at most once however
+    many candidates it gets.
+    """
+    referee_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+        db_constraint=False,
+    )
+    order = models.ForeignKey(
+        "menu.Order",
+        on_delete=models.CASCADE,
+        related_name="+",
+        null=True,
+        blank=True,
+        db_constraint=False,
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"ReferralConversion({self.referee_user_id}, order={self.order_id})"
+
+
+class ReferralStats(models.Model):
+    """Per-referrer counters behind services.referral_stats()."""
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="referral_stats",
+    )
+    total = models.PositiveIntegerField(default=0)
+    successful = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @property
+    def pending(self):
+        return self.total - self.successful
+
+    def __str__(self):
+        return f"ReferralStats({self.user_id}) {self.successful}/{self.total}"
@@ -5,8 +5,8 @@ import hashlib
 import json
 
 from accounts.models import ProfileBase
-from referrals.models import ProfileReferral, ReferralPayout
-from django.db.models import Count, Q
+from referrals.models import ProfileReferral, ReferralConversion, ReferralPayout, ReferralStats
+from django.db.models import F
 
 REFERRALS_PER_UNIT = 10
 
@@ -39,37 +39,36 @@ def apply_referral_code(profile, code: str) -> ProfileReferral:
     if referrer_profile.user_id == referred_profile.user_id:
         raise ValidationError("You cannot use your own referral code.")
 
-    return ProfileReferral.objects.create(
+    referral = ProfileReferral.objects.create(
         referrer_profile=referrer_profile,
         referee_profile=referred_profile,
         referrer_user=referrer_profile.user,
         referee_user=referred_profile.user,
     )
+    ReferralStats.objects.get_or_create(user=referrer_profile.user)
+    ReferralStats.objects.filter(user=referrer_profile.user).update(total=F("total") + 1)
+    return referral
+
+
+def _stats(profile) -> ReferralStats:
+    return ReferralStats.objects.filter(user_id=profile.user_id).first() or ReferralStats(user_id=profile.user_id)
 
 
 def referral_count(profile) -> int:
-    return ProfileReferral.objects.filter(referrer_user=profile.user).count()
+    return _stats(profile).total
 
 
 def successful_referrals(profile) -> int:
-    return ProfileReferral.objects.filter(
-        referrer_user=profile.user,
-        converted_at__isnull=False,
-    ).count()
+    return _stats(profile).successful
 
 
 def referral_stats(profile):
-    qs = ProfileReferral.objects.filter(referrer_user=profile.user)
-
-    stats = qs.aggregate(
-        total=Count("id"),
-        successful=Count("id", filter=Q(converted_at__isnull=False)),
-    )
-
+    """Counters kept by apply_referral_code() and the conversion batches (conversions.py)."""
+    stats = _stats(profile)
     return {
-        "total": stats["total"],
-        "successful": stats["successful"],
-        "pending": stats["total"] - stats["successful"],
+        "total": stats.total,
+        "successful": stats.successful,
+        "pending": stats.pending,
     }
 
 
@@ -79,18 +78,15 @@ def referred_by(user):
     ).select_related("referrer_profile__user").first()
 
 
-@transaction.atomic
-def convert_referral_once(*, referee_profile) -> bool:
-    try:
-        referral = ProfileReferral.objects.select_for_update().get(referee_user=referee_profile.user)
-    except ProfileReferral.DoesNotExist:
-        return False
-
-    if referral.converted_at is not None:
+def record_conversion(*, referee_profile, order=None) -> bool:
+    """
+    Note a completion that converts the referee's referral, if it has one still
+    unconverted. Nothing is locked here; conversions.apply_conversions() converts
+    it, bumps the referrer's stats and queues the points award, exactly once.
+    """
+    if not ProfileReferral.objects.filter(referee_user_id=referee_profile.user_id, converted_at__isnull=True).exists():
         return False
-
-    referral.converted_at = timezone.now()
-    referral.save(update_fields=["converted_at"])
+    ReferralConversion.objects.create(referee_user_id=referee_profile.user_id, order=order)
     return True
 
 ## Admin section
@@ -120,6 +116,8 @@ def convert_referred_user_once(*, referee_user):
 
     referral.converted_at = timezone.now()
     referral.save(update_fields=["converted_at"])
+    ReferralStats.objects.get_or_create(user_id=referral.referrer_user_id)
+    ReferralStats.objects.filter(user_id=referral.referrer_user_id).update(successful=F("successful") + 1)
     return True
 
 
@@ -0,0 +1,9 @@
+from celery import shared_task
+
+from referrals.conversions import apply_conversions
+
+
+@shared_task(name="referrals.apply_referral_conversions", acks_late=True)
+def apply_referral_conversions():
+    # a bounded run; whatever is left waits for the next minute
+    return apply_conversions(max_batches=20)
@@ -0,0 +1,162 @@
+"""
+Referral conversions recorded per completion and applied in batches (referrals/conversions.py).
+
+Goals covered here:
+- a completion only records a candidate; the batch converts, counts and queues the award;
+- a referee converts (and its referrer is rewarded) once, however many candidates it gets;
+- concurrent completions and concurrent batches on one referrer still convert and reward each referral exactly once;
+- an admin conversion racing a batch is not counted or rewarded twice.
+"""
+import threading
+
+import pytest
+from django.db import connection
+
+from accounts.models import Branch, Business, CustomerProfile, User
+from menu.models import Order
+from payments.models import Sale
+from points import tasks as points_tasks
+from referrals.conversions import apply_conversions, award_key
+from referrals.models import ProfileReferral, ReferralConversion, ReferralStats
+from referrals.services import apply_referral_code, convert_referred_user_once, record_conversion, referral_stats
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+def _customer(email):
+    return CustomerProfile.objects.create(user=User.objects.create_user(email=email, password="x"))
+
+
+@pytest.fixture
+def referrer():
+    return _customer("referrer@gmail.com")
+
+
+@pytest.fixture
+def awards(monkeypatch):
+    queued = []
+    monkeypatch.setattr(points_tasks.award_referred_first_order_task, "delay", lambda **kwargs: queued.append(kwargs))
+    return queued
+
+
+def _refer(referrer, n, prefix="referee"):
+    referees = [_customer(f"{prefix}-{i}@gmail.com") for i in range(n)]
+    for referee in referees:
+        apply_referral_code(referee, referrer.referral_code)
+    return referees
+
+
+def _order(referee, number):
+    branch = Branch.objects.create(
+        business=Business.objects.create(business_name=f"Biz {number}"), name="Main", address="1 Test Street"
+    )
+    sale = Sale.objects.create(
+        reference=f"SALE_REF_{number}",
+        payer=referee.user,
+        business_owner=User.objects.create_user(email=f"owner-{number}@gmail.com", password="x"),
+        total_amount=10000,
+        status="in_escrow",
+    )
+    return Order.objects.create(
+        orderer=referee, branch=branch, sale=sale, delivery_secret_hash=f"s-{number}", status="delivered", order_number=number
+    )
+
+
+def test_completion_is_applied_by_the_batch(referrer, awards):
+    (referee,) = _refer(referrer, 1)
+    order = _order(referee, 1)
+
+    assert record_conversion(referee_profile=referee, order=order) is True
+    assert ProfileReferral.objects.get(referee_user=referee.user).converted_at is None
+    assert referral_stats(referrer) == {"total": 1, "successful": 0, "pending": 1}
+
+    assert apply_conversions() == 1
+
+    assert ProfileReferral.objects.get(referee_user=referee.user).converted_at is not None
+    assert referral_stats(referrer) == {"total": 1, "successful": 1, "pending": 0}
+    assert awards == [
+        {
+            "referred_id": referee.id,
+            "sale_id": order.sale_id,
+            "idempotency_key": f"referred-order:{order.id}:{referee.id}",
+        }
+    ]
+    assert not ReferralConversion.objects.exists()
+
+
+def test_repeat_completions_convert_and_reward_once(referrer, awards):
+    (referee,) = _refer(referrer, 1)
+    first, second = _order(referee, 1), _order(referee, 2)
+
+    record_conversion(referee_profile=referee, order=first)
+    record_conversion(referee_profile=referee, order=first)  # retried request
+    apply_conversions(batch_size=1)  # each candidate in its own batch
+    apply_conversions()
+
+    assert record_conversion(referee_profile=referee, order=second) is False  # nothing left to convert
+    assert [award["sale_id"] for award in awards] == [first.sale_id]
+    assert ReferralStats.objects.get(user=referrer.user).successful == 1
+
+
+def test_users_without_a_referral_record_nothing(referrer):
+    assert record_conversion(referee_profile=referrer) is False
+    assert not ReferralConversion.objects.exists()
+
+
+def test_concurrent_completions_on_one_referrer_convert_exactly_once(referrer, awards):
+    referees = _refer(referrer, 20)
+    orders = {referee.id: _order(referee, number) for number, referee in enumerate(referees, start=1)}
+    errors, start = [], threading.Barrier(8)
+
+    def complete(chunk):
+        try:
+            start.wait()
+            for referee in chunk:
+                for _ in range(3):  # duplicate completions of the same referee
+                    record_conversion(referee_profile=referee, order=orders[referee.id])
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+        finally:
+            connection.close()
+
+    def fold():
+        try:
+            start.wait()
+            for _ in range(20):
+                apply_conversions(batch_size=5)
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=complete, args=(referees[i::4],)) for i in range(4)]
+    threads += [threading.Thread(target=fold) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    apply_conversions()
+
+    assert errors == []
+    assert ProfileReferral.objects.filter(referrer_user=referrer.user, converted_at__isnull=True).count() == 0
+    assert referral_stats(referrer) == {"total": 20, "successful": 20, "pending": 0}
+    assert not ReferralConversion.objects.exists()
+    assert sorted(award["idempotency_key"] for award in awards) == sorted(
+        award_key(orders[referee.id].id, referee.id) for referee in referees
+    )
+    assert sorted(award["sale_id"] for award in awards) == sorted(order.sale_id for order in orders.values())
+
+
+def test_admin_conversion_racing_a_batch_is_counted_once(referrer, awards):
+    from django.db import transaction
+
+    (referee,) = _refer(referrer, 1)
+    record_conversion(referee_profile=referee, order=_order(referee, 1))
+    with transaction.atomic():
+        assert convert_referred_user_once(referee_user=referee.user) is True
+
+    apply_conversions()
+
+    assert referral_stats(referrer) == {"total": 1, "successful": 1, "pending": 0}
+    assert awards == []  # the admin path rewards on its own terms
+    assert not ReferralConversion.objects.exists()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import Counter
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from requests.adapters import BaseAdapter
+
+
+class FakeDojah(BaseAdapter):
+    """
+    Local stand-in for the Dojah KYC API, mounted on a requests.Session as a
+    transport adapter, so the gateway's session, timeouts and retries run for
+    real without leaving the process.
+
+    `calls` counts requests per path and `timeouts` records the timeout each
+    request was sent with. `latency` simulates the round trip; a request whose
+    latency exceeds its read timeout raises ReadTimeout. The next `fail_next`
+    requests answer `fail_status` (or raise ConnectTimeout when it is None),
+    and identifiers in `unknown` answer 404.
+    """
+
+    def __init__(self, latency: float = 0.0, fail_next: int = 0, fail_status: int | None = 503, unknown=()):
+        super().__init__()
+        self.latency = latency
+        self.fail_next = fail_next
+        self.fail_status = fail_status
+        self.unknown = set(unknown)
+        self.calls: Counter = Counter()
+        self.timeouts: list = []
+        self._lock = threading.Lock()
+
+    def session(self) -> requests.Session:
+        session = requests.Session()
+        session.mount("https://", self)
+        return session
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        url = urlparse(request.url)
+        with self._lock:
+            self.calls[url.path] += 1
+            self.timeouts.append(timeout)
+            failing = self.fail_next > 0
+            if failing:
+                self.fail_next -= 1
+
+        if failing and self.fail_status is None:
+            raise requests.ConnectTimeout("fake connect timeout", request=request)
+        read_timeout = timeout[1] if isinstance(timeout, tuple) else timeout
+        if self.latency:
+            if read_timeout is not None and self.latency > read_timeout:
+                time.sleep(read_timeout)
+                raise requests.ReadTimeout("fake read timeout", request=request)
+            time.sleep(self.latency)
+        if failing:
+            return self._response(request, self.fail_status, {"error": "provider error"})
+
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if request.body:
+            params.update(json.loads(request.body))
+        identifier = next((params[k] for k in ("nin", "bvn", "plate_number", "tin", "rc_number", "account_number") if k in params), None)
+        if identifier in self.unknown:
+            return self._response(request, 404, {"error": "Not found"})
+        return self._response(request, 200, {"entity": {"path": url.path, **params, "verified": True}})
+
+    def _response(self, request, status: int, body: dict):
+        response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(body).encode()
+        response.headers["Content-Type"] = "application/json"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
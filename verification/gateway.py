@@ -0,0 +1,187 @@
+"""
+Outbound gateway to the KYC provider (Dojah).
+
+    gateway.get("/api/v1/kyc/nin", params={"nin": nin}, cache_as=("nin", nin))
+
+- One pooled `requests.Session` per process with explicit (connect, read)
+  timeouts, so a hung provider costs a worker DOJAH_READ_TIMEOUT at most.
+- Timeouts, connection errors, 429 and 5xx are retried DOJAH_MAX_RETRIES times
+  with full-jitter backoff. Other 4xx answers are the provider's verdict and
+  are raised as requests.HTTPError straight away.
+- A shared circuit breaker ("kyc:dojah", common/utils/circuit.py) fails calls
+  fast with VerificationUnavailableError while the provider is down.
+- Successful lookups are cached for VERIFICATION_CACHE_TTL, encrypted, under an
+  HMAC of the identifier, so a repeated BVN/NIN/plate lookup is not paid for
+  twice and the cache never holds a readable identifier or identity record.
+"""
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import random
+import threading
+import time
+
+import requests
+from cryptography.fernet import Fernet, InvalidToken
+from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+
+from common.utils.circuit import CircuitBreaker
+from payments.observability.metrics import increment, observe_ms
+
+logger = logging.getLogger(__name__)
+
+DOJAH_BASE_URL = "https://api.dojah.io"
+BREAKER_NAME = "kyc:dojah"
+CACHE_KEY = "kyc:result:{}:{}"
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class VerificationUnavailableError(Exception):
+    """The provider is down (breaker open) or kept failing through every retry."""
+
+
+# ===== RESULT CACHE =====
+
+class ResultCache:
+    """Encrypted provider results keyed by HMAC(check, identifier)."""
+
+    def __init__(self, secret=None, ttl=None):
+        self.secret = (secret or getattr(settings, "VERIFICATION_CACHE_SECRET", "") or settings.SECRET_KEY).encode()
+        self.ttl = ttl or getattr(settings, "VERIFICATION_CACHE_TTL", 7 * 24 * 60 * 60)
+        self._fernet = Fernet(base64.urlsafe_b64encode(hashlib.sha256(b"kyc-cache:" + self.secret).digest()))
+
+    def key(self, check: str, identifier) -> str:
+        canonical = json.dumps(identifier, sort_keys=True, separators=(",", ":"), default=str)
+        digest = hmac.new(self.secret, f"{check}:{canonical}".encode(), hashlib.sha256).hexdigest()
+        return CACHE_KEY.format(check, digest)
+
+    def encrypt(self, value) -> str:
+        return self._fernet.encrypt(json.dumps(value, default=str).encode()).decode()
+
+    def decrypt(self, token: str):
+        try:
+            return json.loads(self._fernet.decrypt(token.encode()))
+        except (InvalidToken, ValueError):
+            return None
+
+    def get(self, check: str, identifier):
+        token = cache.get(self.key(check, identifier))
+        return self.decrypt(token) if token else None
+
+    def set(self, check: str, identifier, value):
+        cache.set(self.key(check, identifier), self.encrypt(value), timeout=self.ttl)
+
+
+# ===== GATEWAY =====
+
+class VerificationGateway:
+    def __init__(self, base_url=None, session=None, breaker=None, result_cache=None):
+        self.base_url = base_url or getattr(settings, "DOJAH_BASE_URL", DOJAH_BASE_URL)
+        self.timeout = (
+            getattr(settings, "DOJAH_CONNECT_TIMEOUT", 3),
+            getattr(settings, "DOJAH_READ_TIMEOUT", 15),
+        )
+        self.max_retries = getattr(settings, "DOJAH_MAX_RETRIES", 2)
+        self.backoff = getattr(settings, "DOJAH_RETRY_BACKOFF", 0.25)
+        self.breaker = breaker or CircuitBreaker(BREAKER_NAME)
+        self.cache = result_cache or ResultCache()
+        self._session = session
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            session = requests.Session()
+            pool = getattr(settings, "DOJAH_POOL_SIZE", 10)
+            # retries are ours (with jitter and the breaker), not urllib3's
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool, max_retries=0))
+            session.headers.update({"Content-Type": "application/json"})
+            self._session = session
+        return self._session
+
+    def _headers(self):
+        return {"AppId": settings.DOJAH_APP_ID, "Authorization": settings.DOJAH_SECRET_KEY}
+
+    def _sleep(self, attempt: int):
+        time.sleep(random.uniform(0, self.backoff * (2 ** attempt)))
+
+    def _send(self, method: str, path: str, **kwargs) -> dict:
+        if not self.breaker.allow():
+            increment("kyc.provider_calls_total", tags={"outcome": "breaker_open"})
+            raise VerificationUnavailableError("Verification provider is unavailable, try again shortly")
+
+        url = f"{self.base_url}{path}"
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self._sleep(attempt - 1)
+            started = time.perf_counter()
+            try:
+                response = self.session.request(method, url, headers=self._headers(), timeout=self.timeout, **kwargs)
+            except (requests.Timeout, requests.ConnectionError) as exc:
+                last_error = exc
+                increment("kyc.provider_calls_total", tags={"outcome": "network_error"})
+                continue
+            finally:
+                observe_ms("kyc.provider_latency_ms", (time.perf_counter() - started) * 1000)
+
+            if response.status_code in RETRYABLE_STATUS:
+                last_error = requests.HTTPError(f"{response.status_code} from {path}", response=response)
+                increment("kyc.provider_calls_total", tags={"outcome": "server_error"})
+                continue
+
+            self.breaker.record_success()  # the provider answered, even if the answer is a 4xx
+            increment("kyc.provider_calls_total", tags={"outcome": "ok" if response.ok else "client_error"})
+            response.raise_for_status()
+            return response.json()
+
+        self.breaker.record_failure()
+        logger.warning(f"[kyc] {method} {path} failed after {self.max_retries + 1} attempts: {last_error}")
+        raise VerificationUnavailableError("Verification provider did not respond") from last_error
+
+    def _cached(self, cache_as, fetch):
+        if cache_as is None:
+            return fetch()
+        check, identifier = cache_as
+        hit = self.cache.get(check, identifier)
+        if hit is not None:
+            increment("kyc.cache_total", tags={"check": check, "outcome": "hit"})
+            return hit
+        increment("kyc.cache_total", tags={"check": check, "outcome": "miss"})
+        result = fetch()
+        self.cache.set(check, identifier, result)
+        return result
+
+    def get(self, path: str, params=None, cache_as=None) -> dict:
+        """:param cache_as: (check name, identifier) to serve repeats from the result cache"""
+        return self._cached(cache_as, lambda: self._send("GET", path, params=params))
+
+    def post(self, path: str, payload=None, cache_as=None) -> dict:
+        return self._cached(cache_as, lambda: self._send("POST", path, json=payload))
+
+    def cached(self, check: str, identifier, fetch) -> dict:
+        """Result cache in front of another client (the Paystack BVN lookup)."""
+        return self._cached((check, identifier), fetch)
+
+
+_gateway = None
+_gateway_lock = threading.Lock()
+
+
+def get_gateway() -> VerificationGateway:
+    global _gateway
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                _gateway = VerificationGateway()
+    return _gateway
+
+
+def set_gateway(gateway):
+    """Swap the process-wide gateway (tests point it at verification/fake.py)."""
+    global _gateway
+    _gateway = gateway
@@ -0,0 +1,130 @@
+"""
+Asynchronous verification checks.
+
+    POST /api/verify/jobs/              {"check": "face_match", ...}  -> 202 {"job_id", "status": "pending"}
+    GET  /api/verify/jobs/<job_id>/     -> {"job_id", "check", "status", "result" | "error"}
+
+Slow checks (face match, CAC lookups) need not hold a web worker: submit()
+stores the job and queues `verification.run_check`, which calls the same
+services as the synchronous endpoints and pushes `verification.status` to the
+submitter's ws/notifications/ socket when the job finishes. The socket message
+carries no identity data; the client fetches the result from the status URL.
+
+Jobs live in the cache, encrypted like cached results (gateway.ResultCache),
+for VERIFICATION_JOB_TTL. This app keeps no durable state; the outcome the
+platform acts on is stored by `accounts`.
+"""
+import logging
+import uuid
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from . import services
+from .gateway import ResultCache
+from .serializers import (
+    AccountNumberSerializer,
+    BusinessBVNSerializer,
+    BVNValidationSerializer,
+    BVNVerificationSerializer,
+    FaceMatchSerializer,
+    NINVerificationSerializer,
+    PlateNumberSerializer,
+    RCNumberSerializer,
+    TINVerificationSerializer,
+)
+
+logger = logging.getLogger(__name__)
+
+JOB_KEY = "kyc:job:{}"
+
+PENDING = "pending"
+COMPLETED = "completed"
+FAILED = "failed"
+
+# check -> (input serializer, call)
+CHECKS = {
+    "nin": (NINVerificationSerializer, lambda d: services.verify_nin(d["nin"])),
+    "bvn": (BVNVerificationSerializer, lambda d: services.verify_bvn(d["bvn"])),
+    "bvn_validate": (
+        BVNValidationSerializer,
+        lambda d: services.validate_bvn(d["bvn"], d.get("first_name"), d.get("last_name"), d.get("dob")),
+    ),
+    "account": (AccountNumberSerializer, lambda d: services.verify_account_number(d["account_number"], d["bank_code"])),
+    "face_match": (
+        FaceMatchSerializer,
+        lambda d: services.match_face_to_name(d["image"], d["first_name"], d["last_name"], d.get("bvn"), d.get("nin")),
+    ),
+    "plate": (PlateNumberSerializer, lambda d: services.verify_plate_number(d["plate_number"])),
+    "tin": (TINVerificationSerializer, lambda d: services.verify_tin(d["tin"])),
+    "rc": (RCNumberSerializer, lambda d: services.verify_rc_number(d["rc_number"])),
+    "business_bvn": (BusinessBVNSerializer, lambda d: services.verify_business_bvn(d["bvn"])),
+}
+
+
+def _ttl():
+    return getattr(settings, "VERIFICATION_JOB_TTL", 24 * 60 * 60)
+
+
+def load(job_id: str) -> dict | None:
+    token = cache.get(JOB_KEY.format(job_id))
+    return ResultCache().decrypt(token) if token else None
+
+
+def _save(job: dict):
+    cache.set(JOB_KEY.format(job["job_id"]), ResultCache().encrypt(job), timeout=_ttl())
+
+
+def public(job: dict) -> dict:
+    data = {"job_id": job["job_id"], "check": job["check"], "status": job["status"], "created_at": job["created_at"]}
+    if job["status"] == COMPLETED:
+        data["result"] = job["result"]
+    elif job["status"] == FAILED:
+        data["error"] = job["error"]
+    return data
+
+
+def submit(check: str, params: dict, user_id) -> dict:
+    """:param params: the check's validated serializer data"""
+    from .tasks import run_check
+
+    job = {
+        "job_id": uuid.uuid4().hex,
+        "check": check,
+        "user_id": user_id,
+        "status": PENDING,
+        "params": {key: str(value) if value is not None else None for key, value in params.items()},
+        "created_at": timezone.now().isoformat(),
+    }
+    _save(job)
+    run_check.delay(job["job_id"])
+    return job
+
+
+def finish(job: dict, result=None, error=None) -> dict:
+    from notifications.realtime import push_verification_status
+
+    job.pop("params", None)  # the identifiers are not needed once the check has run
+    job.update(status=FAILED if error is not None else COMPLETED, result=result, error=error)
+    _save(job)
+    push_verification_status(job["user_id"], job["job_id"], job["check"], job["status"])
+    return job
+
+
+def run(job_id: str) -> dict | None:
+    """Run a pending job. VerificationUnavailableError propagates so the task can retry it."""
+    job = load(job_id)
+    if job is None or job["status"] != PENDING:
+        return job
+    _, call = CHECKS[job["check"]]
+    try:
+        result = call(job["params"])
+    except requests.HTTPError as exc:
+        try:
+            detail = exc.response.json()
+        except Exception:
+            detail = str(exc)
+        return finish(job, error=detail)
+    return finish(job, result=result)
@@ -1,31 +1,21 @@
-import requests
-from django.conf import settings
 from payments.integrations.paystack.client import PaystackClient
 
-DOJAH_BASE_URL = "https://api.dojah.io"
+from .gateway import get_gateway
 
 paystack_client = PaystackClient()
 
-def _headers():
-    return {
-        "AppId": settings.DOJAH_APP_ID,
-        "Authorization": settings.DOJAH_SECRET_KEY,
-        "Content-Type": "application/json",
-    }
+# Calls go through verification/gateway.py (pooled session, timeouts, retries,
+# circuit breaker, encrypted result cache). `cache_as` names the check and the
+# identifier a repeat lookup is served from the cache under; face matches are
+# never cached.
 
 
-def _get(path, params=None):
-    url = f"{DOJAH_BASE_URL}{path}"
-    response = requests.get(url, headers=_headers(), params=params)
-    response.raise_for_status()
-    return response.json()
+def _get(path, params=None, cache_as=None):
+    return get_gateway().get(path, params=params, cache_as=cache_as)
 
 
-def _post(path, payload=None):
-    url = f"{DOJAH_BASE_URL}{path}"
-    response = requests.post(url, headers=_headers(), json=payload)
-    response.raise_for_status()
-    return response.json()
+def _post(path, payload=None, cache_as=None):
+    return get_gateway().post(path, payload=payload, cache_as=cache_as)
 
 
 # ──────────────────────────────────────────────
@@ -37,7 +27,7 @@ def verify_nin(nin: str) -> dict:
     Look up a National Identification Number (NIN).
     Returns full identity data tied to the NIN.
     """
-    return _get("/api/v1/kyc/nin", params={"nin": nin})
+    return _get("/api/v1/kyc/nin", params={"nin": nin}, cache_as=("nin", nin))
 
 
 def verify_bvn(bvn: str) -> dict:
@@ -46,7 +36,7 @@ def verify_bvn(bvn: str) -> dict:
     Returns personal details tied to the BVN.
     """
     # return _get("/api/v1/kyc/bvn/full", params={"bvn": bvn})
-    return paystack_client.verfy_bvn(bvn)
+    return get_gateway().cached("bvn", bvn, lambda: paystack_client.verfy_bvn(bvn))
 
 
 def validate_bvn(bvn: str, first_name: str = None, last_name: str = None, dob: str = None) -> dict:
@@ -62,7 +52,7 @@ def validate_bvn(bvn: str, first_name: str = None, last_name: str = None, dob: s
         params["last_name"] = last_name
     if dob:
         params["dob"] = dob
-    return _get("/api/v1/kyc/bvn", params=params)
+    return _get("/api/v1/kyc/bvn", params=params, cache_as=("bvn_validate", params))
 
 
 def verify_account_number(account_number: str, bank_code: str) -> dict:
@@ -71,10 +61,11 @@ def verify_account_number(account_number: str, bank_code: str) -> dict:
     - bank_code: CBN bank code e.g. "044" for Access Bank.
     Returns account name and bank details.
     """
-    return _get("/api/v1/kyc/nuban", params={
+    params = {
         "account_number": account_number,
         "bank_code": bank_code,
-    })
+    }
+    return _get("/api/v1/kyc/nuban", params=params, cache_as=("nuban", params))
 
 
 def match_face_to_name(
@@ -107,7 +98,7 @@ def verify_plate_number(plate_number: str) -> dict:
     Look up a Nigerian vehicle plate number.
     Returns vehicle registration data linked to the plate.
     """
-    return _get("/api/v1/kyc/plate_number", params={"plate_number": plate_number})
+    return _get("/api/v1/kyc/plate_number", params={"plate_number": plate_number}, cache_as=("plate", plate_number))
 
 
 # ──────────────────────────────────────────────
@@ -119,7 +110,7 @@ def verify_tin(tin: str) -> dict:
     Verify a Tax Identification Number (TIN) via FIRS.
     Returns business name, tax office, and registration status.
     """
-    return _get("/api/v1/kyc/tin", params={"tin": tin})
+    return _get("/api/v1/kyc/tin", params={"tin": tin}, cache_as=("tin", tin))
 
 
 def verify_rc_number(rc_number: str) -> dict:
@@ -127,7 +118,7 @@ def verify_rc_number(rc_number: str) -> dict:
     Look up a CAC RC (Registration) Number.
     Returns company name, directors, address, and status.
     """
-    return _get("/api/v1/kyc/cac", params={"rc_number": rc_number})
+    return _get("/api/v1/kyc/cac", params={"rc_number": rc_number}, cache_as=("rc", rc_number))
 
 
 def verify_business_bvn(bvn: str) -> dict:
@@ -135,4 +126,4 @@ def verify_business_bvn(bvn: str) -> dict:
     Verify the BVN of a business owner/director.
     Same as individual BVN lookup but used in a business KYB context.
     """
-    return _get("/api/v1/kyc/bvn/full", params={"bvn": bvn})
+    return _get("/api/v1/kyc/bvn/full", params={"bvn": bvn}, cache_as=("bvn_full", bvn))
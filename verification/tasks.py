@@ -0,0 +1,26 @@
+from celery import shared_task
+import logging
+
+from .gateway import VerificationUnavailableError
+from . import jobs
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    bind=True,
+    name="verification.run_check",
+    max_retries=5,
+)
+def run_check(self, job_id):
+    """Run one submitted verification job (verification/jobs.py)."""
+    try:
+        jobs.run(job_id)
+    except VerificationUnavailableError as exc:
+        if self.request.retries >= self.max_retries:
+            job = jobs.load(job_id)
+            if job and job["status"] == jobs.PENDING:
+                jobs.finish(job, error="Verification provider unavailable")
+            logger.warning(f"[kyc] job {job_id} gave up: {exc}")
+            return
+        raise self.retry(exc=exc, countdown=min(2 ** self.request.retries * 10, 300))
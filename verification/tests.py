@@ -0,0 +1,146 @@
+"""
+KYC gateway against a local fake provider (verification/fake.py).
+
+Goals covered here:
+- calls carry explicit connect/read timeouts and a slow provider costs at most the read timeout;
+- transient failures are retried, provider verdicts (4xx) are not;
+- repeated failures open the breaker and calls fail fast with 503;
+- repeat lookups are served from the cache, which holds neither the identifier nor the record in clear;
+- async jobs run through the task, can be polled by their owner only, and notify the owner's socket.
+"""
+import time
+
+import pytest
+import requests
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from common.utils.circuit import CircuitBreaker
+from verification import gateway as gateway_module
+from verification import jobs, services, tasks
+from verification.fake import FakeDojah
+from verification.gateway import VerificationGateway, VerificationUnavailableError
+
+NIN = "12345678901"
+
+
+@pytest.fixture
+def provider(settings):
+    settings.DOJAH_CONNECT_TIMEOUT = 1
+    settings.DOJAH_READ_TIMEOUT = 0.2
+    settings.DOJAH_MAX_RETRIES = 2
+    settings.DOJAH_RETRY_BACKOFF = 0
+    settings.PROVIDER_BREAKER_THRESHOLD = 2
+    cache.clear()
+    fake = FakeDojah()
+    gateway_module.set_gateway(VerificationGateway(session=fake.session()))
+    yield fake
+    gateway_module.set_gateway(None)
+    cache.clear()
+
+
+def test_calls_are_bounded_by_explicit_timeouts(provider):
+    provider.latency = 5
+
+    started = time.monotonic()
+    with pytest.raises(VerificationUnavailableError):
+        services.verify_nin(NIN)
+
+    assert time.monotonic() - started < 1.5  # three attempts at the 0.2s read timeout, not 15s
+    assert provider.timeouts == [(1, 0.2)] * 3
+
+
+def test_transient_failures_are_retried(provider):
+    provider.fail_next = 2
+
+    assert services.verify_plate_number("ABC123XY")["entity"]["verified"] is True
+    assert provider.calls["/api/v1/kyc/plate_number"] == 3
+
+
+def test_provider_verdicts_are_not_retried_or_cached(provider):
+    provider.unknown = {NIN}
+
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            services.verify_nin(NIN)
+
+    assert provider.calls["/api/v1/kyc/nin"] == 2
+    assert not CircuitBreaker(gateway_module.BREAKER_NAME).is_open
+
+
+def test_breaker_opens_and_fails_fast(provider):
+    provider.fail_next, provider.fail_status = 100, None
+
+    for _ in range(2):
+        with pytest.raises(VerificationUnavailableError):
+            services.verify_tin("TIN-1")
+    calls = provider.calls["/api/v1/kyc/tin"]
+    with pytest.raises(VerificationUnavailableError):
+        services.verify_tin("TIN-1")
+
+    assert calls == 6
+    assert provider.calls["/api/v1/kyc/tin"] == calls
+
+
+def test_repeat_lookups_come_from_the_encrypted_cache(provider):
+    first = services.verify_nin(NIN)
+    second = services.verify_nin(NIN)
+
+    assert first == second
+    assert provider.calls["/api/v1/kyc/nin"] == 1
+
+    key = gateway_module.get_gateway().cache.key("nin", NIN)
+    stored = cache.get(key)
+    assert NIN not in key and NIN not in stored
+
+
+@pytest.mark.django_db
+def test_sync_view_returns_503_while_provider_is_down(provider):
+    provider.fail_next, provider.fail_status = 100, 503
+    client = APIClient()
+    client.force_authenticate(User.objects.create_user(email="kyc-down@gmail.com", password="x"))
+
+    statuses = [client.post("/api/verify/driver/nin/", {"nin": NIN}, format="json").status_code for _ in range(3)]
+
+    assert statuses == [503, 503, 503]
+    assert provider.calls["/api/v1/kyc/nin"] == 6  # the third request never reached the provider
+
+
+@pytest.mark.django_db
+def test_async_job_runs_and_notifies_its_owner(provider, monkeypatch):
+    from notifications import realtime
+
+    pushed = []
+    monkeypatch.setattr(realtime, "_group_send", lambda group, message: pushed.append((group, message)))
+    monkeypatch.setattr(tasks.run_check, "delay", tasks.run_check)
+    owner = User.objects.create_user(email="kyc-owner@gmail.com", password="x")
+    other = User.objects.create_user(email="kyc-other@gmail.com", password="x")
+    client = APIClient()
+    client.force_authenticate(owner)
+
+    response = client.post("/api/verify/jobs/", {"check": "rc", "rc_number": "RC123"}, format="json")
+
+    assert response.status_code == 202
+    job_id = response.data["data"]["job_id"]
+    status = client.get(f"/api/verify/jobs/{job_id}/")
+    assert status.data["data"]["status"] == jobs.COMPLETED
+    assert status.data["data"]["result"]["entity"]["rc_number"] == "RC123"
+    assert pushed == [
+        (
+            realtime.get_user_notifications_group_name(owner.id),
+            {"type": "verification_status", "job_id": job_id, "check": "rc", "status": "completed"},
+        )
+    ]
+
+    client.force_authenticate(other)
+    assert client.get(f"/api/verify/jobs/{job_id}/").status_code == 404
+
+
+@pytest.mark.django_db
+def test_async_job_rejects_unknown_checks_and_bad_input(provider):
+    client = APIClient()
+    client.force_authenticate(User.objects.create_user(email="kyc-bad@gmail.com", password="x"))
+
+    assert client.post("/api/verify/jobs/", {"check": "dna"}, format="json").status_code == 400
+    assert client.post("/api/verify/jobs/", {"check": "nin", "nin": "1"}, format="json").status_code == 400
@@ -1,8 +1,7 @@
 from django.urls import path
 from . import views
 
-# Include this in your project's urls.py:
-# path("api/verify/", include("dojah_verification.urls")),
+# Included from api/urls.py as "api/verify/".
 
 urlpatterns = [
     # ── Driver Verifications ──────────────────────────────────────
@@ -17,4 +16,8 @@ urlpatterns = [
     path("business/tin/",        views.TINVerificationView.as_view(),         name="verify-business-tin"),
     path("business/rc/",         views.RCNumberVerificationView.as_view(),    name="verify-business-rc"),
     path("business/bvn/",        views.BusinessBVNVerificationView.as_view(), name="verify-business-bvn"),
+
+    # ── Async checks ──────────────────────────────────────────────
+    path("jobs/",                views.VerificationJobView.as_view(),         name="verify-job-submit"),
+    path("jobs/<str:job_id>/",   views.VerificationJobStatusView.as_view(),   name="verify-job-status"),
 ]
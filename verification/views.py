@@ -1,4 +1,5 @@
 import requests
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -14,7 +15,8 @@ from .serializers import (
     RCNumberSerializer,
     BusinessBVNSerializer,
 )
-from . import services
+from . import jobs, services
+from .gateway import VerificationUnavailableError
 
 
 def _dojah_error(exc: requests.HTTPError) -> Response:
@@ -29,6 +31,15 @@ def _dojah_error(exc: requests.HTTPError) -> Response:
     )
 
 
+def _unavailable(exc: VerificationUnavailableError) -> Response:
+    """Provider down or timing out: tell the client to retry instead of holding the worker."""
+    return Response(
+        {"success": False, "error": str(exc)},
+        status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        headers={"Retry-After": "30"},
+    )
+
+
 # ──────────────────────────────────────────────
 # DRIVER VIEWS
 # ──────────────────────────────────────────────
@@ -39,6 +50,8 @@ class NINVerificationView(APIView):
     Verify a driver's National Identification Number.
     """
 
+    permission_classes = [IsAuthenticated]
+
     def post(self, request):
         serializer = NINVerificationSerializer(data=request.data)
         if not serializer.is_valid():
@@ -49,6 +62,8 @@ class NINVerificationView(APIView):
             return Response({"success": True, "data": result})
         except requests.HTTPError as exc:
             return _dojah_error(exc)
+        except VerificationUnavailableError as exc:
+            return _unavailable(exc)
 
 
 class BVNVerificationView(APIView):
@@ -57,6 +72,8 @@ class BVNVerificationView(APIView):
     Look up a driver's BVN and return full identity details.
     """
 
+    permission_classes = [IsAuthenticated]
+
     def post(self, request):
         serializer = BVNVerificationSerializer(data=request.data)
         if not serializer.is_valid():
@@ -67,6 +84,8 @@ class BVNVerificationView(APIView):
             return Response({"success": True, "data": result})
         except requests.HTTPError as exc:
             return _dojah_error(exc)
+        except VerificationUnavailableError as exc:
+            return _unavailable(exc)
 
 
 class BVNValidationView(APIView):
@@ -76,6 +95,8 @@ class BVNValidationView(APIView):
     Returns per-field confidence scores.
     """
 
+    permission_classes = [IsAuthenticated]
+
     def post(self, request):
         serializer = BVNValidationSerializer(data=request.data)
         if not serializer.is_valid():
@@ -92,6 +113,8 @@ class BVNValidationView(APIView):
             return Response({"success": True, "data": result})
         except requests.HTTPError as exc:
             return _dojah_error(exc)
+        except VerificationUnavailableError as exc:
+            return _unavailable(exc)
 
 
 class AccountNumberVerificationView(APIView):
@@ -100,6 +123,8 @@ class AccountNumberVerificationView(APIView):
     Verify a bank account number (NUBAN) and retrieve account name.
     """
 
+    permission_classes = [IsAuthenticated]
+
     def post(self, request):
         serializer = AccountNumberSerializer(data=request.data)
         if not serializer.is_valid():
@@ -114,6 +139,8 @@ class AccountNumberVerificationView(APIView):
             return Response({"success": True, "data": result})
         except requests.HTTPError as exc:
             return _dojah_error(exc)
+        except VerificationUnavailableError as exc:
+            return _unavailable(exc)
 
 
 class FaceMatchView(APIView):
@@ -123,6 +150,8 @@ class FaceMatchView(APIView):
     Body: { image (base64), first_name, last_name, bvn? | nin? }
     """
 
+    permission_classes = [IsAuthenticated]
+
     def post(self, request):
         serializer = FaceMatchSerializer(data=request.data)
         if not serializer.is_valid():
@@ -140,6 +169,8 @@ class FaceMatchView(APIView):
             return Response({"success": True, "data": result})
         except requests.HTTPError as exc:
             return _dojah_error(exc)
+        except VerificationUnavailableError as exc:
+            return _unavailable(exc)
 
 
 class PlateNumberVerificationView(APIView):
@@ -148,6 +179,8 @@ class PlateNumberVerificationView(APIView):
     Verify a Nigerian vehicle plate number.
     """
 
+    permission_classes = [IsAuthenticated]
+
     def post(self, request):
         serializer = PlateNumberSerializer(data=request.data)
         if not serializer.is_valid():
@@ -160,6 +193,8 @@ class PlateNumberVerificationView(APIView):
             return Response({"success": True, "data": result})
         except requests.HTTPError as exc:
             return _dojah_error(exc)
+        except VerificationUnavailableError as exc:
+            return _unavailable(exc)
 
 
 # ──────────────────────────────────────────────
@@ -172,6 +207,8 @@ class TINVerificationView(APIView):
     Verify a company Tax Identification Number via FIRS.
     """
 
+    permission_classes = [IsAuthenticated]
+
     def post(self, request):
         serializer = TINVerificationSerializer(data=request.data)
         if not serializer.is_valid():
@@ -182,6 +219,8 @@ class TINVerificationView(APIView):
             return Response({"success": True, "data": result})
         except requests.HTTPError as exc:
             return _dojah_error(exc)
+        except VerificationUnavailableError as exc:
+            return _unavailable(exc)
 
 
 class RCNumberVerificationView(APIView):
@@ -190,6 +229,8 @@ class RCNumberVerificationView(APIView):
     Verify a CAC RC number and retrieve company details and directors.
     """
 
+    permission_classes = [IsAuthenticated]
+
     def post(self, request):
         serializer = RCNumberSerializer(data=request.data)
         if not serializer.is_valid():
@@ -200,6 +241,8 @@ class RCNumberVerificationView(APIView):
             return Response({"success": True, "data": result})
         except requests.HTTPError as exc:
             return _dojah_error(exc)
+        except VerificationUnavailableError as exc:
+            return _unavailable(exc)
 
 
 class BusinessBVNVerificationView(APIView):
@@ -208,6 +251,8 @@ class BusinessBVNVerificationView(APIView):
     Verify the BVN of a business owner or director.
     """
 
+    permission_classes = [IsAuthenticated]
+
     def post(self, request):
         serializer = BusinessBVNSerializer(data=request.data)
         if not serializer.is_valid():
@@ -218,3 +263,52 @@ class BusinessBVNVerificationView(APIView):
             return Response({"success": True, "data": result})
         except requests.HTTPError as exc:
             return _dojah_error(exc)
+        except VerificationUnavailableError as exc:
+            return _unavailable(exc)
+
+
+# ──────────────────────────────────────────────
+# ASYNC CHECKS
+# ──────────────────────────────────────────────
+
+class VerificationJobView(APIView):
+    """
+    POST /api/verify/jobs/
+    Queue a slow check instead of waiting on the provider.
+    Body: { check: one of jobs.CHECKS, ...that check's fields }
+    Returns 202 with a job_id; poll GET /api/verify/jobs/<job_id>/ or wait for
+    `verification.status` on ws/notifications/.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        check = request.data.get("check")
+        if check not in jobs.CHECKS:
+            return Response(
+                {"check": [f"Must be one of: {', '.join(jobs.CHECKS)}"]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        serializer_class, _ = jobs.CHECKS[check]
+        serializer = serializer_class(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        job = jobs.submit(check, serializer.validated_data, request.user.id)
+        return Response({"success": True, "data": jobs.public(job)}, status=status.HTTP_202_ACCEPTED)
+
+
+class VerificationJobStatusView(APIView):
+    """
+    GET /api/verify/jobs/<job_id>/
+    Status of a queued check, with its result once completed.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, job_id):
+        job = jobs.load(job_id)
+        if job is None or job["user_id"] != request.user.id:
+            return Response({"success": False, "error": "Not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response({"success": True, "data": jobs.public(job)})